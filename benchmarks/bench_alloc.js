@@ -0,0 +1,77 @@
+/* Allocation rate of instances, builtin containers and numbers */
+
+load("benchmarks/common.js");
+
+var Empty = __inherit(object, "Empty", true);
+
+var Point = __inherit(object, "Point", true);
+
+Point.PY$__init__ = function(x, y) {
+    this.PY$x = x;
+    this.PY$y = y;
+};
+
+var SlotPoint = __inherit(object, "SlotPoint", true);
+
+SlotPoint.PY$__slots__ = tuple([str("x"), str("y")]);
+SlotPoint.PY$__init__ = Point.PY$__init__;
+$PY.set_slots(SlotPoint);
+
+var Counter = __inherit(object, "Counter", false);
+
+Counter.PY$__call__ = function() {
+    return $c1;
+};
+
+bench("Empty()", 1000000, function(i) {
+    return Empty();
+});
+
+bench("Point(x, y)", 1000000, function(i) {
+    return Point($c1, $c2);
+});
+
+bench("SlotPoint(x, y) [__slots__]", 1000000, function(i) {
+    return SlotPoint($c1, $c2);
+});
+
+bench("Counter() [callable]", 200000, function(i) {
+    return Counter();
+});
+
+bench("tuple([x, y])", 1000000, function(i) {
+    return tuple([$c1, $c2]);
+});
+
+bench("int(n)", 1000000, function(i) {
+    return int(i);
+});
+
+bench("$PY.mkint(n)", 1000000, function(i) {
+    return $PY.mkint(i);
+});
+
+bench("$PY.mkfloat(n)", 1000000, function(i) {
+    return $PY.mkfloat(i + 0.5);
+});
+
+bench("__inherit(Exception, name)", 100000, function(i) {
+    return __inherit(__builtins__.PY$Exception, "MyError");
+});
+
+bench("a, b = b, a [tuple]", 2000000, function(i) {
+    var a = $c1, b = $c2;
+    var t = tuple([b, a]);
+    a = t.PY$__getitem__(0);
+    b = t.PY$__getitem__(1);
+    return a;
+});
+
+bench("a, b = b, a [temporaries]", 2000000, function(i) {
+    var a = $c1, b = $c2;
+    var t1 = b;
+    var t2 = a;
+    a = t1;
+    b = t2;
+    return a;
+});
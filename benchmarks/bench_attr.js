@@ -0,0 +1,50 @@
+/* Attribute reads and writes, in the forms the compiler emits */
+
+load("benchmarks/common.js");
+
+var Point = __inherit(object, "Point");
+Point.PY$__init__ = function(x, y) {
+    this.PY$x = x;
+    this.PY$y = y;
+};
+var p = Point($c1, $c2);
+var holder = {PY$p: p};
+
+/* the same read site sees instances of several classes */
+var points = [];
+for (var i = 0; i < 4; i++) {
+    var cls = __inherit(Point, "Point" + i);
+    points.push(cls($c1, $c2));
+}
+
+bench("p.PY$__getattr__('x')", 2000000, function(i) {
+    return p.PY$__getattr__('x');
+});
+
+bench("guarded read of p.x", 2000000, function(i) {
+    return (typeof p.PY$x === 'object' ? p.PY$x : p.PY$__getattr__('x'));
+});
+
+bench("$PY.getattr(expr, 'PY$x', 'x')", 2000000, function(i) {
+    return $PY.getattr(holder.PY$p, 'PY$x', 'x');
+});
+
+bench("p.PY$__getattr__('x') [4 classes]", 2000000, function(i) {
+    var q = points[i & 3];
+    return q.PY$__getattr__('x');
+});
+
+bench("guarded read of p.x [4 classes]", 2000000, function(i) {
+    var q = points[i & 3];
+    return (typeof q.PY$x === 'object' ? q.PY$x : q.PY$__getattr__('x'));
+});
+
+bench("p.PY$__setattr__('x', v)", 2000000, function(i) {
+    p.PY$__setattr__('x', $c3);
+    return p;
+});
+
+bench("guarded write of p.x", 2000000, function(i) {
+    if (p.PY$__setattr__ === $PY.plain_setattr) { p.PY$x = $c3; } else { p.PY$__setattr__('x', $c3); }
+    return p;
+});
@@ -0,0 +1,39 @@
+/* Method calls, in the forms the compiler emits */
+
+load("benchmarks/common.js");
+
+var Counter = __inherit(object, "Counter");
+Counter.PY$__init__ = function() {
+    this.PY$n = $c0;
+};
+Counter.PY$add = function(x) {
+    return x;
+};
+var Sub = __inherit(Counter, "Sub");
+Sub.PY$add = function(x) {
+    return $PY.supermethod(Sub, 'add').call(this, x);
+};
+
+var c = Counter();
+var s = Sub();
+var holder = {PY$c: c};
+
+bench("c.PY$__getattr__('add')(x)", 2000000, function(i) {
+    return c.PY$__getattr__('add')($c1);
+});
+
+bench("$PY.method(c, 'PY$add', 'add').call(c, x)", 2000000, function(i) {
+    return $PY.method(c, 'PY$add', 'add').call(c, $c1);
+});
+
+bench("$PY.callmethod(expr, 'PY$add', 'add', x)", 2000000, function(i) {
+    return $PY.callmethod(holder.PY$c, 'PY$add', 'add', $c1);
+});
+
+bench("Super(Sub, s).PY$__getattr__('add')(x)", 1000000, function(i) {
+    return Super(Sub, s).PY$__getattr__('add')($c1);
+});
+
+bench("$PY.supermethod(Sub, 'add').call(s, x)", 1000000, function(i) {
+    return $PY.supermethod(Sub, 'add').call(s, $c1);
+});
@@ -0,0 +1,22 @@
+/* % formatting with a few templates that are used over and over */
+
+load("benchmarks/common.js");
+
+var label = str("%s: %d items (%.2f%%)");
+var args = tuple([str("fruit"), $PY.mkint(42), $PY.mkfloat(12.5)]);
+var named = str("%(name)s=%(value)r");
+var kwargs = dict();
+kwargs.PY$__setitem__(str("name"), str("x"));
+kwargs.PY$__setitem__(str("value"), $PY.mkint(7));
+
+bench("'%s: %d items (%.2f%%)' % args", 200000, function(i) {
+    return label.PY$__mod__(args);
+});
+
+bench("'%(name)s=%(value)r' % kwargs", 200000, function(i) {
+    return named.PY$__mod__(kwargs);
+});
+
+bench("'%05x' % n", 200000, function(i) {
+    return str("%05x").PY$__mod__($PY.mkint(i));
+});
@@ -0,0 +1,31 @@
+/* attribute and builtin reads in a loop, as emitted at -O1 and with the loop-invariants pass of -O2 */
+
+load("benchmarks/common.js");
+
+var Box = __inherit(object, "Box");
+var self = Box();
+self.PY$size = $PY.mkint(3);
+var l = list();
+for (var n = 0; n < 1000; n++) {
+    l.PY$append($PY.mkint(n));
+}
+
+bench("self.size + len(l) [-O1]", 2000, function(i) {
+    var x, c = 0;
+    for (var k = 0; k < l.items.length; k++) {
+        x = (typeof self.PY$size === 'object' ? self.PY$size : self.PY$__getattr__('size'));
+        c += __builtins__.PY$len(l) === x ? 1 : 0;
+    }
+    return c;
+});
+
+bench("self.size + len(l) [-O2]", 2000, function(i) {
+    var x, c = 0;
+    var $v1 = undefined;
+    var $v2 = __builtins__.PY$len;
+    for (var k = 0; k < l.items.length; k++) {
+        x = ($v1 !== undefined ? $v1 : ($v1 = (typeof self.PY$size === 'object' ? self.PY$size : self.PY$__getattr__('size'))));
+        c += $v2(l) === x ? 1 : 0;
+    }
+    return c;
+});
@@ -0,0 +1,19 @@
+/* imports of a module that is already loaded, as done by imports inside functions */
+
+load("benchmarks/common.js");
+
+$PY.modules['pkg.shapes'] = function() {
+    return module('pkg.shapes', 'pkg/shapes.py', {
+        "PY$square": function(n) { return n; },
+        "PY$circle": function(r) { return r; }
+    });
+};
+
+bench("import shapes", 1000000, function(i) {
+    return __import__('shapes', 'pkg.main');
+});
+
+bench("from shapes import square, circle", 1000000, function(i) {
+    var $v1 = $PY.import_from(__import__('shapes', 'pkg.main'), ['square', 'circle']);
+    return $v1[0] !== $v1[1];
+});
@@ -0,0 +1,24 @@
+/* Integer arithmetic with boxed ints and with --raw-numbers ints */
+
+load("benchmarks/common.js");
+
+var a = $PY.mkint(12345), b = $PY.mkint(678);
+
+bench("boxed a + b", 2000000, function(i) {
+    return a.PY$__add__(b);
+});
+
+bench("boxed a * b % 1000", 2000000, function(i) {
+    return a.PY$__mul__(b).PY$__mod__($PY.mkint(1000));
+});
+
+$PY.raw_numbers();
+var x = 12345, y = 678;
+
+bench("raw a + b", 2000000, function(i) {
+    return x.PY$__add__(y);
+});
+
+bench("raw a * b % 1000", 2000000, function(i) {
+    return x.PY$__mul__(y).PY$__mod__(1000);
+});
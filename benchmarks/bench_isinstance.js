@@ -0,0 +1,18 @@
+/* Subclass checks, as done for every except clause and StopIteration check */
+
+load("benchmarks/common.js");
+
+var exc = __builtins__.PY$ZeroDivisionError("x");
+var classes = tuple([__builtins__.PY$KeyError, __builtins__.PY$ValueError, __builtins__.PY$ArithmeticError]);
+
+bench("$PY.isinstance(exc, Exception)", 1000000, function(i) {
+    return $PY.isinstance(exc, __builtins__.PY$Exception);
+});
+
+bench("$PY.isinstance(exc, StopIteration) [miss]", 1000000, function(i) {
+    return $PY.isinstance(exc, __builtins__.PY$StopIteration);
+});
+
+bench("isinstance(exc, (KeyError, ValueError, ArithmeticError))", 1000000, function(i) {
+    return __builtins__.PY$isinstance(exc, classes);
+});
@@ -0,0 +1,50 @@
+/* for loops over a list and over dict.items(), in the forms the compiler emits */
+
+load("benchmarks/common.js");
+
+var l = list();
+var d = dict();
+for (var n = 0; n < 1000; n++) {
+    l.PY$append($PY.mkint(n));
+    d.PY$__setitem__(str("k" + n), $PY.mkint(n));
+}
+
+bench("for x in l [iter]", 2000, function(i) {
+    var x, c = 0;
+    for (var it = iter(l); (x = $PY.next(it)) !== null; ) {
+        c++;
+    }
+    return c;
+});
+
+bench("for x in l [indexed]", 2000, function(i) {
+    var x, c = 0;
+    var s = l;
+    var it = (s.PY$__class__ === list || s.PY$__class__ === tuple) ? null : iter(s);
+    var k = 0;
+    for (; (x = (it === null ? (k < s.items.length ? s.items[k++] : null) : $PY.next(it))) !== null; ) {
+        c++;
+    }
+    return c;
+});
+
+bench("for k, v in d.items() [iter]", 2000, function(i) {
+    var t, k, v, c = 0;
+    for (var it = iter(d.PY$items()); (t = $PY.next(it)) !== null; ) {
+        k = t.PY$__getitem__(0);
+        v = t.PY$__getitem__(1);
+        c++;
+    }
+    return c;
+});
+
+bench("for k, v in d.items() [storage]", 2000, function(i) {
+    var t, k, v, c = 0;
+    var items = (d.PY$__class__ === dict) ? d.items.slice() : null;
+    var it = (items === null) ? iter($PY.callmethod(d, 'PY$items', 'items')) : null;
+    var j = 0;
+    for (; items !== null ? (j < items.length && ((k = items[j]), (v = items[j + 1]), (j += 2), true)) : ((t = $PY.next(it)) !== null && ((k = t.PY$__getitem__(0)), (v = t.PY$__getitem__(1)), true)); ) {
+        c++;
+    }
+    return c;
+});
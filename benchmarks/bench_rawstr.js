@@ -0,0 +1,42 @@
+/* Small string operations with boxed strs and with --raw-strings strs */
+
+load("benchmarks/common.js");
+
+var text = str("the quick brown fox jumps over the lazy dog");
+var word = str("fox");
+
+bench("boxed iterate 43 chars", 200000, function(i) {
+    var it = iter(text), c, n = 0;
+    while ((c = $PY.next(it)) !== null) {
+        n++;
+    }
+    return n;
+});
+
+bench("boxed concat + upper", 1000000, function(i) {
+    return text.PY$__add__(word).PY$upper();
+});
+
+bench("boxed js(py(s))", 1000000, function(i) {
+    return js(py("fox"));
+});
+
+$PY.raw_strings();
+var rtext = "the quick brown fox jumps over the lazy dog";
+var rword = "fox";
+
+bench("raw iterate 43 chars", 200000, function(i) {
+    var it = iter(rtext), c, n = 0;
+    while ((c = $PY.next(it)) !== null) {
+        n++;
+    }
+    return n;
+});
+
+bench("raw concat + upper", 1000000, function(i) {
+    return rtext.PY$__add__(rword).PY$upper();
+});
+
+bench("raw js(py(s))", 1000000, function(i) {
+    return js(py("fox"));
+});
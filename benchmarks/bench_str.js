@@ -0,0 +1,32 @@
+/* String methods on a 100 KB input, as used by text processing code */
+
+load("benchmarks/common.js");
+
+var chunk = "the quick brown fox jumps over the lazy dog\n";
+var big = "";
+while (big.length < 100000) {
+    big += chunk;
+}
+big = str(big);
+var padded = str("          " + big + "          ");
+var words = big.PY$split(str(" "));
+
+var the = str("the");
+var a = str("a");
+var sep = str(",");
+
+bench("str.replace(100 KB)", 100, function(i) {
+    return big.PY$replace(the, a);
+});
+
+bench("str.count(100 KB)", 100, function(i) {
+    return big.PY$count(the);
+});
+
+bench("str.strip(100 KB)", 1000, function(i) {
+    return padded.PY$strip();
+});
+
+bench("str.join(" + words.items.length + " words)", 100, function(i) {
+    return sep.PY$join(words);
+});
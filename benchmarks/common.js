@@ -0,0 +1,24 @@
+/*
+ * Helpers shared by the benchmarks in this directory. The benchmarks are run
+ * from the top of the source tree, after py-builtins.js has been generated:
+ *
+ *   js -f benchmarks/bench_alloc.js
+ */
+
+load("py-builtins.js");
+
+function bench(name, count, func) {
+    /* results are kept alive, so the engine can not optimize the work away */
+    var sink = new Array(1024);
+    /* warm up, so that the engine has a chance to optimize func */
+    for (var i = 0; i < count / 10; i++) {
+        sink[i & 1023] = func(i);
+    }
+    var start = new Date().getTime();
+    for (var i = 0; i < count; i++) {
+        sink[i & 1023] = func(i);
+    }
+    var elapsed = Math.max(new Date().getTime() - start, 1);
+    var rate = Math.round(count / elapsed * 1000);
+    print(name + ": " + count + " in " + elapsed + " ms (" + rate + " per second)");
+}
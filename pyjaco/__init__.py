@@ -28,6 +28,7 @@
 import pyjaco.compiler.python
 import pyjaco.compiler.javascript
 import pyjaco.compiler.multiplexer
+import pyjaco.compiler.passes
 import re
 import StringIO
 import ast
@@ -72,24 +73,34 @@ class Compiler(object):
     re_comment = re.compile("^[ ]*#")
 
     def __init__(self, jsvars = None, opts = dict()):
-        defaults = dict(check_params = True)
+        defaults = dict(check_params = True, raw_numbers = False, raw_strings = False, bind_args = False, target = "es5", optimize = 0, passes = None)
 
         compiler_opts = dict()
         compiler_opts.update(defaults)
         compiler_opts.update(opts)
         
         self.shared_state = {}
+        self.opts = compiler_opts
         
         self.compiler = pyjaco.compiler.multiplexer.Compiler(jsvars, compiler_opts, shared_state = self.shared_state)
+        self.passes = pyjaco.compiler.passes.PassManager(compiler_opts['optimize'], compiler_opts['passes'])
         self.buffer = None
         self.reset()
 
     def reset(self):
         self.buffer = StringIO.StringIO()
+        if self.opts['raw_numbers']:
+            self.buffer.write("$PY.raw_numbers();\n\n")
+        if self.opts['raw_strings']:
+            self.buffer.write("$PY.raw_strings();\n\n")
 
     def __str__(self):
         return self.buffer.getvalue()
 
+    def parse(self, code):
+        """Parse python source code, and run the optimisation passes on it."""
+        return self.passes.run(ast.parse(code))
+
     def dedent(self, code, body):
         if body:
             if code[0].lstrip().startswith('def'):
@@ -140,7 +151,7 @@ class Compiler(object):
         self.comment_section(name)
         if jsvars:
             self.compiler.jsvars = jsvars
-        self.buffer.write("\n".join(self.compiler.visit(ast.parse(code))))
+        self.buffer.write("\n".join(self.compiler.visit(self.parse(code))))
         self.buffer.write("\n\n")
         self.compiler.jsvars = []
 
@@ -151,18 +162,30 @@ class Compiler(object):
     def append_class(self, code, name = None):
         self.append_string(inspect.getsource(code), name)
 
-    def append_module(self, code, path, base = None):
-        # determine module name characteristics
+    @staticmethod
+    def module_file(path, base = None):
+        """Name of file path relative to directory base (the current directory
+        by default), with forward slashes."""
         path = os.path.abspath(path)
         if base is None:
             base = os.getcwd()
         base = os.path.abspath(base)
         commonprefix = os.path.commonprefix([path, base])
         path, base, commonprefix = [x.replace('\\','/') for x in (path, base, commonprefix)]
-        filename = path[len(commonprefix):].lstrip('/')
-        dotted = os.path.splitext(filename)[0].replace('/', '.')
+        return path[len(commonprefix):].lstrip('/')
+
+    @staticmethod
+    def module_name(path, base = None):
+        """Dotted name of the module in file path, relative to directory base."""
+        dotted = os.path.splitext(Compiler.module_file(path, base))[0].replace('/', '.')
         if dotted.endswith('.__init__'):
             dotted = dotted[:-9]
+        return dotted
+
+    def append_module(self, code, path, base = None):
+        # determine module name characteristics
+        filename = self.module_file(path, base)
+        dotted = self.module_name(path, base)
         
         # make the module name available to the compilers
         self.shared_state["module"] = dotted
@@ -197,7 +220,7 @@ class Compiler(object):
         self.shared_state["indent_count"] = 1
         
         # compile and buffer the code
-        output = self.compiler.indent(self.compiler.visit(ast.parse(code)))
+        output = self.compiler.indent(self.compiler.visit(self.parse(code)))
         self.buffer.write("\n".join(output))
         self.buffer.write("\n")
         
@@ -220,7 +243,7 @@ class Compiler(object):
     def compile_string(self, code, name = None, jsvars = None):
         if jsvars:
             self.compiler.jsvars = jsvars
-        res = self.format_name(name) + "\n".join(self.compiler.visit(ast.parse(code)))
+        res = self.format_name(name) + "\n".join(self.compiler.visit(self.parse(code)))
         self.compiler.jsvars = []
         return res
 
@@ -242,7 +265,7 @@ class Compiler(object):
         return "\n".join(res)
 
     def compile_data(self, key, value):
-        return "var %s = %s" % (key, "\n".join(self.compiler.visit(ast.parse(repr(value)))))
+        return "var %s = %s" % (key, "\n".join(self.compiler.visit(self.parse(repr(value)))))
 
     def compile_expr(self, value):
-        return "\n".join(self.compiler.visit(ast.parse(repr(value))))
+        return "\n".join(self.compiler.visit(self.parse(repr(value))))
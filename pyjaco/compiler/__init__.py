@@ -45,6 +45,9 @@ class BaseCompiler(object):
     import __builtin__
     builtin = set([x for x in dir(__builtin__) if not x.startswith("__")])
 
+    # Keyword that declares the variables of the compiler's own
+    let = "var"
+
     def __init__(self, opts, **kwargs):
         self.index_var = 0
         # This is the name of the classes that we are currently in:
@@ -174,7 +177,7 @@ class BaseCompiler(object):
     def visit_Assign(self, node):
         if len(node.targets) > 1:
             tmp = self.alloc_var()
-            q = ["var %s = %s" % (tmp, self.visit(node.value))]
+            q = ["%s %s = %s" % (self.let, tmp, self.visit(node.value))]
             for t in node.targets:
                 q.extend(self.visit_AssignSimple(t, tmp))
             return q
@@ -169,7 +169,6 @@ class Compiler(pyjaco.compiler.BaseCompiler):
 
         iter_dummy = self.alloc_var()
         orelse_dummy = self.alloc_var()
-        exc_dummy = self.alloc_var()
 
         if isinstance(node.iter, ast.Call) and isinstance(node.iter.func, ast.Name) and node.iter.func.id == "range" and not node.orelse:
             counter  = self.visit(node.target)
@@ -197,16 +196,10 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         js.append("var %s = iter(%s);" % (iter_dummy, for_iter))
         js.append("var %s = false;" % orelse_dummy)
         js.append("while (1) {")
-        js.append("    var %s;" % for_target)
-        js.append("    try {")
-        js.append("        %s = %s.PY$next();" % (for_target, iter_dummy))
-        js.append("    } catch (%s) {" % exc_dummy)
-        js.append("        if (__builtins__.isinstance(%s, __builtins__.StopIteration)) {" % exc_dummy)
-        js.append("            %s = true;" % orelse_dummy)
-        js.append("            break;")
-        js.append("        } else {")
-        js.append("            throw %s;" % exc_dummy)
-        js.append("        }")
+        js.append("    var %s = $PY.next(%s);" % (for_target, iter_dummy))
+        js.append("    if (%s === null) {" % for_target)
+        js.append("        %s = true;" % orelse_dummy)
+        js.append("        break;")
         js.append("    }")
 
         for stmt in node.body:
@@ -0,0 +1,713 @@
+######################################################################
+##
+## Copyright 2011 Christian Iversen <ci@sikkerhed.org>
+##
+## Permission is hereby granted, free of charge, to any person
+## obtaining a copy of this software and associated documentation
+## files (the "Software"), to deal in the Software without
+## restriction, including without limitation the rights to use,
+## copy, modify, merge, publish, distribute, sublicense, and/or sell
+## copies of the Software, and to permit persons to whom the
+## Software is furnished to do so, subject to the following
+## conditions:
+##
+## The above copyright notice and this permission notice shall be
+## included in all copies or substantial portions of the Software.
+##
+## THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+## EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+## OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+## NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+## HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+## WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+## FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+## OTHER DEALINGS IN THE SOFTWARE.
+##
+######################################################################
+
+"""
+AST to AST passes, run on the syntax tree of the python code before it is
+compiled to javascript.
+
+Each pass is an ast.NodeTransformer with a name, and the lowest
+optimisation level (-O) it is run at. The PassManager runs the passes of
+a level in the order they are listed in PASSES, and keeps track of the
+time spent in each.
+"""
+
+import ast
+import copy
+import time
+import __builtin__
+
+BUILTINS = set(x for x in dir(__builtin__) if not x.startswith("__"))
+
+# Statement lists of the nodes that have them
+BODIES = ("body", "orelse", "finalbody")
+
+def constant(node):
+    """The python value of node, if it is a literal number, string, True,
+    False or None. Returns a (found, value) tuple."""
+    if isinstance(node, ast.Num):
+        return True, node.n
+    elif isinstance(node, ast.Str):
+        return True, node.s
+    elif isinstance(node, ast.Name) and node.id in ("True", "False", "None"):
+        return True, {"True": True, "False": False, "None": None}[node.id]
+    return False, None
+
+class Pass(ast.NodeTransformer):
+    """Base class of the passes."""
+
+    name = None
+    level = 1
+
+    def run(self, tree):
+        return self.visit(tree)
+
+    def generic_visit(self, node):
+        node = super(Pass, self).generic_visit(node)
+        # The body of a statement may not end up empty
+        if getattr(node, "body", None) == [] and isinstance(node, (ast.stmt, ast.excepthandler)):
+            node.body.append(ast.copy_location(ast.Pass(), node))
+        return node
+
+class ConstantFolding(Pass):
+    """Computes arithmetic on literal numbers and strings at compile time.
+
+    Only operations that mean the same in python and javascript, and
+    results the compiler can write as a literal, are folded: no division,
+    no modulo of negative numbers, and ints within the range of small ints
+    of the runtime."""
+
+    name = "constant-folding"
+
+    ops = {
+        ast.Add: lambda a, b: a + b,
+        ast.Sub: lambda a, b: a - b,
+        ast.Mult: lambda a, b: a * b,
+        ast.Pow: lambda a, b: a ** b,
+        ast.Mod: lambda a, b: a % b,
+        ast.FloorDiv: lambda a, b: a // b,
+        ast.BitAnd: lambda a, b: a & b,
+        ast.BitOr: lambda a, b: a | b,
+        ast.BitXor: lambda a, b: a ^ b,
+        ast.LShift: lambda a, b: a << b,
+        ast.RShift: lambda a, b: a >> b,
+    }
+
+    # Operations that are only folded for non-negative ints
+    int_ops = (ast.Mod, ast.FloorDiv, ast.BitAnd, ast.BitOr, ast.BitXor, ast.LShift, ast.RShift)
+
+    max_int = 2**30
+    max_str = 1024
+
+    def literal(self, value, node):
+        """A literal node for value, or None if it can not be written as one."""
+        if isinstance(value, bool):
+            return None
+        elif isinstance(value, (int, long)):
+            if -self.max_int < value < self.max_int:
+                return ast.copy_location(ast.Num(n = int(value)), node)
+        elif isinstance(value, float):
+            if value - value == 0.0:
+                return ast.copy_location(ast.Num(n = value), node)
+        elif isinstance(value, basestring):
+            if len(value) <= self.max_str:
+                return ast.copy_location(ast.Str(s = value), node)
+        return None
+
+    def visit_BinOp(self, node):
+        node = self.generic_visit(node)
+        op = self.ops.get(node.op.__class__)
+        left_found, left = constant(node.left)
+        right_found, right = constant(node.right)
+        if op is None or not (left_found and right_found):
+            return node
+
+        numbers = (int, long, float)
+        strings = basestring
+        if isinstance(left, bool) or isinstance(right, bool):
+            return node
+        elif isinstance(node.op, self.int_ops):
+            if not all(isinstance(x, (int, long)) and x >= 0 for x in (left, right)):
+                return node
+            if isinstance(node.op, (ast.LShift, ast.RShift)) and right >= 32:
+                return node
+        elif isinstance(node.op, ast.Pow):
+            if not (isinstance(left, numbers) and isinstance(right, (int, long)) and 0 <= right <= 64):
+                return node
+        elif isinstance(node.op, ast.Mult) and (isinstance(left, strings) or isinstance(right, strings)):
+            text, count = (left, right) if isinstance(left, strings) else (right, left)
+            if not isinstance(count, (int, long)) or len(text) * count > self.max_str:
+                return node
+        elif isinstance(node.op, ast.Add) and isinstance(left, strings) and isinstance(right, strings):
+            pass
+        elif not (isinstance(left, numbers) and isinstance(right, numbers)):
+            return node
+
+        try:
+            value = op(left, right)
+        except (ArithmeticError, ValueError):
+            return node
+        folded = self.literal(value, node)
+        return node if folded is None else folded
+
+    def visit_UnaryOp(self, node):
+        node = self.generic_visit(node)
+        found, value = constant(node.operand)
+        if not found or isinstance(value, bool) or not isinstance(value, (int, long, float)):
+            return node
+        if isinstance(node.op, ast.USub):
+            value = -value
+        elif isinstance(node.op, ast.UAdd):
+            value = +value
+        else:
+            return node
+        folded = self.literal(value, node)
+        return node if folded is None else folded
+
+class DeadBranches(Pass):
+    """Drops the branches of if statements and expressions, and while loops,
+    that a constant test never takes."""
+
+    name = "dead-branches"
+
+    def visit_If(self, node):
+        node = self.generic_visit(node)
+        found, value = constant(node.test)
+        if not found:
+            return node
+        return node.body if value else node.orelse
+
+    def visit_IfExp(self, node):
+        node = self.generic_visit(node)
+        found, value = constant(node.test)
+        if not found:
+            return node
+        return node.body if value else node.orelse
+
+    def visit_While(self, node):
+        node = self.generic_visit(node)
+        found, value = constant(node.test)
+        if found and not value:
+            return node.orelse
+        return node
+
+class UnreachableCode(Pass):
+    """Drops the statements after a return, raise, break or continue in the
+    same block. Statements that bind names are kept, as they still decide
+    which names are local (or global, for global statements)."""
+
+    name = "unreachable-code"
+
+    jumps = (ast.Return, ast.Raise, ast.Break, ast.Continue)
+
+    def generic_visit(self, node):
+        for field in BODIES:
+            body = getattr(node, field, None)
+            if isinstance(body, list):
+                for i, stmt in enumerate(body):
+                    if isinstance(stmt, self.jumps):
+                        body[i + 1:] = [x for x in body[i + 1:] if bound_names(x)]
+                        break
+        return super(UnreachableCode, self).generic_visit(node)
+
+class StripAsserts(Pass):
+    """Drops assert statements, like python -O does."""
+
+    name = "strip-asserts"
+    level = 2
+
+    def visit_Assert(self, node):
+        return None
+
+def bound_names(node):
+    """Names bound by node, and the nodes inside it, in any scope."""
+    names = set()
+    for n in ast.walk(node):
+        if isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load):
+            names.add(n.id)
+        elif isinstance(n, (ast.FunctionDef, ast.ClassDef)):
+            names.add(n.name)
+        elif isinstance(n, (ast.Import, ast.ImportFrom)):
+            names.update((a.asname or a.name).split(".")[0] for a in n.names)
+        elif isinstance(n, ast.Global):
+            names.update(n.names)
+        elif isinstance(n, ast.arguments):
+            names.update(x for x in (n.vararg, n.kwarg) if x)
+    return names
+
+def local_names(func):
+    """Names that are local to function (or lambda) func."""
+    names = set()
+    todo = list(ast.iter_child_nodes(func))
+    while todo:
+        n = todo.pop()
+        if isinstance(n, (ast.FunctionDef, ast.ClassDef)):
+            names.add(n.name)
+            todo.extend(n.decorator_list)
+            if isinstance(n, ast.FunctionDef):
+                todo.extend(n.args.defaults)
+            else:
+                todo.extend(n.bases)
+            continue
+        elif isinstance(n, ast.Lambda):
+            todo.extend(n.args.defaults)
+            continue
+        elif isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load):
+            names.add(n.id)
+        elif isinstance(n, (ast.Import, ast.ImportFrom)):
+            names.update((a.asname or a.name).split(".")[0] for a in n.names)
+        elif isinstance(n, ast.arguments):
+            names.update(x for x in (n.vararg, n.kwarg) if x)
+        todo.extend(ast.iter_child_nodes(n))
+    for n in ast.walk(func):
+        if isinstance(n, ast.Global):
+            names.difference_update(n.names)
+    return names
+
+class Substitute(ast.NodeTransformer):
+    """Replaces the names in "values" by copies of their values."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def visit_Name(self, node):
+        if node.id in self.values:
+            return copy.deepcopy(self.values[node.id])
+        return node
+
+class Inlining(Pass):
+    """Replaces calls of small functions, defined at module level, with the
+    expression they return.
+
+    Only functions whose body is a single return statement (or pass), and
+    lambdas assigned to a name, are inlined, if the returned expression has
+    at most "budget" nodes. The function must be bound once in the module,
+    by its definition, without decorators or default values other than
+    literals, and the names it uses must not be bound anywhere but at
+    module level. Calls are inlined if they only have positional arguments,
+    and each argument is a literal or a name. When the function calls
+    anything, a name must be local to the caller, so that it can not change
+    before it is used. Inlined expressions are not inlined into again, so
+    recursion ends after one level.
+
+    Methods are not inlined, as they can be overridden in any subclass."""
+
+    name = "inlining"
+    level = 2
+
+    budget = 24
+
+    # Nodes that bind names of their own, or can not be moved
+    excluded = (ast.Lambda, ast.ListComp, ast.GeneratorExp, ast.DictComp, ast.SetComp, ast.Yield)
+
+    def run(self, tree):
+        if not isinstance(tree, ast.Module):
+            return tree
+        self.functions = self.find_functions(tree)
+        self.scopes = [set()]
+        if not self.functions:
+            return tree
+        return self.visit(tree)
+
+    def find_functions(self, tree):
+        """Functions that can be inlined, by name, as (args, defaults,
+        expression, calls) tuples."""
+        candidates = {}
+        for stmt in tree.body:
+            if isinstance(stmt, ast.FunctionDef) and not stmt.decorator_list:
+                body = stmt.body
+                if len(body) > 1 and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Str):
+                    body = body[1:]
+                if len(body) != 1:
+                    continue
+                elif isinstance(body[0], ast.Pass) or (isinstance(body[0], ast.Return) and body[0].value is None):
+                    expr = ast.Name(id = "None", ctx = ast.Load())
+                elif isinstance(body[0], ast.Return):
+                    expr = body[0].value
+                else:
+                    continue
+                candidates[stmt.name] = (stmt.args, expr)
+            elif isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Lambda) and \
+                 len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+                candidates[stmt.targets[0].id] = (stmt.value.args, stmt.value.body)
+
+        # Names bound anywhere, and how often
+        counts = {}
+        nested = set()
+        for n in ast.walk(tree):
+            if isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load):
+                counts[n.id] = counts.get(n.id, 0) + 1
+            elif isinstance(n, (ast.FunctionDef, ast.ClassDef)):
+                counts[n.name] = counts.get(n.name, 0) + 1
+            if isinstance(n, (ast.FunctionDef, ast.Lambda)):
+                nested.update(bound_names(n.args))
+                for stmt in (n.body if isinstance(n.body, list) else [n.body]):
+                    nested.update(bound_names(stmt))
+            elif isinstance(n, ast.ClassDef):
+                for stmt in n.body:
+                    nested.update(bound_names(stmt))
+        rebound = set(name for name, count in counts.items() if count > 1)
+        for n in ast.walk(tree):
+            if isinstance(n, (ast.Import, ast.ImportFrom, ast.Global)):
+                rebound.update(bound_names(n))
+
+        functions = {}
+        for name, (args, expr) in candidates.items():
+            params = [a.id for a in args.args if isinstance(a, ast.Name)]
+            if name in rebound or args.vararg or args.kwarg or len(params) != len(args.args):
+                continue
+            if not all(constant(d)[0] for d in args.defaults):
+                continue
+            nodes = list(ast.walk(expr))
+            if len(nodes) > self.budget or any(isinstance(n, self.excluded) for n in nodes):
+                continue
+            free = set(n.id for n in nodes if isinstance(n, ast.Name) and n.id not in params)
+            if name in free or free & nested:
+                continue
+            calls = any(isinstance(n, ast.Call) for n in nodes)
+            functions[name] = (params, args.defaults, expr, calls)
+        return functions
+
+    def visit_FunctionDef(self, node):
+        self.scopes.append(local_names(node))
+        node = self.generic_visit(node)
+        self.scopes.pop()
+        return node
+
+    def visit_Lambda(self, node):
+        self.scopes.append(local_names(node))
+        node = self.generic_visit(node)
+        self.scopes.pop()
+        return node
+
+    def visit_Call(self, node):
+        node = self.generic_visit(node)
+        if not isinstance(node.func, ast.Name) or node.func.id not in self.functions:
+            return node
+        if node.keywords or node.starargs or node.kwargs:
+            return node
+        params, defaults, expr, calls = self.functions[node.func.id]
+        if not len(params) - len(defaults) <= len(node.args) <= len(params):
+            return node
+        if node.func.id in self.scopes[-1]:
+            return node
+        for arg in node.args:
+            if constant(arg)[0]:
+                continue
+            elif isinstance(arg, ast.Name) and (not calls or arg.id in self.scopes[-1]):
+                continue
+            return node
+
+        missing = len(params) - len(node.args)
+        values = dict(zip(params, node.args + defaults[len(defaults) - missing:]))
+        inlined = Substitute(values).visit(copy.deepcopy(expr))
+        return ast.copy_location(inlined, node)
+
+class Invariant(object):
+    """A value read in a loop that does not change while the loop runs.
+
+    The loop-invariants pass sets the "invariant" attribute of the loop, and
+    of every read of the value in it, to the same Invariant. The compiler
+    reads the value into a variable before the loop, and uses the variable
+    in the loop. Attribute values may not exist, so these are "lazy": they
+    are read on first use, and kept for the rest of the loop."""
+
+    def __init__(self, node, lazy):
+        self.node = node
+        self.lazy = lazy
+        self.var = None
+
+class LoopInvariants(Pass):
+    """Marks reads of globals, builtins and attributes that do not change in
+    a loop inside a function, so that the compiler can hoist them out of it.
+
+    A global is invariant if it is bound at module level, or is a builtin,
+    and no function declares it global. An attribute obj.attr is invariant
+    if the class of obj is known, no attribute called attr is assigned or
+    deleted in the loop, and the loop runs no code that could assign it.
+    The class of obj is known if obj is self in a method of a class in the
+    module, a name only bound to instances of classes in the module, or a
+    module imported at module level. The loop may only call builtins with
+    arguments that are known to be builtin numbers, lists, dicts, tuples or
+    strings, call methods of such objects, and iterate over them. As other
+    code still calls special methods, such as __add__ for +, attributes are
+    not hoisted at all if a class in the module defines special methods
+    other than __init__. Methods that are called are left alone, as are
+    functions decorated with JSVar."""
+
+    name = "loop-invariants"
+    level = 2
+
+    # Builtins, and methods of builtin types, that do not assign attributes
+    pure_functions = set([
+        "abs", "bool", "chr", "divmod", "enumerate", "float", "hasattr", "int", "isinstance",
+        "len", "max", "min", "ord", "range", "reversed", "round", "sorted", "str", "sum",
+        "tuple", "list", "dict", "xrange", "zip",
+    ])
+    pure_methods = set([
+        "append", "count", "endswith", "extend", "find", "get", "has_key", "index", "insert",
+        "items", "iteritems", "iterkeys", "itervalues", "join", "keys", "lower", "lstrip",
+        "pop", "replace", "rstrip", "setdefault", "split", "startswith", "strip", "upper",
+        "values",
+    ])
+
+    # Arguments of methods from which on they are only stored, so that they
+    # need not be builtin objects
+    storing = {"append": 0, "insert": 1, "setdefault": 1}
+
+    # Builtins and methods that return builtin objects
+    builtin_functions = set([
+        "abs", "bool", "chr", "dict", "divmod", "enumerate", "float", "int", "len", "list",
+        "ord", "range", "reversed", "round", "sorted", "str", "sum", "tuple", "xrange", "zip",
+    ])
+    builtin_methods = set(["count", "find", "index", "items", "iteritems", "iterkeys", "itervalues", "keys", "split", "values"])
+
+    # Names the compiler treats specially
+    special = set(["True", "False", "None", "super", "__name__", "__builtins__", "__module__"])
+
+    # Nodes with a scope of their own, or that run later
+    scopes = (ast.FunctionDef, ast.ClassDef, ast.Lambda, ast.GeneratorExp, ast.DictComp, ast.SetComp)
+
+    def run(self, tree):
+        if not isinstance(tree, ast.Module):
+            return tree
+        self.module_names = local_names(tree)
+        self.declared_global = set()
+        self.methods = set()
+        methods = set()
+        rebound = set()
+        for n in ast.walk(tree):
+            if isinstance(n, ast.Global):
+                self.declared_global.update(n.names)
+            elif isinstance(n, ast.ClassDef):
+                self.methods.update(x for x in n.body if isinstance(x, ast.FunctionDef))
+                methods.update(x.name for x in n.body if isinstance(x, ast.FunctionDef))
+            elif isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load):
+                rebound.add(n.id)
+        self.hooks = any(m.startswith("__") and m != "__init__" for m in methods)
+        # Classes and modules bound once at module level
+        self.classes = set()
+        modules = set()
+        for stmt in tree.body:
+            if isinstance(stmt, ast.ClassDef):
+                self.classes.add(stmt.name)
+            elif isinstance(stmt, ast.Import):
+                modules.update((a.asname or a.name).split(".")[0] for a in stmt.names)
+        counts = {}
+        for n in ast.walk(tree):
+            if isinstance(n, (ast.FunctionDef, ast.ClassDef)):
+                counts[n.name] = counts.get(n.name, 0) + 1
+            elif isinstance(n, (ast.Import, ast.ImportFrom)):
+                for a in n.names:
+                    name = (a.asname or a.name).split(".")[0]
+                    counts[name] = counts.get(name, 0) + 1
+        once = set(name for name, count in counts.items() if count == 1) - rebound - self.declared_global
+        self.classes &= once
+        self.modules = modules & once
+        for n in ast.walk(tree):
+            if isinstance(n, ast.FunctionDef) and not any(
+                    isinstance(d, ast.Call) and isinstance(d.func, ast.Name) and d.func.id == "JSVar" for d in n.decorator_list):
+                self.function(n)
+        return tree
+
+    def region(self, node):
+        """The nodes of a loop that run on each iteration, not counting
+        nested scopes."""
+        todo = [node.test] + node.body if isinstance(node, ast.While) else [node.target] + node.body
+        nodes = []
+        while todo:
+            n = todo.pop()
+            nodes.append(n)
+            if not isinstance(n, self.scopes):
+                todo.extend(ast.iter_child_nodes(n))
+        return nodes
+
+    def loops(self, stmts):
+        """The loops in a list of statements, outer loops first."""
+        res = []
+        todo = list(stmts)
+        while todo:
+            n = todo.pop(0)
+            if isinstance(n, (ast.For, ast.While)):
+                res.append(n)
+            if not isinstance(n, self.scopes):
+                todo.extend(ast.iter_child_nodes(n))
+        return res
+
+    def names_bound_to(self, func, local, test, params = ()):
+        """Names local to func that are only ever bound by assignments of
+        values for which test(value) is true, or by for loops over values
+        for which test(value, True) is true, and the names in params that
+        are not bound anywhere else."""
+        typed = set(params)
+        targets = set()
+        other = set()
+        todo = list(ast.iter_child_nodes(func))
+        while todo:
+            n = todo.pop()
+            if isinstance(n, (ast.FunctionDef, ast.ClassDef)):
+                other.add(n.name)
+                continue
+            elif isinstance(n, self.scopes):
+                continue
+            elif isinstance(n, ast.Assign) and all(isinstance(t, ast.Name) for t in n.targets) and test(n.value):
+                typed.update(t.id for t in n.targets)
+                targets.update(n.targets)
+            elif isinstance(n, ast.For) and isinstance(n.target, ast.Name) and test(n.iter, True):
+                typed.add(n.target.id)
+                targets.add(n.target)
+            elif isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load) and n not in targets and \
+                 not (isinstance(n.ctx, ast.Param) and n.id in params):
+                other.add(n.id)
+            elif isinstance(n, (ast.Import, ast.ImportFrom)):
+                other.update((a.asname or a.name).split(".")[0] for a in n.names)
+            todo.extend(ast.iter_child_nodes(n))
+        return (typed & local) - other - self.declared_global
+
+    def function(self, func):
+        local = local_names(func)
+        args = func.args
+        # Names only bound to builtin objects, including the numbers of
+        # range() loops, and to instances of classes in the module
+        typed = self.names_bound_to(func, local,
+            lambda value, loop = False: self.is_range(value, local) if loop else self.is_builtin(value, set(), local),
+            [x for x in (args.vararg, args.kwarg) if x])
+        params = []
+        if func in self.methods and args.args and isinstance(args.args[0], ast.Name) and not func.decorator_list:
+            params.append(args.args[0].id)
+        known = self.names_bound_to(func, local,
+            lambda value, loop = False: not loop and isinstance(value, ast.Call) and isinstance(value.func, ast.Name) and \
+                value.func.id in self.classes and value.func.id not in local,
+            params)
+        for loop in self.loops(func.body):
+            nodes = self.region(loop)
+            stored = set()
+            stored_attrs = set()
+            for n in nodes:
+                if isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load):
+                    stored.add(n.id)
+                elif isinstance(n, ast.Attribute) and not isinstance(n.ctx, ast.Load):
+                    stored_attrs.add(n.attr)
+            iters = [n.iter for n in nodes if isinstance(n, (ast.For, ast.comprehension))]
+            if isinstance(loop, ast.For):
+                iters.append(loop.iter)
+            pure = not self.hooks and \
+                not any(isinstance(n, (ast.GeneratorExp, ast.DictComp, ast.SetComp)) for n in nodes) and \
+                all(self.is_builtin(n, typed, local) for n in iters) and \
+                all(self.is_pure(n, typed, local) for n in nodes if isinstance(n, ast.Call))
+            # Methods that are called, and loops the compiler specialises by
+            # the name of the function they call, are left alone
+            skip = set()
+            for n in nodes:
+                if isinstance(n, ast.For) and isinstance(n.iter, ast.Call):
+                    skip.add(n.iter.func)
+                elif isinstance(n, ast.Call) and isinstance(n.func, ast.Attribute):
+                    skip.add(n.func)
+
+            found = {}
+            for n in nodes:
+                if hasattr(n, "invariant") or n in skip or not isinstance(getattr(n, "ctx", None), ast.Load):
+                    continue
+                if isinstance(n, ast.Name) and self.is_global(n.id, local):
+                    key = n.id
+                    lazy = False
+                elif isinstance(n, ast.Attribute) and pure and isinstance(n.value, ast.Name) and n.attr not in stored_attrs and \
+                     ((n.value.id in known and n.value.id not in stored) or
+                      (n.value.id in self.modules and self.is_global(n.value.id, local))):
+                    key = (n.value.id, n.attr)
+                    lazy = True
+                else:
+                    continue
+                if key not in found:
+                    found[key] = Invariant(n, lazy)
+                n.invariant = found[key]
+            if found:
+                loop.invariants = getattr(loop, "invariants", []) + sorted(found.values(), key = lambda h: (h.node.lineno, h.node.col_offset))
+
+    def is_global(self, name, local):
+        return name not in local and name not in self.special and name not in self.declared_global and \
+            (name in self.module_names or name in BUILTINS)
+
+    def is_range(self, node, local):
+        """Whether node is a call of range() or xrange()."""
+        return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("range", "xrange") and \
+            node.func.id not in local and node.func.id not in self.module_names
+
+    def is_builtin(self, node, typed, local):
+        """Whether node is known to evaluate to a builtin object, that does
+        not run user code when used as an argument of a builtin, iterated
+        over or when its methods are called. Names in typed are known to be
+        bound to such objects."""
+        if isinstance(node, (ast.Num, ast.Str, ast.List, ast.Dict, ast.ListComp)):
+            return True
+        elif isinstance(node, ast.Tuple):
+            return all(self.is_builtin(x, typed, local) for x in node.elts)
+        elif isinstance(node, ast.Name):
+            return node.id in typed or node.id in ("None", "True", "False")
+        elif isinstance(node, ast.UnaryOp):
+            return self.is_builtin(node.operand, typed, local)
+        elif isinstance(node, ast.BinOp):
+            return self.is_builtin(node.left, typed, local) and self.is_builtin(node.right, typed, local)
+        elif isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id not in self.builtin_functions:
+                return False
+            elif isinstance(func, ast.Attribute) and func.attr not in self.builtin_methods:
+                return False
+            return self.is_pure(node, typed, local)
+        return False
+
+    def is_pure(self, call, typed, local):
+        func = call.func
+        if isinstance(func, ast.Name):
+            if func.id not in self.pure_functions or func.id in local or func.id in self.module_names:
+                return False
+            # Builtins call the special methods of their arguments, or
+            # iterate over them. The arguments of range() are taken to be
+            # integers.
+            if func.id in ("isinstance", "range", "xrange"):
+                return True
+            args = call.args + [k.value for k in call.keywords]
+        elif isinstance(func, ast.Attribute):
+            if func.attr not in self.pure_methods or not self.is_builtin(func.value, typed, local):
+                return False
+            # Methods compare their arguments, or iterate over them, unless
+            # they only store them
+            args = call.args[:self.storing.get(func.attr, len(call.args))] + [k.value for k in call.keywords]
+        else:
+            return False
+        return call.starargs is None and call.kwargs is None and all(self.is_builtin(a, typed, local) for a in args)
+
+PASSES = [StripAsserts, Inlining, ConstantFolding, DeadBranches, UnreachableCode, LoopInvariants]
+
+class PassManager(object):
+    """Runs the passes of optimisation level "level" on syntax trees, or the
+    passes named in "passes" if it is given.
+
+    The time spent in each pass, summed over all trees it has run on, is
+    kept in "timings", by name of the pass."""
+
+    def __init__(self, level = 0, passes = None):
+        if passes is None:
+            self.passes = [p for p in PASSES if p.level <= level]
+        else:
+            by_name = dict((p.name, p) for p in PASSES)
+            unknown = [name for name in passes if name not in by_name]
+            if unknown:
+                raise ValueError("Unknown passes: %s" % ", ".join(unknown))
+            self.passes = [by_name[name] for name in passes]
+        self.timings = dict((p.name, 0.0) for p in self.passes)
+
+    def run(self, tree):
+        for cls in self.passes:
+            start = time.time()
+            tree = cls().run(tree)
+            self.timings[cls.name] += time.time() - start
+        return ast.fix_missing_locations(tree)
+
+    def format_timings(self):
+        """The timings as lines of text, in the order the passes are run."""
+        return ["%-20s %8.2f ms" % (cls.name, self.timings[cls.name] * 1000) for cls in self.passes]
@@ -27,12 +27,12 @@
 ##
 ######################################################################
 
+import re
 import ast
 import pyjaco.compiler
 from pyjaco.compiler import JSError
 from pyjaco.compiler.multiplexer import dump
 from utils import special_globals, dotted_to_hierarchy
-from itertools import chain
 
 class Compiler(pyjaco.compiler.BaseCompiler):
 
@@ -76,10 +76,50 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         "LtE": "le",
     }
 
+    format_spec = re.compile(r"%(?:\(([^)]*)\))?(.)", re.S)
+
+    format_conversions = {
+        "s": "js(%s.PY$__str__())",
+        "r": "js(%s.PY$__repr__())",
+        "d": "js(int(%s)).toString()",
+        "i": "js(int(%s)).toString()",
+        "u": "js(int(%s)).toString()",
+    }
+
     def __init__(self, opts, **kwargs):
         super(Compiler, self).__init__(opts, **kwargs)
         self.future_division = False
         self.opts = opts
+        self._stop_raises = set()
+        # Locals of the function being compiled with --target es2015, which
+        # are declared together at its start, and its parameters
+        self._lets = None
+        self._params = set()
+
+    @property
+    def es2015(self):
+        return self.opts.get('target') == 'es2015'
+
+    @property
+    def let(self):
+        """Keyword that declares the variables of the compiler's own: "let"
+        with --target es2015 in functions and modules. The top level of a
+        script keeps "var", as all scripts share one scope for let."""
+        if self.es2015 and (self._lets is not None or self.module):
+            return "let"
+        else:
+            return "var"
+
+    def declare(self, name):
+        """Prefix for the first assignment to the Python variable name. With
+        --target es2015 the locals of a function are declared at its start
+        instead, as Python variables are not block scoped."""
+        if self.es2015 and self._lets is not None:
+            if name not in self._lets and name not in self._params:
+                self._lets.append(name)
+            return ""
+        else:
+            return "var "
 
     def stack_destiny(self, names, skip):
         for name in reversed(self.stack[:-skip]):
@@ -88,7 +128,44 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         else:
             return False
 
+    @staticmethod
+    def is_iterator_next(node):
+        """Is node a plain "def next(self)" method of an iterator class?"""
+        args = node.args
+        return node.name == "next" and len(args.args) == 1 and not (args.vararg or args.kwarg or node.decorator_list)
+
+    @staticmethod
+    def binds_next(stmt):
+        """Does stmt of a class body bind the name next?"""
+        if isinstance(stmt, ast.Assign):
+            return any(isinstance(t, ast.Name) and t.id == "next" for t in stmt.targets)
+        else:
+            return isinstance(stmt, (ast.FunctionDef, ast.ClassDef)) and stmt.name == "next"
+
+    @staticmethod
+    def is_stop_iteration(node):
+        if isinstance(node, ast.Call):
+            node = node.func
+        return isinstance(node, ast.Name) and node.id == "StopIteration"
+
+    def find_stop_raises(self, stmts):
+        """Find the "raise StopIteration" statements in stmts that leave the
+        function directly, i.e. those not inside a try-block or a nested
+        function or class."""
+        res = set()
+        for stmt in stmts:
+            if isinstance(stmt, ast.Raise) and self.is_stop_iteration(stmt.type):
+                res.add(stmt)
+            elif isinstance(stmt, (ast.If, ast.For, ast.While)):
+                res.update(self.find_stop_raises(stmt.body))
+                res.update(self.find_stop_raises(stmt.orelse))
+        return res
+
     def visit_Name(self, node):
+        invariant = getattr(node, "invariant", None)
+        if invariant is not None and invariant.var is not None:
+            return invariant.var
+
         name = self.name_map.get(node.id, node.id)
         
         if name in special_globals.keys():
@@ -116,8 +193,24 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         self._vars.extend(node.names)
         return []
 
+    @staticmethod
+    def is_constant(node):
+        return isinstance(node, (ast.Num, ast.Str)) or (isinstance(node, ast.Name) and node.id in ("None", "True", "False"))
+
     def visit_FunctionDef(self, node):
-        defaults = [None] * (len(node.args.args) - len(node.args.defaults)) + node.args.defaults
+        # Like in python, defaults are evaluated when the function is
+        # defined. Those that are not constants are passed in to a function
+        # that makes the function, so that each definition keeps its own.
+        captured = []
+        default_values = []
+        for default in node.args.defaults:
+            if self.is_constant(default):
+                default_values.append(self.visit(default))
+            else:
+                var = self.alloc_var()
+                captured.append((var, self.visit(default)))
+                default_values.append(var)
+        defaults = [None] * (len(node.args.args) - len(node.args.defaults)) + default_values
 
         if node.args.kwarg:
             kwarg_name = node.args.kwarg
@@ -136,78 +229,197 @@ class Compiler(pyjaco.compiler.BaseCompiler):
 
         inclass = self.stack_destiny(["ClassDef", "FunctionDef"], 2) in ["ClassDef"]
 
+        bind_args = self.opts.get('bind_args')
+        if bind_args:
+            for arg in node.args.args[offset:]:
+                if not isinstance(arg, ast.Name):
+                    raise JSError("tuples in argument list are not supported")
+            names = [self.name_map.get(arg.id, arg.id) for arg in node.args.args[offset:]]
+            # The spec $PY.bind binds the arguments by is made once, along
+            # with the defaults
+            spec = self.alloc_var()
+            captured.append((spec, self.bind_spec(node, offset)))
+
+        # With --target es2015 the arguments are taken as a rest parameter
+        # where they are not bound to parameters of the function itself, and
+        # the defaults of those are default parameters.
+        args = "arguments"
+        if self.es2015 and not (bind_args and not (node.args.vararg or node.args.kwarg)):
+            args = self.alloc_var()
+            params = "..." + args
+        elif bind_args and self.es2015:
+            params = ", ".join(names)
+            if node.args.defaults:
+                params = ", ".join(names[:-len(default_values)] + ["%s = %s" % (name, default)
+                    for name, default in zip(names[-len(default_values):], default_values)])
+        elif bind_args:
+            params = ", ".join(names)
+        else:
+            params = ""
+
+        if captured:
+            start = "(function(%s) { return function(%s) {" % (", ".join(var for var, value in captured), params)
+            end = "}; })(%s)" % ", ".join(value for var, value in captured)
+        else:
+            start = "function(%s) {" % params
+            end = "}"
         if inclass:
-            js = ["function() {"]
+            js = [start]
         elif self.module:
-            js = ["%s = function() {" % self.build_ref(node.name)]
+            js = ["%s = %s" % (self.build_ref(node.name), start)]
             self._funcs.append(self.build_ref(node.name))
         else:
-            js = ["var %s = function() {" % (node.name)]
+            js = ["%s%s = %s" % (self.declare(node.name), node.name, start)]
             self._funcs.append(node.name)
 
         self.push_scope()
+        outer = self._lets, self._params
+        self._lets = []
+        self._params = set(arg.id for arg in node.args.args if isinstance(arg, ast.Name))
+        self._params.update([kwarg_name, vararg_name])
 
         self._vars = [arg.id for arg in node.args.args]
         
         self.increase_indent()
 
         if inclass or offset == 1:
-            js.extend(self.indent(["var self = this;"]))
+            js.extend(self.indent(["%s self = this;" % self.let]))
+            self._params.add("self")
+
+        if bind_args:
+            js.extend(self.indent(self.bind_args(node, offset, default_values, spec, args)))
+        else:
+            js.extend(self.indent(self.unpack_args(node, offset, defaults, kwarg_name, vararg_name, inclass, args)))
+        prologue = len(js)
+
+        if node.name in ["__getattr__", "__setattr__"]:
+            js.extend(self.indent(["if (typeof %(id)s === 'string') { %(id)s = str(%(id)s); };" % { 'id': node.args.args[1].id }]))
+
+        for stmt in node.body:
+            js.extend(self.indent(self.visit(stmt)))
+
+        if self._lets:
+            js[prologue:prologue] = self.indent("let %s;" % ", ".join(self._lets))
+        self._lets, self._params = outer
+        self.pop_scope()
+        if not (node.body and isinstance(node.body[-1], ast.Return)):
+            js.extend(self.indent("return None;"))
+        
+        self.decrease_indent()
+        js.extend(self.indent(end if inclass else end + ";"))
 
+        for dec in node.decorator_list:
+            js.extend(["%s.PY$%s = %s(%s.PY$__getattr__('%s'));" % (self.heirar, node.name, self.visit(dec), self.heirar, node.name)])
+
+        return js
+
+    def full_name(self, node):
+        """Name of function node in messages, with the class name for methods."""
+        if len(self._class_name):
+            return "%s.%s" % (self._class_name[-1], node.name)
+        else:
+            return node.name
+
+    def unpack_args(self, node, offset, defaults, kwarg_name, vararg_name, inclass, args = "arguments"):
+        """Prologue of function node that takes the parameter values from the
+        arguments (or the array args of them), one parameter at a time.
+        defaults holds the javascript values of the defaults, or None, for
+        each parameter."""
+        js = []
         newargs = self.alloc_var()
 
-        js.extend(self.indent(["var %s = __kwargs_get(arguments);" % kwarg_name]))
-        js.extend(self.indent(["var %s = __varargs_get(arguments);" % vararg_name]))
-        js.extend(self.indent(["var %s = Array.prototype.slice.call(arguments).concat(js(%s));" % (newargs, vararg_name)]))
+        js.append("%s %s = __kwargs_get(%s);" % (self.let, kwarg_name, args))
+        js.append("%s %s = __varargs_get(%s);" % (self.let, vararg_name, args))
+        if args == "arguments":
+            js.append("var %s = Array.prototype.slice.call(arguments).concat(js(%s));" % (newargs, vararg_name))
+        else:
+            js.append("%s %s = %s.concat(js(%s));" % (self.let, newargs, args, vararg_name))
         for i, arg in enumerate(node.args.args[offset:]):
             if not isinstance(arg, ast.Name):
                 raise JSError("tuples in argument list are not supported")
 
-            values = dict(i = i, id = self.visit(arg), rawid = arg.id, kwarg = kwarg_name, newargs = newargs, func = node.name, indent = self.indention)
-            if len(self._class_name):
-                values['fullfunc'] = "%s.%s" % (self._class_name[-1], node.name)
-            else:
-                values['fullfunc'] = node.name
+            values = dict(i = i, id = self.visit(arg), rawid = arg.id, kwarg = kwarg_name, newargs = newargs, func = node.name, indent = self.indention, let = self.let)
+            values['fullfunc'] = self.full_name(node)
 
             if defaults[i + offset] == None:
-                js.extend(self.indent(["var %(id)s = ('%(rawid)s' in %(kwarg)s) ? %(kwarg)s['%(rawid)s'] : %(newargs)s[%(i)d];" % values]))
+                js.append("%(let)s %(id)s = ('%(rawid)s' in %(kwarg)s) ? %(kwarg)s['%(rawid)s'] : %(newargs)s[%(i)d];" % values)
             else:
-                values['default'] = self.visit(defaults[i + offset])
-                js.extend(self.indent(["var %(id)s = %(newargs)s[%(i)d];" % values]))
-                js.extend(self.indent(["if (%(id)s === undefined) { %(id)s = %(kwarg)s.%(rawid)s === undefined ? %(default)s : %(kwarg)s.%(rawid)s; };" % values]))
-            js.extend(self.indent(["delete %(kwarg)s.%(id)s" % values]))
+                values['default'] = defaults[i + offset]
+                js.append("%(let)s %(id)s = %(newargs)s[%(i)d];" % values)
+                js.append("if (%(id)s === undefined) { %(id)s = %(kwarg)s.%(rawid)s === undefined ? %(default)s : %(kwarg)s.%(rawid)s; };" % values)
+            js.append("delete %(kwarg)s.%(id)s" % values)
             if self.opts['check_params']:
-                js.extend(self.indent([
+                js.extend([
                     "if (%(id)s === undefined) {" % values,
                     "%(indent)s__builtins__.PY$print('%(fullfunc)s() did not get parameter %(id)s');"  % values,
                     "};"
-                ]))
-
-        if node.name in ["__getattr__", "__setattr__"]:
-            js.extend(self.indent(["if (typeof %(id)s === 'string') { %(id)s = str(%(id)s); };" % { 'id': node.args.args[1].id }]))
+                ])
 
         if node.args.kwarg:
-            js.extend(self.indent(["%s = dict(%s);" % (node.args.kwarg, node.args.kwarg)]))
+            js.append("%s = dict(%s);" % (node.args.kwarg, node.args.kwarg))
 
         if node.args.vararg:
             l = len(node.args.args)
             if inclass:
                 l -= 1
-            js.extend(self.indent(["%s = tuple(%s.slice(%s));" % (node.args.vararg, newargs, l)]))
+            js.append("%s = tuple(%s.slice(%s));" % (node.args.vararg, newargs, l))
 
-        for stmt in node.body:
-            js.extend(self.indent(self.visit(stmt)))
+        return js
 
-        self.pop_scope()
-        if not (node.body and isinstance(node.body[-1], ast.Return)):
-            js.extend(self.indent("return None;"))
-        
-        self.decrease_indent()
-        js.extend(self.indent("}"))
+    def bind_spec(self, node, offset):
+        """The javascript object that describes the parameters of function
+        node to $PY.bind."""
+        args = node.args
+        required = max(len(args.args) - len(args.defaults), offset) - offset
+        return "{name: '%s', args: [%s], required: %d, offset: %d, varargs: %s, kwargs: %s}" % (
+            node.name, ", ".join("'%s'" % arg.id for arg in args.args[offset:]), required, offset,
+            "true" if args.vararg else "false", "true" if args.kwarg else "false")
+
+    def bind_args(self, node, offset, default_values, spec, rest = "arguments"):
+        """Prologue of function node that takes the parameter values from the
+        arguments through $PY.bind, for --bind-args. Calls with just the
+        positional arguments the function takes only check the number of
+        arguments, and that the last one is not a keyword or *args marker.
+        Functions with *args or **kwargs bind rest, the array of arguments
+        with --target es2015. default_values holds the javascript values of
+        the defaults, and spec the variable that holds bind_spec()."""
+        args = node.args
+        names = [self.name_map.get(arg.id, arg.id) for arg in args.args[offset:]]
+        required = max(len(args.args) - len(args.defaults), offset) - offset
 
-        for dec in node.decorator_list:
-            js.extend(["%s.PY$%s = %s(%s.PY$__getattr__('%s'));" % (self.heirar, node.name, self.visit(dec), self.heirar, node.name)])
+        js = []
+        bound = self.alloc_var()
+        defaults = []
+        for i, default in enumerate(default_values):
+            name = names[len(names) - len(default_values) + i]
+            defaults.append("if (%s === undefined) { %s = %s; }" % (name, name, default))
+
+        if args.vararg or args.kwarg:
+            js.append("%s %s = $PY.bind(%s, %s);" % (self.let, bound, rest, spec))
+            declare = "" if rest == "arguments" else "let "
+            js.extend("%s%s = %s[%d];" % (declare, name, bound, i) for i, name in enumerate(names))
+            extra = [x for x in (args.vararg, args.kwarg) if x]
+            js.extend("%s %s = %s[%d];" % (self.let, name, bound, len(names) + i) for i, name in enumerate(extra))
+        else:
+            count = self.alloc_var()
+            last = "arguments[%s - 1]" % count
+            slow = ["%s > %d" % (count, len(names))]
+            if required:
+                slow.insert(0, "%s < %d" % (count, required))
+            if names:
+                slow.append("(%s > 0 && %s !== undefined && (%s.__kwargs === true || %s.__varargs === true))" % (count, last, last, last))
+            js.append("%s %s = arguments.length;" % (self.let, count))
+            js.append("if (%s) {" % " || ".join(slow))
+            js.append("%s%s %s = $PY.bind(arguments, %s);" % (self.indention, self.let, bound, spec))
+            if names:
+                js.append("%s%s" % (self.indention, " ".join("%s = %s[%d];" % (name, bound, i) for i, name in enumerate(names))))
+            if self.es2015:
+                # Default parameters only cover the calls that are not bound
+                js.extend("%s%s" % (self.indention, x) for x in defaults)
+                defaults = []
+            js.append("}")
 
+        js.extend(defaults)
         return js
 
     def visit_ClassDef(self, node):
@@ -230,7 +442,7 @@ class Compiler(pyjaco.compiler.BaseCompiler):
             js.append("__inherit(%s, '%s', %s);" % (bases[0], class_name, use_prototypes))
         else:
             js.append("%s%s = __inherit(%s, '%s', %s);" % (
-                    "" if self.module else "var ",
+                    "" if self.module else self.declare(class_ref),
                     class_ref,
                     bases[0],
                     class_name,
@@ -246,6 +458,14 @@ class Compiler(pyjaco.compiler.BaseCompiler):
                 value = self.visit(stmt.value)
                 for t in stmt.targets:
                     js.append("%s.PY$%s = %s;" % (heirar, t.id, value))
+            elif isinstance(stmt, ast.FunctionDef) and self.is_iterator_next(stmt):
+                # Iterators get a next() method for the internal iteration
+                # protocol, which returns null instead of raising StopIteration
+                self.heirar = heirar
+                self._stop_raises = self.find_stop_raises(stmt.body)
+                js.append("%s.next = $PY.next_method(%s);" % (heirar, "\n".join(self.visit(stmt))))
+                js.append("%s.PY$next = $PY.py_next(%s.next);" % (heirar, heirar))
+                self._stop_raises = set()
             elif isinstance(stmt, ast.FunctionDef):
                 self.heirar = heirar
                 js.append("%s.PY$%s = %s;" % (heirar, stmt.name, "\n".join(self.visit(stmt))))
@@ -258,6 +478,12 @@ class Compiler(pyjaco.compiler.BaseCompiler):
                 pass
             else:
                 raise JSError("Unsupported class data: %s" % stmt)
+            if self.binds_next(stmt) and not (isinstance(stmt, ast.FunctionDef) and self.is_iterator_next(stmt)):
+                # Any other next() replaces the one of the base class for the
+                # internal iteration protocol too
+                js.append("%s.next = $PY.next_from_py;" % heirar)
+        if any(isinstance(stmt, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__slots__" for t in stmt.targets) for stmt in node.body):
+            js.append("$PY.set_slots(%s);" % heirar)
         self._class_name.pop()
         self.pop_scope()
 
@@ -280,19 +506,55 @@ class Compiler(pyjaco.compiler.BaseCompiler):
 
         return js
 
+    def visit_Assign(self, node):
+        target = node.targets[0]
+        if (len(node.targets) == 1 and isinstance(target, (ast.Tuple, ast.List)) and
+                isinstance(node.value, (ast.Tuple, ast.List)) and len(target.elts) == len(node.value.elts)):
+            # "a, b = b, a": evaluate the right hand side into temporaries and
+            # assign those, without building a tuple. Constants need no
+            # temporary.
+            js = []
+            values = []
+            for elt in node.value.elts:
+                value = self.visit(elt)
+                if not isinstance(elt, (ast.Num, ast.Str)):
+                    tmp = self.alloc_var()
+                    js.append("%s %s = %s;" % (self.let, tmp, value))
+                    value = tmp
+                values.append(value)
+            for elt, value in zip(target.elts, values):
+                js.extend(self.visit_AssignSimple(elt, value))
+            return js
+        else:
+            return super(Compiler, self).visit_Assign(node)
+
+    def unpack_items(self, value, count):
+        """Javascript expression for the array of items to unpack from
+        "value" (a plain javascript name) into "count" targets. Lists and
+        tuples of the right length give their item array as is."""
+        return "((%s.PY$__class__ === tuple || %s.PY$__class__ === list) && %s.items.length === %d) ? %s.items : $PY.unpack(%s, %d)" % (
+            value, value, value, count, value, value, count)
+
     def visit_AssignSimple(self, target, value):
         if isinstance(target, (ast.Tuple, ast.List)):
             dummy = self.alloc_var()
-            js = ["var %s = %s;" % (dummy, value)]
+            items = self.alloc_var()
+            js = ["%s %s = %s;" % (self.let, dummy, value)]
+            js.append("%s %s = %s;" % (self.let, items, self.unpack_items(dummy, len(target.elts))))
 
-            for i, target in enumerate(target.elts):
-                var = self.visit(target)
-                declare = ""
-                if isinstance(target, ast.Name):
-                    if not (var in self._vars):
-                        self._vars.append(var)
-                        declare = "var "
-                js.append("%s%s = %s.PY$__getitem__(%d);" % (declare, var, dummy, i))
+            if all(isinstance(elt, ast.Name) for elt in target.elts):
+                for i, elt in enumerate(target.elts):
+                    js.extend(self.visit_AssignSimple(elt, "%s[%d]" % (items, i)))
+            else:
+                # Assigning to an item or attribute could change the list being
+                # unpacked, so take all values out first
+                values = []
+                for i in range(len(target.elts)):
+                    tmp = self.alloc_var()
+                    js.append("%s %s = %s[%d];" % (self.let, tmp, items, i))
+                    values.append(tmp)
+                for elt, tmp in zip(target.elts, values):
+                    js.extend(self.visit_AssignSimple(elt, tmp))
         elif isinstance(target, ast.Subscript) and isinstance(target.slice, ast.Index):
             # found index assignment
             js = ["%s.PY$__setitem__(%s, %s);" % (self.visit(target.value), self.visit(target.slice), value)]
@@ -308,10 +570,10 @@ class Compiler(pyjaco.compiler.BaseCompiler):
                 if not var in self.local_scope:
                     self._vars.append(var)
                     if not self.module or not var.startswith(self.module_ref):
-                        declare = "var "
+                        declare = self.declare(var)
                 js = ["%s%s = %s;" % (declare, var, value)]
             elif isinstance(target, ast.Attribute):
-                js = ["%s.PY$__setattr__('%s', %s);" % (self.visit(target.value), str(target.attr), value)]
+                js = self.visit_SetAttr(target, value)
             else:
                 raise JSError("Unsupported assignment type")
         return js
@@ -333,12 +595,13 @@ class Compiler(pyjaco.compiler.BaseCompiler):
     def visit_For(self, node):
         if isinstance(node.target, ast.Name):
             for_target = self.visit(node.target)
-        elif isinstance(node.target, ast.Tuple):
+        elif isinstance(node.target, (ast.Tuple, ast.List)):
             for_target = self.alloc_var()
         else:
             raise JSError("Advanced for-loop decomposition not supported")
+        unpack = []
 
-        js = []
+        js = self.loop_invariants(node)
 
         if isinstance(node.iter, ast.Call) and isinstance(node.iter.func, ast.Name) and node.iter.func.id == "range" and not node.orelse:
             counter  = self.visit(node.target)
@@ -357,10 +620,11 @@ class Compiler(pyjaco.compiler.BaseCompiler):
                 end   = self.visit(node.iter.args[1])
                 step  = self.visit(node.iter.args[2])
 
-            js.append("%s = %s;" % (end_var, end))
+            js.extend(self.for_declare([counter]))
+            js.append("%s %s = %s;" % (self.let, end_var, end))
             if step <> "$c1":
                 step_var = self.alloc_var()
-                js.append("%s = %s;" % (step_var, step));
+                js.append("%s %s = %s;" % (self.let, step_var, step));
             else:
                 step_var = step
             js.append("for (%s = %s; %s.PY$__lt__(%s) == True; %s = %s.PY$__add__(%s)) {" % (counter, start, counter, end_var, counter, counter, step_var))
@@ -370,22 +634,21 @@ class Compiler(pyjaco.compiler.BaseCompiler):
             return js
 
 
-        for_iter = self.visit(node.iter)
-
-        iter_var = self.alloc_var()
-        exc_var = self.alloc_var()
-
         if node.orelse:
             orelse_var = self.alloc_var()
-            js.append("var %s = true;" % orelse_var)
+            js.append("%s %s = true;" % (self.let, orelse_var))
 
-        js.append("var %s;" % for_target);
-        for_init = "var %s = iter(%s)" % (iter_var, for_iter)
-        for_iter = "%s = $PY.next(%s)" % (for_target, iter_var)
-        for_cond = "%s !== null" % (for_target)
-        js.append("  for (%s; %s; %s) {" % (for_init, for_iter, for_cond))
-        if isinstance(node.target, ast.Tuple):
-            js.append("    %s;" % "; ".join(["var %s = %s.PY$__getitem__(%s)" % (x.id, for_target, i) for i, x in enumerate(node.target.elts)]))
+        setup, for_cond = self.for_special(node)
+        if setup is None:
+            setup, item = self.for_cursor(self.visit(node.iter))
+            for_cond = "(%s = %s) !== null" % (for_target, item)
+            setup.extend(self.for_declare([for_target]))
+            if isinstance(node.target, (ast.Tuple, ast.List)):
+                unpack = self.visit_AssignSimple(node.target, for_target)
+
+        js.extend(setup)
+        js.append("  for (; %s; ) {" % for_cond)
+        js.extend(self.indent(unpack))
 
         for stmt in node.body:
             js.extend(self.indent(self.visit(stmt)))
@@ -400,16 +663,145 @@ class Compiler(pyjaco.compiler.BaseCompiler):
 
         return js
 
-    def visit_While(self, node):
+    def for_cursor(self, seq, fixed = False):
+        """Set up a walk over the Python iterable "seq" (a javascript
+        expression). Lists and tuples are walked by index, anything else
+        falls back to iter(). Returns the setup statements and an expression
+        giving the next item, or null at the end. With "fixed", a copy of the
+        list is walked, so changes to it during the walk are not seen."""
+        seq_var = self.alloc_var()
+        iter_var = self.alloc_var()
+        index_var = self.alloc_var()
+        setup = [
+            "%s %s = %s;" % (self.let, seq_var, seq),
+            "%s %s = (%s.PY$__class__ === list || %s.PY$__class__ === tuple) ? null : iter(%s);" % (self.let, iter_var, seq_var, seq_var, seq_var),
+            "%s %s = 0;" % (self.let, index_var),
+        ]
+        if fixed:
+            items = self.alloc_var()
+            setup.append("%s %s = (%s === null) ? %s.items.slice() : null;" % (self.let, items, iter_var, seq_var))
+        else:
+            items = "%s.items" % seq_var
+        item = "(%s === null ? (%s < %s.length ? %s[%s++] : null) : $PY.next(%s))" % (
+            iter_var, index_var, items, items, index_var, iter_var)
+        return setup, item
+
+    def for_names(self, elts):
+        """Javascript names for the targets of a for loop, or None if they are
+        not all plain names."""
+        if not all(isinstance(x, ast.Name) for x in elts):
+            return None
+        return [self.visit(x) for x in elts]
+
+    def for_declare(self, names):
+        js = []
+        for x in names:
+            if "." not in x and self.declare(x):
+                js.append("var %s;" % x)
+        return js
+
+    dict_loops = {
+        "items": (True, 2), "iteritems": (False, 2),
+        "keys": (True, 0), "iterkeys": (False, 0),
+        "values": (True, 1), "itervalues": (False, 1),
+    }
+
+    def for_special(self, node):
+        """Specialised loops over dict methods, enumerate() and zip(), which
+        walk the underlying storage instead of building tuples. Returns the
+        setup statements and the loop condition, or (None, None) for loops
+        that take the general path."""
+        call = node.iter
+        if not isinstance(call, ast.Call) or call.keywords or call.starargs or call.kwargs:
+            return None, None
+        if isinstance(node.target, ast.Tuple):
+            names = self.for_names(node.target.elts)
+        else:
+            names = self.for_names([node.target])
+        if names is None:
+            return None, None
+
+        func = call.func
+        if isinstance(func, ast.Attribute) and func.attr in self.dict_loops and not call.args:
+            copy, kind = self.dict_loops[func.attr]
+            if len(names) != (2 if kind == 2 else 1):
+                return None, None
+            dict_var = self.alloc_var()
+            items_var = self.alloc_var()
+            iter_var = self.alloc_var()
+            index_var = self.alloc_var()
+            # Items of a dict are stored as [key, value, key, value, ...]
+            setup = [
+                "%s %s = %s;" % (self.let, dict_var, self.visit(func.value)),
+                "%s %s = (%s.PY$__class__ === dict) ? %s.items%s : null;" % (self.let, items_var, dict_var, dict_var, ".slice()" if copy else ""),
+                "%s %s = (%s === null) ? iter($PY.callmethod(%s, 'PY$%s', '%s')) : null;" % (self.let, iter_var, items_var, dict_var, func.attr, func.attr),
+                "%s %s = 0;" % (self.let, index_var),
+            ]
+            setup.extend(self.for_declare(names))
+            if kind == 2:
+                item_var = self.alloc_var()
+                setup.append("%s %s;" % (self.let, item_var))
+                fast = "((%s = %s[%s]), (%s = %s[%s + 1]), (%s += 2), true)" % (
+                    names[0], items_var, index_var, names[1], items_var, index_var, index_var)
+                slow = "(%s = $PY.next(%s)) !== null && ((%s = %s.PY$__getitem__(0)), (%s = %s.PY$__getitem__(1)), true)" % (
+                    item_var, iter_var, names[0], item_var, names[1], item_var)
+            else:
+                fast = "((%s = %s[%s + %d]), (%s += 2), true)" % (names[0], items_var, index_var, kind, index_var)
+                slow = "(%s = $PY.next(%s)) !== null" % (names[0], iter_var)
+            cond = "%s !== null ? (%s < %s.length && %s) : (%s)" % (items_var, index_var, items_var, fast, slow)
+            return setup, cond
+
+        if not isinstance(func, ast.Name):
+            return None, None
+        name = self.visit(func)
+        if name == "__builtins__.PY$enumerate" and len(call.args) in (1, 2) and len(names) == 2:
+            setup, item = self.for_cursor(self.visit(call.args[0]))
+            count_var = self.alloc_var()
+            if len(call.args) == 2:
+                setup.append("%s %s = js(%s);" % (self.let, count_var, self.visit(call.args[1])))
+            else:
+                setup.append("%s %s = 0;" % (self.let, count_var))
+            setup.extend(self.for_declare(names))
+            cond = "(%s = %s) !== null && ((%s = $PY.mkint(%s++)), true)" % (names[1], item, names[0], count_var)
+            return setup, cond
+        elif name == "__builtins__.PY$zip" and isinstance(node.target, (ast.Tuple, ast.List)) and len(call.args) > 0 and len(names) == len(call.args):
+            # zip() returns a list made up front, so changes to the lists in
+            # the loop must not be seen
+            setup = []
+            conds = []
+            for arg, target in zip(call.args, names):
+                arg_setup, item = self.for_cursor(self.visit(arg), fixed = True)
+                setup.extend(arg_setup)
+                conds.append("(%s = %s) !== null" % (target, item))
+            setup.extend(self.for_declare(names))
+            return setup, " && ".join(conds)
+        return None, None
+
+    def loop_invariants(self, node):
+        """Read the values that do not change in loop node, as found by the
+        loop-invariants pass, into variables before the loop. Attributes are
+        read on first use in the loop, as they may not exist."""
         js = []
+        for invariant in getattr(node, "invariants", []):
+            if invariant.lazy:
+                invariant.var = self.alloc_var()
+                js.append("%s %s = undefined;" % (self.let, invariant.var))
+            else:
+                value = self.visit(invariant.node)
+                invariant.var = self.alloc_var()
+                js.append("%s %s = %s;" % (self.let, invariant.var, value))
+        return js
+
+    def visit_While(self, node):
+        js = self.loop_invariants(node)
 
         if node.orelse:
             orelse_var = self.alloc_var()
-            js.append("var %s = true;" % orelse_var)
+            js.append("%s %s = true;" % (self.let, orelse_var))
 
         js.append("while (bool(%s) === True) {" % self.visit(node.test))
         if node.orelse:
-            js.extend(self.indent(["var %s = true;" % orelse_var]))
+            js.extend(self.indent(["%s %s = true;" % (self.let, orelse_var)]))
 
         for stmt in node.body:
             js.extend(self.indent(self.visit(stmt)))
@@ -471,7 +863,7 @@ class Compiler(pyjaco.compiler.BaseCompiler):
 
             if n.name:
                 if isinstance(n.name, ast.Name):
-                    js.append(self.indent(["var %s = %s;" % (self.visit(n.name), err)])[0])
+                    js.append(self.indent(["%s%s = %s;" % (self.declare(self.visit(n.name)), self.visit(n.name), err)])[0])
                 else:
                     raise JSError("Catching non-simple exceptions not supported")
 
@@ -491,7 +883,7 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         js = []
         exc_var = self.alloc_var()
         exc_store = self.alloc_var()
-        js.append("var %s;" % exc_store)
+        js.append("%s %s;" % (self.let, exc_store))
         js.append("try {")
         for n in node.body:
             js.append("\n".join(self.visit(n)))
@@ -513,15 +905,15 @@ class Compiler(pyjaco.compiler.BaseCompiler):
                     y = x.replace('.', '.PY$') 
                     ts = []
                     if not i and not x in self.local_scope:
-                        stmt = "var %(x)s;"
-                        ts.append(stmt)
+                        if self.declare(x):
+                            ts.append("var %(x)s;")
                         self._vars.append(x)
                     stmt = "%(y)s = %(y)s || module('%(x)s', '<empty placeholder>', {});"
                     ts.append(stmt)
                     stmts.extend([t % {"x": x, "y": y} for t in ts])
                 del stmts[-1]
             elif not var in self.local_scope:
-                declare = "var "
+                declare = self.declare(var)
                 self._vars.append(var)
             stmt = "%s%s = __import__('%s', js(__module__));" % (declare, var, node.name)
             stmts.append(stmt)
@@ -537,38 +929,22 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         elif node.module == "__javascript__":
             raise JSError("import from __javascript__ is not supported yet")
         else:
-            module = node.module
-            catch_var = self.alloc_var()
-            stmts.append("var %s;" % catch_var)
-            for node in node.names:
-                var = node.asname if node.asname else node.name
+            names = []
+            for alias in node.names:
+                var = alias.asname if alias.asname else alias.name
                 if not var in self.local_scope:
-                    declare = "var "
+                    if self.declare(var):
+                        stmts.append("var %s;" % var)
                     self._vars.append(var)
-                else:
-                    declare = ""
-                stmt = []
-                stmt.append("%s%s%s = __import__('%s', js(__module__)).PY$__getattr__('%s');" % (
-                        self.indention,
-                        declare,
-                        var,
-                        module,
-                        node.name
-                    )
-                )
-                stmt.append("} catch (%s) {" % catch_var)
-                stmt.append("%sif ($PY.isinstance(%s, __builtins__.PY$AttributeError)) {" % (self.indention, catch_var))
-                stmt.append("%s%sthrow __builtins__.PY$ImportError('Could not find %s');" % (
-                        self.indention,
-                        self.indention,
-                        node.name
-                    )
-                )
-                stmt.append("%s} else {" % self.indention)
-                stmt.append("%s%sthrow %s;" % (self.indention, self.indention, catch_var))
-                stmt.append("%s}" % self.indention)
-                stmt.append("}")
-                stmts.append("\n".join(chain(["try {"], self.indent(stmt))))
+                names.append(var)
+            call = "$PY.import_from(__import__('%s', js(__module__)), [%s])" % (
+                node.module, ", ".join("'%s'" % alias.name for alias in node.names))
+            if len(names) == 1:
+                stmts.append("%s = %s[0];" % (names[0], call))
+            else:
+                values = self.alloc_var()
+                stmts.append("%s %s = %s;" % (self.let, values, call))
+                stmts.extend("%s = %s[%d];" % (var, values, i) for i, var in enumerate(names))
         return stmts
 
     def visit_Lambda(self, node):
@@ -588,7 +964,7 @@ class Compiler(pyjaco.compiler.BaseCompiler):
 
         if assign:
             var = self.alloc_var()
-            return "function() { var %s; %s; return %s; }()" % (var, op.join(["bool(%s = %s) === True" % (var, self.visit(val)) for val in node.values]), var)
+            return "function() { %s %s; %s; return %s; }()" % ("let" if self.es2015 else "var", var, op.join(["bool(%s = %s) === True" % (var, self.visit(val)) for val in node.values]), var)
         else:
             return op.join(["bool(%s) === True" % self.visit(val) for val in node.values])
 
@@ -600,7 +976,94 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         else:
             raise JSError("Unsupported unary op %s" % node.op)
 
+    def parse_format(self, fmt):
+        """Split a %-format string into alternating literal strings and
+        (name, conversion) pairs. Returns None if the format uses anything
+        but plain %s, %r and %d conversions."""
+        parts = []
+        literal = ""
+        i = 0
+        while i < len(fmt):
+            if fmt[i] != "%":
+                literal += fmt[i]
+                i += 1
+                continue
+            m = self.format_spec.match(fmt, i)
+            if not m:
+                return None
+            name, conv = m.groups()
+            if conv == "%" and name is None:
+                literal += "%"
+            elif conv in self.format_conversions:
+                parts.extend([literal, (name, conv)])
+                literal = ""
+            else:
+                return None
+            i = m.end()
+        parts.append(literal)
+        return parts
+
+    def visit_Format(self, fmt, args):
+        """Compile "literal % args" to string concatenation, for simple
+        formats with a tuple, dict or constant on the right. Returns None if
+        the runtime formatter is needed."""
+        parts = self.parse_format(fmt)
+        if parts is None or len(parts) == 1:
+            return None
+
+        names = [name for name, conv in parts[1::2]]
+        if names.count(None) == len(names):
+            if isinstance(args, ast.Tuple):
+                values = args.elts
+            elif isinstance(args, (ast.Num, ast.Str)):
+                values = [args]
+            else:
+                return None
+            if len(values) != len(names):
+                return None
+        elif names.count(None) == 0 and isinstance(args, ast.Dict):
+            if not all(isinstance(key, ast.Str) for key in args.keys):
+                return None
+            mapping = dict((key.s, value) for key, value in zip(args.keys, args.values))
+            if len(mapping) != len(args.keys) or not set(names) <= set(mapping):
+                return None
+            # Only values that are cheap and side-effect free may be skipped
+            # or evaluated more than once
+            for key, value in mapping.iteritems():
+                if names.count(key) == 0 and not isinstance(value, (ast.Num, ast.Str)):
+                    return None
+                if names.count(key) > 1 and not isinstance(value, (ast.Name, ast.Num, ast.Str)):
+                    return None
+            # The other values are evaluated in the order of the format, which
+            # has to be their order in the dict
+            calls = [key.s for key, value in zip(args.keys, args.values) if not isinstance(value, (ast.Name, ast.Num, ast.Str))]
+            if [name for name in names if name in calls] != calls:
+                return None
+            values = [mapping[name] for name in names]
+        else:
+            return None
+
+        code = []
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                if part:
+                    code.append(repr(part).lstrip("urb"))
+            else:
+                value = values[i // 2]
+                if part[1] == "s" and isinstance(value, ast.Str):
+                    code.append(repr(value.s).lstrip("urb"))
+                elif part[1] != "r" and isinstance(value, ast.Num) and isinstance(value.n, (int, long)):
+                    code.append(repr(str(value.n)))
+                else:
+                    code.append(self.format_conversions[part[1]] % self.visit(value))
+        return self.str_value(" + ".join(code))
+
     def visit_BinOp(self, node):
+        if isinstance(node.op, ast.Mod) and isinstance(node.left, ast.Str):
+            res = self.visit_Format(node.left.s, node.right)
+            if res is not None:
+                return res
+
         left = self.visit(node.left)
         right = self.visit(node.right)
 
@@ -637,15 +1100,20 @@ class Compiler(pyjaco.compiler.BaseCompiler):
             raise JSError("Unknown comparison type %s" % node.ops[0])
 
     def visit_Num(self, node):
-        if isinstance(node.n, (int, long)):
+        if isinstance(node.n, (int, long)) and self.opts.get('raw_numbers'):
+            if -2**53 <= node.n <= 2**53:
+                return "(%s)" % str(node.n)
+            else:
+                raise JSError("Long integer type outside of javascript range")
+        elif isinstance(node.n, (int, long)):
             if (0 <= node.n <= 9):
                 return "$c%s" % str(node.n)
             elif -2**30 < node.n < 2**30:
-                return "int(%s)" % str(node.n)
+                return "$PY.mkint(%s)" % str(node.n)
             else:
                 raise JSError("Long integer type outside of javascript range")
         elif isinstance(node.n, float):
-            return "float(%s)" % node.n
+            return "$PY.mkfloat(%s)" % repr(node.n)
         else:
             raise JSError("Unknown numeric type: %s" % node.n.__class__.__name__)
 
@@ -653,12 +1121,31 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         # Uses the Python builtin repr() of a string and the strip string type
         # from it. This is to ensure Javascriptness, even when they use things
         # like b"\\x00" or u"\\u0000".
-        return "str(%s)" % repr(node.s).lstrip("urb")
+        return self.str_value(repr(node.s).lstrip("urb"))
+
+    def str_value(self, code):
+        """Make a python str from javascript string expression "code"."""
+        if self.opts.get('raw_strings'):
+            return "(%s)" % code
+        else:
+            return "str(%s)" % code
+
+    def is_method_call(self, node):
+        return isinstance(node.func, ast.Attribute) and not (node.func.attr.startswith("__") and self.obey_getattr_restriction)
+
+    def is_super_call(self, node):
+        """Is node "super(cls, name)", with the builtin super?"""
+        return (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and
+                len(node.args) == 2 and isinstance(node.args[1], ast.Name) and
+                not (node.keywords or node.starargs or node.kwargs) and
+                self.visit(node.func) == "Super")
 
     def visit_Call(self, node):
         js = []
-        func = self.visit(node.func)
-        compound = ("Assign" in self.stack) or ("AugAssign" in self.stack) or (self.stack.count("Call") > 1)
+        if self.is_method_call(node):
+            func = None
+        else:
+            func = self.visit(node.func)
 
         if node.keywords or node.kwargs:
             keywords = []
@@ -677,16 +1164,31 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         else:
             varargs = []
 
-        js_args = ", ".join([ self.visit(arg) for arg in node.args ] + varargs + kwargs)
+        args = [ self.visit(arg) for arg in node.args ] + varargs + kwargs
 
-        js.append("%s(%s)" % (func, js_args))
+        if func is not None:
+            js.append("%s(%s)" % (func, ", ".join(args)))
+        else:
+            # Method calls don't materialise a bound method
+            attr = node.func.attr
+            recv = node.func.value
+            if self.is_super_call(recv):
+                obj = self.visit(recv.args[1])
+                js.append("$PY.supermethod(%s, '%s').call(%s)" % (self.visit(recv.args[0]), attr, ", ".join([obj] + args)))
+            elif isinstance(recv, ast.Name):
+                obj = self.visit(recv)
+                js.append("$PY.method(%s, 'PY$%s', '%s').call(%s)" % (obj, attr, attr, ", ".join([obj] + args)))
+            else:
+                js.append("$PY.callmethod(%s)" % ", ".join([self.visit(recv), "'PY$%s'" % attr, "'%s'" % attr] + args))
 
         return "\n".join(js)
 
     def visit_Raise(self, node):
         assert node.inst is None
         assert node.tback is None
-        if not node.type:
+        if node in self._stop_raises:
+            return ["return null;"]
+        elif not node.type:
             return ["throw %s;" % self._exceptions[-1]]
         else:
             if isinstance(node.type, ast.Name) and node.type.id in self.builtin:
@@ -697,10 +1199,43 @@ class Compiler(pyjaco.compiler.BaseCompiler):
                 raise JSError("Unknown exception type")
 
     def visit_Attribute(self, node):
-        if node.attr.startswith("__") and self.obey_getattr_restriction:
-            return """%s.PY$%s""" % (self.visit(node.value), node.attr)
+        obj = self.visit(node.value)
+        attr = node.attr
+        if attr.startswith("__") and self.obey_getattr_restriction:
+            js = """%s.PY$%s""" % (obj, attr)
+        elif isinstance(node.value, ast.Name):
+            # Plain Python objects are read directly, anything else takes the
+            # __getattr__ path
+            js = """(%s ? %s.PY$%s : %s.PY$__getattr__('%s'))""" % (self.is_plain_value("%s.PY$%s" % (obj, attr)), obj, attr, obj, attr)
+        else:
+            js = """$PY.getattr(%s, 'PY$%s', '%s')""" % (obj, attr, attr)
+
+        invariant = getattr(node, "invariant", None)
+        if invariant is not None and invariant.var is not None:
+            return "(%s !== undefined ? %s : (%s = %s))" % (invariant.var, invariant.var, invariant.var, js)
+        return js
+
+    def is_plain_value(self, code):
+        """Javascript test for "code" holding a Python object, which is any
+        object, plus raw numbers and strings in the raw modes."""
+        test = "typeof %s === 'object'" % code
+        if self.opts.get('raw_numbers'):
+            test += " || typeof %s === 'number'" % code
+        if self.opts.get('raw_strings'):
+            test += " || typeof %s === 'string'" % code
+        return test
+
+    def visit_SetAttr(self, target, value):
+        obj = self.visit(target.value)
+        attr = str(target.attr)
+        if isinstance(target.value, ast.Name):
+            dummy = self.alloc_var()
+            return [
+                "%s %s = %s;" % (self.let, dummy, value),
+                "if (%s.PY$__setattr__ === $PY.plain_setattr || (%s.PY$__setattr__ === $PY.slot_setattr && %s.hasOwnProperty('PY$%s'))) { %s.PY$%s = %s; } else { %s.PY$__setattr__('%s', %s); }" % (obj, obj, obj, attr, obj, attr, dummy, obj, attr, dummy),
+            ]
         else:
-            return """%s.PY$__getattr__('%s')""" % (self.visit(node.value), node.attr)
+            return ["$PY.setattr(%s, 'PY$%s', '%s', %s);" % (obj, attr, attr, value)]
 
     def visit_Tuple(self, node):
         els = [self.visit(e) for e in node.elts]
@@ -724,14 +1259,15 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         else:
             raise JSError("Unsupported target type in list comprehension")
         iter_var = self.alloc_var()
-        res = "var %s; for (var %s = iter(%s); %s = $PY.next(%s); %s !== null) {\n" % (var, iter_var, self.visit(node.iter), var, iter_var, var)
+        let = "let" if self.es2015 else "var"
+        res = "%s %s; for (%s %s = iter(%s); (%s = $PY.next(%s)) !== null; ) {\n" % (let, var, let, iter_var, self.visit(node.iter), var, iter_var)
         if isinstance(node.target, ast.Tuple):
             for i, el in enumerate(node.target.elts):
                 if isinstance(el, ast.Name):
                     n = self.visit(el)
                 else:
                     raise JSError("Invalid tuple element in list comprehension")
-                res += "var %s = %s.PY$__getitem__($c%d);\n" % (n, var, i)
+                res += "%s %s = %s.PY$__getitem__($c%d);\n" % (let, n, var, i)
 
         if node.ifs:
             ifexp = []
@@ -746,7 +1282,7 @@ class Compiler(pyjaco.compiler.BaseCompiler):
         for x in node.generators:
             exp = "%s %s}" % (self.visit(x), exp)
 
-        return "(function() {var %s = list(); %s; return %s})()" % (res_var, exp, res_var)
+        return "(function() {%s %s = list(); %s; return %s})()" % ("let" if self.es2015 else "var", res_var, exp, res_var)
 
     def visit_GeneratorExp(self, node):
         if not len(node.generators) == 1:
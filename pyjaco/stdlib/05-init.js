@@ -56,16 +56,9 @@ function iterate(obj, func) {
         };
     } else {
         var seq = iter(obj);
-        while (true) {
-            try {
-                func(seq.PY$next());
-            } catch (exc) {
-                if (exc === $PY.c_stopiter || $PY.isinstance(exc, __builtins__.PY$StopIteration)) {
-                    break;
-                } else {
-                    throw exc;
-                }
-            }
+        var item;
+        while ((item = $PY.next(seq)) !== null) {
+            func(item);
         }
     }
 }
@@ -24,28 +24,37 @@
 **/
 
 $PY.isinstance = function(obj, cls) {
+    var c = obj.PY$__class__;
+    if (c === undefined || c.__ancestors === undefined) {
+        return false;
+    }
+    var ancestors = c.__ancestors;
     if (cls instanceof Array) {
         for (var i = 0; i < cls.length; i++) {
-            var c = obj.PY$__class__;
-            while (c) {
-                if (c === cls[i])
-                    return true;
-                c = c.PY$__super__;
-            }
-        }
-
-        return false;
-    } else {
-        var c = obj.PY$__class__;
-        while (c) {
-            if (c === cls)
+            if (ancestors[cls[i].__cid] === true)
                 return true;
-            c = c.PY$__super__;
         }
         return false;
+    } else {
+        return ancestors[cls.__cid] === true;
     }
 };
 
+/*
+ * Object ids are handed out on first use, so that creating an object does
+ * not have to pay for it.
+ */
+$PY.id = function(obj) {
+    if (typeof obj === 'number') {
+        return obj;
+    } else if (typeof obj === 'string') {
+        return basestring.PY$__hash__.call(obj);
+    } else if (!Object.prototype.hasOwnProperty.call(obj, 'id')) {
+        obj.id = prng();
+    }
+    return obj.id;
+};
+
 $PY.repr = function(obj) {
     return __builtins__.PY$repr(obj)._js_();
 };
@@ -83,20 +92,188 @@ $PY.len = function(obj) {
     }
 };
 
+/*
+ * Internal iteration protocol. Iterators implemented in javascript have a
+ * next() method (without the PY$ prefix) that returns null when exhausted,
+ * instead of raising StopIteration like PY$next() does. $PY.next() returns
+ * the next item of any iterator, or null when there are no more items.
+ * next() is only used while PY$next() is the one built from it by
+ * $PY.py_next(), as PY$next can be assigned like any other attribute.
+ */
 $PY.next = function(obj) {
-    if (obj.PY$__class__ === iter) {
-        return obj.next();
-    } else {
+    var next = obj.next;
+    if (next !== undefined) {
+        var py_next = obj.PY$next;
+        if (py_next === undefined || py_next.__next === next) {
+            return next.call(obj);
+        }
+    }
+    return $PY.next_py(obj);
+};
+
+/*
+ * Calls PY$next() on an iterator that only implements the python side of
+ * the protocol. The try/catch is kept out of $PY.next(), so that it does not
+ * end up inside the loops of its callers.
+ */
+$PY.next_py = function(obj) {
+    try {
+        return obj.PY$next();
+    } catch (x) {
+        if (x === $PY.c_stopiter || $PY.isinstance(x, __builtins__.PY$StopIteration)) {
+            return null;
+        } else {
+            throw x;
+        }
+    }
+};
+
+/*
+ * The next() method of compiled python classes whose next is not a plain
+ * "def next(self)", such as "next = other" or a decorated next.
+ */
+$PY.next_from_py = function() {
+    return $PY.next_py(this);
+};
+
+/*
+ * Wraps the next() method of a compiled python class, where "raise
+ * StopIteration" has been turned into "return null", so that StopIteration
+ * raised further down (by another iterator) also ends the iteration.
+ */
+$PY.next_method = function(next) {
+    return function() {
         try {
-            return obj.PY$next();
+            return next.call(this);
         } catch (x) {
             if (x === $PY.c_stopiter || $PY.isinstance(x, __builtins__.PY$StopIteration)) {
                 return null;
             } else {
                 throw x;
             }
-       }
+        }
+    };
+};
+
+/*
+ * Builds the PY$next() method for an iterator from its next() method.
+ */
+$PY.py_next = function(next) {
+    var py_next = function() {
+        var res = next.call(this);
+        if (res === null) {
+            throw $PY.c_stopiter;
+        } else {
+            return res;
+        }
+    };
+    py_next.__next = next;
+    return py_next;
+};
+
+/*
+ * Items of "obj" for unpacking into "count" targets, as a javascript array.
+ * The compiler checks for lists and tuples of the right length inline, so
+ * this is mostly used for other iterables.
+ */
+$PY.unpack = function(obj, count) {
+    var items;
+    if (obj.PY$__class__ === tuple || obj.PY$__class__ === list) {
+        items = obj.items;
+    } else {
+        items = [];
+        var item;
+        for (var it = iter(obj); items.length <= count && (item = $PY.next(it)) !== null; ) {
+            items.push(item);
+        }
+    }
+    if (items.length > count) {
+        throw __builtins__.PY$ValueError("too many values to unpack");
+    } else if (items.length < count) {
+        throw __builtins__.PY$ValueError("need more than " + items.length + " value" + (items.length === 1 ? "" : "s") + " to unpack");
+    }
+    return items;
+};
+
+/*
+ * Binds the arguments of a call to the parameters of a function compiled
+ * with --bind-args, for calls that pass keyword arguments or *args, or a
+ * number of arguments the function does not take. "spec" describes the
+ * parameters: the function name, the parameter names (without self), how
+ * many of them are required, "offset" (1 for methods, to count self in
+ * error messages) and whether it takes *args and **kwargs.
+ *
+ * Returns the values of the parameters, followed by the tuple of extra
+ * positional arguments and the dict of extra keyword arguments if the
+ * function takes them. Parameters with defaults that are not passed are
+ * left undefined.
+ */
+$PY.bind = function(args, spec) {
+    var names = spec.args;
+    var n = args.length;
+    var kw = null;
+    var extra = [];
+    if (n > 0 && args[n - 1] !== undefined && args[n - 1].__kwargs === true) {
+        kw = args[--n];
+    }
+    if (n > 0 && args[n - 1] !== undefined && args[n - 1].__varargs === true) {
+        extra = args[--n].items;
+    }
+    var given = n + extra.length;
+    var values = new Array(names.length);
+    var rest = [];
+    for (var i = 0; i < given; i++) {
+        var value = i < n ? args[i] : extra[i - n];
+        if (i < names.length) {
+            values[i] = value;
+        } else {
+            rest.push(value);
+        }
+    }
+    if (rest.length > 0 && !spec.varargs) {
+        throw $PY.arg_count_error(spec, "at most", names.length, given);
+    }
+    var kwargs = spec.kwargs ? dict() : null;
+    if (kw !== null) {
+        for (var key in kw) {
+            if (key === "__kwargs") {
+                continue;
+            }
+            var index = names.indexOf(key);
+            if (index === -1) {
+                if (kwargs === null) {
+                    throw __builtins__.PY$TypeError(spec.name + "() got an unexpected keyword argument '" + key + "'");
+                }
+                kwargs.PY$__setitem__(str(key), kw[key]);
+            } else if (values[index] !== undefined) {
+                throw __builtins__.PY$TypeError(spec.name + "() got multiple values for keyword argument '" + key + "'");
+            } else {
+                values[index] = kw[key];
+                given++;
+            }
+        }
+    }
+    for (i = 0; i < spec.required; i++) {
+        if (values[i] === undefined) {
+            throw $PY.arg_count_error(spec, "at least", spec.required, given);
+        }
+    }
+    if (spec.varargs) {
+        values.push(tuple(rest));
+    }
+    if (kwargs !== null) {
+        values.push(kwargs);
+    }
+    return values;
+};
+
+$PY.arg_count_error = function(spec, bound, count, given) {
+    if (spec.required === spec.args.length && !spec.varargs) {
+        bound = "exactly";
     }
+    count += spec.offset;
+    var takes = count === 0 ? "no arguments" : bound + " " + count + " argument" + (count === 1 ? "" : "s");
+    return __builtins__.PY$TypeError(spec.name + "() takes " + takes + " (" + (given + spec.offset) + " given)");
 };
 
 $PY.__not__ = function(obj) {
@@ -65,7 +65,7 @@ __builtins__.PY$all = function(obj) {
     }
     var item;
     var bool = __builtins__.PY$bool;
-    for (var it = iter(obj); item = $PY.next(it); item !== null) {
+    for (var it = iter(obj); (item = $PY.next(it)) !== null; ) {
         if (bool(item) !== True) {
             return False;
         }
@@ -79,7 +79,7 @@ __builtins__.PY$any = function(obj) {
     }
     var item;
     var bool = __builtins__.PY$bool;
-    for (var it = iter(obj); item = $PY.next(it); item !== null) {
+    for (var it = iter(obj); (item = $PY.next(it)) !== null; ) {
         if (bool(item) === True) {
             return True;
         }
@@ -94,7 +94,7 @@ __builtins__.PY$apply = function(fun, vargs, kwargs) {
         if (kwargs === undefined) {
             return fun(__varargs_make(vargs));
         } else {
-            return fun(__varargs_make(vargs), __kwargs_make(kwargs));
+            return fun(__varargs_make(vargs), __kwargs_make({}, kwargs));
         }
     }
 };
@@ -171,7 +171,9 @@ __builtins__.PY$credits = "The Pyjaco authors would like to thank everybody who
 
 __builtins__.PY$delattr = function(obj, name) {
     name = js(name);
-    if (obj["PY$" + name] !== undefined) {
+    if (obj.PY$__delattr__ === $PY.slot_delattr) {
+        obj.PY$__delattr__(name);
+    } else if (obj["PY$" + name] !== undefined) {
         delete obj["PY$" + name];
     } else {
         throw __builtins__.PY$AttributeError("Object " + js(str(obj)) + " does not have attribute " + name);
@@ -191,31 +193,18 @@ __builtins__.PY$dir = function(obj) {
 
 __builtins__.PY$divmod = $PY.c_nif;
 
-__builtins__.PY$enumerate = function(obj) {
-    if (arguments.length != 1) {
-        throw __builtins__.PY$NotImplementedError("enumerate() only supports 1 argument");
-    }
-    var items = list();
-    var count = 0;
-    iterate(obj, function(elm) {
-                items.PY$append(tuple([count++, elm]));
-            });
-    return items;
-};
-
 __builtins__.PY$eval = $PY.c_nif;
 __builtins__.PY$execfile = $PY.c_nif;
 __builtins__.PY$exit = $PY.c_nif;
 __builtins__.PY$file = $PY.c_nif;
 
 __builtins__.PY$filter = function(f, l) {
-   var res = list();
-   iterate(l, function(item) {
-     if (f(item) === True) {
-       res.PY$append(item);
-     }
-   });
-   return res;
+    var res = $PY.ifilter(f, l);
+
+    if (__builtins__.PY$__python3__)
+        return res;
+    else
+        return list(res);
 };
 
 __builtins__.PY$format = $PY.c_nif;
@@ -276,7 +265,7 @@ __builtins__.PY$hex = function(num) {
 };
 
 __builtins__.PY$id = function(obj) {
-    return __builtins__.PY$int(obj.id);
+    return __builtins__.PY$int($PY.id(obj));
 }
 
 __builtins__.PY$input = $PY.c_nif;
@@ -291,50 +280,27 @@ __builtins__.PY$intern = function(x) {
 
 __builtins__.PY$isinstance = function(obj, cls) {
     if (cls.PY$__class__ === tuple) {
-        var length = cls.PY$__len__()._js_();
-        obj = obj.PY$__class__;
-        while (obj) {
-            for (var i = 0; i < length; i++) {
-                if (obj === cls.PY$__getitem__(i))
-                    return True;
-            }
-            obj = obj.PY$__super__;
-        }
-
-        return False;
+        return $PY.isinstance(obj, cls.items) ? True : False;
     } else if (cls.PY$__super__ !== undefined) {
-        var c = obj.PY$__class__;
-        while (c) {
-            if (c === cls)
-                return True;
-            c = c.PY$__super__;
-        }
-        return False;
+        return $PY.isinstance(obj, cls) ? True : False;
     } else {
         throw __builtins__.PY$TypeError("isinstance() arg 2 must be a class, type, or tuple of classes and types");
     }
 };
 
 __builtins__.PY$issubclass = function(obj, cls) {
+    var ancestors = obj.__ancestors;
     if (cls.PY$__class__ === tuple) {
-        var length = cls.PY$__len__()._js_();
-
-        while (obj) {
-            for (var i = 0; i < length; i++) {
-                if (obj === cls.PY$__getitem__(i))
+        var items = cls.items;
+        if (ancestors !== undefined) {
+            for (var i = 0; i < items.length; i++) {
+                if (ancestors[items[i].__cid] === true)
                     return True;
             }
-            obj = obj.PY$__super__;
         }
-
         return False;
     } else if (cls.PY$__super__ !== undefined) {
-        while (obj) {
-            if (obj === cls)
-                return True;
-            obj = obj.PY$__super__;
-        }
-        return False;
+        return (ancestors !== undefined && ancestors[cls.__cid] === true) ? True : False;
     } else {
         throw __builtins__.PY$TypeError("issubclass() arg 2 must be a class or tuple of classes");
     }
@@ -366,17 +332,12 @@ __builtins__.PY$map = function() {
         throw __builtins__.PY$NotImplementedError("only one sequence allowed in __builtins__.PY$map()");
     }
 
-    var func = arguments[0];
-    var items = list();
-
-    iterate(arguments[1], function(item) {
-        items.PY$append(func(item));
-    });
+    var res = $PY.imap(arguments[0], arguments[1]);
 
     if (__builtins__.PY$__python3__)
-        return iter(items);
+        return res;
     else
-        return items;
+        return list(res);
 };
 
 __builtins__.PY$max = function(list) {
@@ -411,7 +372,16 @@ __builtins__.PY$min = function(list) {
     }
 };
 
-__builtins__.PY$next = $PY.c_nif;
+__builtins__.PY$next = function(iterator, value) {
+    var res = $PY.next(iterator);
+    if (res !== null) {
+        return res;
+    } else if (value !== undefined) {
+        return value;
+    } else {
+        throw $PY.c_stopiter;
+    }
+};
 
 __builtins__.PY$oct = function(num) {
     if (num.PY$__class__ === __builtins__.PY$int) {
@@ -502,31 +472,12 @@ __builtins__.PY$quit = function() {
 };
 
 __builtins__.PY$range = function(start, end, step) {
-    start = js(start);
-
-    if (end === undefined) {
-        end = start;
-        start = 0;
-    } else {
-        end = js(end);
-    }
-
-    if (step === undefined) {
-        step = 1;
-    } else {
-        step = js(step);
-    }
-
-    var seq = [];
-
-    for (var i = start; i < end; i += step) {
-        seq.push(i);
-    }
+    var res = xrange(start, end, step);
 
     if (__builtins__.PY$__python3__)
-        return iter(seq);
+        return res;
     else
-        return list(seq);
+        return list(res);
 };
 
 __builtins__.PY$raw_input = $PY.c_nif;
@@ -563,20 +514,14 @@ __builtins__.PY$repr = function(obj) {
     } else if (obj.PY$__class__ === undefined) {
         return object.PY$__repr__.call(obj);
     } else if (obj.PY$__repr__ !== undefined) {
-        return obj.PY$__repr__(obj);
+        return obj.PY$__repr__();
     } else if (obj.PY$__str__ !== undefined) {
-        return obj.PY$__str__(obj);
+        return obj.PY$__str__();
     } else {
         throw __builtins__.PY$AttributeError('__repr__ or __str__ not found on ' + typeof(obj));
     }
 };
 
-__builtins__.PY$reversed = function(iterable) {
-    var l = list(iterable);
-    l.PY$reverse();
-    return l;
-}
-
 __builtins__.PY$round = function(num) {
     if (num.PY$__class__ === __builtins__.PY$float) {
         var n = num.obj;
@@ -596,7 +541,11 @@ __builtins__.PY$set = $PY.c_nif;
 
 __builtins__.PY$setattr = function(obj, name, value) {
     name = js(name);
-    obj["PY$" + name] = value;
+    if (obj.PY$__setattr__ !== undefined) {
+        obj.PY$__setattr__(name, value);
+    } else {
+        obj["PY$" + name] = value;
+    }
 };
 
 __builtins__.PY$sorted = function(iterable) {
@@ -642,42 +591,11 @@ __builtins__.PY$unichr = function(unichr) {
 
 __builtins__.PY$vars = $PY.c_nif;
 
-__builtins__.PY$xrange = function(start, end, step) {
-    return iter(__builtins__.PY$range(start, end, step));
-};
-
 __builtins__.PY$zip = function() {
-    if (!arguments.length) {
-        return list();
-    }
-
-    var iters = list();
-    var i;
-
-    for (i = 0; i < arguments.length; i++) {
-        iters.PY$append(iter(arguments[i]));
-    }
+    var res = $PY.izip.apply(null, arguments);
 
-    var items = list();
-
-    while (true) {
-        var item = list();
-
-        for (i = 0; i < arguments.length; i++) {
-            try {
-                var value = iters.PY$__getitem__(i).PY$next();
-            } catch (exc) {
-                if (exc === $PY.c_stopiter || $PY.isinstance(exc, __builtins__.PY$StopIteration)) {
-                    return items;
-                } else {
-                    throw exc;
-                }
-            }
-
-            item.PY$append(value);
-        }
-
-        items.PY$append(tuple(item));
-    }
-    return None;
+    if (__builtins__.PY$__python3__)
+        return res;
+    else
+        return list(res);
 };
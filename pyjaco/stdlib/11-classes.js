@@ -23,6 +23,8 @@
   OTHER DEALINGS IN THE SOFTWARE.
 **/
 
+$PY.class_count = 0;
+
 var __inherit = function(cls, name, prototyping) {
 
     if (name === undefined) {
@@ -30,24 +32,108 @@ var __inherit = function(cls, name, prototyping) {
     }
 
     var res = function() {
-        var x = res.PY$__create__;
-        if (x !== undefined) {
-            return res.PY$__create__.apply(null, [res].concat(Array.prototype.slice.call(arguments)));
-        } else {
+        var create = res.PY$__create__;
+        if (create === undefined) {
             throw __builtins__.PY$AttributeError("Class " + name + " does not have __create__ method");
         }
+        switch (arguments.length) {
+            case 0: return create(res);
+            case 1: return create(res, arguments[0]);
+            case 2: return create(res, arguments[0], arguments[1]);
+            case 3: return create(res, arguments[0], arguments[1], arguments[2]);
+            default: return create.apply(null, [res].concat(Array.prototype.slice.call(arguments)));
+        }
     };
 
-    for (var o in cls) {
-        res[o] = cls[o];
+    /*
+     * Classes are linked through their prototype chain, so methods are
+     * shared with (and later changes are seen by) every subclass. Only
+     * engines without __proto__ get a copy of the base class instead.
+     */
+    if (cls !== null) {
+        if (res.__proto__ === undefined) {
+            for (var o in cls) {
+                res[o] = cls[o];
+            }
+        } else {
+            res.__proto__ = cls;
+        }
+    }
+
+    /*
+     * Instances are plain objects made by "new res.__alloc()", so they all
+     * share one prototype (the class) and start out with the same layout.
+     */
+    var alloc;
+    if (cls !== null && cls.__slots !== undefined) {
+        alloc = __slotted_alloc(res, cls.__slots);
+    } else {
+        alloc = function() {
+            this.PY$__class__ = res;
+            this.PY$__super__ = undefined;
+        };
+        alloc.prototype = res;
     }
 
+    /*
+     * Every class gets a number, and a set of the numbers of itself and all
+     * its base classes, so subclass checks don't have to walk PY$__super__.
+     */
+    var ancestors = {};
+    if (cls !== null) {
+        for (var a in cls.__ancestors) {
+            ancestors[a] = true;
+        }
+    }
+    var cid = $PY.class_count++;
+    ancestors[cid] = true;
+
     res.PY$__name__  = name;
     res.PY$__super__ = cls;
     res.prototyping  = prototyping;
+    res.__alloc      = alloc;
+    res.__cid        = cid;
+    res.__ancestors  = ancestors;
+    res.__fixed      = false;
     return res;
 };
 
+/*
+ * Instances of classes with __slots__ get all their slots (including those
+ * of base classes) set up front, in a fixed order, so they all have the
+ * same shape and slot assignments never add properties. The constructor is
+ * generated with straight-line stores where the engine allows it.
+ */
+var __slotted_alloc = function(cls, slots) {
+    var alloc = null;
+    var body = "this.PY$__class__ = cls; this.PY$__super__ = undefined;";
+    for (var i = 0; i < slots.length && body !== null; i++) {
+        if (/^PY\$[A-Za-z_][A-Za-z0-9_]*$/.test(slots[i])) {
+            body += " this." + slots[i] + " = undefined;";
+        } else {
+            body = null;
+        }
+    }
+    if (body !== null) {
+        try {
+            alloc = new Function("cls", "return function() { " + body + " };")(cls);
+        } catch (e) {
+            alloc = null;
+        }
+    }
+    if (alloc === null) {
+        alloc = function() {
+            this.PY$__class__ = cls;
+            this.PY$__super__ = undefined;
+            for (var i = 0; i < slots.length; i++) {
+                this[slots[i]] = undefined;
+            }
+        };
+    }
+    alloc.prototype = cls;
+    return alloc;
+};
+
 var object = __inherit(null, "object");
 
 __builtins__.PY$object = object;
@@ -55,27 +141,19 @@ __builtins__.PY$object = object;
 object.PY$__init__ = function() {
 };
 
-object.PY$__create__ = function(cls) {
-    var args = Array.prototype.slice.call(arguments, 1);
-
+/*
+ * Instances of classes with a __call__ method have to be real functions, so
+ * they are built the slow way, by pointing the prototype of a fresh closure
+ * at the class.
+ */
+var __callable_instance = function(cls) {
     var obj = function() {
-        var x = cls.PY$__call__;
-        if (x !== undefined) {
-            return cls.PY$__call__.apply(cls, args);
-        } else {
-            throw __builtins__.PY$AttributeError("Object " + js(cls.PY$__name__) + " does not have __call__ method");
-        }
+        return obj.PY$__call__.apply(obj, arguments);
     };
 
     if (obj.__proto__ === undefined) {
-        if (cls.prototyping) {
-            var x = function() {};
-            x.prototype = cls;
-            obj = new x();
-        } else {
-            for (var o in cls) {
-                obj[o] = cls[o];
-            }
+        for (var o in cls) {
+            obj[o] = cls[o];
         }
     } else {
         obj.__proto__ = cls;
@@ -83,8 +161,29 @@ object.PY$__create__ = function(cls) {
 
     obj.PY$__class__ = cls;
     obj.PY$__super__ = undefined;
-    obj.id = prng();
-    obj.PY$__init__.apply(obj, args);
+    if (cls.__slots !== undefined) {
+        for (var i = 0; i < cls.__slots.length; i++) {
+            obj[cls.__slots[i]] = undefined;
+        }
+    }
+    return obj;
+};
+
+object.PY$__create__ = function(cls) {
+    var obj;
+    if (cls.PY$__call__ === undefined) {
+        obj = new cls.__alloc();
+    } else {
+        obj = __callable_instance(cls);
+    }
+
+    switch (arguments.length) {
+        case 1: obj.PY$__init__(); break;
+        case 2: obj.PY$__init__(arguments[1]); break;
+        case 3: obj.PY$__init__(arguments[1], arguments[2]); break;
+        case 4: obj.PY$__init__(arguments[1], arguments[2], arguments[3]); break;
+        default: obj.PY$__init__.apply(obj, Array.prototype.slice.call(arguments, 1));
+    }
     return obj;
 };
 
@@ -117,13 +216,121 @@ object.PY$__getattr__ = function(k) {
     }
 };
 
+/*
+ * Compiled attribute access reads "obj.PY$name" directly when it holds a
+ * plain Python object, and stores directly when the class keeps the default
+ * __setattr__. Everything else (methods, missing attributes, raw JS values
+ * other than those of --raw-numbers and --raw-strings) goes through
+ * __getattr__ and __setattr__. The compiler inlines these
+ * checks for simple receivers and calls the helpers below for the rest.
+ */
+$PY.getattr = function(obj, key, name) {
+    var q = obj[key];
+    var t = typeof q;
+    if (t === 'object' || (t === 'number' && $PY.raw_ints) || (t === 'string' && $PY.raw_strs)) {
+        return q;
+    } else {
+        return obj.PY$__getattr__(name);
+    }
+};
+
+$PY.plain_setattr = object.PY$__setattr__;
+
+$PY.plain_getattr = object.PY$__getattr__;
+
+/*
+ * Classes that define __slots__ are set up by $PY.set_slots after their
+ * body has run. Like in CPython, only classes whose bases all have
+ * __slots__ reject other attributes.
+ */
+$PY.slot_setattr = function(k, v) {
+    var key = "PY$" + k;
+    if (this.PY$__class__.__fixed && !this.hasOwnProperty(key)) {
+        throw __builtins__.PY$AttributeError("'" + this.PY$__class__.PY$__name__ + "' object has no attribute '" + js(k) + "'");
+    }
+    this[key] = v;
+};
+
+$PY.slot_delattr = function(k) {
+    var key = "PY$" + k;
+    if (this.hasOwnProperty(key) && this.PY$__class__.__slots.indexOf(key) !== -1) {
+        if (this[key] === undefined) {
+            throw __builtins__.PY$AttributeError(js(k));
+        }
+        this[key] = undefined;
+    } else {
+        object.PY$__delattr__.call(this, k);
+    }
+};
+
+$PY.set_slots = function(cls) {
+    var slots = cls.PY$__slots__;
+    var base = cls.PY$__super__;
+    var keys = (base.__slots === undefined) ? [] : base.__slots.concat();
+
+    if ($PY.isinstance(slots, basestring)) {
+        slots = tuple([slots]);
+    }
+    iterate(slots, function(name) {
+        var key = "PY$" + js(name);
+        if (keys.indexOf(key) === -1) {
+            keys.push(key);
+        }
+    });
+
+    cls.__slots = keys;
+    cls.__fixed = (base === object || base.__fixed);
+    cls.__alloc = __slotted_alloc(cls, keys);
+    if (cls.PY$__setattr__ === $PY.plain_setattr) {
+        cls.PY$__setattr__ = $PY.slot_setattr;
+    }
+    if (cls.PY$__delattr__ === object.PY$__delattr__) {
+        cls.PY$__delattr__ = $PY.slot_delattr;
+    }
+};
+
+/*
+ * Method calls "obj.name(...)" call the method with "this" set to obj,
+ * instead of having __getattr__ make a bound closure first. Classes (which
+ * have no __class__) and objects with their own __getattr__ still get
+ * whatever __getattr__ returns.
+ */
+$PY.method = function(obj, key, name) {
+    var q = obj[key];
+    if (typeof q === 'function' && obj.PY$__getattr__ === $PY.plain_getattr && obj.PY$__class__ !== undefined) {
+        return q;
+    } else {
+        return obj.PY$__getattr__(name);
+    }
+};
+
+$PY.callmethod = function(obj, key, name) {
+    var q = $PY.method(obj, key, name);
+    switch (arguments.length) {
+        case 3: return q.call(obj);
+        case 4: return q.call(obj, arguments[3]);
+        case 5: return q.call(obj, arguments[3], arguments[4]);
+        case 6: return q.call(obj, arguments[3], arguments[4], arguments[5]);
+        default: return q.apply(obj, Array.prototype.slice.call(arguments, 3));
+    }
+};
+
+$PY.setattr = function(obj, key, name, value) {
+    var setattr = obj.PY$__setattr__;
+    if (setattr === $PY.plain_setattr || (setattr === $PY.slot_setattr && obj.hasOwnProperty(key))) {
+        obj[key] = value;
+    } else {
+        obj.PY$__setattr__(name, value);
+    }
+};
+
 object.PY$__delattr__ = function(k) {
     delete this["PY$" + k];
 };
 
 object.PY$__repr__ = function() {
     if (this.PY$__class__) {
-        return str("<instance of " + this.PY$__class__.PY$__name__ + " at 0x" + this.id.toString(16) + ">");
+        return str("<instance of " + this.PY$__class__.PY$__name__ + " at 0x" + $PY.id(this).toString(16) + ">");
     } else if (this.PY$__name__) {
         return str("<type '" + this.PY$__name__ + "'>");
     } else {
@@ -44,6 +44,14 @@ Super.PY$__getattr__ = function(k) {
     }
 };
 
+/*
+ * Used for "super(cls, obj).name(...)" calls, which call the result with
+ * "this" set to obj rather than going through a Super instance.
+ */
+$PY.supermethod = function(cls, name) {
+    return cls.PY$__super__.PY$__getattr__(name, false);
+};
+
 Super.PY$__repr__ = function() {
     return str("<super " + this.cls.toString() + ", " + this.obj.toString() + ">");
 };
@@ -41,20 +41,11 @@ module.PY$__init__ = function(modname, filename, objects) {
 module.PY$__getattr__ = function(k) {
     var q = this["PY$" + k];
     if (q === undefined) {
-    	var AE = true;
-    	try {
-    		q = this["PY$" + k] = __import__(k, this.modname);
-            AE = false;
-        } catch ($v1) {
-            if ($PY.isinstance($v1, __builtins__.PY$ImportError)) {
-            	AE = true;
-	        } else { 
-	        	throw $v1; 
-	        }
-        };
-    	if(AE) {
-    		throw __builtins__.PY$AttributeError(js(this.PY$__repr__()) + " does not have attribute '" + js(k) + "'");
-    	}
+        var name = $PY.find_module(js(k), this.modname);
+        if (name === null) {
+            throw __builtins__.PY$AttributeError(js(this.PY$__repr__()) + " does not have attribute '" + js(k) + "'");
+        }
+        q = this["PY$" + k] = $PY.load_module(name);
     }
     return q;
 };
@@ -48,7 +48,9 @@ iter.PY$__init__ = function(obj) {
 var __iter_real__ = iter.PY$__create__;
 
 iter.PY$__create__ = function(cls, obj) {
-    if (obj.PY$__class__ === iter) {
+    if (typeof obj === "string") {
+        return $PY.mkstriter(obj);
+    } else if (obj.PY$__class__ === iter) {
        return obj;
     } else if (obj.PY$__iter__ !== undefined) {
         return obj.PY$__iter__();
@@ -61,24 +63,282 @@ iter.PY$__str__ = function () {
     return str("<iterator of " + this.seq + " at " + this.index + ">");
 };
 
-iter.PY$next = function() {
-    var value = this.seq[this.index++];
-
-    if (this.index <= this.seq.length) {
-        if (value === undefined) {
+iter.next = function() {
+    if (this.index >= this.seq.length) {
+        return null;
+    } else {
+        var value = this.seq[this.index++];
+        if (value === undefined || value === null) {
             return None;
         } else {
             return value;
         }
+    }
+};
+
+iter.PY$next = $PY.py_next(iter.next);
+
+/*
+ * The lazy iterators below hand out one item at a time from next(), and
+ * implement drain(items), which pushes all remaining items onto a JS array
+ * so list() and tuple() can drain them in one go.
+ */
+$PY.drain = function(items) {
+    var item;
+    while ((item = this.next()) !== null) {
+        items.push(item);
+    }
+};
+
+$PY.iter_self = function() {
+    return this;
+};
+
+$PY.range_len = function(start, stop, step) {
+    if (step > 0 && start < stop) {
+        return Math.ceil((stop - start) / step);
+    } else if (step < 0 && start > stop) {
+        return Math.ceil((start - stop) / -step);
     } else {
-        throw $PY.c_stopiter;
+        return 0;
     }
 };
 
-iter.next = function() {
-    if (this.index >= this.seq.length) {
+var rangeiter = __inherit(object, "rangeiterator");
+
+$PY.mkrangeiter = function(start, step, len) {
+    var res = new rangeiter.__alloc();
+    res.cur = start;
+    res.step = step;
+    res.left = len;
+    return res;
+};
+
+rangeiter.PY$__iter__ = $PY.iter_self;
+
+rangeiter.next = function() {
+    if (this.left === 0) {
+        return null;
+    }
+    this.left--;
+    var value = this.cur;
+    this.cur += this.step;
+    return $PY.mkint(value);
+};
+
+rangeiter.PY$next = $PY.py_next(rangeiter.next);
+
+rangeiter.drain = function(items) {
+    for (; this.left > 0; this.left--) {
+        items.push($PY.mkint(this.cur));
+        this.cur += this.step;
+    }
+};
+
+var xrange = __inherit(object, "xrange");
+
+__builtins__.PY$xrange = xrange;
+
+xrange.PY$__init__ = function(start, stop, step) {
+    start = js(start);
+
+    if (stop === undefined) {
+        stop = start;
+        start = 0;
+    } else {
+        stop = js(stop);
+    }
+
+    if (step === undefined) {
+        step = 1;
+    } else {
+        step = js(step);
+        if (step === 0) {
+            throw __builtins__.PY$ValueError("xrange() arg 3 must not be zero");
+        }
+    }
+
+    this.start = start;
+    this.step = step;
+    this.len = $PY.range_len(start, stop, step);
+};
+
+xrange.PY$__str__ = function() {
+    if (this.start === 0 && this.step === 1) {
+        return str("xrange(" + this.len + ")");
+    } else if (this.step === 1) {
+        return str("xrange(" + this.start + ", " + (this.start + this.len) + ")");
+    } else {
+        return str("xrange(" + this.start + ", " + (this.start + this.len * this.step) + ", " + this.step + ")");
+    }
+};
+
+xrange.PY$__repr__ = xrange.PY$__str__;
+
+xrange.PY$__len__ = function() {
+    return $PY.mkint(this.len);
+};
+
+xrange.PY$__getitem__ = function(index) {
+    index = js(index);
+    if (index < 0) {
+        index += this.len;
+    }
+    if (index < 0 || index >= this.len) {
+        throw __builtins__.PY$IndexError("xrange object index out of range");
+    }
+    return $PY.mkint(this.start + index * this.step);
+};
+
+xrange.PY$__iter__ = function() {
+    return $PY.mkrangeiter(this.start, this.step, this.len);
+};
+
+xrange.PY$__reversed__ = function() {
+    return $PY.mkrangeiter(this.start + (this.len - 1) * this.step, -this.step, this.len);
+};
+
+xrange.drain = function(items) {
+    this.PY$__iter__().drain(items);
+};
+
+var enumerate = __inherit(object, "enumerate");
+
+__builtins__.PY$enumerate = enumerate;
+
+enumerate.PY$__init__ = function(seq, start) {
+    this.it = iter(seq);
+    this.count = (start === undefined) ? 0 : js(start);
+};
+
+enumerate.PY$__iter__ = $PY.iter_self;
+
+enumerate.next = function() {
+    var item = $PY.next(this.it);
+    if (item === null) {
         return null;
+    }
+    return $PY.mktuple([$PY.mkint(this.count++), item]);
+};
+
+enumerate.PY$next = $PY.py_next(enumerate.next);
+
+enumerate.drain = $PY.drain;
+
+var reversed = __inherit(object, "reversed");
+
+__builtins__.PY$reversed = reversed;
+
+var __reversed_real__ = reversed.PY$__create__;
+
+reversed.PY$__create__ = function(cls, seq) {
+    if (seq.PY$__reversed__ !== undefined) {
+        return seq.PY$__reversed__();
     } else {
-        return this.seq[this.index++];
+        return __reversed_real__(cls, seq);
     }
 };
+
+reversed.PY$__init__ = function(seq) {
+    if (seq.PY$__class__ === list || seq.PY$__class__ === tuple) {
+        this.items = seq.items;
+    } else {
+        this.items = list(seq).items;
+    }
+    this.index = this.items.length - 1;
+};
+
+reversed.PY$__iter__ = $PY.iter_self;
+
+reversed.next = function() {
+    var index = this.index;
+    if (index < 0 || index >= this.items.length) {
+        this.index = -1;
+        return null;
+    }
+    this.index--;
+    return this.items[index];
+};
+
+reversed.PY$next = $PY.py_next(reversed.next);
+
+reversed.drain = $PY.drain;
+
+/*
+ * Iterators behind zip(), map() and filter(). Python 2 turns these into
+ * lists right away, but __python3__ mode hands them out as they are.
+ */
+$PY.izip = __inherit(object, "izip");
+
+$PY.izip.PY$__init__ = function() {
+    this.iters = [];
+    for (var i = 0; i < arguments.length; i++) {
+        this.iters.push(iter(arguments[i]));
+    }
+};
+
+$PY.izip.PY$__iter__ = $PY.iter_self;
+
+$PY.izip.next = function() {
+    var iters = this.iters;
+    if (iters.length === 0) {
+        return null;
+    }
+    var items = new Array(iters.length);
+    for (var i = 0; i < iters.length; i++) {
+        var value = $PY.next(iters[i]);
+        if (value === null) {
+            return null;
+        }
+        items[i] = value;
+    }
+    return $PY.mktuple(items);
+};
+
+$PY.izip.PY$next = $PY.py_next($PY.izip.next);
+
+$PY.izip.drain = $PY.drain;
+
+$PY.imap = __inherit(object, "imap");
+
+$PY.imap.PY$__init__ = function(func, seq) {
+    this.func = func;
+    this.it = iter(seq);
+};
+
+$PY.imap.PY$__iter__ = $PY.iter_self;
+
+$PY.imap.next = function() {
+    var item = $PY.next(this.it);
+    if (item === null) {
+        return null;
+    }
+    return py(this.func(item));
+};
+
+$PY.imap.PY$next = $PY.py_next($PY.imap.next);
+
+$PY.imap.drain = $PY.drain;
+
+$PY.ifilter = __inherit(object, "ifilter");
+
+$PY.ifilter.PY$__init__ = function(func, seq) {
+    this.func = func;
+    this.it = iter(seq);
+};
+
+$PY.ifilter.PY$__iter__ = $PY.iter_self;
+
+$PY.ifilter.next = function() {
+    var item;
+    while ((item = $PY.next(this.it)) !== null) {
+        if (this.func(item) === True) {
+            return item;
+        }
+    }
+    return null;
+};
+
+$PY.ifilter.PY$next = $PY.py_next($PY.ifilter.next);
+
+$PY.ifilter.drain = $PY.drain;
@@ -36,6 +36,9 @@ tuple.PY$__init__ = function(seq) {
         this.items = [];
     } else if (seq.PY$__class__ === list || seq.PY$__class__ === tuple) {
         this.items = seq.items.concat();
+    } else if (seq.drain !== undefined) {
+        this.items = [];
+        seq.drain(this.items);
     } else {
         var that = this;
         this.items = [];
@@ -50,6 +53,12 @@ tuple.PY$__init__ = function(seq) {
     }
 };
 
+$PY.mktuple = function(items) {
+    var res = new tuple.__alloc();
+    res.items = items;
+    return res;
+};
+
 tuple.PY$__str__ = function () {
     if (this.items.length === 0) {
         return str("()");
@@ -109,16 +118,8 @@ tuple.PY$__cmp__ = function (other) {
             }
         }
 
-        while (true) {
-            try {
-                var elm = it.PY$next();
-            } catch (exc) {
-                if (exc === $PY.c_stopiter || $PY.isinstance(exc, __builtins__.PY$StopIteration)) {
-                    break;
-                } else {
-                    throw exc;
-                }
-            }
+        var elm;
+        while ((elm = $PY.next(it)) !== null) {
             if (count >= this.items.length) {
                 res = $cn1;
                 break;
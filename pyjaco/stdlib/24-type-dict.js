@@ -189,6 +189,52 @@ dict.PY$values = function() {
     return list(res);
 };
 
+/*
+ * Lazy iterators for iteritems(), iterkeys() and itervalues(). They walk
+ * the [key, value, key, value, ...] storage of the dict directly.
+ */
+var dictiter = __inherit(object, "dictionary-iterator");
+
+$PY.mkdictiter = function(d, kind) {
+    var res = new dictiter.__alloc();
+    res.items = d.items;
+    res.index = 0;
+    res.kind = kind;
+    return res;
+};
+
+dictiter.PY$__iter__ = $PY.iter_self;
+
+dictiter.next = function() {
+    var items = this.items;
+    var i = this.index;
+    if (i >= items.length) {
+        return null;
+    }
+    this.index = i + 2;
+    if (this.kind === 2) {
+        return $PY.mktuple([items[i], items[i+1]]);
+    } else {
+        return items[i + this.kind];
+    }
+};
+
+dictiter.PY$next = $PY.py_next(dictiter.next);
+
+dictiter.drain = $PY.drain;
+
+dict.PY$iterkeys = function() {
+    return $PY.mkdictiter(this, 0);
+};
+
+dict.PY$itervalues = function() {
+    return $PY.mkdictiter(this, 1);
+};
+
+dict.PY$iteritems = function() {
+    return $PY.mkdictiter(this, 2);
+};
+
 dict.PY$update = function(other) {
    var self = this;
    iterate(other,
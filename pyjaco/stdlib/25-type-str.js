@@ -44,7 +44,9 @@ basestring.PY$__init__ = function(s) {
 var __basestring_real__ = basestring.PY$__create__;
 
 basestring.PY$__create__ = function(cls, obj) {
-    if ($PY.isinstance(obj, basestring)) {
+    if (typeof obj === "string") {
+        return __basestring_real__(cls, obj);
+    } else if ($PY.isinstance(obj, basestring)) {
         return obj;
     } else if (obj.PY$__class__ === undefined && obj.PY$__super__ !== undefined) {
         return object.PY$__repr__.apply(obj);
@@ -96,7 +98,38 @@ basestring.PY$__len__ = function() {
 };
 
 basestring.PY$__iter__ = function() {
-    return iter(this.obj);
+    return $PY.mkstriter(this.obj);
+};
+
+/*
+ * Iterates over the characters of a javascript string, making each one a
+ * str only when it is handed out.
+ */
+var striter = __inherit(object, "striterator");
+
+$PY.mkstriter = function(s) {
+    var res = new striter.__alloc();
+    res.s = s;
+    res.index = 0;
+    return res;
+};
+
+striter.PY$__iter__ = $PY.iter_self;
+
+striter.next = function() {
+    if (this.index >= this.s.length) {
+        return null;
+    }
+    return $PY.mkstr(this.s.charAt(this.index++));
+};
+
+striter.PY$next = $PY.py_next(striter.next);
+
+striter.drain = function(items) {
+    var s = this.s;
+    for (; this.index < s.length; this.index++) {
+        items.push($PY.mkstr(s.charAt(this.index)));
+    }
 };
 
 basestring.PY$__mod__ = function(args) {
@@ -141,13 +174,7 @@ basestring.PY$__lt__ = function(s) {
 };
 
 basestring.PY$__contains__ = function(item) {
-    for (var index in this.obj) {
-        if (item === this.obj[index]) {
-            return True;
-        }
-    }
-
-    return False;
+    return this.obj.indexOf(js(item)) !== -1 ? True : False;
 };
 
 basestring.PY$__getitem__ = function(index) {
@@ -208,24 +235,21 @@ basestring.PY$__add__ = function(c) {
 basestring.PY$__iadd__ = basestring.PY$__add__;
 
 basestring.PY$count = function(needle, start, end) {
-    if (start === undefined) {
-        start = 0;
-    } else {
-      start = js(start);
+    var s = this.obj;
+    if (start !== undefined) {
+        s = s.slice(js(start), end === undefined ? undefined : js(end));
+    }
+    needle = js(needle);
+    if (needle === "") {
+        return $PY.mkint(s.length + 1);
     }
-    if (end === undefined)
-        end = null;
-    else
-        end = js(end);
     var count = 0;
-    var s = this.PY$__getitem__(slice(start, end));
-    var idx = js(s.PY$find(needle));
-    while (idx != -1) {
-        count += 1;
-        s = s.PY$__getitem__(slice(idx+1, null));
-        idx = js(s.PY$find(needle));
+    var idx = s.indexOf(needle);
+    while (idx !== -1) {
+        count++;
+        idx = s.indexOf(needle, idx + needle.length);
     }
-    return count;
+    return $PY.mkint(count);
 };
 
 basestring.PY$index = function(value, start, end) {
@@ -257,63 +281,87 @@ basestring.PY$rfind = function(s) {
 };
 
 basestring.PY$join = function(s) {
-    // return this.PY$__class__(js(s).join(js(this)));
-    var res = "";
-    var that = this;
-    iterate(s, function(elm) {
-                if (res != "")
-                    res += that.obj;
-                res += str(elm)._js_();
-            });
-    return str(res);
+    var items;
+    if (s.PY$__class__ === list || s.PY$__class__ === tuple) {
+        items = new Array(s.items.length);
+        for (var i = 0; i < items.length; i++) {
+            items[i] = str(s.items[i])._js_();
+        }
+    } else {
+        items = [];
+        iterate(s, function(elm) {
+                    items.push(str(elm)._js_());
+                });
+    }
+    return str(items.join(this.obj));
 };
 
 basestring.PY$replace = function(old, _new, count) {
+    var s = this.obj;
     old = js(old);
     _new = js(_new);
-    var old_s;
-    var new_s;
 
-    if (count !== undefined)
-        count = js(count);
-    else
+    if (count === undefined) {
         count = -1;
-    old_s = "";
-    new_s = this.obj;
-    while ((count != 0) && (new_s != old_s)) {
-        old_s = new_s;
-        new_s = new_s.replace(old, _new);
-        count -= 1;
+    } else {
+        count = js(count);
+    }
+
+    if (old === "") {
+        var n = (count < 0) ? s.length + 1 : Math.min(count, s.length + 1);
+        var parts = [];
+        for (var i = 0; i < n; i++) {
+            parts.push(_new, s.charAt(i));
+        }
+        parts.push(s.slice(n));
+        return this.PY$__class__(parts.join(""));
+    } else if (count < 0) {
+        return this.PY$__class__(s.split(old).join(_new));
+    } else {
+        var parts = [];
+        var pos = 0;
+        var idx;
+        while (count > 0 && (idx = s.indexOf(old, pos)) !== -1) {
+            parts.push(s.slice(pos, idx), _new);
+            pos = idx + old.length;
+            count--;
+        }
+        parts.push(s.slice(pos));
+        return this.PY$__class__(parts.join(""));
     }
-    return this.PY$__class__(new_s);
 };
 
+/*
+ * Character sets for strip() and friends, as objects keyed by character.
+ */
+$PY.charset = function(chars) {
+    var set = {};
+    for (var i = 0; i < chars.length; i++) {
+        set[chars.charAt(i)] = true;
+    }
+    return set;
+};
+
+$PY.whitespace = $PY.charset(" \t\n\r\x0b\x0c");
+
 basestring.PY$lstrip = function(chars) {
-    if (this.obj.length === 0)
-        return this;
-    if (chars !== undefined)
-        chars = tuple(chars);
-    else
-        chars = tuple(["\n", "\t", " "]);
+    var s = this.obj;
+    var set = (chars === undefined || chars === None) ? $PY.whitespace : $PY.charset(js(chars));
     var i = 0;
-    while ((i < this.obj.length) && (js(chars.PY$__contains__(this.PY$__getitem__(i))))) {
-        i += 1;
+    while (i < s.length && set[s.charAt(i)] === true) {
+        i++;
     }
-    return this.PY$__getitem__(slice(i, null));
+    return (i === 0) ? this : this.PY$__class__(s.slice(i));
 };
 
 basestring.PY$rstrip = function(chars) {
-    if (this.obj.length === 0)
-        return this;
-    if (chars !== undefined)
-        chars = tuple(chars);
-    else
-        chars = tuple(["\n", "\t", " "]);
-    var i = this.obj.length - 1;
-    while ((i >= 0) && (js(chars.PY$__contains__(this.PY$__getitem__(i))))) {
-        i -= 1;
+    var s = this.obj;
+    var set = (chars === undefined || chars === None) ? $PY.whitespace : $PY.charset(js(chars));
+    var i = s.length;
+    while (i > 0 && set[s.charAt(i - 1)] === true) {
+        i--;
     }
-    return this.PY$__getitem__(slice(i+1));
+    return (i === s.length) ? this : this.PY$__class__(s.slice(0, i));
 };
 
 basestring.PY$strip = function(chars) {
@@ -399,3 +447,66 @@ unicode.PY$__create__ = function(cls, obj) {
         return basestring.PY$__create__(cls, obj);
     }
 };
+
+$PY.mkstr = function(s) {
+    var obj = new str.__alloc();
+    obj.obj = s;
+    return obj;
+};
+
+/*
+ * Raw string mode (pyjs.py --raw-strings) makes str values plain javascript
+ * strings, which get the methods of str through String.prototype, so string
+ * operations no longer allocate a wrapper for every result, and js() and
+ * py() pass strings through unchanged. unicode() objects stay boxed, which
+ * keeps str and unicode apart. Strings made before the switch keep working
+ * alongside raw ones.
+ */
+$PY.raw_strs = false;
+
+$PY.raw_strings = function() {
+    if ($PY.raw_strs) {
+        return;
+    }
+    $PY.raw_strs = true;
+
+    // Not enumerable, so that for-in over a string only sees its indices
+    var define = function(name, value) {
+        Object.defineProperty(String.prototype, name, {
+            value: value,
+            writable: true,
+            configurable: true
+        });
+    };
+
+    for (var k in str) {
+        if (k.indexOf("PY$") === 0) {
+            if (k !== "PY$__name__" && k !== "PY$__super__" && k !== "PY$__create__") {
+                define(k, str[k]);
+            }
+        } else if (k === "_js_") {
+            define(k, str[k]);
+        }
+    }
+    define("PY$__class__", str);
+    Object.defineProperty(String.prototype, "obj", {
+        get: function() { return this; },
+        configurable: true
+    });
+
+    var create = str.PY$__create__;
+    str.PY$__create__ = function(cls, obj) {
+        if (typeof obj === "string" && cls === str) {
+            return obj;
+        }
+        var res = create(cls, obj);
+        if (typeof res === "object" && res.PY$__class__ === str) {
+            return res.obj;
+        }
+        return res;
+    };
+
+    $PY.mkstr = function(s) {
+        return s;
+    };
+};
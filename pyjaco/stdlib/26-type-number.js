@@ -50,15 +50,27 @@ number._js_ = function () {
 };
 
 number.PY$__pos__ = function() {
-    return this.PY$__class__(+this.obj);
+    if (this.PY$__class__ === this.numberclass) {
+        return this.numbermake(+this.obj);
+    } else {
+        return this.PY$__class__(+this.obj);
+    }
 };
 
 number.PY$__abs__ = function() {
-    return this.PY$__class__(Math.abs(this.obj));
+    if (this.PY$__class__ === this.numberclass) {
+        return this.numbermake(Math.abs(this.obj));
+    } else {
+        return this.PY$__class__(Math.abs(this.obj));
+    }
 };
 
 number.PY$__neg__ = function() {
-    return this.PY$__class__(-this.obj);
+    if (this.PY$__class__ === this.numberclass) {
+        return this.numbermake(-this.obj);
+    } else {
+        return this.PY$__class__(-this.obj);
+    }
 };
 
 number.PY$__nonzero__ = function() {
@@ -92,16 +104,16 @@ number.PY$__lt__ = function(x) {
 number.PY$__mul__ = function(x) {
     if (x.numbertype === undefined) {
         if (x.PY$__int__ !== undefined) {
-            return this.numberclass(this.obj * x.PY$__int__()._js_());
+            return this.numbermake(this.obj * x.PY$__int__()._js_());
         } else if ($PY.isinstance(x, [basestring, list, tuple])) {
             return x.PY$__mul__(this);
         } else {
             throw __builtins__.PY$TypeError("Cannot multiply number and non-number");
         }
     } else if ((this.numbertype === 'PY$__float__') || (x.numbertype !== 'PY$__float__')) {
-        return this.numberclass(this.obj * x.obj);
+        return this.numbermake(this.obj * x.obj);
     } else {
-        return x.numberclass(this.obj * x.obj);
+        return x.numbermake(this.obj * x.obj);
     }
 };
 
@@ -109,36 +121,36 @@ number.PY$__add__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot add number and non-number");
     if ((this.numbertype === 'PY$__float__') || (x.numbertype !== 'PY$__float__'))
-        return this.numberclass(this.obj + x.obj);
+        return this.numbermake(this.obj + x.obj);
     else
-        return x.numberclass(this.obj + x.obj);
+        return x.numbermake(this.obj + x.obj);
 };
 
 number.PY$__div__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot divide number and non-number");
     if ((this.numbertype === 'PY$__float__') || (x.numbertype !== 'PY$__float__'))
-        return this.numberclass(this.obj / x.obj);
+        return this.numbermake(this.obj / x.obj);
     else
-        return x.numberclass(this.obj / x.obj);
+        return x.numbermake(this.obj / x.obj);
 };
 
 number.PY$__sub__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot subtract number and non-number");
     if ((this.numbertype === 'PY$__float__') || (x.numbertype !== 'PY$__float__'))
-        return this.numberclass(this.obj - x.obj);
+        return this.numbermake(this.obj - x.obj);
     else
-        return x.numberclass(this.obj - x.obj);
+        return x.numbermake(this.obj - x.obj);
 };
 
 number.PY$__pow__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot exponentiate number and non-number");
     if ((this.numbertype === 'PY$__float__') || (x.numbertype !== 'PY$__float__'))
-        return this.numberclass(Math.pow(this.obj, x.obj));
+        return this.numbermake(Math.pow(this.obj, x.obj));
     else
-        return x.numberclass(Math.pow(this.obj, x.obj));
+        return x.numbermake(Math.pow(this.obj, x.obj));
 };
 
 number.PY$__imul__      = number.PY$__mul__;
@@ -29,6 +29,7 @@ __builtins__.PY$float = float;
 
 float.numbertype = "PY$__float__";
 float.numberclass = float;
+float.numbermake = function(n) { return $PY.mkfloat(n); };
 
 float.PY$__init__ = function(value) {
     var s = str(value)._js_();
@@ -41,8 +42,21 @@ float.PY$__init__ = function(value) {
 
 var __float_real__ = float.PY$__create__;
 
+/*
+ * Build a float directly from a javascript number, bypassing __create__,
+ * __init__ and the string validation done there. Only for internal use,
+ * where the argument is known to be a number.
+ */
+$PY.mkfloat = function(n) {
+    var obj = new float.__alloc();
+    obj.obj = n;
+    return obj;
+};
+
 float.PY$__create__ = function(cls, obj) {
-    if (js($PY.isinstance(obj, object)) && (obj.PY$__float__ !== undefined)) {
+    if (cls === float && typeof obj === 'number') {
+        return $PY.mkfloat(obj);
+    } else if (js($PY.isinstance(obj, object)) && (obj.PY$__float__ !== undefined)) {
         return obj.PY$__float__();
     } else {
         return __float_real__(cls, obj);
@@ -54,7 +68,11 @@ float.PY$__float__ = function () {
 };
 
 float.PY$__int__ = function () {
-    return int(parseInt(this.obj));
+    var n = parseInt(this.obj);
+    if (isNaN(n)) {
+        throw __builtins__.PY$ValueError("cannot convert float " + this.obj + " to integer");
+    }
+    return $PY.mkint(n);
 };
 
 float.PY$__str__ = function () {
@@ -81,13 +99,13 @@ float.PY$__div__ = function(x) {
         throw __builtins__.PY$TypeError("Cannot divide number and non-number");
     if (x.obj === 0)
         throw __builtins__.PY$ZeroDivisionError("float division by zero");
-    return float((0.0 + this.obj) / (0.0 + x.obj));
+    return $PY.mkfloat((0.0 + this.obj) / (0.0 + x.obj));
 };
 
 float.PY$__pow__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot exponentiate number and non-number");
-    return float(Math.pow(this.obj, x.obj));
+    return $PY.mkfloat(Math.pow(this.obj, x.obj));
 };
 
 float.PY$__floordiv__ = float.PY$__div__;
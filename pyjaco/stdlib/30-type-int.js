@@ -29,6 +29,7 @@ __builtins__.PY$int = int;
 
 int.numbertype = "PY$__int__";
 int.numberclass = int;
+int.numbermake = function(n) { return $PY.mkint(n); };
 
 int.PY$__init__ = function(value) {
     if (arguments.length === 2) {
@@ -45,8 +46,36 @@ int.PY$__init__ = function(value) {
 
 var __int_real__ = int.PY$__create__;
 
+/*
+ * Small ints are shared, like in CPython. $PY.intcache[n + 5] holds int(n)
+ * for -5 <= n <= 256.
+ */
+$PY.intcache = [];
+
+/*
+ * Build an int directly from a javascript number, bypassing __create__,
+ * __init__ and the string validation done there. Only for internal use,
+ * where the argument is known to be an integral number.
+ */
+$PY.mkint = function(n) {
+    var obj = $PY.intcache[n + 5];
+    if (obj === undefined) {
+        obj = new int.__alloc();
+        obj.obj = n;
+    }
+    return obj;
+};
+
+(function() {
+     for (var i = -5; i <= 256; i++) {
+         $PY.intcache[i + 5] = $PY.mkint(i);
+     }
+})();
+
 int.PY$__create__ = function(cls, obj) {
-    if (js($PY.isinstance(obj, object)) && (obj.PY$__int__ !== undefined)) {
+    if (cls === int && typeof obj === 'number' && obj % 1 === 0) {
+        return $PY.mkint(obj);
+    } else if (js($PY.isinstance(obj, object)) && (obj.PY$__int__ !== undefined)) {
         return obj.PY$__int__();
     } else {
         return __int_real__(cls, obj);
@@ -58,11 +87,11 @@ int.PY$__int__ = function () {
 };
 
 int.PY$__float__ = function () {
-    return float(this.obj);
+    return $PY.mkfloat(this.obj);
 };
 
 int.PY$__str__ = function () {
-    return str(this.obj);
+    return str(String(this.obj));
 };
 
 int.PY$__repr__ = int.PY$__str__;
@@ -72,7 +101,7 @@ int.PY$__hash__ = function () {
 };
 
 int.PY$__invert__ = function() {
-    return int(~this.obj);
+    return $PY.mkint(~this.obj);
 };
 
 int.PY$__div__ = function(x) {
@@ -81,7 +110,7 @@ int.PY$__div__ = function(x) {
     if (x.obj === 0)
         throw __builtins__.PY$ZeroDivisionError("integer division or modulo by zero");
     var res = this.obj / x.obj;
-    return float(res);
+    return $PY.mkfloat(res);
 };
 
 int.PY$__floordiv__ = function(x) {
@@ -90,56 +119,60 @@ int.PY$__floordiv__ = function(x) {
     if (x.obj === 0)
         throw __builtins__.PY$ZeroDivisionError("integer division or modulo by zero");
     if (x.numbertype === "PY$__float__") {
-        return float(this.obj / x.obj);
+        return $PY.mkfloat(this.obj / x.obj);
     } else {
-        return int(Math.floor(this.obj / x.obj));
+        return $PY.mkint(Math.floor(this.obj / x.obj));
     }
 };
 
 int.PY$__mod__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot find remainder of int and non-int");
-    return int(this.obj % x.obj);
+    if (x.numbertype === "PY$__float__") {
+        return $PY.mkfloat(this.obj % x.obj);
+    } else {
+        return $PY.mkint(this.obj % x.obj);
+    }
 };
 
 int.PY$__pow__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot exponentiate int and non-int");
     if (x.numbertype === "PY$__float__") {
-        return float(Math.pow(this.obj, x.obj));
+        return $PY.mkfloat(Math.pow(this.obj, x.obj));
     } else {
-        return int(Math.floor(Math.pow(this.obj, x.obj)));
+        return $PY.mkint(Math.floor(Math.pow(this.obj, x.obj)));
     }
 };
 
 int.PY$__bitand__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot operate on int and non-int");
-    return int(this.obj & x.obj);
+    return $PY.mkint(this.obj & x.obj);
 };
 
 int.PY$__bitor__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot operate on int and non-int");
-    return int(this.obj | x.obj);
+    return $PY.mkint(this.obj | x.obj);
 };
 
 int.PY$__bitxor__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot operate on int and non-int");
-    return int(this.obj ^ x.obj);
+    return $PY.mkint(this.obj ^ x.obj);
 };
 
 int.PY$__lshift__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot operate on int and non-int");
-    return int(this.obj << x.obj);
+    return $PY.mkint(this.obj << x.obj);
 };
 
 int.PY$__rshift__ = function(x) {
     if (!x.numbertype)
         throw __builtins__.PY$TypeError("Cannot operate on int and non-int");
-    return int(this.obj >> x.obj);
+    return $PY.mkint(this.obj >> x.obj);
 };
 
 int.PY$__idiv__      = int.PY$__div__;
@@ -150,14 +183,62 @@ int.PY$__ibitor__    = int.PY$__bitor__;
 int.PY$__ibitxor__   = int.PY$__bitxor__;
 int.PY$__ifloordiv__ = int.PY$__floordiv__;
 
-var $cn1 = int(-1);
-var $c0 = int(0);
-var $c1 = int(1);
-var $c2 = int(2);
-var $c3 = int(3);
-var $c4 = int(4);
-var $c5 = int(5);
-var $c6 = int(6);
-var $c7 = int(7);
-var $c8 = int(8);
-var $c9 = int(9);
+var $cn1 = $PY.mkint(-1);
+var $c0 = $PY.mkint(0);
+var $c1 = $PY.mkint(1);
+var $c2 = $PY.mkint(2);
+var $c3 = $PY.mkint(3);
+var $c4 = $PY.mkint(4);
+var $c5 = $PY.mkint(5);
+var $c6 = $PY.mkint(6);
+var $c7 = $PY.mkint(7);
+var $c8 = $PY.mkint(8);
+var $c9 = $PY.mkint(9);
+
+/*
+ * Raw number mode (pyjs.py --raw-numbers) makes ints plain javascript
+ * numbers, which get the methods of int through Number.prototype, so int
+ * arithmetic no longer allocates. Floats stay boxed, which keeps ints and
+ * floats apart. Ints made before the switch keep working alongside raw
+ * ones.
+ */
+$PY.raw_ints = false;
+
+$PY.raw_numbers = function() {
+    if ($PY.raw_ints) {
+        return;
+    }
+    $PY.raw_ints = true;
+
+    var proto = Number.prototype;
+    for (var k in int) {
+        if (k.indexOf("PY$") === 0) {
+            if (k !== "PY$__name__" && k !== "PY$__super__" && k !== "PY$__create__") {
+                proto[k] = int[k];
+            }
+        } else if (k === "numbertype" || k === "numberclass" || k === "numbermake" || k === "_js_") {
+            proto[k] = int[k];
+        }
+    }
+    proto.PY$__class__ = int;
+    Object.defineProperty(proto, "obj", {
+        get: function() { return this; },
+        configurable: true
+    });
+
+    $PY.mkint = function(n) {
+        return n;
+    };
+
+    $cn1 = -1;
+    $c0 = 0;
+    $c1 = 1;
+    $c2 = 2;
+    $c3 = 3;
+    $c4 = 4;
+    $c5 = 5;
+    $c6 = 6;
+    $c7 = 7;
+    $c8 = 8;
+    $c9 = 9;
+};
@@ -23,232 +23,331 @@
   OTHER DEALINGS IN THE SOFTWARE.
 **/
 
-function sprintf(obj, args) {
+/*
+ * Format strings are compiled once into a list of operations, where strings
+ * are copied to the output as they are and objects describe a conversion.
+ * Compiled formats are kept in a small LRU cache keyed by the format string.
+ */
 
-    var get_argument = function() {
-        if (flag_name) {
-            return args.PY$__getitem__(flag_name);
+$PY.format_fixed_digits = function(num, digits) {
+    if (digits > 0 && digits < num.length) {
+        if (num.charAt(digits) >= "5") {
+            return num.substring(0, digits-1) + (parseInt(num.charAt(digits-1)) + 1).toString();
         } else {
-            return args.PY$__getitem__(argc++);
+            return num.substring(0, digits);
         }
-    };
-    var fixed_digits = function(num, digits) {
-        if (digits > 0 && digits < num.length) {
-            if (num.charAt(digits) >= "5") {
-                return num.substring(0, digits-1) + (parseInt(num.charAt(digits-1)) + 1).toString();
+    } else {
+        return num;
+    }
+};
+
+$PY.format_float = function(num, defprec, prec) {
+    if (prec < 1) {
+        prec = defprec;
+    }
+    var parts = num.toFixed(prec+1).split(".");
+    if (prec > defprec) {
+        return parts[0] + "." + parts[1].substring(0, prec);
+    } else {
+        return parts[0] + "." + $PY.format_fixed_digits(parts[1], prec);
+    }
+};
+
+$PY.format_exp = function(num, expchar, defprec, prec, drop_empty_exp) {
+    var parts = num.toExponential(defprec).split("e");
+    if (parts[1].length < 3) {
+        parts[1] = parts[1].charAt(0) + "0" + parts[1].substring(1);
+    }
+    if (prec) {
+        var decparts = parts[0].split(".");
+        decparts[1] = $PY.format_fixed_digits(decparts[1], prec);
+        parts[0] = decparts[0] + "." + decparts[1];
+    }
+    if (drop_empty_exp && parts[1] === "+00") {
+        return parts[0];
+    } else {
+        return parts[0] + expchar + parts[1];
+    }
+};
+
+$PY.format_trim_zeroes = function(s) {
+    var i = s.length - 1;
+    while (s.charAt(i) === '0') {
+        i--;
+    }
+    s = s.substr(0, i + 1);
+    if (s.charAt(s.length - 1) === '.') {
+        s = s.substr(0, s.length - 1);
+    }
+    return s;
+};
+
+$PY.format_compile = function(s) {
+    var ops = [];
+    var lit = "";
+    var i = 0;
+    var si;
+
+    while (i < s.length) {
+        var next = s.indexOf("%", i);
+        if (next === -1) {
+            lit += s.substring(i);
+            break;
+        }
+        lit += s.substring(i, next);
+        i = next + 1;
+
+        var op = {
+            conv:  null,
+            zero:  false,
+            minus: false,
+            hash:  false,
+            plus:  false,
+            space: false,
+            len:   0,
+            len2:  0,
+            name:  null,
+            error: null
+        };
+        while (i < s.length) {
+            si = s.charAt(i);
+            if (si === "0") {
+                op.zero = true;
+            } else if (si === "-") {
+                op.minus = true;
+            } else if (si === "#") {
+                op.hash = true;
+            } else if (si === " ") {
+                op.space = true;
+            } else if (si === "+") {
+                op.space = false;
+                op.plus  = true;
+            } else if (si > "0" && si <= "9") {
+                var len = "";
+                while (si >= "0" && si <= "9") {
+                    len += si;
+                    si = s.charAt(++i);
+                }
+                op.len = Number(len);
+                i--;
+            } else if (si === ".") {
+                var len2 = "0";
+                si = s.charAt(++i);
+                while (si >= "0" && si <= "9") {
+                    len2 += si;
+                    si = s.charAt(++i);
+                }
+                op.len2 = Number(len2);
+                i--;
+            } else if (si === "(") {
+                op.name = "";
+                while (i++ < s.length) {
+                    si = s.charAt(i);
+                    if (si === ")") {
+                        break;
+                    }
+                    op.name += si;
+                }
+            } else if ("%diusrfFeEgGoxX".indexOf(si) !== -1) {
+                op.conv = si;
             } else {
-                return num.substring(0, digits);
+                op.error = "Unsupported format character '" + si + "' at index " + String(i);
+            }
+            i++;
+            if (op.conv !== null || op.error !== null) {
+                break;
             }
-        } else {
-            return num;
         }
-    };
-    var format_float = function(num, defprec, prec) {
-        if (prec < 1) {
-            prec = defprec;
+
+        if (op.conv === null && op.error === null) {
+            op.error = "Incomplete format";
         }
-        var parts = num.toFixed(prec+1).split(".");
-        if (prec > defprec) {
-            return parts[0] + "." + parts[1].substring(0, prec);
+
+        if (op.conv === "%" && op.len === 0 && op.name === null && !(op.space || op.plus)) {
+            lit += "%";
         } else {
-            return parts[0] + "." + fixed_digits(parts[1], prec);
-        }
-    };
-    var format_exp = function(num, expchar, defprec, prec, drop_empty_exp) {
-        var parts = num.toExponential(defprec).split("e");
-        if (parts[1].length < 3) {
-            parts[1] = parts[1].charAt(0) + "0" + parts[1].substring(1);
-        }
-        if (prec) {
-            var decparts = parts[0].split(".");
-            decparts[1] = fixed_digits(decparts[1], prec);
-            parts[0] = decparts[0] + "." + decparts[1];
+            if (lit !== "") {
+                ops.push(lit);
+                lit = "";
+            }
+            ops.push(op);
+            if (op.error !== null) {
+                return ops;
+            }
         }
-        if (drop_empty_exp && parts[1] === "+00") {
-            return parts[0];
+    }
+
+    if (lit !== "") {
+        ops.push(lit);
+    }
+    return ops;
+};
+
+$PY.format_convert = function(op, arg) {
+    var conv = op.conv;
+    var subres;
+    var prefix = "";
+    var has_sign = false;
+
+    if (conv === "s") {
+        subres = js(arg.PY$__str__());
+    } else if (conv === "d" || conv === "i" || conv === "u") {
+        has_sign = true;
+        subres = js(int(arg)).toString();
+    } else if (conv === "r") {
+        subres = js(arg.PY$__repr__());
+    } else if (conv === "%") {
+        subres = "%";
+    } else if (conv === "f" || conv === "F") {
+        has_sign = true;
+        subres = $PY.format_float(js(arg.PY$__float__()), 6, op.len2);
+    } else if (conv === "e" || conv === "E") {
+        has_sign = true;
+        subres = $PY.format_exp(js(arg.PY$__float__()), conv, 6, op.len2, false);
+    } else if (conv === "g" || conv === "G") {
+        has_sign = true;
+        var num = js(arg.PY$__float__());
+
+        var val = op.len2;
+        if (val === 0)
+            val = 6;
+
+        if (num === 0 && !op.hash) {
+            subres = "0";
+        } else if (num < 0.0001 || num.toFixed().split(".")[0].length > val) {
+            var expchar = (conv === "G") ? "E" : "e";
+            subres = $PY.format_exp(num, expchar, 5, op.len2-1, true);
+
+            if (!op.hash) {
+                var parts = subres.split(expchar);
+                subres = $PY.format_trim_zeroes(parts[0]);
+                if (parts[1]) {
+                    subres += expchar + parts[1];
+                }
+            }
         } else {
-            return parts[0] + expchar + parts[1];
+            subres = $PY.format_float(num, 5, op.len2-1);
+            if (!op.hash) {
+                subres = $PY.format_trim_zeroes(subres);
+            }
         }
-    };
-    var trim_trailing_zeroes = function(s) {
-        var i = s.length - 1;
-        while (s.charAt(i) === '0') {
-            i--;
+    } else if (conv === "o") {
+        has_sign = true;
+        subres = js(arg.PY$__int__()).toString(8);
+        if (op.hash && subres.charAt(0) !== "0")
+            prefix = "0";
+    } else if (conv === "x") {
+        has_sign = true;
+        if (op.hash)
+            prefix = "0x";
+        subres = js(arg.PY$__int__()).toString(16);
+    } else {
+        has_sign = true;
+        if (op.hash)
+            prefix = "0X";
+        subres = js(arg.PY$__int__()).toString(16).toUpperCase();
+    }
+
+    var sign = "";
+    if (has_sign) {
+        if (subres.charAt(0) === "-" || subres.charAt(0) === "+") {
+            sign = subres.charAt(0);
+            subres = subres.substring(1);
+        } else if (op.plus) {
+            sign = "+";
         }
-        s = s.substr(0, i + 1);
-        if (s.charAt(s.length - 1) === '.') {
-            s = s.substr(0, s.length - 1);
+    }
+    if (op.space) {
+        prefix = " " + prefix;
+    }
+    var pad_char = op.zero ? "0" : " ";
+    var pad = "";
+    for (var c = sign.length + prefix.length + subres.length; c < op.len; c++)
+        pad = pad + pad_char;
+    if (op.minus) {
+        return sign + prefix + subres + pad;
+    } else if (op.zero) {
+        return sign + pad + prefix + subres;
+    } else {
+        return pad + sign + prefix + subres;
+    }
+};
+
+$PY.format_cache = {
+    entries: {},
+    size:    0,
+    limit:   256,
+    head:    null,
+    tail:    null
+};
+
+/*
+ * Returns the compiled form of the format string s, and marks it as the
+ * most recently used entry of the cache.
+ */
+$PY.format_lookup = function(s) {
+    var cache = $PY.format_cache;
+    var key = "%" + s;
+    var entry = cache.entries[key];
+
+    if (entry !== undefined) {
+        if (entry !== cache.head) {
+            entry.prev.next = entry.next;
+            if (entry.next !== null) {
+                entry.next.prev = entry.prev;
+            } else {
+                cache.tail = entry.prev;
+            }
+            entry.prev = null;
+            entry.next = cache.head;
+            cache.head.prev = entry;
+            cache.head = entry;
         }
-        return s;
-    };
+        return entry.ops;
+    }
 
-    var s = js(obj);
-    var i = 0;
+    entry = {key: key, ops: $PY.format_compile(s), prev: null, next: cache.head};
+    if (cache.head !== null) {
+        cache.head.prev = entry;
+    } else {
+        cache.tail = entry;
+    }
+    cache.head = entry;
+    cache.entries[key] = entry;
+
+    if (++cache.size > cache.limit) {
+        var last = cache.tail;
+        cache.tail = last.prev;
+        cache.tail.next = null;
+        delete cache.entries[last.key];
+        cache.size--;
+    }
+    return entry.ops;
+};
+
+$PY.format_seqtypes = [dict, list, tuple];
+
+function sprintf(obj, args) {
+    var ops = $PY.format_lookup(js(obj));
     var res = "";
     var argc = 0;
-    var si;
-    if ($PY.isinstance(args, [dict, list, tuple]) === false) {
+
+    if ($PY.isinstance(args, $PY.format_seqtypes) === false) {
         args = tuple([args]);
     }
-    while (i < s.length) {
-        si = s.charAt(i);
-        if (si === "%") {
-            if (++i === s.length) {
-                throw __builtins__.PY$ValueError("Incomplete format");
-            }
 
-            var flag_zero  = false;
-            var flag_minus = false;
-            var flag_hash  = false;
-            var flag_plus  = false;
-            var flag_space = false;
-            var flag_len   = 0;
-            var flag_len2  = 0;
-            var subres     = null;
-            var prefix     = "";
-            var has_sign  = false;
-            var flag_name  = null;
-            while (i < s.length) {
-                si = s.charAt(i);
-                if (si === "0") {
-                    flag_zero = true;
-                } else if (si === "-") {
-                    flag_minus = true;
-                } else if (si === "#") {
-                    flag_hash = true;
-                } else if (si === "0") {
-                    flag_zero = true;
-                } else if (si === " ") {
-                    flag_space = true;
-                } else if (si === "+") {
-                    flag_space = false;
-                    flag_plus  = true;
-                } else if (si > "0" && si <= "9") {
-                    flag_len = "";
-                    while (si >= "0" && si <= "9") {
-                        flag_len += si;
-                        si = s.charAt(++i);
-                    }
-                    flag_len = Number(flag_len);
-                    i--;
-                } else if (si === ".") {
-                    si = s.charAt(++i);
-                    while (si >= "0" && si <= "9") {
-                        flag_len2 += si;
-                        si = s.charAt(++i);
-                    }
-                    flag_len2 = Number(flag_len2);
-                    i--;
-                } else if (si === "(") {
-                    flag_name = "";
-                    while (i++ < s.length) {
-                        si = s.charAt(i);
-                        if (si === ")") {
-                            break;
-                        }
-                        flag_name += si;
-                    }
-                } else if (si === "%") {
-                    subres = "%";
-                } else if (si === "d" || si === "i" || si === "u") {
-                    has_sign = true;
-                    subres = js(int(get_argument())).toString();
-                } else if (si === "s") {
-                    subres = js(get_argument().PY$__str__());
-                } else if (si === "r") {
-                    subres = js(get_argument().PY$__repr__());
-                } else if (si === "f" || si === "F") {
-                    has_sign = true;
-                    subres = format_float(js(get_argument().PY$__float__()), 6, flag_len2);
-                } else if (si === "e" || si === "E") {
-                    has_sign = true;
-                    var expchar = si;
-                    subres = format_exp(js(get_argument().PY$__float__()), expchar, 6, flag_len2, false);
-                } else if (si === "g" || si === "G") {
-                    has_sign = true;
-                    var arg = js(get_argument().PY$__float__());
-
-                    var val = flag_len2;
-                    if (val === 0)
-                        val = 6;
-
-                    if (arg === 0 && !flag_hash) {
-                        subres = "0";
-                    } else if (arg < 0.0001 || arg.toFixed().split(".")[0].length > val) {
-                        expchar = "e";
-                        if (si === "G")
-                            expchar = "E";
-                        subres = format_exp(arg, expchar, 5, flag_len2-1, true);
-
-                        if (!flag_hash) {
-                            var parts = subres.split(expchar);
-                            subres = trim_trailing_zeroes(parts[0]);
-                            if (parts[1]) {
-                                subres += expchar + parts[1];
-                            }
-                        }
-                    } else {
-                        subres = format_float(arg, 5, flag_len2-1);
-                        if (!flag_hash) {
-                            subres = trim_trailing_zeroes(subres);
-                        }
-                    }
-                } else if (si === "o") {
-                    has_sign = true;
-                    subres = js(get_argument().PY$__int__()).toString(8);
-                    if (flag_hash && subres.charAt(0) !== "0")
-                        prefix = "0";
-                } else if (si === "x") {
-                    has_sign = true;
-                    if (flag_hash)
-                        prefix = "0x";
-                    subres = js(get_argument().PY$__int__()).toString(16);
-                } else if (si === "X") {
-                    has_sign = true;
-                    if (flag_hash)
-                        prefix = "0X";
-                    subres = js(get_argument().PY$__int__()).toString(16).toUpperCase();
-                } else {
-                    throw __builtins__.PY$ValueError("Unsupported format character '" + si + "' at index " + String(i));
-                }
-                i++;
-                if (subres != null)
-                    break;
-            }
-            var pad_char = " ";
-            if (flag_zero)
-                pad_char = "0";
-            var sign = "";
-            if (has_sign) {
-                if (subres.charAt(0) === "-" || subres.charAt(0) === "+") {
-                    sign = subres.charAt(0);
-                    subres = subres.substring(1);
-                } else if (flag_plus) {
-                    sign = "+";
-                }
-            }
-            if (flag_space) {
-                prefix = " " + prefix;
-            }
-            if (pad_char === " x") {
-                prefix = sign + prefix;
-                sign = "";
-            }
-            var pad = "";
-            for (var c = sign.length + prefix.length + subres.length; c < flag_len; c++)
-                pad = pad + pad_char;
-            if (flag_minus) {
-                res += sign + prefix + subres + pad;
-            } else {
-                if (flag_zero) {
-                    res += sign + pad + prefix + subres;
-                } else {
-                    res += pad + sign + prefix + subres;
-                }
-            }
-         } else {
-             res += si;
-             i++;
+    for (var i = 0; i < ops.length; i++) {
+        var op = ops[i];
+        if (typeof op === "string") {
+            res += op;
+        } else if (op.error !== null) {
+            throw __builtins__.PY$ValueError(op.error);
+        } else if (op.conv === "%") {
+            res += $PY.format_convert(op, null);
+        } else if (op.name !== null) {
+            res += $PY.format_convert(op, args.PY$__getitem__(op.name));
+        } else {
+            res += $PY.format_convert(op, args.PY$__getitem__(argc++));
         }
     }
     return res;
@@ -1,23 +1,68 @@
 $PY.__import_cache = {};
 
-function __import__(name, dotted_caller) {
-	
-	if(!(name in $PY.modules)) {
-		var dotted_array = dotted_caller.split('.');
-		dotted_array = dotted_array.slice(0,-1);
-		var tempname = dotted_array.join('.') + '.' + name;
-		if(!(tempname in $PY.modules)) {
-			tempname = dotted_caller + '.' + name;
-			if(!(tempname in $PY.modules)) {
-				throw __builtins__.PY$ImportError(str('Could not import "'+name+'".'));
-			}
+/*
+ * Modules that pyjs.py --bundle --chunk left out of the main file, by name,
+ * with the chunk file that holds them, relative to $PY.chunk_base. A chunk
+ * is loaded by $PY.load_chunk when one of its modules is first imported.
+ * The default loads the file with load() of the javascript shell; pages
+ * plug in their own loader. A chunk that fails to load is tried again on
+ * the next import.
+ */
+$PY.chunks = {};
+$PY.loaded_chunks = {};
+$PY.chunk_base = '';
+
+$PY.load_chunk = function(chunk) {
+	load($PY.chunk_base + chunk);
+};
+
+$PY.has_module = function(name) {
+	if(name in $PY.modules) {
+		return true;
+	}
+	var chunk = $PY.chunks[name];
+	if(chunk !== undefined && $PY.loaded_chunks[chunk] !== true) {
+		try {
+			$PY.load_chunk(chunk);
+		} catch (e) {
+			throw __builtins__.PY$ImportError(str('Could not load chunk "' + chunk + '" of module "' + name + '": ' + e));
+		}
+		$PY.loaded_chunks[chunk] = true;
+		return name in $PY.modules;
+	}
+	return false;
+};
+
+/*
+ * The module each name imported by a module refers to, by the name of the
+ * importing module. pyjs.py --bundle fills it in for the modules it finds,
+ * and $PY.find_module remembers the rest the first time they are looked up.
+ */
+$PY.import_table = {};
+
+$PY.find_module = function(name, dotted_caller) {
+	var table = $PY.import_table[dotted_caller];
+	if(table === undefined) {
+		table = $PY.import_table[dotted_caller] = {};
+	} else if(table.hasOwnProperty(name)) {
+		return table[name];
+	}
+	var parent = dotted_caller.slice(0, Math.max(dotted_caller.lastIndexOf('.'), 0));
+	var candidates = [name, parent + '.' + name, dotted_caller + '.' + name];
+	for(var i = 0; i < candidates.length; i++) {
+		if($PY.has_module(candidates[i])) {
+			return table[name] = candidates[i];
 		}
-		name = tempname;
 	}
-	
+	return null;
+};
+
+$PY.load_module = function(name) {
 	var module = $PY.__import_cache[name];
-	
 	if(module === undefined) {
+		if(!$PY.has_module(name)) {
+			throw __builtins__.PY$ImportError(str('Could not import "' + name + '".'));
+		}
 		var kwargs = {
 			"__name__": name,
 			"__builtins__": __builtins__,
@@ -25,6 +70,37 @@ function __import__(name, dotted_caller) {
 		};
 		module = $PY.__import_cache[name] = $PY.modules[name](__kwargs_make(kwargs));
 	}
-	
 	return module;
-}
\ No newline at end of file
+};
+
+function __import__(name, dotted_caller) {
+	var table = $PY.import_table[dotted_caller];
+	var found = (table !== undefined && table.hasOwnProperty(name)) ? table[name] : $PY.find_module(name, dotted_caller);
+	if(found === null) {
+		throw __builtins__.PY$ImportError(str('Could not import "'+name+'".'));
+	}
+	var module = $PY.__import_cache[found];
+	return module !== undefined ? module : $PY.load_module(found);
+}
+
+/*
+ * from module import a, b: binds all names with one import of the module.
+ */
+$PY.import_from = function(module, names) {
+	var values = [];
+	for(var i = 0; i < names.length; i++) {
+		var value = module["PY$" + names[i]];
+		if(value === undefined) {
+			try {
+				value = module.PY$__getattr__(names[i]);
+			} catch (e) {
+				if($PY.isinstance(e, __builtins__.PY$AttributeError)) {
+					throw __builtins__.PY$ImportError('Could not find ' + names[i]);
+				}
+				throw e;
+			}
+		}
+		values.push(value);
+	}
+	return values;
+};
@@ -0,0 +1,59 @@
+/**
+  Copyright 2011 Christian Iversen <ci@sikkerhed.org>
+
+  Permission is hereby granted, free of charge, to any person
+  obtaining a copy of this software and associated documentation
+  files (the "Software"), to deal in the Software without
+  restriction, including without limitation the rights to use,
+  copy, modify, merge, publish, distribute, sublicense, and/or sell
+  copies of the Software, and to permit persons to whom the
+  Software is furnished to do so, subject to the following
+  conditions:
+
+  The above copyright notice and this permission notice shall be
+  included in all copies or substantial portions of the Software.
+
+  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+  OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+  NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+  HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+  OTHER DEALINGS IN THE SOFTWARE.
+
+/*
+ * Replaces the functions of 11-classes.js that pass on any number of
+ * arguments, for --target es2015. The arguments come in a rest parameter,
+ * so that calls with more than a few of them no longer copy the arguments
+ * object with slice.
+ */
+
+object.PY$__create__ = function(cls, ...args) {
+    var obj;
+    if (cls.PY$__call__ === undefined) {
+        obj = new cls.__alloc();
+    } else {
+        obj = __callable_instance(cls);
+    }
+
+    switch (args.length) {
+        case 0: obj.PY$__init__(); break;
+        case 1: obj.PY$__init__(args[0]); break;
+        case 2: obj.PY$__init__(args[0], args[1]); break;
+        case 3: obj.PY$__init__(args[0], args[1], args[2]); break;
+        default: obj.PY$__init__(...args);
+    }
+    return obj;
+};
+
+$PY.callmethod = function(obj, key, name, ...args) {
+    var q = $PY.method(obj, key, name);
+    switch (args.length) {
+        case 0: return q.call(obj);
+        case 1: return q.call(obj, args[0]);
+        case 2: return q.call(obj, args[0], args[1]);
+        case 3: return q.call(obj, args[0], args[1], args[2]);
+        default: return q.apply(obj, args);
+    }
+};
@@ -6,9 +6,13 @@ import os.path
 import datetime
 import time
 import traceback
-import pkg_resources
-from optparse import OptionParser
-from pyjaco import Compiler
+import socket
+import stat
+import json
+from optparse import OptionParser, Values
+
+# pkg_resources and the compiler itself are imported where they are used,
+# so that client mode (--connect) does not pay for them
 
 # extensions of files that can be compiled to .js
 VALID_EXTENSIONS = ['.py', '.pyjaco']
@@ -43,43 +47,199 @@ class BuiltinGenerator(object):
             elif not BLANK.match(line) and not COMMENT.match(line):
                 yield line
 
-    def generate_builtins(self):
+    def generate_builtins(self, target = "es5"):
         '''Combine the builtins shipped with the pyjaco library into a single
-        py-builtins.js file.'''
+        py-builtins.js file. For --target es2015, the files in stdlib/es2015
+        follow the stdlib files of the same name, and replace some of their
+        functions with ones using newer language features.'''
+        import pkg_resources
         builtin_lines = []
         js_filenames = sorted(
                 [f for f in pkg_resources.resource_listdir("pyjaco", "stdlib") if (f.endswith(".js") and not f.startswith("."))])
         for js_filename in js_filenames:
-            builtin_lines.append("\n/* %-30s*/" % js_filename)
-            lines = self.comment_stripper(pkg_resources.resource_string(
-                "pyjaco", "stdlib/%s" % js_filename
-                ).splitlines())
-            builtin_lines.extend(lines)
+            paths = ["stdlib/%s" % js_filename]
+            if target != "es5" and pkg_resources.resource_exists("pyjaco", "stdlib/%s/%s" % (target, js_filename)):
+                paths.append("stdlib/%s/%s" % (target, js_filename))
+            for path in paths:
+                builtin_lines.append("\n/* %-30s*/" % path[len("stdlib/"):])
+                lines = self.comment_stripper(pkg_resources.resource_string(
+                    "pyjaco", path
+                    ).splitlines())
+                builtin_lines.extend(lines)
 
         return "\n".join(builtin_lines)
 
 
-def compile_file(infile, outfile, options):
-    '''Compile a single python file object to a single javascript output file
-    object'''
+def compile_source(source, filename, options, builtins = None, diagnostics = None):
+    '''Compile python source code to javascript, and return it as a string.
+    builtins is the standard library to use for --builtins=include, which is
+    generated if not given. Timings are written to diagnostics, stderr by
+    default.'''
+    from pyjaco import Compiler
+
+    res = []
     if options.builtins == "include":
-        builtins = BuiltinGenerator().generate_builtins()
+        if builtins is None:
+            builtins = BuiltinGenerator().generate_builtins(options.target)
 
-        outfile.write("/*%s*/\n" % "  Standard library  ".center(76, "*"))
-        outfile.write(builtins)
-        outfile.write("/*%s*/\n" % "  User code  ".center(76, "*"))
+        res.append("/*%s*/\n" % "  Standard library  ".center(76, "*"))
+        res.append(builtins)
+        res.append("/*%s*/\n" % "  User code  ".center(76, "*"))
     elif options.builtins == "import":
-        outfile.write('load("py-builtins.js");\n')
+        res.append('load("py-builtins.js");\n')
 
-    c = Compiler()
+    c = Compiler(opts = dict(raw_numbers = options.raw_numbers, raw_strings = options.raw_strings,
+                             bind_args = options.bind_args, target = options.target, optimize = options.optimize))
     if options.as_module:
         kwargs = {}
         if options.module_base:
             kwargs["base"] = options.module_base
-        c.append_module(infile.read(), infile.name, **kwargs)
+        c.append_module(source, filename, **kwargs)
     else:
-        c.append_string(infile.read())
-    outfile.write(str(c))
+        c.append_string(source)
+    if getattr(options, "timings", False):
+        for line in c.passes.format_timings():
+            (diagnostics or sys.stderr).write("[%s] %s: %s\n" % (datetime.datetime.now(), filename, line))
+    res.append(str(c))
+    return "".join(res)
+
+def compile_file(infile, outfile, options):
+    '''Compile a single python file object to a single javascript output file
+    object'''
+    if options.connect:
+        outfile.write(CompileClient(options.connect).compile_file(infile, options))
+    else:
+        outfile.write(compile_source(infile.read(), infile.name, options))
+
+class Bundler(object):
+    '''Compiles a program and all modules it imports into one javascript
+    file. Modules are found the way __import__ looks them up at run time,
+    relative to the base directory, and emitted with the modules they import
+    first, along with the table __import__ resolves their imports with.
+    Module bodies still only run on their first import, and the entry
+    module is run as __main__ at the end.'''
+    def __init__(self, entry, options):
+        from pyjaco import Compiler
+        self.options = options
+        self.base = os.path.abspath(options.module_base or os.getcwd())
+        self.entry = Compiler.module_name(entry, self.base)
+        self.paths = {self.entry: entry}
+        self.order = []
+        self.resolved = {}
+
+    def module_path(self, dotted):
+        '''The file of module dotted, or None if there is none.'''
+        path = os.path.join(self.base, *dotted.split("."))
+        for ext in VALID_EXTENSIONS:
+            for candidate in (path + ext, os.path.join(path, "__init__" + ext)):
+                if os.path.isfile(candidate):
+                    return candidate
+        return None
+
+    def resolve(self, name, caller):
+        '''Dotted name of the module that name refers to when imported from
+        module caller, or None if it cannot be found.'''
+        candidates = [name]
+        if "." in caller:
+            candidates.append("%s.%s" % (caller.rsplit(".", 1)[0], name))
+        candidates.append("%s.%s" % (caller, name))
+        for dotted in candidates:
+            if dotted in self.paths:
+                return dotted
+            path = self.module_path(dotted)
+            if path:
+                self.paths[dotted] = path
+                return dotted
+        return None
+
+    def imports(self, dotted, tree):
+        '''Names imported by the module, as they are passed to __import__,
+        including the packages of dotted names and the names imported from
+        packages, as (name, required) pairs. Names imported from a module
+        are not required, as they are usually not modules themselves.'''
+        import ast
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    parts = alias.name.split(".")
+                    names.extend((".".join(parts[:i + 1]), True) for i in range(len(parts)))
+            elif isinstance(node, ast.ImportFrom) and node.module not in ("__future__", "__javascript__"):
+                names.append((node.module, True))
+                names.extend(("%s.%s" % (node.module, alias.name), False) for alias in node.names)
+        return names
+
+    def visit(self, dotted, sources):
+        import ast
+        sources[dotted] = open(self.paths[dotted]).read()
+        for name, required in self.imports(dotted, ast.parse(sources[dotted], self.paths[dotted])):
+            dep = self.resolve(name, dotted)
+            if dep is None:
+                if required and not self.options.quiet:
+                    sys.stderr.write("[%s] %s: cannot find module %s, leaving it out\n" % (datetime.datetime.now(), dotted, name))
+                continue
+            self.resolved.setdefault(dotted, {})[name] = dep
+            if dep not in sources:
+                self.visit(dep, sources)
+        self.order.append(dotted)
+
+    def chunk_of(self, dotted):
+        '''Index of the --chunk option that module dotted belongs to, or None
+        if it goes into the main file. Chunks name packages or modules, either
+        by their full dotted name or relative to the package of the entry
+        module.'''
+        package = self.entry.rsplit(".", 1)[0] + "." if "." in self.entry else ""
+        for i, chunk in enumerate(self.options.chunks):
+            for name in (chunk, package + chunk):
+                if dotted == name or dotted.startswith(name + "."):
+                    return i
+        return None
+
+    def chunk_path(self, output, i):
+        root, ext = os.path.splitext(output)
+        return "%s.%d%s" % (root, i + 1, ext or ".js")
+
+    def bundle(self, outfile, output = None):
+        '''Write the bundle to outfile. Modules that go into chunks are written
+        to files next to output, the name of the main file.'''
+        sources = {}
+        self.visit(self.entry, sources)
+
+        options = Values(dict((k, getattr(self.options, k)) for k in SERVER_OPTIONS))
+        options.as_module = True
+        options.module_base = self.base
+        chunks = {}
+        for dotted in self.order:
+            i = self.chunk_of(dotted) if dotted != self.entry else None
+            if not self.options.quiet:
+                sys.stderr.write("[%s] bundling %s as %s%s\n" % (datetime.datetime.now(), self.paths[dotted], dotted,
+                    "" if i is None else " in chunk %d" % (i + 1)))
+            if i is None:
+                outfile.write(compile_source(sources[dotted], self.paths[dotted], options))
+                options.builtins = "none"
+            else:
+                chunks.setdefault(i, []).append(dotted)
+
+        chunk_options = Values(dict(options.__dict__, builtins = "none"))
+        for i, modules in sorted(chunks.items()):
+            path = self.chunk_path(output, i)
+            with open(path, "w") as chunkfile:
+                for dotted in modules:
+                    chunkfile.write(compile_source(sources[dotted], self.paths[dotted], chunk_options))
+            # Chunks are named relative to the main file, and found through
+            # $PY.chunk_base at run time
+            for dotted in modules:
+                outfile.write("$PY.chunks['%s'] = '%s';\n" % (dotted, os.path.basename(path)))
+        if chunks and self.options.chunk_base is not None:
+            outfile.write("$PY.chunk_base = '%s';\n" % self.options.chunk_base.replace("\\", "/"))
+        # The modules each module imports were found above, so __import__
+        # does not have to search for them again.
+        for dotted in self.order:
+            table = self.resolved.get(dotted)
+            if table:
+                outfile.write("$PY.import_table['%s'] = {%s};\n" % (dotted,
+                    ", ".join("'%s': '%s'" % item for item in sorted(table.items()))))
+        outfile.write("$PY.run_module('%s', '__main__');\n" % self.entry)
 
 def run_once(input_filenames, options):
     '''Given the input filenames and collection of options, run the compilation
@@ -98,7 +258,7 @@ def run_once(input_filenames, options):
         else:
             builtin_output = sys.stdout
 
-        builtins = BuiltinGenerator().generate_builtins()
+        builtins = BuiltinGenerator().generate_builtins(options.target)
         builtin_output.write(builtins)
 
     if len(input_filenames) == 1 and not os.path.isdir(input_filenames[0]):
@@ -199,6 +359,147 @@ class Monitor:
 
             time.sleep(1)
 
+# Options that change the output of the compiler, and so are sent along
+# with each request to a compile server
+SERVER_OPTIONS = ["builtins", "as_module", "module_base", "raw_numbers", "raw_strings", "bind_args", "target", "optimize", "timings"]
+
+class CompileError(Exception):
+    pass
+
+class CompileServer(object):
+    '''Compiles files sent by pyjs.py --connect over a Unix socket, so that
+    each compilation does not have to start python and load the compiler.
+
+    A request is a JSON object with the source, file name and options, sent
+    by a client that then shuts down its side of the connection. The reply is
+    a JSON object with the javascript, or an error message, the warnings and
+    timings of the compilation, and the time it took. Requests are handled
+    in threads of their own.'''
+    def __init__(self, path, quiet = False):
+        import SocketServer
+        import pkg_resources
+        import threading
+
+        self.path = path
+        self.quiet = quiet
+        self.lock = threading.Lock()
+        self.compile_lock = threading.Lock()
+        self.stdlib = pkg_resources.resource_filename("pyjaco", "stdlib")
+        self.builtins = {}
+        self.builtins_mtimes = None
+
+        server = self
+
+        class Handler(SocketServer.StreamRequestHandler):
+            def handle(self):
+                self.wfile.write(json.dumps(server.handle(self.rfile.read())))
+
+        if os.path.exists(path):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise CompileError("%s exists and is not a socket\n" % path)
+            os.unlink(path)
+        self.server = SocketServer.ThreadingUnixStreamServer(path, Handler)
+        self.server.daemon_threads = True
+
+    def stdlib_mtimes(self):
+        '''Modification times of the stdlib files, which make up the builtins.'''
+        mtimes = {}
+        for root, dirs, files in os.walk(self.stdlib):
+            for f in files:
+                mtimes[os.path.join(root, f)] = os.stat(os.path.join(root, f)).st_mtime
+        return mtimes
+
+    def get_builtins(self, target):
+        '''The builtins of target for --builtins=include, generated again when
+        any of the stdlib files has changed.'''
+        with self.lock:
+            mtimes = self.stdlib_mtimes()
+            if mtimes != self.builtins_mtimes:
+                self.builtins = {}
+                self.builtins_mtimes = mtimes
+            if target not in self.builtins:
+                self.builtins[target] = BuiltinGenerator().generate_builtins(target)
+            return self.builtins[target]
+
+    def handle(self, data):
+        import warnings
+        import StringIO
+
+        start = time.time()
+        request = {}
+        diagnostics = StringIO.StringIO()
+        try:
+            request = json.loads(data)
+            options = Values(dict((str(k), v) for k, v in request["options"].items()))
+            builtins = self.get_builtins(options.target) if options.builtins == "include" else None
+            source = request["source"].encode("utf-8")
+            # The warnings filters are shared by all threads, so warnings are
+            # caught for one compilation at a time
+            with self.compile_lock:
+                with warnings.catch_warnings(record = True) as caught:
+                    warnings.simplefilter("always")
+                    try:
+                        res = dict(js = compile_source(source, request["filename"], options, builtins, diagnostics).decode("utf-8"))
+                    finally:
+                        for w in caught:
+                            diagnostics.write(warnings.formatwarning(w.message, w.category, w.filename, w.lineno))
+        except Exception:
+            res = dict(error = traceback.format_exc())
+        res["diagnostics"] = diagnostics.getvalue()
+        res["time"] = time.time() - start
+        if not self.quiet:
+            sys.stderr.write("[%s] compiled %s in %.1f ms\n" % (datetime.datetime.now(), request.get("filename"), res["time"] * 1000))
+        return res
+
+    def run(self):
+        import signal
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        if not self.quiet:
+            sys.stderr.write("[%s] listening on %s\n" % (datetime.datetime.now(), self.path))
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server.server_close()
+            os.unlink(self.path)
+
+class CompileClient(object):
+    '''Sends files to a CompileServer to compile them.'''
+    def __init__(self, path):
+        self.path = path
+
+    def compile_file(self, infile, options):
+        request = dict(
+            source = infile.read(),
+            filename = os.path.abspath(infile.name),
+            options = dict((k, getattr(options, k)) for k in SERVER_OPTIONS))
+        # Paths are resolved here, as the server runs in another directory
+        if options.as_module:
+            request["options"]["module_base"] = os.path.abspath(options.module_base or os.getcwd())
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+            sock.sendall(json.dumps(request))
+            sock.shutdown(socket.SHUT_WR)
+            data = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data.append(chunk)
+        finally:
+            sock.close()
+
+        reply = json.loads("".join(data))
+        sys.stderr.write(reply.get("diagnostics", ""))
+        if not options.quiet:
+            sys.stderr.write("[%s] server compiled %s in %.1f ms\n" % (datetime.datetime.now(), infile.name, reply["time"] * 1000))
+        if "error" in reply:
+            raise CompileError(reply["error"])
+        return reply["js"].encode("utf-8")
+
 parser = OptionParser(usage="""%prog [options] <infile>
         
         where infile is the name of a file or directory to be compiled.
@@ -249,9 +550,98 @@ def main():
             default = None,
             help   = "base path used to calculate dotted path for module")
 
+    parser.add_option("--raw-numbers",
+            action = "store_true",
+            dest   = "raw_numbers",
+            default = False,
+            help   = "represent ints as plain javascript numbers")
+
+    parser.add_option("--raw-strings",
+            action = "store_true",
+            dest   = "raw_strings",
+            default = False,
+            help   = "represent strs as plain javascript strings")
+
+    parser.add_option("--bind-args",
+            action = "store_true",
+            dest   = "bind_args",
+            default = False,
+            help   = "bind the arguments of functions through a shared helper, with an inline check for plain positional calls, instead of unpacking them in each function")
+
+    parser.add_option("--target",
+            action = "store",
+            dest   = "target",
+            choices = ["es5", "es2015"],
+            default = "es5",
+            help   = "language version of the javascript: ES5 (the default) or ES2015, which declares variables with let, takes variable arguments as rest parameters and uses default parameters, for the compiled code and the builtins")
+
+    parser.add_option("-O",
+            action = "store",
+            type   = "int",
+            dest   = "optimize",
+            default = 0,
+            metavar = "LEVEL",
+            help   = "optimisation level: -O0 (the default) compiles the code as written, -O1 folds constants and drops dead and unreachable code, -O2 also inlines small functions, hoists invariant reads out of loops and drops assert statements")
+
+    parser.add_option("--timings",
+            action = "store_true",
+            dest   = "timings",
+            default = False,
+            help   = "print the time spent in each optimisation pass to stderr")
+
+    parser.add_option("--bundle",
+            action = "store_true",
+            dest   = "bundle",
+            default = False,
+            help   = "compile the input file and every module it imports into a single file, which runs the input file as __main__")
+
+    parser.add_option("--chunk",
+            action = "append",
+            dest   = "chunks",
+            default = [],
+            metavar = "PACKAGE",
+            help   = "with --bundle, put PACKAGE (a module or package, and everything in it) in a chunk file of its own, which is only loaded when first imported; can be given more than once")
+
+    parser.add_option("--chunk-base",
+            action = "store",
+            dest   = "chunk_base",
+            default = None,
+            metavar = "BASE",
+            help   = "with --chunk, load chunk files from BASE, a directory or URL ending in a slash (default: the current directory, or $PY.chunk_base as set by the page)")
+
+    parser.add_option("--serve",
+            action = "store",
+            dest   = "serve",
+            default = None,
+            metavar = "SOCKET",
+            help   = "run a compile server on the Unix socket SOCKET")
+
+    parser.add_option("--connect",
+            action = "store",
+            dest   = "connect",
+            default = None,
+            metavar = "SOCKET",
+            help   = "compile through the compile server on SOCKET (see --serve)")
+
     options, args = parser.parse_args()
 
-    if len(args) == 0 and options.builtins != "generate":
+    if options.serve:
+        try:
+            server = CompileServer(options.serve, options.quiet)
+        except CompileError as e:
+            parser.error(str(e).strip())
+        server.run()
+    elif options.bundle:
+        if len(args) != 1 or not os.path.isfile(args[0]):
+            parser.error("--bundle takes exactly one input file, the entry module")
+        if options.chunks and not options.output:
+            parser.error("--chunk needs --output, to name the chunk files after")
+        if options.output:
+            with open(options.output, "w") as output:
+                Bundler(args[0], options).bundle(output, options.output)
+        else:
+            Bundler(args[0], options).bundle(sys.stdout)
+    elif len(args) == 0 and options.builtins != "generate":
         parser.error("No input path specified. You must supply an input file, or pass --builtins=generate")
     elif len(args) > 1 and not os.path.isdir(options.output):
         parser.error("Multiple input arguments supplied, but output is not a directory.")
@@ -261,7 +651,11 @@ def main():
                 parser.error("The input path '%s' does not point to a valid file or directory" % arg)
 
         if not options.watch:
-            run_once(args, options)
+            try:
+                run_once(args, options)
+            except CompileError as e:
+                sys.stderr.write(str(e))
+                sys.exit(1)
         else:
             monitor = Monitor(args, options)
             monitor.run()
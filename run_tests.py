@@ -69,10 +69,67 @@ def main():
         default=False,
         help="clean tests before running"
         )
+    option_parser.add_option(
+        "-r",
+        "--raw-numbers",
+        action="store_true",
+        dest="raw_numbers",
+        default=False,
+        help="compile tests with --raw-numbers (implies -c)"
+        )
+    option_parser.add_option(
+        "-s",
+        "--raw-strings",
+        action="store_true",
+        dest="raw_strings",
+        default=False,
+        help="compile tests with --raw-strings (implies -c)"
+        )
+    option_parser.add_option(
+        "-b",
+        "--bind-args",
+        action="store_true",
+        dest="bind_args",
+        default=False,
+        help="compile tests with --bind-args (implies -c)"
+        )
+    option_parser.add_option(
+        "-t",
+        "--target",
+        action="store",
+        dest="target",
+        choices=["es5", "es2015"],
+        default="es5",
+        help="compile tests and the builtins for javascript version TARGET (implies -c unless es5)"
+        )
+    option_parser.add_option(
+        "-O",
+        action="store",
+        type="int",
+        dest="optimize",
+        default=None,
+        metavar="LEVEL",
+        help="compile tests with optimisation level LEVEL (implies -c)"
+        )
     options, args = option_parser.parse_args()
+
+    flags = []
+    if options.optimize is not None:
+        flags.append("-O%d" % options.optimize)
+    if options.raw_numbers:
+        flags.append("--raw-numbers")
+    if options.raw_strings:
+        flags.append("--raw-strings")
+    if options.bind_args:
+        flags.append("--bind-args")
+    if options.target != "es5":
+        flags.append("--target %s" % options.target)
+    if flags:
+        testtools.util.COMPILE_FLAGS = " ".join(flags)
+        options.clean_first = True
     
     with open("py-builtins.js", "w") as f:
-        builtins = BuiltinGenerator().generate_builtins()
+        builtins = BuiltinGenerator().generate_builtins(options.target)
         f.write(builtins)
     
     if options.clean_first:
@@ -17,6 +17,6 @@ setup(
     url = "http://pyjaco.org",
     keywords = "python javascript translator compiler",
     packages=["pyjaco", "pyjaco.compiler"],
-    package_data={"pyjaco": ["stdlib/*.js"]},
+    package_data={"pyjaco": ["stdlib/*.js", "stdlib/es2015/*.js"]},
     data_files = [("pyjaco", [version_file, "_version.py"])],
 )
@@ -0,0 +1,19 @@
+load("py-builtins.js");
+var fib = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('fib() did not get parameter x');
+    };
+    if (bool(x.PY$__eq__($c1)) === True) {
+        return x;
+    } else {
+        return x.PY$__mul__(fib(x.PY$__sub__($c1)));
+    }
+    return None;
+};
+__builtins__.PY$print(fib($c4));
+
@@ -0,0 +1,73 @@
+load("py-builtins.js");
+var abs = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('abs() did not get parameter x');
+    };
+    if (bool(x.PY$__gt__($c0)) === True) {
+        return x;
+    } else {
+        return x.PY$__neg__();
+    }
+    return None;
+};
+var sqrt = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v2[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('sqrt() did not get parameter x');
+    };
+    var eps = $PY.mkfloat(1e-10);
+    x = __builtins__.PY$float(x);
+    var r = x.PY$__floordiv__($c2);
+    var residual = r.PY$__pow__($c2).PY$__sub__(x);
+    while (bool(abs(residual).PY$__gt__(eps)) === True) {
+        var r_d = residual.PY$__neg__().PY$__floordiv__($c2.PY$__mul__(r));
+        r = r.PY$__iadd__(r_d);
+        residual = r.PY$__pow__($c2).PY$__sub__(x);
+    }
+    return r;
+};
+var p = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v3[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('p() did not get parameter x');
+    };
+    var prec = $PY.mkint(11);
+    var l = __builtins__.PY$list(__builtins__.PY$iter(__builtins__.PY$str(x))).PY$__getitem__(slice(prec));
+    if (bool($PY.__not__(l.PY$__contains__(str('.')))) === True) {
+        $PY.method(l, 'PY$append', 'append').call(l, str('.'));
+        $PY.method(l, 'PY$append', 'append').call(l, str('0'));
+    }
+    while (bool(__builtins__.PY$len(l).PY$__lt__(prec)) === True) {
+        $PY.method(l, 'PY$append', 'append').call(l, str('0'));
+    }
+    var s = str('');
+    var $v4 = l;
+    var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+    var $v6 = 0;
+    var c;
+      for (; (c = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+        s = s.PY$__iadd__(c);
+      }
+    return s;
+};
+__builtins__.PY$print(p(sqrt($c1)));
+__builtins__.PY$print(p(sqrt($c2)));
+__builtins__.PY$print(p(sqrt($c3)));
+__builtins__.PY$print(p(sqrt($c4)));
+__builtins__.PY$print(p(sqrt($c5)));
+__builtins__.PY$print(p(sqrt($c6)));
+__builtins__.PY$print(p(sqrt($PY.mkint(7000))));
+
@@ -0,0 +1,457 @@
+load("py-builtins.js");
+var abs = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('abs() did not get parameter x');
+    };
+    if (bool(x.PY$__gt__($c0)) === True) {
+        return x;
+    } else {
+        return x.PY$__neg__();
+    }
+    return None;
+};
+var sqrt = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v2[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('sqrt() did not get parameter x');
+    };
+    var eps = $PY.mkfloat(1e-10);
+    x = __builtins__.PY$float(x);
+    var r = x.PY$__floordiv__($c2);
+    var residual = r.PY$__pow__($c2).PY$__sub__(x);
+    while (bool(abs(residual).PY$__gt__(eps)) === True) {
+        var r_d = residual.PY$__neg__().PY$__floordiv__($c2.PY$__mul__(r));
+        r = r.PY$__iadd__(r_d);
+        residual = r.PY$__pow__($c2).PY$__sub__(x);
+    }
+    return r;
+};
+var is_on_the_left = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var c = ('c' in __kwargs) ? __kwargs['c'] : $v3[0];
+    delete __kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('is_on_the_left() did not get parameter c');
+    };
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v3[1];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('is_on_the_left() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v3[2];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('is_on_the_left() did not get parameter b');
+    };
+    var pts_list = ('pts_list' in __kwargs) ? __kwargs['pts_list'] : $v3[3];
+    delete __kwargs.pts_list
+    if (pts_list === undefined) {
+        __builtins__.PY$print('is_on_the_left() did not get parameter pts_list');
+    };
+    var $v4 = pts_list.PY$__getitem__(a);
+    var $v5 = (($v4.PY$__class__ === tuple || $v4.PY$__class__ === list) && $v4.items.length === 2) ? $v4.items : $PY.unpack($v4, 2);
+    var ax = $v5[0];
+    var ay = $v5[1];
+    var $v6 = pts_list.PY$__getitem__(b);
+    var $v7 = (($v6.PY$__class__ === tuple || $v6.PY$__class__ === list) && $v6.items.length === 2) ? $v6.items : $PY.unpack($v6, 2);
+    var bx = $v7[0];
+    var by = $v7[1];
+    var $v8 = pts_list.PY$__getitem__(c);
+    var $v9 = (($v8.PY$__class__ === tuple || $v8.PY$__class__ === list) && $v8.items.length === 2) ? $v8.items : $PY.unpack($v8, 2);
+    var cx = $v9[0];
+    var cy = $v9[1];
+    var ux = __builtins__.PY$float(bx.PY$__sub__(ax));
+    var uy = __builtins__.PY$float(by.PY$__sub__(ay));
+    var vx = __builtins__.PY$float(cx.PY$__sub__(ax));
+    var vy = __builtins__.PY$float(cy.PY$__sub__(ay));
+    return ux.PY$__mul__(vy).PY$__sub__(uy.PY$__mul__(vx)).PY$__gt__($c0);
+};
+var criterion = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v10 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v10[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('criterion() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v10[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('criterion() did not get parameter b');
+    };
+    var c = ('c' in __kwargs) ? __kwargs['c'] : $v10[2];
+    delete __kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('criterion() did not get parameter c');
+    };
+    var pts_list = ('pts_list' in __kwargs) ? __kwargs['pts_list'] : $v10[3];
+    delete __kwargs.pts_list
+    if (pts_list === undefined) {
+        __builtins__.PY$print('criterion() did not get parameter pts_list');
+    };
+    var $v11 = pts_list.PY$__getitem__(a);
+    var $v12 = (($v11.PY$__class__ === tuple || $v11.PY$__class__ === list) && $v11.items.length === 2) ? $v11.items : $PY.unpack($v11, 2);
+    var ax = $v12[0];
+    var ay = $v12[1];
+    var $v13 = pts_list.PY$__getitem__(b);
+    var $v14 = (($v13.PY$__class__ === tuple || $v13.PY$__class__ === list) && $v13.items.length === 2) ? $v13.items : $PY.unpack($v13, 2);
+    var bx = $v14[0];
+    var by = $v14[1];
+    var $v15 = pts_list.PY$__getitem__(c);
+    var $v16 = (($v15.PY$__class__ === tuple || $v15.PY$__class__ === list) && $v15.items.length === 2) ? $v15.items : $PY.unpack($v15, 2);
+    var cx = $v16[0];
+    var cy = $v16[1];
+    var ux = __builtins__.PY$float(ax.PY$__sub__(cx));
+    var uy = __builtins__.PY$float(ay.PY$__sub__(cy));
+    var vx = __builtins__.PY$float(bx.PY$__sub__(cx));
+    var vy = __builtins__.PY$float(by.PY$__sub__(cy));
+    var len_u = sqrt(ux.PY$__mul__(ux).PY$__add__(uy.PY$__mul__(uy)));
+    var len_v = sqrt(vx.PY$__mul__(vx).PY$__add__(vy.PY$__mul__(vy)));
+    return ux.PY$__mul__(vx).PY$__add__(uy.PY$__mul__(vy)).PY$__floordiv__(len_u.PY$__mul__(len_v));
+};
+var find_third_point = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v17 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v17[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('find_third_point() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v17[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('find_third_point() did not get parameter b');
+    };
+    var pts_list = ('pts_list' in __kwargs) ? __kwargs['pts_list'] : $v17[2];
+    delete __kwargs.pts_list
+    if (pts_list === undefined) {
+        __builtins__.PY$print('find_third_point() did not get parameter pts_list');
+    };
+    var edges = ('edges' in __kwargs) ? __kwargs['edges'] : $v17[3];
+    delete __kwargs.edges
+    if (edges === undefined) {
+        __builtins__.PY$print('find_third_point() did not get parameter edges');
+    };
+    str("\n    Take a boundary edge (a,b), and in the list of points\n    find a point 'c' that lies on the left of ab and maximizes\n    the angle acb\n    ");
+    var found = $c0;
+    var minimum = $PY.mkint(10).PY$__pow__($c8);
+    var c_index = $PY.mkint(-1);
+    var pt_index = $PY.mkint(-1);
+    var $v18 = pts_list;
+    var $v19 = ($v18.PY$__class__ === list || $v18.PY$__class__ === tuple) ? null : iter($v18);
+    var $v20 = 0;
+    var c_point;
+      for (; (c_point = ($v19 === null ? ($v20 < $v18.items.length ? $v18.items[$v20++] : null) : $PY.next($v19))) !== null; ) {
+        c_index = c_index.PY$__iadd__($c1);
+        if (bool(bool(c_index.PY$__ne__(a)) === True && bool(c_index.PY$__ne__(b)) === True && bool(is_on_the_left(c_index, a, b, pts_list)) === True) === True) {
+            var edge_intersects = function() { var $v21; bool($v21 = edge_intersects_edges(tuple([a, c_index]), pts_list, edges)) === True || bool($v21 = edge_intersects_edges(tuple([b, c_index]), pts_list, edges)) === True; return $v21; }();
+            if (bool($PY.__not__(edge_intersects)) === True) {
+                var crit = criterion(a, b, c_index, pts_list);
+                if (bool(crit.PY$__lt__(minimum)) === True) {
+                    minimum = crit;
+                    pt_index = c_index;
+                    found = $c1;
+                }
+            }
+        }
+      }
+    if (bool(found.PY$__eq__($c0)) === True) {
+        throw TriangulationError(str('ERROR: Optimal point not found in find_third_point().'));
+    }
+    return pt_index;
+};
+var lies_inside = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v22 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var c = ('c' in __kwargs) ? __kwargs['c'] : $v22[0];
+    delete __kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('lies_inside() did not get parameter c');
+    };
+    var bdy_edges = ('bdy_edges' in __kwargs) ? __kwargs['bdy_edges'] : $v22[1];
+    delete __kwargs.bdy_edges
+    if (bdy_edges === undefined) {
+        __builtins__.PY$print('lies_inside() did not get parameter bdy_edges');
+    };
+    var $v23 = bdy_edges;
+    var $v24 = ($v23.PY$__class__ === list || $v23.PY$__class__ === tuple) ? null : iter($v23);
+    var $v25 = 0;
+    var edge;
+      for (; (edge = ($v24 === null ? ($v25 < $v23.items.length ? $v23.items[$v25++] : null) : $PY.next($v24))) !== null; ) {
+        var $v26 = edge;
+        var $v27 = (($v26.PY$__class__ === tuple || $v26.PY$__class__ === list) && $v26.items.length === 2) ? $v26.items : $PY.unpack($v26, 2);
+        var a = $v27[0];
+        var b = $v27[1];
+        if (bool(bool(c.PY$__eq__(a)) === True || bool(c.PY$__eq__(b)) === True) === True) {
+            return __builtins__.PY$False;
+        }
+      }
+    return __builtins__.PY$True;
+};
+var is_boundary_edge = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v28 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v28[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('is_boundary_edge() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v28[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('is_boundary_edge() did not get parameter b');
+    };
+    var bdy_edges = ('bdy_edges' in __kwargs) ? __kwargs['bdy_edges'] : $v28[2];
+    delete __kwargs.bdy_edges
+    if (bdy_edges === undefined) {
+        __builtins__.PY$print('is_boundary_edge() did not get parameter bdy_edges');
+    };
+    str('\n    Checks whether edge (a, b) is in the list of boundary edges\n    ');
+    var $v29 = bdy_edges;
+    var $v30 = ($v29.PY$__class__ === list || $v29.PY$__class__ === tuple) ? null : iter($v29);
+    var $v31 = 0;
+    var edge;
+      for (; (edge = ($v30 === null ? ($v31 < $v29.items.length ? $v29.items[$v31++] : null) : $PY.next($v30))) !== null; ) {
+        var $v32 = edge;
+        var $v33 = (($v32.PY$__class__ === tuple || $v32.PY$__class__ === list) && $v32.items.length === 2) ? $v32.items : $PY.unpack($v32, 2);
+        var a0 = $v33[0];
+        var b0 = $v33[1];
+        if (bool(bool(a.PY$__eq__(a0)) === True && bool(b.PY$__eq__(b0)) === True) === True) {
+            return __builtins__.PY$True;
+        }
+      }
+    return __builtins__.PY$False;
+};
+var triangulate_af = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v34 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var pts_list = ('pts_list' in __kwargs) ? __kwargs['pts_list'] : $v34[0];
+    delete __kwargs.pts_list
+    if (pts_list === undefined) {
+        __builtins__.PY$print('triangulate_af() did not get parameter pts_list');
+    };
+    var bdy_edges = ('bdy_edges' in __kwargs) ? __kwargs['bdy_edges'] : $v34[1];
+    delete __kwargs.bdy_edges
+    if (bdy_edges === undefined) {
+        __builtins__.PY$print('triangulate_af() did not get parameter bdy_edges');
+    };
+    str('\n    Create a triangulation using the advancing front method.\n    ');
+    var elems = list([]);
+    bdy_edges = bdy_edges.PY$__getitem__(slice(null));
+    while (bool(bdy_edges.PY$__ne__(list([]))) === True) {
+        var $v35 = $PY.method(bdy_edges, 'PY$pop', 'pop').call(bdy_edges);
+        var $v36 = (($v35.PY$__class__ === tuple || $v35.PY$__class__ === list) && $v35.items.length === 2) ? $v35.items : $PY.unpack($v35, 2);
+        var a = $v36[0];
+        var b = $v36[1];
+        var c = find_third_point(a, b, pts_list, bdy_edges);
+        $PY.method(elems, 'PY$append', 'append').call(elems, tuple([a, b, c]));
+        if (bool(is_boundary_edge(c, a, bdy_edges)) === True) {
+            $PY.method(bdy_edges, 'PY$remove', 'remove').call(bdy_edges, tuple([c, a]));
+        } else {
+            $PY.method(bdy_edges, 'PY$append', 'append').call(bdy_edges, tuple([a, c]));
+        }
+        if (bool(is_boundary_edge(b, c, bdy_edges)) === True) {
+            $PY.method(bdy_edges, 'PY$remove', 'remove').call(bdy_edges, tuple([b, c]));
+        } else {
+            $PY.method(bdy_edges, 'PY$append', 'append').call(bdy_edges, tuple([c, b]));
+        }
+    }
+    return elems;
+};
+var ccw = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v37 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var A = ('A' in __kwargs) ? __kwargs['A'] : $v37[0];
+    delete __kwargs.A
+    if (A === undefined) {
+        __builtins__.PY$print('ccw() did not get parameter A');
+    };
+    var B = ('B' in __kwargs) ? __kwargs['B'] : $v37[1];
+    delete __kwargs.B
+    if (B === undefined) {
+        __builtins__.PY$print('ccw() did not get parameter B');
+    };
+    var C = ('C' in __kwargs) ? __kwargs['C'] : $v37[2];
+    delete __kwargs.C
+    if (C === undefined) {
+        __builtins__.PY$print('ccw() did not get parameter C');
+    };
+    return C.PY$__getitem__($c1).PY$__sub__(A.PY$__getitem__($c1)).PY$__mul__(B.PY$__getitem__($c0).PY$__sub__(A.PY$__getitem__($c0))).PY$__gt__(B.PY$__getitem__($c1).PY$__sub__(A.PY$__getitem__($c1)).PY$__mul__(C.PY$__getitem__($c0).PY$__sub__(A.PY$__getitem__($c0))));
+};
+var intersect = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v38 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var A = ('A' in __kwargs) ? __kwargs['A'] : $v38[0];
+    delete __kwargs.A
+    if (A === undefined) {
+        __builtins__.PY$print('intersect() did not get parameter A');
+    };
+    var B = ('B' in __kwargs) ? __kwargs['B'] : $v38[1];
+    delete __kwargs.B
+    if (B === undefined) {
+        __builtins__.PY$print('intersect() did not get parameter B');
+    };
+    var C = ('C' in __kwargs) ? __kwargs['C'] : $v38[2];
+    delete __kwargs.C
+    if (C === undefined) {
+        __builtins__.PY$print('intersect() did not get parameter C');
+    };
+    var D = ('D' in __kwargs) ? __kwargs['D'] : $v38[3];
+    delete __kwargs.D
+    if (D === undefined) {
+        __builtins__.PY$print('intersect() did not get parameter D');
+    };
+    return bool(ccw(A, C, D).PY$__ne__(ccw(B, C, D))) === True && bool(ccw(A, B, C).PY$__ne__(ccw(A, B, D))) === True;
+};
+var two_edges_intersect = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v39 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var nodes = ('nodes' in __kwargs) ? __kwargs['nodes'] : $v39[0];
+    delete __kwargs.nodes
+    if (nodes === undefined) {
+        __builtins__.PY$print('two_edges_intersect() did not get parameter nodes');
+    };
+    var e1 = ('e1' in __kwargs) ? __kwargs['e1'] : $v39[1];
+    delete __kwargs.e1
+    if (e1 === undefined) {
+        __builtins__.PY$print('two_edges_intersect() did not get parameter e1');
+    };
+    var e2 = ('e2' in __kwargs) ? __kwargs['e2'] : $v39[2];
+    delete __kwargs.e2
+    if (e2 === undefined) {
+        __builtins__.PY$print('two_edges_intersect() did not get parameter e2');
+    };
+    str('\n    Checks whether the two edges intersect.\n\n    It assumes that e1 and e2 are tuples of (a_id, b_id) of ids into the nodes.\n    ');
+    var A = nodes.PY$__getitem__(e1.PY$__getitem__($c0));
+    var B = nodes.PY$__getitem__(e1.PY$__getitem__($c1));
+    var C = nodes.PY$__getitem__(e2.PY$__getitem__($c0));
+    var D = nodes.PY$__getitem__(e2.PY$__getitem__($c1));
+    return intersect(A, B, C, D);
+};
+var any_edges_intersect = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v40 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var nodes = ('nodes' in __kwargs) ? __kwargs['nodes'] : $v40[0];
+    delete __kwargs.nodes
+    if (nodes === undefined) {
+        __builtins__.PY$print('any_edges_intersect() did not get parameter nodes');
+    };
+    var edges = ('edges' in __kwargs) ? __kwargs['edges'] : $v40[1];
+    delete __kwargs.edges
+    if (edges === undefined) {
+        __builtins__.PY$print('any_edges_intersect() did not get parameter edges');
+    };
+    str('\n    Returns True if any two edges intersect.\n    ');
+    var i;
+    var $v41 = __builtins__.PY$len(edges);
+    for (i = $c0; i.PY$__lt__($v41) == True; i = i.PY$__add__($c1)) {
+        var j;
+        var $v42 = __builtins__.PY$len(edges);
+        for (j = i.PY$__add__($c1); j.PY$__lt__($v42) == True; j = j.PY$__add__($c1)) {
+            var e1 = edges.PY$__getitem__(i);
+            var e2 = edges.PY$__getitem__(j);
+            if (bool(bool(e1.PY$__getitem__($c1).PY$__eq__(e2.PY$__getitem__($c0))) === True || bool(e1.PY$__getitem__($c0).PY$__eq__(e2.PY$__getitem__($c1))) === True) === True) {
+                continue;
+            }
+            if (bool(two_edges_intersect(nodes, e1, e2)) === True) {
+                return __builtins__.PY$True;
+            }
+        }
+    }
+    return __builtins__.PY$False;
+};
+var edge_intersects_edges = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v43 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var e1 = ('e1' in __kwargs) ? __kwargs['e1'] : $v43[0];
+    delete __kwargs.e1
+    if (e1 === undefined) {
+        __builtins__.PY$print('edge_intersects_edges() did not get parameter e1');
+    };
+    var nodes = ('nodes' in __kwargs) ? __kwargs['nodes'] : $v43[1];
+    delete __kwargs.nodes
+    if (nodes === undefined) {
+        __builtins__.PY$print('edge_intersects_edges() did not get parameter nodes');
+    };
+    var edges = ('edges' in __kwargs) ? __kwargs['edges'] : $v43[2];
+    delete __kwargs.edges
+    if (edges === undefined) {
+        __builtins__.PY$print('edge_intersects_edges() did not get parameter edges');
+    };
+    str('\n    Returns True if "e1" intersects any edge from "edges".\n    ');
+    var i;
+    var $v44 = __builtins__.PY$len(edges);
+    for (i = $c0; i.PY$__lt__($v44) == True; i = i.PY$__add__($c1)) {
+        var e2 = edges.PY$__getitem__(i);
+        if (bool(bool(e1.PY$__getitem__($c1).PY$__eq__(e2.PY$__getitem__($c0))) === True || bool(e1.PY$__getitem__($c0).PY$__eq__(e2.PY$__getitem__($c1))) === True) === True) {
+            continue;
+        }
+        if (bool(two_edges_intersect(nodes, e1, e2)) === True) {
+            return __builtins__.PY$True;
+        }
+    }
+    return __builtins__.PY$False;
+};
+var example1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v45 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var nodes = list([tuple([$c0, $c0]), tuple([$c1, $c0]), tuple([$c1, $c1]), tuple([$c0, $c1])]);
+    var edges = list([tuple([$c0, $c1]), tuple([$c1, $c2]), tuple([$c2, $c3]), tuple([$c3, $c0])]);
+    var elems = triangulate_af(nodes, edges);
+    return tuple([nodes, edges, elems]);
+};
+var example2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v46 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var nodes = list([tuple([$c0, $c0]), tuple([$c1, $c0]), tuple([$c2, $c1]), tuple([$c2, $c2]), tuple([$c1, $c2]), tuple([$PY.mkfloat(0.5), $PY.mkfloat(1.5)]), tuple([$c0, $c1])]);
+    var edges = list([tuple([$c0, $c1]), tuple([$c1, $c2]), tuple([$c2, $c3]), tuple([$c3, $c4]), tuple([$c4, $c5]), tuple([$c5, $c0])]);
+    var elems = triangulate_af(nodes, edges);
+    return tuple([nodes, edges, elems]);
+};
+var $v47 = example1();
+var $v48 = (($v47.PY$__class__ === tuple || $v47.PY$__class__ === list) && $v47.items.length === 3) ? $v47.items : $PY.unpack($v47, 3);
+var nodes = $v48[0];
+var edges = $v48[1];
+var elems = $v48[2];
+__builtins__.PY$print(nodes);
+__builtins__.PY$print(edges);
+__builtins__.PY$print(elems);
+if (bool($PY.__not__(any_edges_intersect(nodes, edges))) === True) {
+__builtins__.PY$print(str('ok'));
+}
+__builtins__.PY$print();
+var $v49 = example2();
+var $v50 = (($v49.PY$__class__ === tuple || $v49.PY$__class__ === list) && $v49.items.length === 3) ? $v49.items : $PY.unpack($v49, 3);
+nodes = $v50[0];
+edges = $v50[1];
+elems = $v50[2];
+__builtins__.PY$print(nodes);
+__builtins__.PY$print(edges);
+__builtins__.PY$print(elems);
+if (bool($PY.__not__(any_edges_intersect(nodes, edges))) === True) {
+__builtins__.PY$print(str('ok'));
+}
+
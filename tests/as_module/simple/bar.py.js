@@ -0,0 +1,28 @@
+load("py-builtins.js");
+/**************************| tests.as_module.simple.bar |**************************/
+$PY.modules['tests.as_module.simple.bar'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.as_module = {};
+    $m__tests.as_module.simple = {};
+    $m__tests.as_module.simple.bar = {};
+    $m__tests.as_module.simple.bar.PY$val = str('hello');
+    $m__tests.as_module.simple.bar.PY$Bar = __inherit(__builtins__.PY$object, 'Bar', true);
+    $m__tests.as_module.simple.bar.PY$Bar.PY$val = str('goodbye');
+    $m__tests.as_module.simple.bar.PY$Bar.PY$notify = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        __builtins__.PY$print($m__tests.as_module.simple.bar.PY$val.PY$__add__(str(' ')).PY$__add__((typeof self.PY$val === 'object' ? self.PY$val : self.PY$__getattr__('val'))));
+        return None;
+    };
+    if (bool(__name__.PY$__eq__(str('__main__'))) === True) {
+        $PY.callmethod($m__tests.as_module.simple.bar.PY$Bar(), 'PY$notify', 'notify');
+    }
+    return module('tests.as_module.simple.bar', 'tests/as_module/simple/bar.py', $m__tests.as_module.simple.bar);
+});
+
@@ -0,0 +1,24 @@
+load("py-builtins.js");
+/***********************| tests.as_module.simple.test_run |************************/
+$PY.modules['tests.as_module.simple.test_run'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.as_module = {};
+    $m__tests.as_module.simple = {};
+    $m__tests.as_module.simple.test_run = {};
+    $m__tests.as_module.simple.test_run.PY$run = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            __builtins__.PY$print(str('ran'));
+            return None;
+        };
+    if (bool(__name__.PY$__eq__(str('__main__'))) === True) {
+        $m__tests.as_module.simple.test_run.PY$run();
+    }
+    return module('tests.as_module.simple.test_run', 'tests/as_module/simple/test_run.py', $m__tests.as_module.simple.test_run);
+});
+
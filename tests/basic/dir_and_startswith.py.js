@@ -0,0 +1,25 @@
+load("py-builtins.js");
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+Foo.PY$a = $c1;
+Foo.PY$b = $c2;
+Foo.PY$c = $c3;
+var f = Foo();
+var $v1 = tuple([str('a'), str('b'), str('c'), str('d')]);
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(str(js(x.PY$__str__()) + ': ' + js(__builtins__.PY$dir(f).PY$__contains__(x).PY$__str__())));
+  }
+var $v4 = $c4;
+if (f.PY$__setattr__ === $PY.plain_setattr || (f.PY$__setattr__ === $PY.slot_setattr && f.hasOwnProperty('PY$d'))) { f.PY$d = $v4; } else { f.PY$__setattr__('d', $v4); }
+var $v5 = tuple([str('a'), str('b'), str('c'), str('d')]);
+var $v6 = ($v5.PY$__class__ === list || $v5.PY$__class__ === tuple) ? null : iter($v5);
+var $v7 = 0;
+var x;
+  for (; (x = ($v6 === null ? ($v7 < $v5.items.length ? $v5.items[$v7++] : null) : $PY.next($v6))) !== null; ) {
+__builtins__.PY$print(str(js(x.PY$__str__()) + ': ' + js(__builtins__.PY$dir(f).PY$__contains__(x).PY$__str__())));
+  }
+__builtins__.PY$print(__builtins__.PY$filter(function(x) {return $PY.__not__($PY.method(x, 'PY$startswith', 'startswith').call(x, str('__')));}, __builtins__.PY$dir(f)));
+__builtins__.PY$print(__builtins__.PY$filter(function(x) {return $PY.__not__($PY.method(x, 'PY$endswith', 'endswith').call(x, str('__')));}, __builtins__.PY$dir(f)));
+
@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var a = str('spam');
+var b = str('eggs');
+__builtins__.PY$print(a);
+__builtins__.PY$print(b);
+
@@ -0,0 +1,4 @@
+load("py-builtins.js");
+__builtins__.PY$print(str('hello'));
+__builtins__.PY$print(str('hello world'));
+
@@ -0,0 +1,4 @@
+load("py-builtins.js");
+var y = function(x) {return x.PY$__mul__(x);};
+__builtins__.PY$print(y($c4));
+
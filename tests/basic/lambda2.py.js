@@ -0,0 +1,4 @@
+load("py-builtins.js");
+var x = function(x) {return function(x) {return function(x) {return x.PY$__add__($c2);}(x.PY$__add__($c2));}(x.PY$__add__($c2));};
+__builtins__.PY$print(x($c2));
+
@@ -0,0 +1,9 @@
+load("py-builtins.js");
+var la = list([]);
+var x;
+var $v1 = $c5;
+for (x = $c0; x.PY$__lt__($v1) == True; x = x.PY$__add__($c1)) {
+$PY.method(la, 'PY$append', 'append').call(la, function(x) {return function(q) {return q.PY$__add__(x);}(x);});
+}
+__builtins__.PY$print(la.PY$__getitem__($c3)($c1));
+
@@ -0,0 +1,10 @@
+load("py-builtins.js");
+var a = $PY.mkfloat(1.234);
+var b = $c3;
+var c = $PY.mkfloat(3.45);
+var d = str('cats');
+__builtins__.PY$print(a);
+__builtins__.PY$print(b);
+__builtins__.PY$print(c);
+__builtins__.PY$print(d);
+
@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var x = $c1;
+var y = $c2;
+var z = $c3;
+__builtins__.PY$print(x, y, z);
+
@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var x = __builtins__.PY$None;
+if (bool(x.PY$__eq__(__builtins__.PY$None)) === True) {
+__builtins__.PY$print(str('x is None/null'));
+} else {
+__builtins__.PY$print(str('x is not None/null'));
+}
+
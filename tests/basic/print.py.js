@@ -0,0 +1,3 @@
+load("py-builtins.js");
+__builtins__.PY$print($PY.mkfloat(1.23), str('foobar'), $PY.mkint(-1), str('x'));
+
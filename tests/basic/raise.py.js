@@ -0,0 +1,20 @@
+load("py-builtins.js");
+var a = str('hello');
+try {
+try {
+__builtins__.PY$print(str('Trying illegal access'));
+var x = str('abc');
+$PY.method(x, 'PY$abc', 'abc').call(x);
+} catch ($v1) {
+if (true) {
+__builtins__.PY$print(str('Exception raised, re-raising'));
+throw $v1;
+}
+};
+} catch ($v2) {
+if (true) {
+__builtins__.PY$print(str('Exception raised'));
+/* pass */
+}
+};
+
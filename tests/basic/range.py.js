@@ -0,0 +1,18 @@
+load("py-builtins.js");
+var x;
+var $v1 = $PY.mkint(10);
+for (x = $c0; x.PY$__lt__($v1) == True; x = x.PY$__add__($c1)) {
+__builtins__.PY$print(x);
+}
+var x;
+var $v2 = $PY.mkint(20);
+for (x = $PY.mkint(10); x.PY$__lt__($v2) == True; x = x.PY$__add__($c1)) {
+__builtins__.PY$print(x);
+}
+var x;
+var $v3 = $PY.mkint(100);
+var $v4 = $c7;
+for (x = $PY.mkint(10); x.PY$__lt__($v3) == True; x = x.PY$__add__($v4)) {
+__builtins__.PY$print(x);
+}
+
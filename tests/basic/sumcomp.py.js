@@ -0,0 +1,4 @@
+load("py-builtins.js");
+var x = __builtins__.PY$sum(__builtins__.PY$map(function(x) {return x.PY$__mul__(x);}, list([$c2, $c3, $c4, $c5, $c6, $c7])));
+__builtins__.PY$print(x);
+
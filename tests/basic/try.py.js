@@ -0,0 +1,77 @@
+load("py-builtins.js");
+var MyException = __inherit(__builtins__.PY$Exception, 'MyException', true);
+MyException.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var msg = ('msg' in __kwargs) ? __kwargs['msg'] : $v1[0];
+    delete __kwargs.msg
+    if (msg === undefined) {
+        __builtins__.PY$print('MyException.__init__() did not get parameter msg');
+    };
+    var $v2 = msg;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$msg'))) { self.PY$msg = $v2; } else { self.PY$__setattr__('msg', $v2); }
+    return None;
+};
+MyException.PY$message = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return (typeof self.PY$msg === 'object' ? self.PY$msg : self.PY$__getattr__('msg'));
+};
+var MyOtherException = __inherit(__builtins__.PY$Exception, 'MyOtherException', true);
+MyOtherException.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var msg = ('msg' in __kwargs) ? __kwargs['msg'] : $v4[0];
+    delete __kwargs.msg
+    if (msg === undefined) {
+        __builtins__.PY$print('MyOtherException.__init__() did not get parameter msg');
+    };
+    var $v5 = msg;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$msg'))) { self.PY$msg = $v5; } else { self.PY$__setattr__('msg', $v5); }
+    return None;
+};
+MyOtherException.PY$message = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return (typeof self.PY$msg === 'object' ? self.PY$msg : self.PY$__getattr__('msg'));
+};
+var $v7 = list([$c1, $c2]);
+var $v8 = ($v7.PY$__class__ === list || $v7.PY$__class__ === tuple) ? null : iter($v7);
+var $v9 = 0;
+var index;
+  for (; (index = ($v8 === null ? ($v9 < $v7.items.length ? $v7.items[$v9++] : null) : $PY.next($v8))) !== null; ) {
+var $v11;
+try {
+try {
+__builtins__.PY$print(str('raising exception...'));
+if (bool(index.PY$__eq__($c1)) === True) {
+throw MyException(str('bar'));
+} else {
+if (bool(index.PY$__eq__($c2)) === True) {
+throw MyOtherException(str('foo'));
+}
+}
+} catch ($v12) {
+if ($PY.isinstance($v12, MyOtherException)) {
+var ex2 = $v12;
+__builtins__.PY$print(str('caught other exception:').PY$__add__($PY.method(ex2, 'PY$message', 'message').call(ex2)));
+}
+else if ($PY.isinstance($v12, MyException)) {
+var ex = $v12;
+__builtins__.PY$print(str('caught exception:').PY$__add__($PY.method(ex, 'PY$message', 'message').call(ex)));
+}
+else { throw $v12; }
+};
+} catch ($v10) { $v11 = $v10; }
+__builtins__.PY$print(str('and finally...'));
+if ($v11) { throw $v11; }
+  }
+
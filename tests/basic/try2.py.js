@@ -0,0 +1,54 @@
+load("py-builtins.js");
+try {
+throw __builtins__.PY$IOError(str('foo'));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$Exception)) {
+var e = $v1;
+__builtins__.PY$print((typeof e.PY$message === 'object' ? e.PY$message : e.PY$__getattr__('message')));
+}
+else { throw $v1; }
+};
+try {
+throw __builtins__.PY$IOError(str('foo'));
+} catch ($v2) {
+if (true) {
+__builtins__.PY$print(str('x'));
+}
+};
+try {
+throw __builtins__.PY$IOError(str('foo'));
+} catch ($v3) {
+if ($PY.isinstance($v3, __builtins__.PY$TypeError)) {
+__builtins__.PY$print(str('type'));
+}
+else if ($PY.isinstance($v3, __builtins__.PY$IOError)) {
+__builtins__.PY$print(str('io'));
+}
+else if (true) {
+__builtins__.PY$print(str('y'));
+}
+};
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    try {
+        throw __builtins__.PY$IOError(str('foo'));
+    } catch ($v5) {
+        if ($PY.isinstance($v5, __builtins__.PY$TypeError)) {
+        var e = $v5;
+        __builtins__.PY$print((typeof e.PY$message === 'object' ? e.PY$message : e.PY$__getattr__('message')));
+    }
+    else { throw $v5; }
+    };
+    return None;
+};
+try {
+foo();
+} catch ($v6) {
+if ($PY.isinstance($v6, __builtins__.PY$IOError)) {
+__builtins__.PY$print(str('z'));
+}
+else { throw $v6; }
+};
+
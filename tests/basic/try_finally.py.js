@@ -0,0 +1,23 @@
+load("py-builtins.js");
+try {
+$c1.PY$__floordiv__($c0);
+} catch ($v1) {
+if (true) {
+__builtins__.PY$print(str('nothing to see here, move along'));
+}
+};
+try {
+var $v3;
+try {
+$c1.PY$__floordiv__($c0);
+} catch ($v2) { $v3 = $v2; }
+__builtins__.PY$print(str('finally'));
+if ($v3) { throw $v3; }
+} catch ($v4) {
+if ($PY.isinstance($v4, __builtins__.PY$Exception)) {
+var E = $v4;
+__builtins__.PY$print(E);
+}
+else { throw $v4; }
+};
+
@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var $v2;
+try {
+__builtins__.PY$print(str('no exception'));
+} catch ($v1) { $v2 = $v1; }
+__builtins__.PY$print(str('done'));
+if ($v2) { throw $v2; }
+
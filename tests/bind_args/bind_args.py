@@ -0,0 +1,53 @@
+def plain(a, b, c):
+    return a + b * c
+
+def defaults(a, b=2, c=3):
+    return [a, b, c]
+
+def star(a, *rest):
+    return [a, rest]
+
+def keywords(a, **kw):
+    return [a, sorted(kw.keys())]
+
+def both(a, b=1, *rest, **kw):
+    return [a, b, rest, sorted(kw.items())]
+
+def noargs():
+    return "none"
+
+class Counter(object):
+    def __init__(self, start=0):
+        self.count = start
+
+    def add(self, n, times=1):
+        self.count = self.count + n * times
+        return self.count
+
+print plain(1, 2, 3), plain(c=3, b=2, a=1)
+print defaults(1), defaults(1, 5), defaults(1, c=9), defaults(a=0)
+print star(1), star(1, 2, 3), star(*[4, 5])
+print keywords(1), keywords(1, x=2, y=3), keywords(**{"a": 1, "z": 2})
+print both(1), both(1, 2, 3, 4, k=5)
+print noargs()
+c = Counter()
+print c.add(2), c.add(3, 2), c.add(n=1, times=4), Counter(10).add(1)
+
+
+def attempt(f, *args, **kw):
+    try:
+        f(*args, **kw)
+    except TypeError, e:
+        print e
+
+attempt(plain, 1, 2, d=3)
+attempt(keywords, 1, a=2)
+attempt(plain, 1, 2, 3, a=1)
+attempt(plain, 1)
+attempt(defaults)
+attempt(plain, 1, 2, 3, 4)
+attempt(noargs, 1)
+attempt(c.add)
+attempt(c.add, 1, 2, 3)
+attempt(Counter.add, c)
+attempt(Counter, 1, 2)
@@ -0,0 +1,108 @@
+load("py-builtins.js");
+var plain = (function($v1) { return function(a, b, c) {
+    var $v3 = arguments.length;
+    if ($v3 < 3 || $v3 > 3 || ($v3 > 0 && arguments[$v3 - 1] !== undefined && (arguments[$v3 - 1].__kwargs === true || arguments[$v3 - 1].__varargs === true))) {
+        var $v2 = $PY.bind(arguments, $v1);
+        a = $v2[0]; b = $v2[1]; c = $v2[2];
+    }
+    return a.PY$__add__(b.PY$__mul__(c));
+}; })({name: 'plain', args: ['a', 'b', 'c'], required: 3, offset: 0, varargs: false, kwargs: false});
+var defaults = (function($v4) { return function(a, b, c) {
+    var $v6 = arguments.length;
+    if ($v6 < 1 || $v6 > 3 || ($v6 > 0 && arguments[$v6 - 1] !== undefined && (arguments[$v6 - 1].__kwargs === true || arguments[$v6 - 1].__varargs === true))) {
+        var $v5 = $PY.bind(arguments, $v4);
+        a = $v5[0]; b = $v5[1]; c = $v5[2];
+    }
+    if (b === undefined) { b = $c2; }
+    if (c === undefined) { c = $c3; }
+    return list([a, b, c]);
+}; })({name: 'defaults', args: ['a', 'b', 'c'], required: 1, offset: 0, varargs: false, kwargs: false});
+var star = (function($v7) { return function(a) {
+    var $v8 = $PY.bind(arguments, $v7);
+    a = $v8[0];
+    var rest = $v8[1];
+    return list([a, rest]);
+}; })({name: 'star', args: ['a'], required: 1, offset: 0, varargs: true, kwargs: false});
+var keywords = (function($v9) { return function(a) {
+    var $v10 = $PY.bind(arguments, $v9);
+    a = $v10[0];
+    var kw = $v10[1];
+    return list([a, __builtins__.PY$sorted($PY.method(kw, 'PY$keys', 'keys').call(kw))]);
+}; })({name: 'keywords', args: ['a'], required: 1, offset: 0, varargs: false, kwargs: true});
+var both = (function($v11) { return function(a, b) {
+    var $v12 = $PY.bind(arguments, $v11);
+    a = $v12[0];
+    b = $v12[1];
+    var rest = $v12[2];
+    var kw = $v12[3];
+    if (b === undefined) { b = $c1; }
+    return list([a, b, rest, __builtins__.PY$sorted($PY.method(kw, 'PY$items', 'items').call(kw))]);
+}; })({name: 'both', args: ['a', 'b'], required: 1, offset: 0, varargs: true, kwargs: true});
+var noargs = (function($v13) { return function() {
+    var $v15 = arguments.length;
+    if ($v15 > 0) {
+        var $v14 = $PY.bind(arguments, $v13);
+    }
+    return str('none');
+}; })({name: 'noargs', args: [], required: 0, offset: 0, varargs: false, kwargs: false});
+var Counter = __inherit(__builtins__.PY$object, 'Counter', true);
+Counter.PY$__init__ = (function($v16) { return function(start) {
+    var self = this;
+    var $v18 = arguments.length;
+    if ($v18 > 1 || ($v18 > 0 && arguments[$v18 - 1] !== undefined && (arguments[$v18 - 1].__kwargs === true || arguments[$v18 - 1].__varargs === true))) {
+        var $v17 = $PY.bind(arguments, $v16);
+        start = $v17[0];
+    }
+    if (start === undefined) { start = $c0; }
+    var $v19 = start;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$count'))) { self.PY$count = $v19; } else { self.PY$__setattr__('count', $v19); }
+    return None;
+}; })({name: '__init__', args: ['start'], required: 0, offset: 1, varargs: false, kwargs: false});
+Counter.PY$add = (function($v20) { return function(n, times) {
+    var self = this;
+    var $v22 = arguments.length;
+    if ($v22 < 1 || $v22 > 2 || ($v22 > 0 && arguments[$v22 - 1] !== undefined && (arguments[$v22 - 1].__kwargs === true || arguments[$v22 - 1].__varargs === true))) {
+        var $v21 = $PY.bind(arguments, $v20);
+        n = $v21[0]; times = $v21[1];
+    }
+    if (times === undefined) { times = $c1; }
+    var $v23 = (typeof self.PY$count === 'object' ? self.PY$count : self.PY$__getattr__('count')).PY$__add__(n.PY$__mul__(times));
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$count'))) { self.PY$count = $v23; } else { self.PY$__setattr__('count', $v23); }
+    return (typeof self.PY$count === 'object' ? self.PY$count : self.PY$__getattr__('count'));
+}; })({name: 'add', args: ['n', 'times'], required: 1, offset: 1, varargs: false, kwargs: false});
+__builtins__.PY$print(plain($c1, $c2, $c3), plain(__kwargs_make({c: $c3, b: $c2, a: $c1})));
+__builtins__.PY$print(defaults($c1), defaults($c1, $c5), defaults($c1, __kwargs_make({c: $c9})), defaults(__kwargs_make({a: $c0})));
+__builtins__.PY$print(star($c1), star($c1, $c2, $c3), star(__varargs_make(list([$c4, $c5]))));
+__builtins__.PY$print(keywords($c1), keywords($c1, __kwargs_make({x: $c2, y: $c3})), keywords(__kwargs_make({}, dict([str('a'), $c1, str('z'), $c2]))));
+__builtins__.PY$print(both($c1), both($c1, $c2, $c3, $c4, __kwargs_make({k: $c5})));
+__builtins__.PY$print(noargs());
+var c = Counter();
+__builtins__.PY$print($PY.method(c, 'PY$add', 'add').call(c, $c2), $PY.method(c, 'PY$add', 'add').call(c, $c3, $c2), $PY.method(c, 'PY$add', 'add').call(c, __kwargs_make({n: $c1, times: $c4})), $PY.callmethod(Counter($PY.mkint(10)), 'PY$add', 'add', $c1));
+var attempt = (function($v24) { return function(f) {
+    var $v25 = $PY.bind(arguments, $v24);
+    f = $v25[0];
+    var args = $v25[1];
+    var kw = $v25[2];
+    try {
+        f(__varargs_make(args), __kwargs_make({}, kw));
+    } catch ($v26) {
+        if ($PY.isinstance($v26, __builtins__.PY$TypeError)) {
+        var e = $v26;
+        __builtins__.PY$print(e);
+    }
+    else { throw $v26; }
+    };
+    return None;
+}; })({name: 'attempt', args: ['f'], required: 1, offset: 0, varargs: true, kwargs: true});
+attempt(plain, $c1, $c2, __kwargs_make({d: $c3}));
+attempt(keywords, $c1, __kwargs_make({a: $c2}));
+attempt(plain, $c1, $c2, $c3, __kwargs_make({a: $c1}));
+attempt(plain, $c1);
+attempt(defaults);
+attempt(plain, $c1, $c2, $c3, $c4);
+attempt(noargs, $c1);
+attempt((typeof c.PY$add === 'object' ? c.PY$add : c.PY$__getattr__('add')));
+attempt((typeof c.PY$add === 'object' ? c.PY$add : c.PY$__getattr__('add')), $c1, $c2, $c3);
+attempt((typeof Counter.PY$add === 'object' ? Counter.PY$add : Counter.PY$__getattr__('add')), c);
+attempt(Counter, $c1, $c2);
+
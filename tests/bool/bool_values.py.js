@@ -0,0 +1,10 @@
+load("py-builtins.js");
+var m = list([list([]), dict([]), $PY.mkfloat(0.0), $c0, str(''), str('0'), str('x'), __builtins__.PY$True, __builtins__.PY$False]);
+var $v1 = m;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(str(js(__builtins__.PY$bool(x).PY$__str__()) + ': ' + js(x.PY$__str__())));
+  }
+
@@ -0,0 +1,14 @@
+load("py-builtins.js");
+var x = __builtins__.PY$True;
+var y = __builtins__.PY$False;
+var z = $PY.__not__(y);
+if (bool(x) === True) {
+__builtins__.PY$print(str('x'));
+}
+if (bool(y) === True) {
+__builtins__.PY$print(str('y'));
+}
+if (bool(z) === True) {
+__builtins__.PY$print(str('z'));
+}
+
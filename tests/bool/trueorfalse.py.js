@@ -0,0 +1,14 @@
+load("py-builtins.js");
+var literals = list([str('a'), str(''), $c0, __builtins__.PY$None, $c1, $PY.mkfloat(0.0), $PY.mkfloat(1.0), $PY.mkint(-1), $PY.mkfloat(-1.0), $c0]);
+var $v1 = literals;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var l;
+  for (; (l = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+if (bool(l) === True) {
+__builtins__.PY$print(str('True'));
+} else {
+__builtins__.PY$print(str('False'));
+}
+  }
+
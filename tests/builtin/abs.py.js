@@ -0,0 +1,33 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$abs($c2));
+__builtins__.PY$print(__builtins__.PY$abs($PY.mkint(-2)));
+__builtins__.PY$print(__builtins__.PY$abs($PY.mkfloat(4.2)));
+__builtins__.PY$print(__builtins__.PY$abs($PY.mkfloat(-4.2)));
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+Foo.PY$__abs__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return $PY.mkint(42);
+};
+__builtins__.PY$print(__builtins__.PY$abs(Foo()));
+try {
+__builtins__.PY$print(__builtins__.PY$abs(str('foo')));
+} catch ($v2) {
+if ($PY.isinstance($v2, __builtins__.PY$TypeError)) {
+var E = $v2;
+__builtins__.PY$print(str('Fail'), E);
+}
+else { throw $v2; }
+};
+try {
+__builtins__.PY$print(__builtins__.PY$abs());
+} catch ($v3) {
+if ($PY.isinstance($v3, __builtins__.PY$TypeError)) {
+var E = $v3;
+__builtins__.PY$print(str('Fail'), E);
+}
+else { throw $v3; }
+};
+
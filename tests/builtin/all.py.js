@@ -0,0 +1,15 @@
+load("py-builtins.js");
+var x = list([__builtins__.PY$True, $c1, $PY.mkfloat(1.0), list([__builtins__.PY$True]), tuple([$c1]), __builtins__.PY$dict(__kwargs_make({a: $c1}))]);
+__builtins__.PY$print(__builtins__.PY$all(list([])));
+__builtins__.PY$print(__builtins__.PY$all(x));
+__builtins__.PY$print(__builtins__.PY$all(x.PY$__add__(list([$c0]))));
+try {
+__builtins__.PY$print(__builtins__.PY$all());
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Fail'), E);
+}
+else { throw $v1; }
+};
+
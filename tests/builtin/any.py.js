@@ -0,0 +1,15 @@
+load("py-builtins.js");
+var x = list([__builtins__.PY$False, $c0, $PY.mkfloat(0.0), list([]), tuple([]), __builtins__.PY$dict()]);
+__builtins__.PY$print(__builtins__.PY$any(list([])));
+__builtins__.PY$print(__builtins__.PY$any(x));
+__builtins__.PY$print(__builtins__.PY$any(x.PY$__add__(list([$c1]))));
+try {
+__builtins__.PY$print(__builtins__.PY$any());
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Fail'), E);
+}
+else { throw $v1; }
+};
+
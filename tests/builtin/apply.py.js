@@ -0,0 +1,25 @@
+load("py-builtins.js");
+var foo = function() {
+    var kwargs = __kwargs_get(arguments);
+    var vargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(vargs));
+    kwargs = dict(kwargs);
+    vargs = tuple($v1.slice(0));
+    __builtins__.PY$print(vargs);
+    var $v2 = __builtins__.PY$sorted(kwargs);
+    var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+    var $v4 = 0;
+    var x;
+      for (; (x = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+        __builtins__.PY$print(x, kwargs.PY$__getitem__(x));
+      }
+    return None;
+};
+__builtins__.PY$apply(foo);
+__builtins__.PY$apply(foo, list([$c1, $c2, $c3, $c4, $c5]));
+__builtins__.PY$apply(foo, list([]), __builtins__.PY$dict(__kwargs_make({a: str('a'), b: str('b'), c: str('c')})));
+__builtins__.PY$apply(foo, list([$c1, $c2, $c3, $c4, $c5]), __builtins__.PY$dict(__kwargs_make({a: str('a'), b: str('b'), c: str('c')})));
+__builtins__.PY$apply(foo, list([$c1, $c2, $c3, $c4, $c5]), __builtins__.PY$dict());
+__builtins__.PY$apply(foo, list([]), __builtins__.PY$dict());
+__builtins__.PY$apply(foo, list([]), __builtins__.PY$dict(__kwargs_make({a: str('a'), b: str('b'), c: str('c')})));
+
@@ -0,0 +1,25 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$callable($c2));
+__builtins__.PY$print(__builtins__.PY$callable(function(x) {return x;}));
+var foo = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return $PY.mkint(42);
+};
+__builtins__.PY$print(__builtins__.PY$callable(foo));
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+var Bar = __inherit(__builtins__.PY$object, 'Bar', false);
+Bar.PY$__call__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return $PY.mkint(42);
+};
+__builtins__.PY$print(__builtins__.PY$callable(Foo));
+__builtins__.PY$print(__builtins__.PY$callable(Bar));
+__builtins__.PY$print(__builtins__.PY$callable(Foo()));
+__builtins__.PY$print(__builtins__.PY$callable(Bar()));
+
@@ -0,0 +1,14 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$chr($PY.mkint(42)));
+__builtins__.PY$print(__builtins__.PY$chr($PY.mkint(43)));
+try {
+__builtins__.PY$print(__builtins__.PY$chr(str('foo')));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Could not convert string:'));
+}
+else { throw $v1; }
+};
+__builtins__.PY$print(__builtins__.PY$type(__builtins__.PY$chr($PY.mkint(42))).PY$__eq__(__builtins__.PY$str));
+
@@ -0,0 +1,24 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$coerce($c0, $c0));
+__builtins__.PY$print(__builtins__.PY$coerce($PY.mkfloat(1.0), $c0));
+__builtins__.PY$print(__builtins__.PY$coerce($c0, $PY.mkfloat(1.0)));
+__builtins__.PY$print(__builtins__.PY$coerce($PY.mkfloat(1.0), $PY.mkfloat(1.0)));
+try {
+__builtins__.PY$print(__builtins__.PY$coerce(str('foo'), $PY.mkfloat(1.0)));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Fail'), E);
+}
+else { throw $v1; }
+};
+try {
+__builtins__.PY$print(__builtins__.PY$coerce($c2, str('foo')));
+} catch ($v2) {
+if ($PY.isinstance($v2, __builtins__.PY$TypeError)) {
+var E = $v2;
+__builtins__.PY$print(str('Fail'), E);
+}
+else { throw $v2; }
+};
+
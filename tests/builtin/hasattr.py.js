@@ -0,0 +1,6 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$hasattr(__builtins__, str('hasattr')));
+var x = __builtins__.PY$dict();
+__builtins__.PY$print(__builtins__.PY$hasattr(x, str('__getitem__')));
+__builtins__.PY$print(__builtins__.PY$hasattr(x, str('not really')));
+
@@ -0,0 +1,5 @@
+load("py-builtins.js");
+__builtins__.PY$print($PY.getattr(__builtins__.PY$id(str('foo')), 'PY$__class__', '__class__').PY$__eq__(__builtins__.PY$int));
+__builtins__.PY$print(__builtins__.PY$id($c2).PY$__eq__(__builtins__.PY$id($c2)));
+__builtins__.PY$print(__builtins__.PY$id($c2).PY$__ne__(__builtins__.PY$id($c3)));
+
@@ -0,0 +1,13 @@
+load("py-builtins.js");
+__builtins__.PY$intern(str(''));
+__builtins__.PY$intern(str('foo'));
+try {
+__builtins__.PY$intern($PY.mkint(42));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Failed:'), E);
+}
+else { throw $v1; }
+};
+
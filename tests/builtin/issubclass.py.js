@@ -0,0 +1,33 @@
+load("py-builtins.js");
+var A = __inherit(__builtins__.PY$object, 'A', true);
+var B = __inherit(A, 'B', true);
+var C = __inherit(B, 'C', true);
+var D = __inherit(C, 'D', true);
+var X = __inherit(A, 'X', true);
+__builtins__.PY$print(__builtins__.PY$issubclass(A, __builtins__.PY$object));
+__builtins__.PY$print(__builtins__.PY$issubclass(A, A));
+__builtins__.PY$print(__builtins__.PY$issubclass(A, B));
+__builtins__.PY$print(__builtins__.PY$issubclass(A, C));
+__builtins__.PY$print(__builtins__.PY$issubclass(A, D));
+__builtins__.PY$print(__builtins__.PY$issubclass(A, A));
+__builtins__.PY$print(__builtins__.PY$issubclass(B, A));
+__builtins__.PY$print(__builtins__.PY$issubclass(C, A));
+__builtins__.PY$print(__builtins__.PY$issubclass(D, A));
+__builtins__.PY$print(__builtins__.PY$issubclass(A, A));
+__builtins__.PY$print(__builtins__.PY$issubclass(B, X));
+__builtins__.PY$print(__builtins__.PY$issubclass(C, tuple([A, B, C, D])));
+__builtins__.PY$print(__builtins__.PY$issubclass(C, tuple([D, B])));
+__builtins__.PY$print(__builtins__.PY$issubclass(C, tuple([B, D])));
+__builtins__.PY$print(__builtins__.PY$issubclass(D, tuple([A, B, C])));
+__builtins__.PY$print(__builtins__.PY$issubclass(C, tuple([D, X])));
+__builtins__.PY$print(__builtins__.PY$issubclass(A, tuple([B, C, D])));
+try {
+__builtins__.PY$print(__builtins__.PY$issubclass(__builtins__.PY$int, str('foo')));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Fail:'), E);
+}
+else { throw $v1; }
+};
+
@@ -0,0 +1,15 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$oct($PY.mkint(42)));
+__builtins__.PY$print(__builtins__.PY$oct($c0));
+__builtins__.PY$print(__builtins__.PY$oct($PY.mkint(12345678)));
+__builtins__.PY$print(__builtins__.PY$oct($PY.mkint(-100)));
+try {
+__builtins__.PY$print(__builtins__.PY$oct(str('foo')));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Failed:'), E);
+}
+else { throw $v1; }
+};
+
@@ -0,0 +1,13 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$ord(str('*')));
+__builtins__.PY$print(__builtins__.PY$ord(str('!')));
+try {
+__builtins__.PY$print(__builtins__.PY$ord(str('abc')));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Could not convert string:'), E);
+}
+else { throw $v1; }
+};
+
@@ -0,0 +1,18 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$pow($c0, $c0));
+__builtins__.PY$print(__builtins__.PY$pow($c1, $c0));
+__builtins__.PY$print(__builtins__.PY$pow($c0, $c1));
+__builtins__.PY$print(__builtins__.PY$pow($c1, $c1));
+__builtins__.PY$print(__builtins__.PY$pow($c2, $PY.mkint(-1)));
+__builtins__.PY$print(__builtins__.PY$pow($PY.mkint(100), $PY.mkint(-1)));
+__builtins__.PY$print(__builtins__.PY$pow($c2, $PY.mkint(10)));
+try {
+__builtins__.PY$print(__builtins__.PY$pow(str('foo'), str('bar')));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Failed:'), E);
+}
+else { throw $v1; }
+};
+
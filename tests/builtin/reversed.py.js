@@ -0,0 +1,11 @@
+load("py-builtins.js");
+var x = list([$c1, $c2, $c3, $c4, $c5, $c6, $c7, $c8, $c9, $PY.mkint(10)]);
+__builtins__.PY$print(__builtins__.PY$list(__builtins__.PY$reversed(x)));
+var $v1 = __builtins__.PY$reversed(x);
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var q;
+  for (; (q = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(q);
+  }
+
@@ -0,0 +1,18 @@
+load("py-builtins.js");
+var $v1 = list([$c0, $PY.mkfloat(0.4), $PY.mkfloat(0.5), $PY.mkfloat(0.6), $c0, $PY.mkint(-1), $PY.mkfloat(-0.4), $PY.mkfloat(-0.4999), $PY.mkfloat(-0.5), $PY.mkfloat(-0.6)]);
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(str('Round %.2f: %d').PY$__mod__(tuple([x, __builtins__.PY$round(x)])));
+  }
+try {
+__builtins__.PY$print(__builtins__.PY$round(str('foo')));
+} catch ($v4) {
+if ($PY.isinstance($v4, __builtins__.PY$TypeError)) {
+var E = $v4;
+__builtins__.PY$print(str('Fail:'), E);
+}
+else { throw $v4; }
+};
+
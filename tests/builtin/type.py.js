@@ -0,0 +1,8 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$type($PY.mkint(42)).PY$__eq__(__builtins__.PY$int));
+__builtins__.PY$print($PY.__is__(__builtins__.PY$type(str('foo')), __builtins__.PY$str));
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+var f = Foo();
+__builtins__.PY$print(__builtins__.PY$type(f).PY$__eq__(Foo));
+__builtins__.PY$print($PY.__is__(__builtins__.PY$type(f), Foo));
+
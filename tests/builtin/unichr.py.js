@@ -0,0 +1,15 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$unichr($PY.mkint(42)));
+__builtins__.PY$print(__builtins__.PY$unichr($PY.mkint(43)));
+try {
+__builtins__.PY$print(__builtins__.PY$unichr(str('foo')));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$TypeError)) {
+var E = $v1;
+__builtins__.PY$print(str('Could not convert string:'), E);
+}
+else { throw $v1; }
+};
+__builtins__.PY$print($PY.getattr(__builtins__.PY$unichr($PY.mkint(42)), 'PY$__class__', '__class__').PY$__eq__(__builtins__.PY$unicode));
+__builtins__.PY$print(__builtins__.PY$type(__builtins__.PY$unichr($PY.mkint(42))), __builtins__.PY$unicode);
+
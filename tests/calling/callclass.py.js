@@ -0,0 +1,13 @@
+load("py-builtins.js");
+var Foo = __inherit(__builtins__.PY$object, 'Foo', false);
+Foo.PY$__call__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print(str('Indeed!'));
+    return None;
+};
+var f = Foo();
+f();
+
@@ -0,0 +1,39 @@
+load("py-builtins.js");
+var g = $PY.mkint(99);
+var f = (function($v1) { return function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v2[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('f() did not get parameter a');
+    };
+    var b = $v2[1];
+    if (b === undefined) { b = __kwargs.b === undefined ? $c1 : __kwargs.b; };
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('f() did not get parameter b');
+    };
+    var c = $v2[2];
+    if (c === undefined) { c = __kwargs.c === undefined ? str('default c') : __kwargs.c; };
+    delete __kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('f() did not get parameter c');
+    };
+    var d = $v2[3];
+    if (d === undefined) { d = __kwargs.d === undefined ? $v1 : __kwargs.d; };
+    delete __kwargs.d
+    if (d === undefined) {
+        __builtins__.PY$print('f() did not get parameter d');
+    };
+    __builtins__.PY$print(a);
+    __builtins__.PY$print(b);
+    __builtins__.PY$print(c);
+    __builtins__.PY$print(d);
+    return None;
+}; })(g);
+f($c0);
+f($c0, $PY.mkint(77));
+f($c0, $PY.mkint(77), str('hello'));
+
@@ -0,0 +1,42 @@
+load("py-builtins.js");
+var myfunc = function() {
+    var d = __kwargs_get(arguments);
+    var c = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(c));
+    var a = ('a' in d) ? d['a'] : $v1[0];
+    delete d.a
+    if (a === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter a');
+    };
+    var b = ('b' in d) ? d['b'] : $v1[1];
+    delete d.b
+    if (b === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter b');
+    };
+    d = dict(d);
+    c = tuple($v1.slice(2));
+    __builtins__.PY$print(a);
+    __builtins__.PY$print(b);
+    var $v2 = c;
+    var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+    var $v4 = 0;
+    var i;
+      for (; (i = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+        __builtins__.PY$print(i);
+      }
+    var keys = $PY.method(d, 'PY$keys', 'keys').call(d);
+    $PY.method(keys, 'PY$sort', 'sort').call(keys);
+    var $v5 = keys;
+    var $v6 = ($v5.PY$__class__ === list || $v5.PY$__class__ === tuple) ? null : iter($v5);
+    var $v7 = 0;
+    var i;
+      for (; (i = ($v6 === null ? ($v7 < $v5.items.length ? $v5.items[$v7++] : null) : $PY.next($v6))) !== null; ) {
+        __builtins__.PY$print(i);
+        __builtins__.PY$print(d.PY$__getitem__(i));
+      }
+    return None;
+};
+myfunc($c1, $c2, __kwargs_make({bar: str('a'), foo: str('c')}));
+__builtins__.PY$print();
+myfunc($c1, $c2, $c3, $c4, __kwargs_make({bar: str('a'), foo: str('c')}));
+
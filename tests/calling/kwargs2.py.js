@@ -0,0 +1,34 @@
+load("py-builtins.js");
+var myfunc = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v1[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter a');
+    };
+    var b = $v1[1];
+    if (b === undefined) { b = __kwargs.b === undefined ? $c3 : __kwargs.b; };
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter b');
+    };
+    var c = $v1[2];
+    if (c === undefined) { c = __kwargs.c === undefined ? $c4 : __kwargs.c; };
+    delete __kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter c');
+    };
+    __builtins__.PY$print(a);
+    __builtins__.PY$print(b);
+    __builtins__.PY$print(c);
+    __builtins__.PY$print();
+    return None;
+};
+myfunc($c1);
+myfunc($c1, $c2);
+myfunc($c1, $c2, $c3);
+myfunc($c1, __kwargs_make({c: $c3, b: $c4}));
+myfunc($c1, __kwargs_make({b: $c4}));
+
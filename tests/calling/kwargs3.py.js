@@ -0,0 +1,32 @@
+load("py-builtins.js");
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v1[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('foo() did not get parameter a');
+    };
+    var b = $v1[1];
+    if (b === undefined) { b = __kwargs.b === undefined ? __builtins__.PY$None : __kwargs.b; };
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('foo() did not get parameter b');
+    };
+    __builtins__.PY$print(a, b);
+    return a;
+};
+var bar = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v2[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('bar() did not get parameter x');
+    };
+    return x;
+};
+__builtins__.PY$print(bar(foo($PY.mkint(17), __kwargs_make({b: str('foo')}))));
+
@@ -0,0 +1,54 @@
+load("py-builtins.js");
+var myfunc = function() {
+    var e = __kwargs_get(arguments);
+    var d = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(d));
+    var a = ('a' in e) ? e['a'] : $v1[0];
+    delete e.a
+    if (a === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter a');
+    };
+    var b = $v1[1];
+    if (b === undefined) { b = e.b === undefined ? $PY.mkint(42) : e.b; };
+    delete e.b
+    if (b === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter b');
+    };
+    var c = $v1[2];
+    if (c === undefined) { c = e.c === undefined ? $PY.mkint(10) : e.c; };
+    delete e.c
+    if (c === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter c');
+    };
+    e = dict(e);
+    d = tuple($v1.slice(3));
+    __builtins__.PY$print(a);
+    __builtins__.PY$print(b);
+    __builtins__.PY$print(c);
+    var $v2 = d;
+    var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+    var $v4 = 0;
+    var i;
+      for (; (i = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+        __builtins__.PY$print(i);
+      }
+    var keys = $PY.method(e, 'PY$keys', 'keys').call(e);
+    $PY.method(keys, 'PY$sort', 'sort').call(keys);
+    var $v5 = keys;
+    var $v6 = ($v5.PY$__class__ === list || $v5.PY$__class__ === tuple) ? null : iter($v5);
+    var $v7 = 0;
+    var i;
+      for (; (i = ($v6 === null ? ($v7 < $v5.items.length ? $v5.items[$v7++] : null) : $PY.next($v6))) !== null; ) {
+        __builtins__.PY$print(i);
+        __builtins__.PY$print(e.PY$__getitem__(i));
+      }
+    return None;
+};
+myfunc($c1, $c2, __kwargs_make({bar: str('a'), foo: str('c')}));
+__builtins__.PY$print(str('----'));
+myfunc($c1, $c2, $c3, $c4, __kwargs_make({bar: str('a'), foo: str('c')}));
+__builtins__.PY$print(str('----'));
+myfunc($c1, __kwargs_make({bar: str('a'), foo: str('c')}));
+__builtins__.PY$print(str('----'));
+myfunc($c1, $c2, $c3, $c4, $c5, $c6, $c7, $c8);
+
@@ -0,0 +1,36 @@
+load("py-builtins.js");
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v1[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('foo() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v1[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('foo() did not get parameter b');
+    };
+    var c = ('c' in __kwargs) ? __kwargs['c'] : $v1[2];
+    delete __kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('foo() did not get parameter c');
+    };
+    var d = $v1[3];
+    if (d === undefined) { d = __kwargs.d === undefined ? $PY.mkint(10) : __kwargs.d; };
+    delete __kwargs.d
+    if (d === undefined) {
+        __builtins__.PY$print('foo() did not get parameter d');
+    };
+    __builtins__.PY$print(a, b, c, d);
+    return None;
+};
+foo($c1, $c2, $c3, $c4);
+foo($c1, $c2, $c3);
+foo($c1, $c2, $c3, __kwargs_make({d: $PY.mkint(20)}));
+foo($c1, $c2, __kwargs_make({c: $PY.mkint(10), d: $PY.mkint(20)}));
+foo(__kwargs_make({d: $c4, c: $c3, b: $c2, a: $c1}));
+foo(__kwargs_make({}, __builtins__.PY$dict(__kwargs_make({d: $c4, c: $c3, b: $c2, a: $c1}))));
+
@@ -0,0 +1,37 @@
+load("py-builtins.js");
+var fun1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var vargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(vargs));
+    vargs = tuple($v1.slice(0));
+    __builtins__.PY$print(vargs);
+    return None;
+};
+var fun2 = function() {
+    var kwargs = __kwargs_get(arguments);
+    var vargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(vargs));
+    kwargs = dict(kwargs);
+    vargs = tuple($v2.slice(0));
+    __builtins__.PY$print(vargs, kwargs);
+    return None;
+};
+fun1();
+fun1($c1, $c2, $c3);
+fun1(__varargs_make(list([$c1, $c2, $c3])));
+fun1(__varargs_make(list([$c1, $c2, $c3]).PY$__add__(list([$c4, $c5, $c6]))));
+var l = list([$c4, $c5, $c6]);
+fun1(__varargs_make(l.PY$__add__(l)));
+var $v3 = list([__builtins__.PY$dict(), __builtins__.PY$dict(__kwargs_make({a: str('a')}))]);
+var $v4 = ($v3.PY$__class__ === list || $v3.PY$__class__ === tuple) ? null : iter($v3);
+var $v5 = 0;
+var x;
+  for (; (x = ($v4 === null ? ($v5 < $v3.items.length ? $v3.items[$v5++] : null) : $PY.next($v4))) !== null; ) {
+fun2(__kwargs_make({}, x));
+fun2($c1, $c2, $c3, __kwargs_make({}, x));
+fun2(__varargs_make(list([$c1, $c2, $c3])), __kwargs_make({}, x));
+fun2(__varargs_make(list([$c1, $c2, $c3]).PY$__add__(list([$c4, $c5, $c6]))), __kwargs_make({}, x));
+l = list([$c4, $c5, $c6]);
+fun2(__varargs_make(l.PY$__add__(l)), __kwargs_make({}, x));
+  }
+
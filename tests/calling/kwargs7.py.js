@@ -0,0 +1,24 @@
+load("py-builtins.js");
+var foo = function() {
+    var vals = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in vals) ? vals['x'] : $v1[0];
+    delete vals.x
+    if (x === undefined) {
+        __builtins__.PY$print('foo() did not get parameter x');
+    };
+    var y = ('y' in vals) ? vals['y'] : $v1[1];
+    delete vals.y
+    if (y === undefined) {
+        __builtins__.PY$print('foo() did not get parameter y');
+    };
+    vals = dict(vals);
+    __builtins__.PY$print(x, y, $PY.method(vals, 'PY$keys', 'keys').call(vals), $PY.method(vals, 'PY$values', 'values').call(vals));
+    return None;
+};
+foo($c1, $c2, __kwargs_make({z: $c3}));
+foo(__kwargs_make({y: $c2, x: $c1, z: $c3}));
+foo(__kwargs_make({x: $c1, y: $c2, z: $c3, w: $c4}));
+foo($c1, $c2);
+
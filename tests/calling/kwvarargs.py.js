@@ -0,0 +1,97 @@
+load("py-builtins.js");
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v1[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('foo() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v1[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('foo() did not get parameter b');
+    };
+    var c = ('c' in __kwargs) ? __kwargs['c'] : $v1[2];
+    delete __kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('foo() did not get parameter c');
+    };
+    __builtins__.PY$print(a, b, c);
+    return None;
+};
+foo($c1, $c2, $c3);
+foo($c1, $c2, __varargs_make(list([$c3])));
+foo($c1, __varargs_make(list([$c2, $c3])));
+foo(__varargs_make(list([$c1, $c2, $c3])));
+var bar = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var vargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(vargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v2[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('bar() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v2[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('bar() did not get parameter b');
+    };
+    var c = ('c' in __kwargs) ? __kwargs['c'] : $v2[2];
+    delete __kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('bar() did not get parameter c');
+    };
+    vargs = tuple($v2.slice(3));
+    __builtins__.PY$print(a, b, c, vargs);
+    return None;
+};
+var $v3 = tuple([list([]), list([$c4]), list([$c4, $c5]), list([$c4, $c5, $c6])]);
+var $v4 = ($v3.PY$__class__ === list || $v3.PY$__class__ === tuple) ? null : iter($v3);
+var $v5 = 0;
+var x;
+  for (; (x = ($v4 === null ? ($v5 < $v3.items.length ? $v3.items[$v5++] : null) : $PY.next($v4))) !== null; ) {
+bar($c1, $c2, $c3, __varargs_make(x));
+bar($c1, $c2, __varargs_make(list([$c3]).PY$__add__(x)));
+bar($c1, __varargs_make(list([$c2, $c3]).PY$__add__(x)));
+bar(__varargs_make(list([$c1, $c2, $c3]).PY$__add__(x)));
+bar(__varargs_make(list([$c1, $c2, $c3, $c4, $c5])));
+  }
+var baz = function() {
+    var kwargs = __kwargs_get(arguments);
+    var vargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(vargs));
+    var a = ('a' in kwargs) ? kwargs['a'] : $v6[0];
+    delete kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('baz() did not get parameter a');
+    };
+    var b = ('b' in kwargs) ? kwargs['b'] : $v6[1];
+    delete kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('baz() did not get parameter b');
+    };
+    var c = ('c' in kwargs) ? kwargs['c'] : $v6[2];
+    delete kwargs.c
+    if (c === undefined) {
+        __builtins__.PY$print('baz() did not get parameter c');
+    };
+    kwargs = dict(kwargs);
+    vargs = tuple($v6.slice(3));
+    __builtins__.PY$print(a, b, c, vargs, kwargs);
+    return None;
+};
+var $v7 = tuple([list([]), list([$c4]), list([$c4, $c5]), list([$c4, $c5, $c6])]);
+var $v8 = ($v7.PY$__class__ === list || $v7.PY$__class__ === tuple) ? null : iter($v7);
+var $v9 = 0;
+var x;
+  for (; (x = ($v8 === null ? ($v9 < $v7.items.length ? $v7.items[$v9++] : null) : $PY.next($v8))) !== null; ) {
+baz($c1, $c2, $c3, __varargs_make(x), __kwargs_make({foo: str('bar')}));
+baz($c1, $c2, __varargs_make(list([$c3]).PY$__add__(x)), __kwargs_make({foo: str('bar')}));
+baz($c1, __varargs_make(list([$c2, $c3]).PY$__add__(x)), __kwargs_make({foo: str('bar')}));
+baz(__varargs_make(list([$c1, $c2, $c3]).PY$__add__(x)), __kwargs_make({foo: str('bar')}));
+baz(__varargs_make(list([$c1, $c2, $c3, $c4, $c5])), __kwargs_make({foo: str('bar')}));
+  }
+
@@ -0,0 +1,9 @@
+load("py-builtins.js");
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return None;
+};
+__builtins__.PY$print(foo());
+
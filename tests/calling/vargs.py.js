@@ -0,0 +1,31 @@
+load("py-builtins.js");
+var myfunc = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var c = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(c));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v1[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v1[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('myfunc() did not get parameter b');
+    };
+    c = tuple($v1.slice(2));
+    __builtins__.PY$print(a);
+    __builtins__.PY$print(b);
+    var $v2 = c;
+    var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+    var $v4 = 0;
+    var i;
+      for (; (i = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+        __builtins__.PY$print(i);
+      }
+    return None;
+};
+myfunc($c1, $c2);
+myfunc(str('a'), str('b'), str('c'), str('d'));
+myfunc($c3, $c4, $c5, $c6, str('hello'));
+
@@ -0,0 +1,18 @@
+class Adder(object):
+
+    def __init__(self, n):
+        self.n = n
+
+    def __call__(self, x):
+        return self.n + x
+
+class Twice(Adder):
+    pass
+
+a = Adder(3)
+print a(4)
+print a(10)
+t = Twice(1)
+print t(1)
+print callable(t)
+print isinstance(t, Adder)
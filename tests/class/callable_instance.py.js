@@ -0,0 +1,37 @@
+load("py-builtins.js");
+var Adder = __inherit(__builtins__.PY$object, 'Adder', false);
+Adder.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v1[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('Adder.__init__() did not get parameter n');
+    };
+    var $v2 = n;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$n'))) { self.PY$n = $v2; } else { self.PY$__setattr__('n', $v2); }
+    return None;
+};
+Adder.PY$__call__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v3[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Adder.__call__() did not get parameter x');
+    };
+    return (typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n')).PY$__add__(x);
+};
+var Twice = __inherit(Adder, 'Twice', true);
+var a = Adder($c3);
+__builtins__.PY$print(a($c4));
+__builtins__.PY$print(a($PY.mkint(10)));
+var t = Twice($c1);
+__builtins__.PY$print(t($c1));
+__builtins__.PY$print(__builtins__.PY$callable(t));
+__builtins__.PY$print(__builtins__.PY$isinstance(t, Adder));
+
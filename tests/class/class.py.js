@@ -0,0 +1,45 @@
+load("py-builtins.js");
+var foobar = __inherit(__builtins__.PY$object, 'foobar', true);
+foobar.PY$x = $c1;
+foobar.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var $v2 = $c1;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$foovar'))) { self.PY$foovar = $v2; } else { self.PY$__setattr__('foovar', $v2); }
+    return None;
+};
+foobar.PY$foo = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v3[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('foobar.foo() did not get parameter x');
+    };
+    var $v4 = (typeof self.PY$foovar === 'object' ? self.PY$foovar : self.PY$__getattr__('foovar')).PY$__add__(x);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$foovar'))) { self.PY$foovar = $v4; } else { self.PY$__setattr__('foovar', $v4); }
+    return None;
+};
+foobar.PY$bar = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print((typeof self.PY$foovar === 'object' ? self.PY$foovar : self.PY$__getattr__('foovar')));
+    return None;
+};
+var f = foobar();
+$PY.method(f, 'PY$bar', 'bar').call(f);
+$PY.method(f, 'PY$foo', 'foo').call(f, $c1);
+$PY.method(f, 'PY$foo', 'foo').call(f, $c2);
+$PY.method(f, 'PY$bar', 'bar').call(f);
+$PY.method(f, 'PY$bar', 'bar').call(f);
+$PY.method(f, 'PY$foo', 'foo').call(f, $PY.mkint(-1));
+$PY.method(f, 'PY$bar', 'bar').call(f);
+$PY.method(f, 'PY$foo', 'foo').call(f, $c7);
+$PY.method(f, 'PY$bar', 'bar').call(f);
+
@@ -0,0 +1,58 @@
+load("py-builtins.js");
+var Class1 = __inherit(__builtins__.PY$object, 'Class1', true);
+Class1.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    /* pass */
+    return None;
+};
+Class1.PY$test1 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return $c5;
+};
+var Class2 = __inherit(__builtins__.PY$object, 'Class2', true);
+Class2.PY$test1 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return $c6;
+};
+var Class3 = __inherit(__builtins__.PY$object, 'Class3', true);
+Class3.PY$test1 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v4[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Class3.test1() did not get parameter x');
+    };
+    return $PY.method(self, 'PY$test2', 'test2').call(self, x).PY$__sub__($c1);
+};
+Class3.PY$test2 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v5[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Class3.test2() did not get parameter x');
+    };
+    return $c2.PY$__mul__(x);
+};
+var a = Class1();
+__builtins__.PY$print($PY.method(a, 'PY$test1', 'test1').call(a));
+a = Class2();
+__builtins__.PY$print($PY.method(a, 'PY$test1', 'test1').call(a));
+a = Class3();
+__builtins__.PY$print($PY.method(a, 'PY$test1', 'test1').call(a, $c3));
+__builtins__.PY$print($PY.method(a, 'PY$test2', 'test2').call(a, $c3));
+
@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var A = __inherit(__builtins__.PY$object, 'A', true);
+A.PY$v = $c1;
+var a = A();
+var XX = A;
+var x = XX();
+__builtins__.PY$print((typeof x.PY$v === 'object' ? x.PY$v : x.PY$__getattr__('v')));
+
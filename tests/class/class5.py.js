@@ -0,0 +1,26 @@
+load("py-builtins.js");
+var create = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var cls = ('cls' in __kwargs) ? __kwargs['cls'] : $v1[0];
+    delete __kwargs.cls
+    if (cls === undefined) {
+        __builtins__.PY$print('create() did not get parameter cls');
+    };
+    return cls();
+};
+var A = __inherit(object, 'A', true);
+A.PY$m = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print(str('A.m()'));
+    return None;
+};
+var a = A();
+$PY.method(a, 'PY$m', 'm').call(a);
+var b = create(A);
+$PY.method(b, 'PY$m', 'm').call(b);
+
@@ -0,0 +1,62 @@
+load("py-builtins.js");
+var spam = __inherit(object, 'spam', true);
+spam.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var $v2 = $c0;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$eggs'))) { self.PY$eggs = $v2; } else { self.PY$__setattr__('eggs', $v2); }
+    return None;
+};
+spam.PY$addegg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    try {
+        if (bool((typeof self.PY$eggs === 'object' ? self.PY$eggs : self.PY$__getattr__('eggs'))) === True) {
+            var $v4 = (typeof self.PY$eggs === 'object' ? self.PY$eggs : self.PY$__getattr__('eggs')).PY$__iadd__($c1);
+            if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$eggs'))) { self.PY$eggs = $v4; } else { self.PY$__setattr__('eggs', $v4); }
+        } else {
+            var $v5 = $c1;
+            if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$eggs'))) { self.PY$eggs = $v5; } else { self.PY$__setattr__('eggs', $v5); }
+        }
+    } catch ($v6) {
+    if (true) {
+        var $v7 = $c1;
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$eggs'))) { self.PY$eggs = $v7; } else { self.PY$__setattr__('eggs', $v7); }
+    }
+    };
+    return None;
+};
+spam.PY$printit = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v8 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    try {
+        if (bool((typeof self.PY$eggs === 'object' ? self.PY$eggs : self.PY$__getattr__('eggs'))) === True) {
+            __builtins__.PY$print((typeof self.PY$eggs === 'object' ? self.PY$eggs : self.PY$__getattr__('eggs')));
+        } else {
+            __builtins__.PY$print(str('no eggs'));
+        }
+    } catch ($v9) {
+    if (true) {
+        __builtins__.PY$print(str('no eggs'));
+    }
+    };
+    return None;
+};
+var s = spam();
+$PY.method(s, 'PY$addegg', 'addegg').call(s);
+$PY.method(s, 'PY$addegg', 'addegg').call(s);
+$PY.method(s, 'PY$printit', 'printit').call(s);
+$PY.method(s, 'PY$addegg', 'addegg').call(s);
+$PY.method(s, 'PY$printit', 'printit').call(s);
+s.PY$__delattr__('eggs');
+$PY.method(s, 'PY$printit', 'printit').call(s);
+$PY.method(s, 'PY$addegg', 'addegg').call(s);
+$PY.method(s, 'PY$addegg', 'addegg').call(s);
+$PY.method(s, 'PY$printit', 'printit').call(s);
+
@@ -0,0 +1,28 @@
+load("py-builtins.js");
+var myclass = __inherit(__builtins__.PY$object, 'myclass', true);
+/* This is a class that really says something */
+myclass.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var msg = ('msg' in __kwargs) ? __kwargs['msg'] : $v1[0];
+    delete __kwargs.msg
+    if (msg === undefined) {
+        __builtins__.PY$print('myclass.__init__() did not get parameter msg');
+    };
+    var $v2 = msg;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$msg'))) { self.PY$msg = $v2; } else { self.PY$__setattr__('msg', $v2); }
+    return None;
+};
+myclass.PY$saysomething = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print((typeof self.PY$msg === 'object' ? self.PY$msg : self.PY$__getattr__('msg')));
+    return None;
+};
+var m = myclass(str('hello'));
+$PY.method(m, 'PY$saysomething', 'saysomething').call(m);
+
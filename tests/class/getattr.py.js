@@ -0,0 +1,25 @@
+load("py-builtins.js");
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+Foo.PY$__getattr__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var key = ('key' in __kwargs) ? __kwargs['key'] : $v1[0];
+    delete __kwargs.key
+    if (key === undefined) {
+        __builtins__.PY$print('Foo.__getattr__() did not get parameter key');
+    };
+    if (typeof key === 'string') { key = str(key); };
+    var x = $PY.method(key, 'PY$split', 'split').call(key, str('_'));
+    if (bool(bool(__builtins__.PY$len(x).PY$__gt__($c1)) === True && bool(x.PY$__getitem__($c1).PY$__eq__(str('foo'))) === True) === True) {
+        return str('FOO');
+    } else {
+        return str('BAR');
+    }
+    return None;
+};
+var f = Foo();
+__builtins__.PY$print((typeof f.PY$foo_foo === 'object' ? f.PY$foo_foo : f.PY$__getattr__('foo_foo')));
+__builtins__.PY$print((typeof f.PY$bonk === 'object' ? f.PY$bonk : f.PY$__getattr__('bonk')));
+
@@ -0,0 +1,21 @@
+load("py-builtins.js");
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+Foo.PY$__getattr__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var key = ('key' in __kwargs) ? __kwargs['key'] : $v1[0];
+    delete __kwargs.key
+    if (key === undefined) {
+        __builtins__.PY$print('Foo.__getattr__() did not get parameter key');
+    };
+    if (typeof key === 'string') { key = str(key); };
+    __builtins__.PY$print(str('In __getattr__'));
+    return $c1;
+};
+Foo.PY$__foo__ = str('42');
+var f = Foo();
+__builtins__.PY$print((typeof f.PY$__foo__ === 'object' ? f.PY$__foo__ : f.PY$__getattr__('__foo__')));
+__builtins__.PY$print((typeof f.PY$bar === 'object' ? f.PY$bar : f.PY$__getattr__('bar')));
+
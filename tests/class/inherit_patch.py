@@ -0,0 +1,23 @@
+class Base(object):
+
+    def hello(self):
+        return "hello from base"
+
+class Child(Base):
+    pass
+
+class GrandChild(Child):
+
+    def hello(self):
+        return "hello from grandchild"
+
+def late(self):
+    return "late " + self.hello()
+
+Base.late = late
+
+print Child().hello()
+print Child().late()
+print GrandChild().late()
+print issubclass(GrandChild, Base)
+print isinstance(Child(), GrandChild)
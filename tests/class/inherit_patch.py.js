@@ -0,0 +1,33 @@
+load("py-builtins.js");
+var Base = __inherit(__builtins__.PY$object, 'Base', true);
+Base.PY$hello = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return str('hello from base');
+};
+var Child = __inherit(Base, 'Child', true);
+var GrandChild = __inherit(Child, 'GrandChild', true);
+GrandChild.PY$hello = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return str('hello from grandchild');
+};
+var late = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return str('late ').PY$__add__($PY.method(self, 'PY$hello', 'hello').call(self));
+};
+var $v4 = late;
+if (Base.PY$__setattr__ === $PY.plain_setattr || (Base.PY$__setattr__ === $PY.slot_setattr && Base.hasOwnProperty('PY$late'))) { Base.PY$late = $v4; } else { Base.PY$__setattr__('late', $v4); }
+__builtins__.PY$print($PY.callmethod(Child(), 'PY$hello', 'hello'));
+__builtins__.PY$print($PY.callmethod(Child(), 'PY$late', 'late'));
+__builtins__.PY$print($PY.callmethod(GrandChild(), 'PY$late', 'late'));
+__builtins__.PY$print(__builtins__.PY$issubclass(GrandChild, Base));
+__builtins__.PY$print(__builtins__.PY$isinstance(Child(), GrandChild));
+
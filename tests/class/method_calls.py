@@ -0,0 +1,38 @@
+class Base(object):
+    def __init__(self, n):
+        self.n = n
+
+    def get(self, k=1):
+        return self.n * k
+
+    @staticmethod
+    def twice(x):
+        return x * 2
+
+class Child(Base):
+    def get(self, k=1):
+        return super(Child, self).get(k) + 1
+
+class Holder(object):
+    pass
+
+c = Child(5)
+print c.get()
+print c.get(3)
+print c.get(k=2)
+print Base.get(c, 2)
+print Base.twice(4)
+print c.twice(6)
+
+h = Holder()
+h.child = c
+print h.child.get(10)
+
+f = c.get
+print f(4)
+
+h.func = lambda x: x + 100
+print h.func(1)
+
+print "a,b".split(",")
+print [1, 2].__len__()
@@ -0,0 +1,76 @@
+load("py-builtins.js");
+var Base = __inherit(__builtins__.PY$object, 'Base', true);
+Base.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v1[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('Base.__init__() did not get parameter n');
+    };
+    var $v2 = n;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$n'))) { self.PY$n = $v2; } else { self.PY$__setattr__('n', $v2); }
+    return None;
+};
+Base.PY$get = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var k = $v3[0];
+    if (k === undefined) { k = __kwargs.k === undefined ? $c1 : __kwargs.k; };
+    delete __kwargs.k
+    if (k === undefined) {
+        __builtins__.PY$print('Base.get() did not get parameter k');
+    };
+    return (typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n')).PY$__mul__(k);
+};
+Base.PY$twice = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v4[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Base.twice() did not get parameter x');
+    };
+    return x.PY$__mul__($c2);
+}
+Base.PY$twice = __builtins__.PY$staticmethod(Base.PY$__getattr__('twice'));;
+var Child = __inherit(Base, 'Child', true);
+Child.PY$get = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var k = $v5[0];
+    if (k === undefined) { k = __kwargs.k === undefined ? $c1 : __kwargs.k; };
+    delete __kwargs.k
+    if (k === undefined) {
+        __builtins__.PY$print('Child.get() did not get parameter k');
+    };
+    return $PY.supermethod(Child, 'get').call(self, k).PY$__add__($c1);
+};
+var Holder = __inherit(__builtins__.PY$object, 'Holder', true);
+var c = Child($c5);
+__builtins__.PY$print($PY.method(c, 'PY$get', 'get').call(c));
+__builtins__.PY$print($PY.method(c, 'PY$get', 'get').call(c, $c3));
+__builtins__.PY$print($PY.method(c, 'PY$get', 'get').call(c, __kwargs_make({k: $c2})));
+__builtins__.PY$print($PY.method(Base, 'PY$get', 'get').call(Base, c, $c2));
+__builtins__.PY$print($PY.method(Base, 'PY$twice', 'twice').call(Base, $c4));
+__builtins__.PY$print($PY.method(c, 'PY$twice', 'twice').call(c, $c6));
+var h = Holder();
+var $v6 = c;
+if (h.PY$__setattr__ === $PY.plain_setattr || (h.PY$__setattr__ === $PY.slot_setattr && h.hasOwnProperty('PY$child'))) { h.PY$child = $v6; } else { h.PY$__setattr__('child', $v6); }
+__builtins__.PY$print($PY.callmethod((typeof h.PY$child === 'object' ? h.PY$child : h.PY$__getattr__('child')), 'PY$get', 'get', $PY.mkint(10)));
+var f = (typeof c.PY$get === 'object' ? c.PY$get : c.PY$__getattr__('get'));
+__builtins__.PY$print(f($c4));
+var $v7 = function(x) {return x.PY$__add__($PY.mkint(100));};
+if (h.PY$__setattr__ === $PY.plain_setattr || (h.PY$__setattr__ === $PY.slot_setattr && h.hasOwnProperty('PY$func'))) { h.PY$func = $v7; } else { h.PY$__setattr__('func', $v7); }
+__builtins__.PY$print($PY.method(h, 'PY$func', 'func').call(h, $c1));
+__builtins__.PY$print($PY.callmethod(str('a,b'), 'PY$split', 'split', str(',')));
+__builtins__.PY$print($PY.callmethod(list([$c1, $c2]), 'PY$__len__', '__len__'));
+
@@ -0,0 +1,26 @@
+load("py-builtins.js");
+var foo = __inherit(__builtins__.PY$object, 'foo', true);
+foo.PY$bar = __inherit(__builtins__.PY$object, 'bar', true);
+foo.PY$bar.PY$msg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print(str('bar'));
+    return None;
+};;
+foo.PY$msg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print(str('foo'));
+    var b = $PY.method(self, 'PY$bar', 'bar').call(self);
+    $PY.method(b, 'PY$msg', 'msg').call(b);
+    return None;
+};
+var f = $PY.method(foo, 'PY$bar', 'bar').call(foo);
+$PY.method(f, 'PY$msg', 'msg').call(f);
+f = foo();
+$PY.method(f, 'PY$msg', 'msg').call(f);
+
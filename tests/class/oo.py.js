@@ -0,0 +1,75 @@
+load("py-builtins.js");
+var foo = __inherit(__builtins__.PY$object, 'foo', true);
+foo.PY$registered = list([]);
+foo.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var val = ('val' in __kwargs) ? __kwargs['val'] : $v1[0];
+    delete __kwargs.val
+    if (val === undefined) {
+        __builtins__.PY$print('foo.__init__() did not get parameter val');
+    };
+    var $v2 = val;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$fval'))) { self.PY$fval = $v2; } else { self.PY$__setattr__('fval', $v2); }
+    $PY.method(self, 'PY$register', 'register').call(self, self);
+    return None;
+};
+foo.PY$inc = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var $v4 = (typeof self.PY$fval === 'object' ? self.PY$fval : self.PY$__getattr__('fval')).PY$__iadd__($c1);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$fval'))) { self.PY$fval = $v4; } else { self.PY$__setattr__('fval', $v4); }
+    return None;
+};
+foo.PY$msg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return str('foo says:').PY$__add__(__builtins__.PY$str((typeof self.PY$fval === 'object' ? self.PY$fval : self.PY$__getattr__('fval'))));
+};
+foo.PY$register = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var f = ('f' in __kwargs) ? __kwargs['f'] : $v6[0];
+    delete __kwargs.f
+    if (f === undefined) {
+        __builtins__.PY$print('foo.register() did not get parameter f');
+    };
+    $PY.callmethod((typeof foo.PY$registered === 'object' ? foo.PY$registered : foo.PY$__getattr__('registered')), 'PY$append', 'append', f);
+    return None;
+}
+foo.PY$register = __builtins__.PY$staticmethod(foo.PY$__getattr__('register'));;
+foo.PY$printregistered = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var $v8 = (typeof foo.PY$registered === 'object' ? foo.PY$registered : foo.PY$__getattr__('registered'));
+    var $v9 = ($v8.PY$__class__ === list || $v8.PY$__class__ === tuple) ? null : iter($v8);
+    var $v10 = 0;
+    var r;
+      for (; (r = ($v9 === null ? ($v10 < $v8.items.length ? $v8.items[$v10++] : null) : $PY.next($v9))) !== null; ) {
+        __builtins__.PY$print($PY.method(r, 'PY$msg', 'msg').call(r));
+      }
+    return None;
+}
+foo.PY$printregistered = __builtins__.PY$staticmethod(foo.PY$__getattr__('printregistered'));;
+var a = foo($PY.mkint(10));
+var b = foo($PY.mkint(20));
+var c = foo($PY.mkint(30));
+$PY.method(a, 'PY$inc', 'inc').call(a);
+$PY.method(a, 'PY$inc', 'inc').call(a);
+$PY.method(c, 'PY$inc', 'inc').call(c);
+__builtins__.PY$print($PY.method(a, 'PY$msg', 'msg').call(a));
+__builtins__.PY$print($PY.method(b, 'PY$msg', 'msg').call(b));
+__builtins__.PY$print($PY.method(c, 'PY$msg', 'msg').call(c));
+__builtins__.PY$print(str('---'));
+$PY.method(foo, 'PY$printregistered', 'printregistered').call(foo);
+
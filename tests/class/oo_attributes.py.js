@@ -0,0 +1,24 @@
+load("py-builtins.js");
+var Foobar = __inherit(__builtins__.PY$object, 'Foobar', true);
+Foobar.PY$foo = $c1;
+Foobar.PY$bar = list([$c1, $c2, $c3]);
+var my_foobar = Foobar();
+__builtins__.PY$print((typeof my_foobar.PY$foo === 'object' ? my_foobar.PY$foo : my_foobar.PY$__getattr__('foo')));
+__builtins__.PY$print((typeof my_foobar.PY$bar === 'object' ? my_foobar.PY$bar : my_foobar.PY$__getattr__('bar')));
+__builtins__.PY$print((typeof Foobar.PY$foo === 'object' ? Foobar.PY$foo : Foobar.PY$__getattr__('foo')));
+__builtins__.PY$print((typeof Foobar.PY$bar === 'object' ? Foobar.PY$bar : Foobar.PY$__getattr__('bar')));
+var $v1 = $c2;
+if (my_foobar.PY$__setattr__ === $PY.plain_setattr || (my_foobar.PY$__setattr__ === $PY.slot_setattr && my_foobar.hasOwnProperty('PY$foo'))) { my_foobar.PY$foo = $v1; } else { my_foobar.PY$__setattr__('foo', $v1); }
+$PY.callmethod((typeof my_foobar.PY$bar === 'object' ? my_foobar.PY$bar : my_foobar.PY$__getattr__('bar')), 'PY$append', 'append', $c5);
+__builtins__.PY$print((typeof my_foobar.PY$foo === 'object' ? my_foobar.PY$foo : my_foobar.PY$__getattr__('foo')));
+__builtins__.PY$print((typeof my_foobar.PY$bar === 'object' ? my_foobar.PY$bar : my_foobar.PY$__getattr__('bar')));
+__builtins__.PY$print((typeof Foobar.PY$foo === 'object' ? Foobar.PY$foo : Foobar.PY$__getattr__('foo')));
+__builtins__.PY$print((typeof Foobar.PY$bar === 'object' ? Foobar.PY$bar : Foobar.PY$__getattr__('bar')));
+var $v2 = $c3;
+if (Foobar.PY$__setattr__ === $PY.plain_setattr || (Foobar.PY$__setattr__ === $PY.slot_setattr && Foobar.hasOwnProperty('PY$foo'))) { Foobar.PY$foo = $v2; } else { Foobar.PY$__setattr__('foo', $v2); }
+$PY.callmethod((typeof Foobar.PY$bar === 'object' ? Foobar.PY$bar : Foobar.PY$__getattr__('bar')), 'PY$append', 'append', $c6);
+__builtins__.PY$print((typeof my_foobar.PY$foo === 'object' ? my_foobar.PY$foo : my_foobar.PY$__getattr__('foo')));
+__builtins__.PY$print((typeof my_foobar.PY$bar === 'object' ? my_foobar.PY$bar : my_foobar.PY$__getattr__('bar')));
+__builtins__.PY$print((typeof Foobar.PY$foo === 'object' ? Foobar.PY$foo : Foobar.PY$__getattr__('foo')));
+__builtins__.PY$print((typeof Foobar.PY$bar === 'object' ? Foobar.PY$bar : Foobar.PY$__getattr__('bar')));
+
@@ -0,0 +1,22 @@
+load("py-builtins.js");
+var cls = __inherit(__builtins__.PY$object, 'cls', true);
+cls.PY$x = $PY.mkint(10);
+var obj = cls();
+__builtins__.PY$print(str('cls:'), (typeof cls.PY$x === 'object' ? cls.PY$x : cls.PY$__getattr__('x')));
+__builtins__.PY$print(str('obj:'), (typeof obj.PY$x === 'object' ? obj.PY$x : obj.PY$__getattr__('x')));
+var $v1 = $PY.mkint(20);
+if (cls.PY$__setattr__ === $PY.plain_setattr || (cls.PY$__setattr__ === $PY.slot_setattr && cls.hasOwnProperty('PY$x'))) { cls.PY$x = $v1; } else { cls.PY$__setattr__('x', $v1); }
+__builtins__.PY$print(str('cls:'), (typeof cls.PY$x === 'object' ? cls.PY$x : cls.PY$__getattr__('x')));
+__builtins__.PY$print(str('obj:'), (typeof obj.PY$x === 'object' ? obj.PY$x : obj.PY$__getattr__('x')));
+var $v2 = $PY.mkint(30);
+if (obj.PY$__setattr__ === $PY.plain_setattr || (obj.PY$__setattr__ === $PY.slot_setattr && obj.hasOwnProperty('PY$x'))) { obj.PY$x = $v2; } else { obj.PY$__setattr__('x', $v2); }
+__builtins__.PY$print(str('cls:'), (typeof cls.PY$x === 'object' ? cls.PY$x : cls.PY$__getattr__('x')));
+__builtins__.PY$print(str('obj:'), (typeof obj.PY$x === 'object' ? obj.PY$x : obj.PY$__getattr__('x')));
+var $v3 = $PY.mkint(40);
+if (cls.PY$__setattr__ === $PY.plain_setattr || (cls.PY$__setattr__ === $PY.slot_setattr && cls.hasOwnProperty('PY$x'))) { cls.PY$x = $v3; } else { cls.PY$__setattr__('x', $v3); }
+__builtins__.PY$print(str('cls:'), (typeof cls.PY$x === 'object' ? cls.PY$x : cls.PY$__getattr__('x')));
+__builtins__.PY$print(str('obj:'), (typeof obj.PY$x === 'object' ? obj.PY$x : obj.PY$__getattr__('x')));
+obj.PY$__delattr__('x');
+__builtins__.PY$print(str('cls:'), (typeof cls.PY$x === 'object' ? cls.PY$x : cls.PY$__getattr__('x')));
+__builtins__.PY$print(str('obj:'), (typeof obj.PY$x === 'object' ? obj.PY$x : obj.PY$__getattr__('x')));
+
@@ -0,0 +1,121 @@
+load("py-builtins.js");
+var bar = __inherit(__builtins__.PY$object, 'bar', true);
+bar.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var name = ('name' in __kwargs) ? __kwargs['name'] : $v1[0];
+    delete __kwargs.name
+    if (name === undefined) {
+        __builtins__.PY$print('bar.__init__() did not get parameter name');
+    };
+    var $v2 = name;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$name'))) { self.PY$name = $v2; } else { self.PY$__setattr__('name', $v2); }
+    return None;
+};
+bar.PY$setname = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var name = ('name' in __kwargs) ? __kwargs['name'] : $v3[0];
+    delete __kwargs.name
+    if (name === undefined) {
+        __builtins__.PY$print('bar.setname() did not get parameter name');
+    };
+    var $v4 = name;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$name'))) { self.PY$name = $v4; } else { self.PY$__setattr__('name', $v4); }
+    return None;
+};
+var foo = __inherit(bar, 'foo', true);
+foo.PY$registered = list([]);
+foo.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var val = ('val' in __kwargs) ? __kwargs['val'] : $v5[0];
+    delete __kwargs.val
+    if (val === undefined) {
+        __builtins__.PY$print('foo.__init__() did not get parameter val');
+    };
+    var name = ('name' in __kwargs) ? __kwargs['name'] : $v5[1];
+    delete __kwargs.name
+    if (name === undefined) {
+        __builtins__.PY$print('foo.__init__() did not get parameter name');
+    };
+    var $v6 = val;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$fval'))) { self.PY$fval = $v6; } else { self.PY$__setattr__('fval', $v6); }
+    $PY.method(self, 'PY$register', 'register').call(self, self);
+    $PY.method(bar, 'PY$__init__', '__init__').call(bar, self, name);
+    return None;
+};
+foo.PY$inc = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var $v8 = (typeof self.PY$fval === 'object' ? self.PY$fval : self.PY$__getattr__('fval')).PY$__iadd__($c1);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$fval'))) { self.PY$fval = $v8; } else { self.PY$__setattr__('fval', $v8); }
+    return None;
+};
+foo.PY$msg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var varargs = __varargs_get(arguments);
+    var $v9 = Array.prototype.slice.call(arguments).concat(js(varargs));
+    varargs = tuple($v9.slice(0));
+    var txt = str('');
+    var $v10 = varargs;
+    var $v11 = ($v10.PY$__class__ === list || $v10.PY$__class__ === tuple) ? null : iter($v10);
+    var $v12 = 0;
+    var arg;
+      for (; (arg = ($v11 === null ? ($v12 < $v10.items.length ? $v10.items[$v12++] : null) : $PY.next($v11))) !== null; ) {
+        txt = txt.PY$__iadd__(__builtins__.PY$str(arg));
+        txt = txt.PY$__iadd__(str(','));
+      }
+    return txt.PY$__add__((typeof self.PY$name === 'object' ? self.PY$name : self.PY$__getattr__('name'))).PY$__add__(str(' says:')).PY$__add__(__builtins__.PY$str((typeof self.PY$fval === 'object' ? self.PY$fval : self.PY$__getattr__('fval'))));
+};
+foo.PY$register = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v13 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var f = ('f' in __kwargs) ? __kwargs['f'] : $v13[0];
+    delete __kwargs.f
+    if (f === undefined) {
+        __builtins__.PY$print('foo.register() did not get parameter f');
+    };
+    $PY.callmethod((typeof foo.PY$registered === 'object' ? foo.PY$registered : foo.PY$__getattr__('registered')), 'PY$append', 'append', f);
+    return None;
+}
+foo.PY$register = __builtins__.PY$staticmethod(foo.PY$__getattr__('register'));;
+foo.PY$printregistered = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v14 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var $v15 = (typeof foo.PY$registered === 'object' ? foo.PY$registered : foo.PY$__getattr__('registered'));
+    var $v16 = ($v15.PY$__class__ === list || $v15.PY$__class__ === tuple) ? null : iter($v15);
+    var $v17 = 0;
+    var r;
+      for (; (r = ($v16 === null ? ($v17 < $v15.items.length ? $v15.items[$v17++] : null) : $PY.next($v16))) !== null; ) {
+        __builtins__.PY$print($PY.method(r, 'PY$msg', 'msg').call(r));
+      }
+    return None;
+}
+foo.PY$printregistered = __builtins__.PY$staticmethod(foo.PY$__getattr__('printregistered'));;
+var a = foo($PY.mkint(10), str('a'));
+$PY.method(a, 'PY$setname', 'setname').call(a, str('aaa'));
+var b = foo($PY.mkint(20), str('b'));
+var c = foo($PY.mkint(30), str('c'));
+$PY.method(a, 'PY$inc', 'inc').call(a);
+$PY.method(a, 'PY$inc', 'inc').call(a);
+$PY.method(c, 'PY$inc', 'inc').call(c);
+__builtins__.PY$print($PY.method(a, 'PY$msg', 'msg').call(a));
+__builtins__.PY$print($PY.method(b, 'PY$msg', 'msg').call(b));
+__builtins__.PY$print($PY.method(c, 'PY$msg', 'msg').call(c, $c2, $c3, $c4));
+__builtins__.PY$print(str('---'));
+$PY.method(foo, 'PY$printregistered', 'printregistered').call(foo);
+
@@ -0,0 +1,60 @@
+load("py-builtins.js");
+var show = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var o = ('o' in __kwargs) ? __kwargs['o'] : $v1[0];
+    delete __kwargs.o
+    if (o === undefined) {
+        __builtins__.PY$print('show() did not get parameter o');
+    };
+    str('\n    This tests that the proper method is called.\n    ');
+    $PY.method(o, 'PY$msg', 'msg').call(o);
+    return None;
+};
+var show2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var o = ('o' in __kwargs) ? __kwargs['o'] : $v2[0];
+    delete __kwargs.o
+    if (o === undefined) {
+        __builtins__.PY$print('show2() did not get parameter o');
+    };
+    str('\n    This tests oo inheritance.\n    ');
+    $PY.method(o, 'PY$print_msg', 'print_msg').call(o);
+    return None;
+};
+var A = __inherit(__builtins__.PY$object, 'A', true);
+A.PY$msg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print(str('A.msg()'));
+    return None;
+};
+A.PY$print_msg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    $PY.method(self, 'PY$msg', 'msg').call(self);
+    return None;
+};
+var B = __inherit(A, 'B', true);
+B.PY$msg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print(str('B.msg()'));
+    return None;
+};
+var a = A();
+show(a);
+show2(a);
+var b = B();
+show(b);
+show2(b);
+
@@ -0,0 +1,23 @@
+load("py-builtins.js");
+var A = __inherit(__builtins__.PY$object, 'A', true);
+A.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print((typeof self.PY$x === 'object' ? self.PY$x : self.PY$__getattr__('x')));
+    return None;
+};
+var B = __inherit(A, 'B', true);
+B.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var $v3 = $PY.mkint(42);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$x'))) { self.PY$x = $v3; } else { self.PY$__setattr__('x', $v3); }
+    $PY.supermethod(B, '__init__').call(self);
+    return None;
+};
+var b = B();
+
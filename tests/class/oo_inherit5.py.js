@@ -0,0 +1,14 @@
+load("py-builtins.js");
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+Foo.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print($PY.getattr((typeof self.PY$__class__ === 'object' ? self.PY$__class__ : self.PY$__getattr__('__class__')), 'PY$__name__', '__name__'));
+    return None;
+};
+var Bar = __inherit(Foo, 'Bar', true);
+Foo();
+Bar();
+
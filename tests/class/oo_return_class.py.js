@@ -0,0 +1,41 @@
+load("py-builtins.js");
+__builtins__.PY$print(str('Defining Foo'));
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+Foo.PY$test = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print($PY.mkint(42));
+    return None;
+}
+Foo.PY$test = __builtins__.PY$staticmethod(Foo.PY$__getattr__('test'));;
+__builtins__.PY$print(str('Defining Bar'));
+var Bar = __inherit(__builtins__.PY$object, 'Bar', true);
+Bar.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var cls = ('cls' in __kwargs) ? __kwargs['cls'] : $v2[0];
+    delete __kwargs.cls
+    if (cls === undefined) {
+        __builtins__.PY$print('Bar.__init__() did not get parameter cls');
+    };
+    var $v3 = cls;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$cls'))) { self.PY$cls = $v3; } else { self.PY$__setattr__('cls', $v3); }
+    return None;
+};
+Bar.PY$test = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    $PY.callmethod((typeof self.PY$cls === 'object' ? self.PY$cls : self.PY$__getattr__('cls')), 'PY$test', 'test');
+    return (typeof self.PY$cls === 'object' ? self.PY$cls : self.PY$__getattr__('cls'));
+};
+__builtins__.PY$print(str('Creating Bar'));
+var b = Bar(Foo);
+__builtins__.PY$print(str('Testing Bar'));
+__builtins__.PY$print($PY.method(b, 'PY$test', 'test').call(b).PY$__eq__(Foo));
+
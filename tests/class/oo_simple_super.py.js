@@ -0,0 +1,41 @@
+load("py-builtins.js");
+var superclass = __inherit(__builtins__.PY$object, 'superclass', true);
+superclass.PY$test1 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print(str('superclass'));
+    return None;
+};
+var childclass = __inherit(superclass, 'childclass', true);
+childclass.PY$test1 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    __builtins__.PY$print(str('child'));
+    return None;
+};
+childclass.PY$test2 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    $PY.supermethod(childclass, 'test1').call(self);
+    return None;
+};
+childclass.PY$test3 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    $PY.method(self, 'PY$test1', 'test1').call(self);
+    $PY.supermethod(childclass, 'test1').call(self);
+    return None;
+};
+var x = childclass();
+$PY.method(x, 'PY$test1', 'test1').call(x);
+$PY.method(x, 'PY$test2', 'test2').call(x);
+$PY.method(x, 'PY$test3', 'test3').call(x);
+
@@ -0,0 +1,21 @@
+load("py-builtins.js");
+var a1 = __inherit(__builtins__.PY$object, 'a1', true);
+a1.PY$msg = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var val = ('val' in __kwargs) ? __kwargs['val'] : $v1[0];
+    delete __kwargs.val
+    if (val === undefined) {
+        __builtins__.PY$print('a1.msg() did not get parameter val');
+    };
+    __builtins__.PY$print(str('a1 static method msg says:').PY$__add__(__builtins__.PY$str(val)));
+    return None;
+}
+a1.PY$msg = __builtins__.PY$staticmethod(a1.PY$__getattr__('msg'));;
+var a2 = __inherit(a1, 'a2', true);
+var a = a2();
+$PY.method(a, 'PY$msg', 'msg').call(a, str('hello'));
+$PY.method(a2, 'PY$msg', 'msg').call(a2, str('world'));
+
@@ -0,0 +1,36 @@
+load("py-builtins.js");
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+Foo.PY$x = $PY.mkint(42);
+Foo.PY$foo = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v1[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('Foo.foo() did not get parameter a');
+    };
+    __builtins__.PY$print((typeof self.PY$x === 'object' ? self.PY$x : self.PY$__getattr__('x')), a);
+    return None;
+};
+Foo.PY$bar = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v2[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('Foo.bar() did not get parameter a');
+    };
+    __builtins__.PY$print(a);
+    return None;
+}
+Foo.PY$bar = __builtins__.PY$staticmethod(Foo.PY$__getattr__('bar'));;
+var f = Foo();
+$PY.method(f, 'PY$foo', 'foo').call(f, $PY.mkint(10));
+$PY.method(Foo, 'PY$foo', 'foo').call(Foo, f, $PY.mkint(10));
+$PY.method(f, 'PY$bar', 'bar').call(f, $PY.mkint(20));
+$PY.method(Foo, 'PY$bar', 'bar').call(Foo, $PY.mkint(20));
+
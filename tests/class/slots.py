@@ -0,0 +1,62 @@
+class Point(object):
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def norm1(self):
+        return abs(self.x) + abs(self.y)
+
+class Point3(Point):
+    __slots__ = ["z"]
+
+    def __init__(self, x, y, z):
+        Point.__init__(self, x, y)
+        self.z = z
+
+class Loose(Point):
+    pass
+
+class Named(object):
+    __slots__ = "name"
+
+p = Point(3, -4)
+print p.x, p.y, p.norm1()
+p.x = 10
+print p.x
+
+try:
+    p.z = 1
+except AttributeError:
+    print "no z on Point"
+
+q = Point3(1, 2, 3)
+print q.x, q.y, q.z
+
+try:
+    q.w = 4
+except AttributeError:
+    print "no w on Point3"
+
+try:
+    setattr(q, "w", 4)
+except AttributeError:
+    print "setattr rejected too"
+
+l = Loose(5, 6)
+l.extra = "ok"
+print l.x, l.extra
+
+n = Named()
+try:
+    print n.name
+except AttributeError:
+    print "name not set yet"
+n.name = "bob"
+print n.name
+del n.name
+try:
+    print n.name
+except AttributeError:
+    print "name deleted"
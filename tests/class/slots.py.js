@@ -0,0 +1,123 @@
+load("py-builtins.js");
+var Point = __inherit(__builtins__.PY$object, 'Point', true);
+Point.PY$__slots__ = tuple([str('x'), str('y')]);
+Point.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Point.__init__() did not get parameter x');
+    };
+    var y = ('y' in __kwargs) ? __kwargs['y'] : $v1[1];
+    delete __kwargs.y
+    if (y === undefined) {
+        __builtins__.PY$print('Point.__init__() did not get parameter y');
+    };
+    var $v2 = x;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$x'))) { self.PY$x = $v2; } else { self.PY$__setattr__('x', $v2); }
+    var $v3 = y;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$y'))) { self.PY$y = $v3; } else { self.PY$__setattr__('y', $v3); }
+    return None;
+};
+Point.PY$norm1 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return __builtins__.PY$abs((typeof self.PY$x === 'object' ? self.PY$x : self.PY$__getattr__('x'))).PY$__add__(__builtins__.PY$abs((typeof self.PY$y === 'object' ? self.PY$y : self.PY$__getattr__('y'))));
+};
+$PY.set_slots(Point);
+var Point3 = __inherit(Point, 'Point3', true);
+Point3.PY$__slots__ = list([str('z')]);
+Point3.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v5[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Point3.__init__() did not get parameter x');
+    };
+    var y = ('y' in __kwargs) ? __kwargs['y'] : $v5[1];
+    delete __kwargs.y
+    if (y === undefined) {
+        __builtins__.PY$print('Point3.__init__() did not get parameter y');
+    };
+    var z = ('z' in __kwargs) ? __kwargs['z'] : $v5[2];
+    delete __kwargs.z
+    if (z === undefined) {
+        __builtins__.PY$print('Point3.__init__() did not get parameter z');
+    };
+    $PY.method(Point, 'PY$__init__', '__init__').call(Point, self, x, y);
+    var $v6 = z;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$z'))) { self.PY$z = $v6; } else { self.PY$__setattr__('z', $v6); }
+    return None;
+};
+$PY.set_slots(Point3);
+var Loose = __inherit(Point, 'Loose', true);
+var Named = __inherit(__builtins__.PY$object, 'Named', true);
+Named.PY$__slots__ = str('name');
+$PY.set_slots(Named);
+var p = Point($c3, $PY.mkint(-4));
+__builtins__.PY$print((typeof p.PY$x === 'object' ? p.PY$x : p.PY$__getattr__('x')), (typeof p.PY$y === 'object' ? p.PY$y : p.PY$__getattr__('y')), $PY.method(p, 'PY$norm1', 'norm1').call(p));
+var $v7 = $PY.mkint(10);
+if (p.PY$__setattr__ === $PY.plain_setattr || (p.PY$__setattr__ === $PY.slot_setattr && p.hasOwnProperty('PY$x'))) { p.PY$x = $v7; } else { p.PY$__setattr__('x', $v7); }
+__builtins__.PY$print((typeof p.PY$x === 'object' ? p.PY$x : p.PY$__getattr__('x')));
+try {
+var $v8 = $c1;
+if (p.PY$__setattr__ === $PY.plain_setattr || (p.PY$__setattr__ === $PY.slot_setattr && p.hasOwnProperty('PY$z'))) { p.PY$z = $v8; } else { p.PY$__setattr__('z', $v8); }
+} catch ($v9) {
+if ($PY.isinstance($v9, __builtins__.PY$AttributeError)) {
+__builtins__.PY$print(str('no z on Point'));
+}
+else { throw $v9; }
+};
+var q = Point3($c1, $c2, $c3);
+__builtins__.PY$print((typeof q.PY$x === 'object' ? q.PY$x : q.PY$__getattr__('x')), (typeof q.PY$y === 'object' ? q.PY$y : q.PY$__getattr__('y')), (typeof q.PY$z === 'object' ? q.PY$z : q.PY$__getattr__('z')));
+try {
+var $v10 = $c4;
+if (q.PY$__setattr__ === $PY.plain_setattr || (q.PY$__setattr__ === $PY.slot_setattr && q.hasOwnProperty('PY$w'))) { q.PY$w = $v10; } else { q.PY$__setattr__('w', $v10); }
+} catch ($v11) {
+if ($PY.isinstance($v11, __builtins__.PY$AttributeError)) {
+__builtins__.PY$print(str('no w on Point3'));
+}
+else { throw $v11; }
+};
+try {
+__builtins__.PY$setattr(q, str('w'), $c4);
+} catch ($v12) {
+if ($PY.isinstance($v12, __builtins__.PY$AttributeError)) {
+__builtins__.PY$print(str('setattr rejected too'));
+}
+else { throw $v12; }
+};
+var l = Loose($c5, $c6);
+var $v13 = str('ok');
+if (l.PY$__setattr__ === $PY.plain_setattr || (l.PY$__setattr__ === $PY.slot_setattr && l.hasOwnProperty('PY$extra'))) { l.PY$extra = $v13; } else { l.PY$__setattr__('extra', $v13); }
+__builtins__.PY$print((typeof l.PY$x === 'object' ? l.PY$x : l.PY$__getattr__('x')), (typeof l.PY$extra === 'object' ? l.PY$extra : l.PY$__getattr__('extra')));
+var n = Named();
+try {
+__builtins__.PY$print((typeof n.PY$name === 'object' ? n.PY$name : n.PY$__getattr__('name')));
+} catch ($v14) {
+if ($PY.isinstance($v14, __builtins__.PY$AttributeError)) {
+__builtins__.PY$print(str('name not set yet'));
+}
+else { throw $v14; }
+};
+var $v15 = str('bob');
+if (n.PY$__setattr__ === $PY.plain_setattr || (n.PY$__setattr__ === $PY.slot_setattr && n.hasOwnProperty('PY$name'))) { n.PY$name = $v15; } else { n.PY$__setattr__('name', $v15); }
+__builtins__.PY$print((typeof n.PY$name === 'object' ? n.PY$name : n.PY$__getattr__('name')));
+n.PY$__delattr__('name');
+try {
+__builtins__.PY$print((typeof n.PY$name === 'object' ? n.PY$name : n.PY$__getattr__('name')));
+} catch ($v16) {
+if ($PY.isinstance($v16, __builtins__.PY$AttributeError)) {
+__builtins__.PY$print(str('name deleted'));
+}
+else { throw $v16; }
+};
+
@@ -0,0 +1,72 @@
+load("py-builtins.js");
+var baseklass = __inherit(__builtins__.PY$object, 'baseklass', true);
+baseklass.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var bval = ('bval' in __kwargs) ? __kwargs['bval'] : $v1[0];
+    delete __kwargs.bval
+    if (bval === undefined) {
+        __builtins__.PY$print('baseklass.__init__() did not get parameter bval');
+    };
+    var $v2 = bval;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$bval'))) { self.PY$bval = $v2; } else { self.PY$__setattr__('bval', $v2); }
+    return None;
+};
+baseklass.PY$describe = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var arg = ('arg' in __kwargs) ? __kwargs['arg'] : $v3[0];
+    delete __kwargs.arg
+    if (arg === undefined) {
+        __builtins__.PY$print('baseklass.describe() did not get parameter arg');
+    };
+    __builtins__.PY$print(str('baseklass.describe:').PY$__add__((typeof self.PY$bval === 'object' ? self.PY$bval : self.PY$__getattr__('bval'))).PY$__add__(str(':')).PY$__add__(__builtins__.PY$str(arg)));
+    return None;
+};
+baseklass.PY$describe2 = function() {
+    var self = this;
+    var kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    kwargs = dict(kwargs);
+    __builtins__.PY$print(str('baseklass.describe2:').PY$__add__((typeof self.PY$bval === 'object' ? self.PY$bval : self.PY$__getattr__('bval'))).PY$__add__(str(':')).PY$__add__(kwargs.PY$__getitem__(str('string'))));
+    return None;
+};
+var klass = __inherit(baseklass, 'klass', true);
+klass.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var val = ('val' in __kwargs) ? __kwargs['val'] : $v5[0];
+    delete __kwargs.val
+    if (val === undefined) {
+        __builtins__.PY$print('klass.__init__() did not get parameter val');
+    };
+    var bval = ('bval' in __kwargs) ? __kwargs['bval'] : $v5[1];
+    delete __kwargs.bval
+    if (bval === undefined) {
+        __builtins__.PY$print('klass.__init__() did not get parameter bval');
+    };
+    $PY.method(baseklass, 'PY$__init__', '__init__').call(baseklass, self, bval);
+    var $v6 = val;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$val'))) { self.PY$val = $v6; } else { self.PY$__setattr__('val', $v6); }
+    return None;
+};
+klass.PY$describe = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    $PY.supermethod(klass, 'describe').call(self, $PY.mkint(10));
+    $PY.supermethod(klass, 'describe2').call(self, __kwargs_make({string: str('somestring')}));
+    __builtins__.PY$print(str('klass.describe:').PY$__add__((typeof self.PY$val === 'object' ? self.PY$val : self.PY$__getattr__('val'))));
+    return None;
+};
+var k = klass(str('world'), str('hello'));
+$PY.method(k, 'PY$describe', 'describe').call(k);
+
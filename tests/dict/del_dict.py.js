@@ -0,0 +1,25 @@
+load("py-builtins.js");
+var mydict = dict([]);
+mydict.PY$__setitem__(str('abc'), str('def'));
+mydict.PY$__setitem__(str('def'), str('abc'));
+mydict.PY$__setitem__(str('xyz'), str('rst'));
+__builtins__.PY$print(mydict.PY$__getitem__(str('abc')));
+__builtins__.PY$print(mydict.PY$__getitem__(str('def')));
+__builtins__.PY$print(mydict.PY$__getitem__(str('xyz')));
+mydict.PY$__delitem__(str('def'));
+if (bool(mydict.PY$__contains__(str('abc'))) === True) {
+__builtins__.PY$print(str('abc in mydict'));
+} else {
+__builtins__.PY$print(str('abc not in mydict'));
+}
+if (bool(mydict.PY$__contains__(str('def'))) === True) {
+__builtins__.PY$print(str('def in mydict'));
+} else {
+__builtins__.PY$print(str('def not in mydict'));
+}
+if (bool(mydict.PY$__contains__(str('xyz'))) === True) {
+__builtins__.PY$print(str('xyz in mydict'));
+} else {
+__builtins__.PY$print(str('xyz not in mydict'));
+}
+
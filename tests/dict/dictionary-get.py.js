@@ -0,0 +1,7 @@
+load("py-builtins.js");
+var d = __builtins__.PY$dict(__kwargs_make({foo: str('foo')}));
+__builtins__.PY$print(str('starting'));
+__builtins__.PY$print($PY.method(d, 'PY$get', 'get').call(d, str('foo')));
+__builtins__.PY$print($PY.method(d, 'PY$get', 'get').call(d, str('bar'), str('bar')));
+__builtins__.PY$print($PY.method(d, 'PY$get', 'get').call(d, str('foo'), str('bar')));
+
@@ -0,0 +1,14 @@
+load("py-builtins.js");
+var d = __builtins__.PY$dict(__kwargs_make({a: $c2, b: $c3, c: $c4, d: __builtins__.PY$None}));
+var $v2 = __builtins__.PY$sorted($PY.method(d, 'PY$items', 'items').call(d));
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var $v1;
+  for (; ($v1 = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+var $v5 = $v1;
+var $v6 = (($v5.PY$__class__ === tuple || $v5.PY$__class__ === list) && $v5.items.length === 2) ? $v5.items : $PY.unpack($v5, 2);
+var a = $v6[0];
+var b = $v6[1];
+__builtins__.PY$print(str(js(a.PY$__str__()) + ' -> ' + js(b.PY$__str__())));
+  }
+
@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var foo = dict([str('a'), str('b'), str('c'), str('d')]);
+__builtins__.PY$print(foo.PY$__getitem__(str('a')));
+__builtins__.PY$print(foo.PY$__getitem__(str('c')));
+if (bool(foo.PY$__contains__(str('a'))) === True) {
+__builtins__.PY$print(str('a in foo'));
+}
+
@@ -0,0 +1,30 @@
+load("py-builtins.js");
+var dict1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = dict([$c1, $c3, str('s'), $c4]);
+    return __builtins__.PY$len(a);
+};
+var dict2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = dict([$c1, $c3, str('s'), $c4]);
+    var b = a.PY$__getitem__($c1).PY$__add__(a.PY$__getitem__(str('s')));
+    return b;
+};
+var dict3 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = dict([]);
+    a.PY$__setitem__($c1, $c3);
+    a.PY$__setitem__(str('s'), $c4);
+    var b = a.PY$__getitem__($c1).PY$__add__(a.PY$__getitem__(str('s')));
+    return b;
+};
+__builtins__.PY$print(dict1());
+__builtins__.PY$print(dict2());
+__builtins__.PY$print(dict3());
+
@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var x = __builtins__.PY$dict(__kwargs_make({foo: str('foo')}));
+__builtins__.PY$print(x);
+var y = __builtins__.PY$dict(x);
+__builtins__.PY$print(y);
+
@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var d = __builtins__.PY$dict(__kwargs_make({a: str('a'), b: str('b')}));
+__builtins__.PY$print(d);
+__builtins__.PY$print(__builtins__.PY$list(d));
+__builtins__.PY$print(__builtins__.PY$dict(d));
+__builtins__.PY$print(__builtins__.PY$dict(__builtins__.PY$dict(d)));
+__builtins__.PY$print(__builtins__.PY$dict(__builtins__.PY$tuple(list([__builtins__.PY$tuple(list([str('a'), str('a')])), __builtins__.PY$tuple(list([str('b'), str('b')]))]))));
+
@@ -0,0 +1,5 @@
+load("py-builtins.js");
+var a = str('b');
+var b = str('a');
+__builtins__.PY$print(dict([a, b]));
+
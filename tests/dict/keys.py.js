@@ -0,0 +1,12 @@
+load("py-builtins.js");
+var x = dict([str('foo'), str('bar'), str('aaa'), str('bbb'), str('xyz'), str('zyx'), str('spam'), str('eggs')]);
+var s = $PY.method(x, 'PY$keys', 'keys').call(x);
+$PY.method(s, 'PY$sort', 'sort').call(s);
+var $v1 = s;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var k;
+  for (; (k = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(k.PY$__add__(str(' -> ')).PY$__add__(x.PY$__getitem__(k)));
+  }
+
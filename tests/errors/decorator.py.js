@@ -0,0 +1,61 @@
+load("py-builtins.js");
+var mydecorator = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('mydecorator() did not get parameter x');
+    };
+    var wrapped = function() {
+            var self = this;
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var a = ('a' in __kwargs) ? __kwargs['a'] : $v2[0];
+            delete __kwargs.a
+            if (a === undefined) {
+                __builtins__.PY$print('wrapped() did not get parameter a');
+            };
+            var b = ('b' in __kwargs) ? __kwargs['b'] : $v2[1];
+            delete __kwargs.b
+            if (b === undefined) {
+                __builtins__.PY$print('wrapped() did not get parameter b');
+            };
+            var c = ('c' in __kwargs) ? __kwargs['c'] : $v2[2];
+            delete __kwargs.c
+            if (c === undefined) {
+                __builtins__.PY$print('wrapped() did not get parameter c');
+            };
+            var out = x(self);
+            return str('(' + js(out.PY$__str__()) + ' - ' + js(a.PY$__add__(b).PY$__str__()) + ', ' + js(c.PY$__str__()) + ')');
+        };
+    return wrapped;
+};
+var myclass = __inherit(__builtins__.PY$object, 'myclass', true);
+myclass.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var val = ('val' in __kwargs) ? __kwargs['val'] : $v3[0];
+    delete __kwargs.val
+    if (val === undefined) {
+        __builtins__.PY$print('myclass.__init__() did not get parameter val');
+    };
+    var $v4 = val;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$val'))) { self.PY$val = $v4; } else { self.PY$__setattr__('val', $v4); }
+    return None;
+};
+myclass.PY$describe = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return (typeof self.PY$val === 'object' ? self.PY$val : self.PY$__getattr__('val'));
+}
+myclass.PY$describe = mydecorator(myclass.PY$__getattr__('describe'));;
+var m = myclass(str('hello'));
+__builtins__.PY$print($PY.method(m, 'PY$describe', 'describe').call(m, $PY.mkint(10), $c5, str('foo')));
+
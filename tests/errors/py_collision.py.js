@@ -0,0 +1,20 @@
+load("py-builtins.js");
+var a = $c1;
+if (bool(a.PY$__eq__($c1)) === True) {
+__builtins__.PY$print(str('ok'));
+} else {
+__builtins__.PY$print(str('no'));
+}
+var py_builtins = $c1;
+if (bool(py_builtins.PY$__eq__($c1)) === True) {
+__builtins__.PY$print(str('ok'));
+} else {
+__builtins__.PY$print(str('no'));
+}
+var py_builtins;
+var $v1 = $c5;
+for (py_builtins = $c0; py_builtins.PY$__lt__($v1) == True; py_builtins = py_builtins.PY$__add__($c1)) {
+a = a.PY$__iadd__(py_builtins);
+}
+__builtins__.PY$print(a);
+
@@ -0,0 +1,10 @@
+load("py-builtins.js");
+var x = $c0;
+while (bool(__builtins__.PY$True) === True) {
+x = x.PY$__add__($c1);
+__builtins__.PY$print(x);
+if (bool(x.PY$__gt__($PY.mkint(10))) === True) {
+break;
+}
+}
+
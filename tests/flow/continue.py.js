@@ -0,0 +1,12 @@
+load("py-builtins.js");
+var $v1 = __builtins__.PY$xrange($c0, $PY.mkint(20));
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+if (bool(bool(x.PY$__gt__($PY.mkint(10))) === True && bool(x.PY$__lt__($PY.mkint(17))) === True) === True) {
+continue;
+}
+__builtins__.PY$print(x);
+  }
+
@@ -0,0 +1,43 @@
+load("py-builtins.js");
+var a = list([$c1, $c2, $c3, $c4, $c5]);
+var $v1 = a;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(x);
+  }
+a = tuple([str('cats'), str('dogs'), str('squirrels')]);
+var $v4 = a;
+var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+var $v6 = 0;
+var x;
+  for (; (x = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+__builtins__.PY$print(x);
+  }
+a = dict([str('a'), $c1, str('b'), $c2, str('c'), $c3]);
+var keys = list([]);
+var $v7 = a;
+var $v8 = ($v7.PY$__class__ === list || $v7.PY$__class__ === tuple) ? null : iter($v7);
+var $v9 = 0;
+var x;
+  for (; (x = ($v8 === null ? ($v9 < $v7.items.length ? $v7.items[$v9++] : null) : $PY.next($v8))) !== null; ) {
+$PY.method(keys, 'PY$append', 'append').call(keys, x);
+  }
+$PY.method(keys, 'PY$sort', 'sort').call(keys);
+var $v10 = keys;
+var $v11 = ($v10.PY$__class__ === list || $v10.PY$__class__ === tuple) ? null : iter($v10);
+var $v12 = 0;
+var k;
+  for (; (k = ($v11 === null ? ($v12 < $v10.items.length ? $v10.items[$v12++] : null) : $PY.next($v11))) !== null; ) {
+__builtins__.PY$print(k);
+  }
+a = str('defabc');
+var $v13 = a;
+var $v14 = ($v13.PY$__class__ === list || $v13.PY$__class__ === tuple) ? null : iter($v13);
+var $v15 = 0;
+var x;
+  for (; (x = ($v14 === null ? ($v15 < $v13.items.length ? $v13.items[$v15++] : null) : $PY.next($v14))) !== null; ) {
+__builtins__.PY$print(x);
+  }
+
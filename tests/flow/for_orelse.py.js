@@ -0,0 +1,44 @@
+load("py-builtins.js");
+var $v1 = true;
+var $v2 = __builtins__.PY$range($c5);
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var x;
+  for (; (x = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+__builtins__.PY$print(str('iterating'), x);
+  }
+if ($v1) {
+__builtins__.PY$print(str('finishing up 1 of 2'));
+  }
+var $v5 = true;
+var $v6 = __builtins__.PY$range($c0);
+var $v7 = ($v6.PY$__class__ === list || $v6.PY$__class__ === tuple) ? null : iter($v6);
+var $v8 = 0;
+var x;
+  for (; (x = ($v7 === null ? ($v8 < $v6.items.length ? $v6.items[$v8++] : null) : $PY.next($v7))) !== null; ) {
+__builtins__.PY$print(str('should not happen'));
+  }
+if ($v5) {
+__builtins__.PY$print(str('finishing up 2 of 2'));
+  }
+try {
+var $v9 = true;
+var $v10 = __builtins__.PY$range($c5);
+var $v11 = ($v10.PY$__class__ === list || $v10.PY$__class__ === tuple) ? null : iter($v10);
+var $v12 = 0;
+var x;
+  for (; (x = ($v11 === null ? ($v12 < $v10.items.length ? $v10.items[$v12++] : null) : $PY.next($v11))) !== null; ) {
+__builtins__.PY$print(str('iterating'), x);
+if (bool(x.PY$__gt__($c3)) === True) {
+throw __builtins__.PY$ValueError(str('too high'));
+}
+  }
+if ($v9) {
+__builtins__.PY$print(str('should not happen'));
+  }
+} catch ($v13) {
+if (true) {
+/* pass */
+}
+};
+
@@ -0,0 +1,14 @@
+load("py-builtins.js");
+var L = list([tuple([$c1, $c2]), tuple([$c3, $c4]), tuple([$c5, $c6]), tuple([$c7, $c8])]);
+var $v2 = L;
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var $v1;
+  for (; ($v1 = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+var $v5 = $v1;
+var $v6 = (($v5.PY$__class__ === tuple || $v5.PY$__class__ === list) && $v5.items.length === 2) ? $v5.items : $PY.unpack($v5, 2);
+var x = $v6[0];
+var y = $v6[1];
+__builtins__.PY$print(x, y.PY$__mul__($PY.mkint(10)));
+  }
+
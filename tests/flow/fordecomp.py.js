@@ -0,0 +1,14 @@
+load("py-builtins.js");
+var $v2 = list([tuple([$c1, $c2, $c3]), tuple([$c4, $c5, $c6]), tuple([$c7, $c8, $c9])]);
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var $v1;
+  for (; ($v1 = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+var $v5 = $v1;
+var $v6 = (($v5.PY$__class__ === tuple || $v5.PY$__class__ === list) && $v5.items.length === 3) ? $v5.items : $PY.unpack($v5, 3);
+var x = $v6[0];
+var y = $v6[1];
+var z = $v6[2];
+__builtins__.PY$print(x, y, z);
+  }
+
@@ -0,0 +1,91 @@
+load("py-builtins.js");
+var ifs1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('ifs1() did not get parameter x');
+    };
+    var a = $c1;
+    if (bool(x) === True) {
+        a = a.PY$__add__($c1);
+        a = a.PY$__imul__($c2);
+    } else {
+        a = a.PY$__sub__($c1);
+        a = a.PY$__imul__($c4);
+    }
+    return a;
+};
+var ifs2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v2[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('ifs2() did not get parameter x');
+    };
+    var a = $c1;
+    if (bool(x.PY$__gt__($c0)) === True) {
+        a = a.PY$__add__($c1);
+        a = a.PY$__imul__($c2);
+    } else {
+        a = a.PY$__sub__($c1);
+        a = a.PY$__imul__($c4);
+    }
+    return a;
+};
+var ifs3 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v3[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('ifs3() did not get parameter x');
+    };
+    var a = $c1;
+    if (bool(x.PY$__gt__($c0)) === True) {
+        if (bool(x.PY$__gt__($PY.mkint(10))) === True) {
+            a = $c3;
+        } else {
+            a = $c4;
+        }
+    }
+    a = $c5;
+    return a;
+};
+var ifs4 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v4[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('ifs4() did not get parameter x');
+    };
+    var a = $c1;
+    if (bool(x.PY$__gt__($c0)) === True) {
+        if (bool(x.PY$__gt__($PY.mkint(10))) === True) {
+            a = $c3;
+        } else {
+            a = $c4;
+        }
+    } else {
+        a = $c5;
+    }
+    return a;
+};
+__builtins__.PY$print(ifs1(__builtins__.PY$True));
+__builtins__.PY$print(ifs1(__builtins__.PY$False));
+__builtins__.PY$print(ifs2($c1));
+__builtins__.PY$print(ifs2($PY.mkint(-1)));
+__builtins__.PY$print(ifs3($c1));
+__builtins__.PY$print(ifs3($PY.mkint(20)));
+__builtins__.PY$print(ifs3($PY.mkint(-1)));
+__builtins__.PY$print(ifs4($c1));
+__builtins__.PY$print(ifs4($PY.mkint(20)));
+__builtins__.PY$print(ifs4($PY.mkint(-1)));
+
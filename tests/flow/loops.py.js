@@ -0,0 +1,27 @@
+load("py-builtins.js");
+var loop1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('loop1() did not get parameter x');
+    };
+    var a = $c0;
+    var i;
+    var $v2 = x;
+    for (i = $c0; i.PY$__lt__($v2) == True; i = i.PY$__add__($c1)) {
+        x;
+        a = a.PY$__iadd__(i);
+    }
+    return a;
+};
+__builtins__.PY$print(loop1($c1));
+__builtins__.PY$print(loop1($c2));
+__builtins__.PY$print(loop1($c3));
+__builtins__.PY$print(loop1($c4));
+__builtins__.PY$print(loop1($c5));
+__builtins__.PY$print(loop1($c6));
+__builtins__.PY$print(loop1($c7));
+
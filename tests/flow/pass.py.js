@@ -0,0 +1,12 @@
+load("py-builtins.js");
+var x = str('hello');
+if (bool(x.PY$__ne__(str('hello'))) === True) {
+__builtins__.PY$print(str('1'));
+/* pass */
+__builtins__.PY$print(str('2'));
+} else {
+__builtins__.PY$print(str('3'));
+/* pass */
+__builtins__.PY$print(str('4'));
+}
+
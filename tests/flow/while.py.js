@@ -0,0 +1,7 @@
+load("py-builtins.js");
+var x = $c1;
+while (bool(x.PY$__lt__($PY.mkint(10))) === True) {
+__builtins__.PY$print(x);
+x = x.PY$__add__($c1);
+}
+
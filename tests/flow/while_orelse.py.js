@@ -0,0 +1,21 @@
+load("py-builtins.js");
+var x = $c5;
+var count = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    x = x.PY$__isub__($c1);
+    return x.PY$__add__($c1);
+};
+while (bool(count().PY$__gt__($c0)) === True) {
+__builtins__.PY$print(x);
+}
+var $v2 = true;
+while (bool(count().PY$__gt__($c0)) === True) {
+var $v2 = true;
+__builtins__.PY$print(x);
+}
+if ($v2) {
+__builtins__.PY$print(str('no iterations'));
+}
+
@@ -0,0 +1,12 @@
+# More distinct format strings than the runtime keeps compiled at once
+total = 0
+for i in range(300):
+    total += len(("%d" + "-" * (i % 280)) % i)
+print total
+
+fmt = "%s=%05.1f%%"
+for x in [1.24, 2.56, 30.71]:
+    print fmt % ("x", x)
+
+print "%(a)s %(b)r %(a)s" % {"a": 1, "b": "two"}
+print "%5%|%-3d|%+d|% d|%#x|%#o" % (5, 6, 7, 255, 8)
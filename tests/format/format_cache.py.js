@@ -0,0 +1,19 @@
+load("py-builtins.js");
+var total = $c0;
+var i;
+var $v1 = $PY.mkint(300);
+for (i = $c0; i.PY$__lt__($v1) == True; i = i.PY$__add__($c1)) {
+total = total.PY$__iadd__(__builtins__.PY$len(str('%d').PY$__add__(str('-').PY$__mul__(i.PY$__mod__($PY.mkint(280)))).PY$__mod__(i)));
+}
+__builtins__.PY$print(total);
+var fmt = str('%s=%05.1f%%');
+var $v2 = list([$PY.mkfloat(1.24), $PY.mkfloat(2.56), $PY.mkfloat(30.71)]);
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var x;
+  for (; (x = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+__builtins__.PY$print(fmt.PY$__mod__(tuple([str('x'), x])));
+  }
+__builtins__.PY$print(str('1' + ' ' + js(str('two').PY$__repr__()) + ' ' + '1'));
+__builtins__.PY$print(str('%5%|%-3d|%+d|% d|%#x|%#o').PY$__mod__(tuple([$c5, $c6, $c7, $PY.mkint(255), $c8])));
+
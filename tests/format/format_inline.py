@@ -0,0 +1,35 @@
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __str__(self):
+        return "(%d, %d)" % (self.x, self.y)
+
+    def __repr__(self):
+        return "Point(%r, %r)" % (self.x, self.y)
+
+p = Point(3, -4)
+name = "origin"
+
+print "point %s" % (p,)
+print "repr %r of %s" % (p, name)
+print "%s%s%%" % (1, "2")
+print "%d items" % 5
+print "%(n)s is %(p)r, %(n)s again" % {"n": name, "p": p}
+print "%(a)s" % {"a": "used", "b": 0}
+print "%s" % (p.x, )
+print "%s and %s" % ("a", p)
+
+t = (1, 2)
+print "%s-%s" % t
+print "%5s|%-3d|" % ("ab", 7)
+
+calls = []
+def traced(s):
+    calls.append(s)
+    return s
+
+print "%(b)s %(a)s" % {"a": traced("a"), "b": traced("b")}
+print "%(a)s %(b)s" % {"a": traced("c"), "b": traced("d")}
+print calls
@@ -0,0 +1,67 @@
+load("py-builtins.js");
+var Point = __inherit(__builtins__.PY$object, 'Point', true);
+Point.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Point.__init__() did not get parameter x');
+    };
+    var y = ('y' in __kwargs) ? __kwargs['y'] : $v1[1];
+    delete __kwargs.y
+    if (y === undefined) {
+        __builtins__.PY$print('Point.__init__() did not get parameter y');
+    };
+    var $v2 = x;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$x'))) { self.PY$x = $v2; } else { self.PY$__setattr__('x', $v2); }
+    var $v3 = y;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$y'))) { self.PY$y = $v3; } else { self.PY$__setattr__('y', $v3); }
+    return None;
+};
+Point.PY$__str__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return str('(' + js(int((typeof self.PY$x === 'object' ? self.PY$x : self.PY$__getattr__('x')))).toString() + ', ' + js(int((typeof self.PY$y === 'object' ? self.PY$y : self.PY$__getattr__('y')))).toString() + ')');
+};
+Point.PY$__repr__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return str('Point(' + js((typeof self.PY$x === 'object' ? self.PY$x : self.PY$__getattr__('x')).PY$__repr__()) + ', ' + js((typeof self.PY$y === 'object' ? self.PY$y : self.PY$__getattr__('y')).PY$__repr__()) + ')');
+};
+var p = Point($c3, $PY.mkint(-4));
+var name = str('origin');
+__builtins__.PY$print(str('point ' + js(p.PY$__str__())));
+__builtins__.PY$print(str('repr ' + js(p.PY$__repr__()) + ' of ' + js(name.PY$__str__())));
+__builtins__.PY$print(str('1' + '2' + '%'));
+__builtins__.PY$print(str('5' + ' items'));
+__builtins__.PY$print(str(js(name.PY$__str__()) + ' is ' + js(p.PY$__repr__()) + ', ' + js(name.PY$__str__()) + ' again'));
+__builtins__.PY$print(str('used'));
+__builtins__.PY$print(str(js((typeof p.PY$x === 'object' ? p.PY$x : p.PY$__getattr__('x')).PY$__str__())));
+__builtins__.PY$print(str('a' + ' and ' + js(p.PY$__str__())));
+var t = tuple([$c1, $c2]);
+__builtins__.PY$print(str('%s-%s').PY$__mod__(t));
+__builtins__.PY$print(str('%5s|%-3d|').PY$__mod__(tuple([str('ab'), $c7])));
+var calls = list([]);
+var traced = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var s = ('s' in __kwargs) ? __kwargs['s'] : $v6[0];
+    delete __kwargs.s
+    if (s === undefined) {
+        __builtins__.PY$print('traced() did not get parameter s');
+    };
+    $PY.method(calls, 'PY$append', 'append').call(calls, s);
+    return s;
+};
+__builtins__.PY$print(str('%(b)s %(a)s').PY$__mod__(dict([str('a'), traced(str('a')), str('b'), traced(str('b'))])));
+__builtins__.PY$print(str(js(traced(str('c')).PY$__str__()) + ' ' + js(traced(str('d')).PY$__str__())));
+__builtins__.PY$print(calls);
+
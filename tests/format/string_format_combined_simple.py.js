@@ -0,0 +1,9 @@
+load("py-builtins.js");
+var a = str('well');
+var b = str('seems to work');
+var c = str('something else');
+var d = $PY.mkint(10);
+var f = $PY.mkint(15);
+var s = str(js(a.PY$__str__()) + ': ' + js(int(d)).toString() + ', ' + js(b.PY$__str__()) + ': ' + js(int(f)).toString() + ', ' + js(c.PY$__str__()) + ': ' + js(int(d)).toString());
+__builtins__.PY$print(s);
+
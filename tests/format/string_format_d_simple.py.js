@@ -0,0 +1,14 @@
+load("py-builtins.js");
+var a = $PY.mkfloat(1.123456);
+var b = $PY.mkint(10);
+var c = $PY.mkint(-30);
+var d = $PY.mkint(34);
+var e = $PY.mkfloat(123.456);
+var f = $PY.mkint(19892122);
+var s = str('b=%d').PY$__mod__(b);
+__builtins__.PY$print(s);
+s = str('b,c,d=' + js(int(b)).toString() + '+' + js(int(c)).toString() + '+' + js(int(d)).toString());
+__builtins__.PY$print(s);
+__builtins__.PY$print(s);
+__builtins__.PY$print(s);
+
@@ -0,0 +1,31 @@
+load("py-builtins.js");
+var a = $PY.mkfloat(1.123456);
+var b = $PY.mkfloat(3.24324e-10);
+var c = $PY.mkfloat(18347894.2131);
+var d = $PY.mkfloat(0.0);
+var e = $PY.mkfloat(-1324323.456);
+var f = $PY.mkfloat(-1.9892122e-11);
+var vars = list([a, b, c, d, e, f]);
+var codes = list([str('e'), str('E'), str('f'), str('F'), str('g'), str('G')]);
+var fmts = list([str('a=%e'), str('a=%10.5e'), str('a=%+10.5e'), str('a=%#e')]);
+var $v1 = codes;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var code;
+  for (; (code = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+var $v4 = fmts;
+var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+var $v6 = 0;
+var fmt;
+  for (; (fmt = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+var fmt = $PY.method(fmt, 'PY$replace', 'replace').call(fmt, str('e'), code);
+var $v7 = vars;
+var $v8 = ($v7.PY$__class__ === list || $v7.PY$__class__ === tuple) ? null : iter($v7);
+var $v9 = 0;
+var v;
+  for (; (v = ($v8 === null ? ($v9 < $v7.items.length ? $v7.items[$v9++] : null) : $PY.next($v8))) !== null; ) {
+__builtins__.PY$print(fmt.PY$__add__(str(':')), fmt.PY$__mod__(v));
+  }
+  }
+  }
+
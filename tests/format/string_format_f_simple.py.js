@@ -0,0 +1,12 @@
+load("py-builtins.js");
+var a = $PY.mkfloat(1.123456);
+var b = $PY.mkint(10);
+var c = $PY.mkint(-30);
+var d = $PY.mkint(34);
+var e = $PY.mkfloat(123.456789);
+var f = $PY.mkfloat(892122.129899);
+var s = str('b=%f').PY$__mod__(a);
+__builtins__.PY$print(s);
+s = str('b,c,d=%f+%f+%f').PY$__mod__(tuple([a, e, f]));
+__builtins__.PY$print(s);
+
@@ -0,0 +1,9 @@
+load("py-builtins.js");
+var a = str('well');
+var b = str('seems to work');
+var c = str('something else');
+var s = str('b=%s').PY$__mod__(a);
+__builtins__.PY$print(s);
+s = str('b,c,d=' + js(a.PY$__str__()) + '+' + js(b.PY$__str__()) + '+' + js(c.PY$__str__()));
+__builtins__.PY$print(s);
+
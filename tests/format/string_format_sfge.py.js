@@ -0,0 +1,16 @@
+load("py-builtins.js");
+var n = list([$PY.mkint(10000000), $PY.mkint(1000000), $PY.mkint(100000), $PY.mkint(10000), $PY.mkint(1000), $PY.mkint(100), $PY.mkint(10), $c1, $PY.mkfloat(0.1), $PY.mkfloat(0.12), $PY.mkfloat(0.123), $PY.mkfloat(0.1234), $PY.mkfloat(1e-05), $PY.mkfloat(1e-06), $PY.mkfloat(1e-07), $PY.mkfloat(1e-08), $PY.mkfloat(1e-09)]);
+var $v2 = n;
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var $v5 = 0;
+var i;
+var x;
+  for (; (x = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null && ((i = $PY.mkint($v5++)), true); ) {
+__builtins__.PY$print(str('Number %d').PY$__mod__(i));
+__builtins__.PY$print(str('%%s: %s').PY$__mod__(x));
+__builtins__.PY$print(str('%%f: %f').PY$__mod__(x));
+__builtins__.PY$print(str('%%g: %g').PY$__mod__(x));
+__builtins__.PY$print(str('%%e: %e').PY$__mod__(x));
+  }
+
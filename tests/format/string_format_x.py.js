@@ -0,0 +1,17 @@
+load("py-builtins.js");
+var vals = list([$c0, $PY.mkint(10), $PY.mkint(-30), $PY.mkint(173247), $PY.mkint(123), $PY.mkint(19892122)]);
+var formats = list([str('%x'), str('%020x'), str('%X'), str('%020X'), str('%-20x'), str('%#x')]);
+var $v1 = vals;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var val;
+  for (; (val = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+var $v4 = formats;
+var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+var $v6 = 0;
+var fmt;
+  for (; (fmt = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+__builtins__.PY$print(fmt.PY$__add__(str(':')), fmt.PY$__mod__(val));
+  }
+  }
+
@@ -0,0 +1,9 @@
+load("py-builtins.js");
+var mylist = list([]);
+$PY.method(mylist, 'PY$append', 'append').call(mylist, str('a'));
+$PY.method(mylist, 'PY$append', 'append').call(mylist, str('b'));
+$PY.method(mylist, 'PY$append', 'append').call(mylist, str('c'));
+__builtins__.PY$print(mylist.PY$__getitem__($c0));
+__builtins__.PY$print(mylist.PY$__getitem__($c1));
+__builtins__.PY$print(mylist.PY$__getitem__($c2));
+
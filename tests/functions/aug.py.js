@@ -0,0 +1,28 @@
+load("py-builtins.js");
+var a = $PY.mkint(244);
+var b = $PY.mkint(23);
+__builtins__.PY$print(a);
+a = a.PY$__iadd__($c4);
+__builtins__.PY$print(a);
+a = a.PY$__isub__($c2);
+__builtins__.PY$print(a);
+a = a.PY$__ilshift__($c4);
+__builtins__.PY$print(a);
+a = a.PY$__irshift__($c2);
+__builtins__.PY$print(a);
+a = a.PY$__ibitor__($PY.mkint(234324));
+__builtins__.PY$print(a);
+a = a.PY$__ibitand__($PY.mkint(213213));
+__builtins__.PY$print(a);
+a = a.PY$__ibitxor__($PY.mkint(2312));
+__builtins__.PY$print(a);
+a = a.PY$__ifloordiv__($PY.mkint(324));
+__builtins__.PY$print(a);
+a = a.PY$__iadd__($c1);
+__builtins__.PY$print(a);
+a = a.PY$__idiv__($c2);
+__builtins__.PY$print(a);
+__builtins__.PY$print(b);
+b = b.PY$__ipow__($c3);
+__builtins__.PY$print(b);
+
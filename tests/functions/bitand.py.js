@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var x = $PY.mkint(32424);
+var y = $PY.mkint(1437);
+var z = x.PY$__bitand__(y);
+__builtins__.PY$print(z);
+
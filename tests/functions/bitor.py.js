@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var x = $PY.mkint(123215);
+var y = $PY.mkint(3423);
+var z = x.PY$__bitor__(y);
+__builtins__.PY$print(z);
+
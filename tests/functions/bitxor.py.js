@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var x = $PY.mkint(32213);
+var y = $PY.mkint(98743);
+var z = x.PY$__bitxor__(y);
+__builtins__.PY$print(z);
+
@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var x = $PY.mkint(23423);
+var y = $PY.mkint(213);
+var z = x.PY$__floordiv__(y);
+__builtins__.PY$print(z);
+
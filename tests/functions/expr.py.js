@@ -0,0 +1,15 @@
+load("py-builtins.js");
+var a = $PY.mkint(244);
+var b = $PY.mkint(23);
+__builtins__.PY$print(a);
+__builtins__.PY$print(a.PY$__add__($c4));
+__builtins__.PY$print(a.PY$__sub__($c2));
+__builtins__.PY$print(a.PY$__lshift__($c4));
+__builtins__.PY$print(a.PY$__rshift__($c2));
+__builtins__.PY$print(a.PY$__bitor__($PY.mkint(234324)));
+__builtins__.PY$print(a.PY$__bitand__($PY.mkint(213213)));
+__builtins__.PY$print(a.PY$__bitxor__($PY.mkint(2312)));
+__builtins__.PY$print(a.PY$__floordiv__($PY.mkint(324)));
+__builtins__.PY$print(a.PY$__div__($c2));
+__builtins__.PY$print(b.PY$__pow__($c3));
+
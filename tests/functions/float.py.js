@@ -0,0 +1,5 @@
+load("py-builtins.js");
+var a = str('123.456');
+var b = __builtins__.PY$float(a);
+__builtins__.PY$print(b);
+
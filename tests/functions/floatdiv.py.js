@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var a = $c3;
+var b = $c2;
+var c = a.PY$__div__(b);
+__builtins__.PY$print(c);
+
@@ -0,0 +1,26 @@
+load("py-builtins.js");
+var x = $PY.mkint(123);
+var y = $PY.mkint(233);
+var y2 = $PY.mkint(233);
+var z = $PY.mkint(892);
+if (bool(x.PY$__gt__(y)) === True) {
+__builtins__.PY$print(str('x > y - incorrect'));
+} else {
+__builtins__.PY$print(str('not x > y - correct'));
+}
+if (bool(y.PY$__ge__(y2)) === True) {
+__builtins__.PY$print(str('y >= y2 - correct'));
+} else {
+__builtins__.PY$print(str('not y >= y2 - incorrect'));
+}
+if (bool(z.PY$__gt__(x)) === True) {
+__builtins__.PY$print(str('z > x - correct'));
+} else {
+__builtins__.PY$print(str('not z > x - incorrect'));
+}
+if (bool(y.PY$__ge__(z)) === True) {
+__builtins__.PY$print(str('y >= z - incorrect'));
+} else {
+__builtins__.PY$print(str('not y >= x - correct'));
+}
+
@@ -0,0 +1,18 @@
+load("py-builtins.js");
+var a = dict([$c1, str('aaa'), str('b'), $c2]);
+if (bool(a.PY$__contains__($c2)) === True) {
+__builtins__.PY$print(str('2 in a - incorrect'));
+}
+if (bool(a.PY$__contains__(str('b'))) === True) {
+__builtins__.PY$print(str('b in a - correct'));
+}
+if (bool(a.PY$__contains__($c1)) === True) {
+__builtins__.PY$print(str('1 in a - correct'));
+}
+if (bool($PY.__not__(a.PY$__contains__($c3))) === True) {
+__builtins__.PY$print(str('3 not in a - correct'));
+}
+if (bool($PY.__not__(a.PY$__contains__(str('x')))) === True) {
+__builtins__.PY$print(str('x not in a - correct'));
+}
+
@@ -0,0 +1,5 @@
+load("py-builtins.js");
+var x = str('123');
+var y = __builtins__.PY$int(x);
+__builtins__.PY$print(y);
+
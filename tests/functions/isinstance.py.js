@@ -0,0 +1,46 @@
+load("py-builtins.js");
+var Spam = __inherit(__builtins__.PY$object, 'Spam', true);
+Spam.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var value = ('value' in __kwargs) ? __kwargs['value'] : $v1[0];
+    delete __kwargs.value
+    if (value === undefined) {
+        __builtins__.PY$print('Spam.__init__() did not get parameter value');
+    };
+    var $v2 = value;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$value'))) { self.PY$value = $v2; } else { self.PY$__setattr__('value', $v2); }
+    return None;
+};
+var Eggs = __inherit(__builtins__.PY$object, 'Eggs', true);
+Eggs.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var value = ('value' in __kwargs) ? __kwargs['value'] : $v3[0];
+    delete __kwargs.value
+    if (value === undefined) {
+        __builtins__.PY$print('Eggs.__init__() did not get parameter value');
+    };
+    var $v4 = value;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$value'))) { self.PY$value = $v4; } else { self.PY$__setattr__('value', $v4); }
+    return None;
+};
+var s = Spam($c1);
+var e = Eggs($c2);
+if (bool(__builtins__.PY$isinstance(s, Spam)) === True) {
+__builtins__.PY$print(str('s is Spam - correct'));
+}
+if (bool(__builtins__.PY$isinstance(s, Eggs)) === True) {
+__builtins__.PY$print(str('s is Eggs - incorrect'));
+}
+if (bool(__builtins__.PY$isinstance(e, Spam)) === True) {
+__builtins__.PY$print(str('e is Spam - incorrect'));
+}
+if (bool(__builtins__.PY$isinstance(e, Eggs)) === True) {
+__builtins__.PY$print(str('e is Eggs - correct'));
+}
+
@@ -0,0 +1,4 @@
+load("py-builtins.js");
+var mylist = list([$c1, $c2, $c3]);
+__builtins__.PY$print(__builtins__.PY$len(mylist));
+
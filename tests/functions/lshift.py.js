@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var x = $PY.mkint(10);
+var y = x.PY$__lshift__($c3);
+x = x.PY$__ilshift__($c3);
+__builtins__.PY$print(x, y);
+
@@ -0,0 +1,26 @@
+load("py-builtins.js");
+var x = $PY.mkint(123);
+var y = $PY.mkint(233);
+var y2 = $PY.mkint(233);
+var z = $PY.mkint(892);
+if (bool(x.PY$__lt__(y)) === True) {
+__builtins__.PY$print(str('x < y - correct'));
+} else {
+__builtins__.PY$print(str('not x < y - incorrect'));
+}
+if (bool(y.PY$__le__(y2)) === True) {
+__builtins__.PY$print(str('y <= y2 - correct'));
+} else {
+__builtins__.PY$print(str('not y <= y2 - incorrect'));
+}
+if (bool(z.PY$__lt__(x)) === True) {
+__builtins__.PY$print(str('z < x - incorrect'));
+} else {
+__builtins__.PY$print(str('not z < x - correct'));
+}
+if (bool(y.PY$__le__(z)) === True) {
+__builtins__.PY$print(str('y <= z - correct'));
+} else {
+__builtins__.PY$print(str('not y <= x - incorrect'));
+}
+
@@ -0,0 +1,17 @@
+load("py-builtins.js");
+var $v2 = list([tuple([$c1, $c2]), tuple([str('aaa'), str('bbb')]), tuple([$c4, $c4]), tuple([str('a'), str('a')])]);
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var $v1;
+  for (; ($v1 = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+var $v5 = $v1;
+var $v6 = (($v5.PY$__class__ === tuple || $v5.PY$__class__ === list) && $v5.items.length === 2) ? $v5.items : $PY.unpack($v5, 2);
+var x = $v6[0];
+var y = $v6[1];
+if (bool(x.PY$__ne__(y)) === True) {
+__builtins__.PY$print(__builtins__.PY$str(x).PY$__add__(str(' <> ')).PY$__add__(__builtins__.PY$str(y)));
+} else {
+__builtins__.PY$print(str('not: ').PY$__add__(__builtins__.PY$str(x)).PY$__add__(str(' <> ')).PY$__add__(__builtins__.PY$str(y)));
+}
+  }
+
@@ -0,0 +1,73 @@
+load("py-builtins.js");
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('foo() did not get parameter x');
+    };
+    var bar = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var x = ('x' in __kwargs) ? __kwargs['x'] : $v2[0];
+            delete __kwargs.x
+            if (x === undefined) {
+                __builtins__.PY$print('bar() did not get parameter x');
+            };
+            var quux = function() {
+                        var __kwargs = __kwargs_get(arguments);
+                        var __varargs = __varargs_get(arguments);
+                        var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+                        var x = ('x' in __kwargs) ? __kwargs['x'] : $v3[0];
+                        delete __kwargs.x
+                        if (x === undefined) {
+                            __builtins__.PY$print('quux() did not get parameter x');
+                        };
+                        return x.PY$__add__($c1);
+                    };
+            return quux(x).PY$__add__($PY.mkint(10));
+        };
+    return bar(x).PY$__add__($PY.mkint(100));
+};
+__builtins__.PY$print(foo($c0));
+var Stuff = __inherit(__builtins__.PY$object, 'Stuff', true);
+Stuff.PY$foo = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v4[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Stuff.foo() did not get parameter x');
+    };
+    var bar = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var x = ('x' in __kwargs) ? __kwargs['x'] : $v5[0];
+            delete __kwargs.x
+            if (x === undefined) {
+                __builtins__.PY$print('Stuff.bar() did not get parameter x');
+            };
+            var quux = function() {
+                        var __kwargs = __kwargs_get(arguments);
+                        var __varargs = __varargs_get(arguments);
+                        var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+                        var x = ('x' in __kwargs) ? __kwargs['x'] : $v6[0];
+                        delete __kwargs.x
+                        if (x === undefined) {
+                            __builtins__.PY$print('Stuff.quux() did not get parameter x');
+                        };
+                        return x.PY$__add__($c1);
+                    };
+            return quux(x).PY$__add__($PY.mkint(10));
+        };
+    return bar(x).PY$__add__($PY.mkint(100));
+};
+var s = Stuff();
+__builtins__.PY$print($PY.method(s, 'PY$foo', 'foo').call(s, $c0));
+
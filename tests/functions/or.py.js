@@ -0,0 +1,31 @@
+load("py-builtins.js");
+var tests = list([tuple([__builtins__.PY$False, __builtins__.PY$False]), tuple([__builtins__.PY$False, __builtins__.PY$True]), tuple([__builtins__.PY$True, __builtins__.PY$False]), tuple([__builtins__.PY$True, __builtins__.PY$True]), tuple([__builtins__.PY$True, __builtins__.PY$None]), tuple([__builtins__.PY$False, __builtins__.PY$None]), tuple([__builtins__.PY$None, __builtins__.PY$True]), tuple([__builtins__.PY$None, __builtins__.PY$False])]);
+var pp = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var v = ('v' in __kwargs) ? __kwargs['v'] : $v1[0];
+    delete __kwargs.v
+    if (v === undefined) {
+        __builtins__.PY$print('pp() did not get parameter v');
+    };
+    if (bool(v.PY$__eq__(__builtins__.PY$False)) === True) {
+        return str('F');
+    }
+    if (bool(v.PY$__eq__(__builtins__.PY$True)) === True) {
+        return str('T');
+    }
+    return str('?');
+};
+var $v2 = tests;
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var t;
+  for (; (t = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+var $v5 = t;
+var $v6 = (($v5.PY$__class__ === tuple || $v5.PY$__class__ === list) && $v5.items.length === 2) ? $v5.items : $PY.unpack($v5, 2);
+var b1 = $v6[0];
+var b2 = $v6[1];
+__builtins__.PY$print(pp(b1).PY$__add__(str(' OR ')).PY$__add__(pp(b2)).PY$__add__(str('=')).PY$__add__(pp(function() { var $v7; bool($v7 = b1) === True || bool($v7 = b2) === True; return $v7; }())));
+  }
+
@@ -0,0 +1,4 @@
+load("py-builtins.js");
+var a = list([$c1, $c2, $c3, $c4]);
+__builtins__.PY$print($PY.method(a, 'PY$pop', 'pop').call(a));
+
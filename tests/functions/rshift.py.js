@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var x = $PY.mkint(345);
+var y = x.PY$__rshift__($c7);
+x = x.PY$__irshift__($c7);
+__builtins__.PY$print(x, y);
+
@@ -0,0 +1,69 @@
+def branches(n):
+    if n > 2:
+        big = "big"
+    else:
+        big = "small"
+    for i in range(n):
+        last = i
+    return [big, last]
+
+def countdown(n):
+    res = []
+    for i in range(n):
+        if i > 0:
+            res.extend(countdown(i))
+        res.append(i)
+    return res
+
+def handler(x):
+    try:
+        res = 10 / x
+    except ZeroDivisionError, e:
+        res = "error"
+    return res
+
+def loop_closures(n):
+    funcs = []
+    for i in range(n):
+        def get(x):
+            return x * 2
+        funcs.append(get)
+    return [f(n) for f in funcs]
+
+def nested(a, b=1, *rest):
+    def inner(c):
+        total = a + b + c
+        return total
+    total = inner(len(rest))
+    return total
+
+print branches(3)
+print branches(1)
+print countdown(3)
+print handler(2)
+print handler(0)
+print loop_closures(3)
+print nested(1)
+print nested(1, 2, 3, 4)
+
+def bound_defaults(n):
+    funcs = []
+    for i in range(n):
+        def k(i=i):
+            return i * 10
+        funcs.append(k)
+    return [f() for f in funcs]
+
+print bound_defaults(3)
+
+width = 4
+
+def later(a=width, width=len("ab")):
+    return [a, width]
+
+def shared(item, seen=[]):
+    seen.append(item)
+    return len(seen)
+
+print later(), later(width=5)
+print shared(1), shared(2)
@@ -0,0 +1,201 @@
+load("py-builtins.js");
+var branches = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v1[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('branches() did not get parameter n');
+    };
+    if (bool(n.PY$__gt__($c2)) === True) {
+        var big = str('big');
+    } else {
+        big = str('small');
+    }
+    var i;
+    var $v2 = n;
+    for (i = $c0; i.PY$__lt__($v2) == True; i = i.PY$__add__($c1)) {
+        var last = i;
+    }
+    return list([big, last]);
+};
+var countdown = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v3[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('countdown() did not get parameter n');
+    };
+    var res = list([]);
+    var i;
+    var $v4 = n;
+    for (i = $c0; i.PY$__lt__($v4) == True; i = i.PY$__add__($c1)) {
+        if (bool(i.PY$__gt__($c0)) === True) {
+            $PY.method(res, 'PY$extend', 'extend').call(res, countdown(i));
+        }
+        $PY.method(res, 'PY$append', 'append').call(res, i);
+    }
+    return res;
+};
+var handler = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v5[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('handler() did not get parameter x');
+    };
+    try {
+        var res = $PY.mkint(10).PY$__floordiv__(x);
+    } catch ($v6) {
+        if ($PY.isinstance($v6, __builtins__.PY$ZeroDivisionError)) {
+        var e = $v6;
+        res = str('error');
+    }
+    else { throw $v6; }
+    };
+    return res;
+};
+var loop_closures = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v7[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('loop_closures() did not get parameter n');
+    };
+    var funcs = list([]);
+    var i;
+    var $v8 = n;
+    for (i = $c0; i.PY$__lt__($v8) == True; i = i.PY$__add__($c1)) {
+        var get = function() {
+                var __kwargs = __kwargs_get(arguments);
+                var __varargs = __varargs_get(arguments);
+                var $v9 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+                var x = ('x' in __kwargs) ? __kwargs['x'] : $v9[0];
+                delete __kwargs.x
+                if (x === undefined) {
+                    __builtins__.PY$print('get() did not get parameter x');
+                };
+                return x.PY$__mul__($c2);
+            };
+        $PY.method(funcs, 'PY$append', 'append').call(funcs, get);
+    }
+    return (function() {var $v10 = list(); var f; for (var $v11 = iter(funcs); (f = $PY.next($v11)) !== null; ) {
+ $v10.PY$append(f(n))}; return $v10})();
+};
+var nested = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var rest = __varargs_get(arguments);
+    var $v12 = Array.prototype.slice.call(arguments).concat(js(rest));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v12[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('nested() did not get parameter a');
+    };
+    var b = $v12[1];
+    if (b === undefined) { b = __kwargs.b === undefined ? $c1 : __kwargs.b; };
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('nested() did not get parameter b');
+    };
+    rest = tuple($v12.slice(2));
+    var inner = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v13 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var c = ('c' in __kwargs) ? __kwargs['c'] : $v13[0];
+            delete __kwargs.c
+            if (c === undefined) {
+                __builtins__.PY$print('inner() did not get parameter c');
+            };
+            var total = a.PY$__add__(b).PY$__add__(c);
+            return total;
+        };
+    var total = inner(__builtins__.PY$len(rest));
+    return total;
+};
+__builtins__.PY$print(branches($c3));
+__builtins__.PY$print(branches($c1));
+__builtins__.PY$print(countdown($c3));
+__builtins__.PY$print(handler($c2));
+__builtins__.PY$print(handler($c0));
+__builtins__.PY$print(loop_closures($c3));
+__builtins__.PY$print(nested($c1));
+__builtins__.PY$print(nested($c1, $c2, $c3, $c4));
+var bound_defaults = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v14 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v14[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('bound_defaults() did not get parameter n');
+    };
+    var funcs = list([]);
+    var i;
+    var $v15 = n;
+    for (i = $c0; i.PY$__lt__($v15) == True; i = i.PY$__add__($c1)) {
+        var k = (function($v16) { return function() {
+                var __kwargs = __kwargs_get(arguments);
+                var __varargs = __varargs_get(arguments);
+                var $v17 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+                var i = $v17[0];
+                if (i === undefined) { i = __kwargs.i === undefined ? $v16 : __kwargs.i; };
+                delete __kwargs.i
+                if (i === undefined) {
+                    __builtins__.PY$print('k() did not get parameter i');
+                };
+                return i.PY$__mul__($PY.mkint(10));
+            }; })(i);
+        $PY.method(funcs, 'PY$append', 'append').call(funcs, k);
+    }
+    return (function() {var $v18 = list(); var f; for (var $v19 = iter(funcs); (f = $PY.next($v19)) !== null; ) {
+ $v18.PY$append(f())}; return $v18})();
+};
+__builtins__.PY$print(bound_defaults($c3));
+var width = $c4;
+var later = (function($v20, $v21) { return function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v22 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = $v22[0];
+    if (a === undefined) { a = __kwargs.a === undefined ? $v20 : __kwargs.a; };
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('later() did not get parameter a');
+    };
+    var width = $v22[1];
+    if (width === undefined) { width = __kwargs.width === undefined ? $v21 : __kwargs.width; };
+    delete __kwargs.width
+    if (width === undefined) {
+        __builtins__.PY$print('later() did not get parameter width');
+    };
+    return list([a, width]);
+}; })(width, __builtins__.PY$len(str('ab')));
+var shared = (function($v23) { return function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v24 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var item = ('item' in __kwargs) ? __kwargs['item'] : $v24[0];
+    delete __kwargs.item
+    if (item === undefined) {
+        __builtins__.PY$print('shared() did not get parameter item');
+    };
+    var seen = $v24[1];
+    if (seen === undefined) { seen = __kwargs.seen === undefined ? $v23 : __kwargs.seen; };
+    delete __kwargs.seen
+    if (seen === undefined) {
+        __builtins__.PY$print('shared() did not get parameter seen');
+    };
+    $PY.method(seen, 'PY$append', 'append').call(seen, item);
+    return __builtins__.PY$len(seen);
+}; })(list([]));
+__builtins__.PY$print(later(), later(__kwargs_make({width: $c5})));
+__builtins__.PY$print(shared($c1), shared($c2));
+
@@ -0,0 +1,7 @@
+load("py-builtins.js");
+var l = list([$c3, $c2, $c1]);
+$PY.method(l, 'PY$sort', 'sort').call(l);
+__builtins__.PY$print(l.PY$__getitem__($c0));
+__builtins__.PY$print(l.PY$__getitem__($c1));
+__builtins__.PY$print(l.PY$__getitem__($c2));
+
@@ -0,0 +1,29 @@
+load("py-builtins.js");
+var revcmp = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v1[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('revcmp() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v1[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('revcmp() did not get parameter b');
+    };
+    if (bool(b.PY$__lt__(a)) === True) {
+        return $PY.mkint(-1);
+    }
+    if (bool(b.PY$__eq__(a)) === True) {
+        return $c0;
+    }
+    return $c1;
+};
+var l = list([$c4, $c7, $c2, $c3, $c8, $c1, $c3]);
+$PY.method(l, 'PY$sort', 'sort').call(l, revcmp);
+__builtins__.PY$print(l.PY$__getitem__($c0));
+__builtins__.PY$print(l.PY$__getitem__($c1));
+__builtins__.PY$print(l.PY$__getitem__($c2));
+
@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var a = $c1;
+var b = __builtins__.PY$str(a);
+var c = str('x: ').PY$__add__(b);
+__builtins__.PY$print(a);
+__builtins__.PY$print(b);
+__builtins__.PY$print(c);
+
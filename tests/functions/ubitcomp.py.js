@@ -0,0 +1,4 @@
+load("py-builtins.js");
+var b = $c1.PY$__invert__().PY$__bitand__($PY.mkint(65535));
+__builtins__.PY$print(b);
+
@@ -0,0 +1,4 @@
+load("py-builtins.js");
+var x = $PY.mkint(7623).PY$__pos__();
+__builtins__.PY$print(x);
+
@@ -0,0 +1,19 @@
+from shapes import square, circle as disc, NAME
+from shapes import sizes
+
+def area(n):
+    import shapes
+    from shapes import square
+    return square(n) + shapes.square(n)
+
+print NAME
+print square(3), disc(2)
+print sizes.SMALL
+for i in range(3):
+    print area(i)
+
+try:
+    from shapes import missing
+    print "imported missing"
+except ImportError:
+    print "no missing"
@@ -0,0 +1,108 @@
+load("py-builtins.js");
+/************************| tests.import.fromnames.shapes |*************************/
+$PY.modules['tests.import.fromnames.shapes'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.import = {};
+    $m__tests.import.fromnames = {};
+    $m__tests.import.fromnames.shapes = {};
+    $m__tests.import.fromnames.shapes.PY$NAME = str('shapes');
+    $m__tests.import.fromnames.shapes.PY$square = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var n = ('n' in __kwargs) ? __kwargs['n'] : $v1[0];
+            delete __kwargs.n
+            if (n === undefined) {
+                __builtins__.PY$print('square() did not get parameter n');
+            };
+            return n.PY$__mul__(n);
+        };
+    $m__tests.import.fromnames.shapes.PY$circle = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var r = ('r' in __kwargs) ? __kwargs['r'] : $v2[0];
+            delete __kwargs.r
+            if (r === undefined) {
+                __builtins__.PY$print('circle() did not get parameter r');
+            };
+            return $c3.PY$__mul__(r).PY$__mul__(r);
+        };
+    return module('tests.import.fromnames.shapes', 'tests/import/fromnames/shapes/__init__.py', $m__tests.import.fromnames.shapes);
+});
+
+/*********************| tests.import.fromnames.shapes.sizes |**********************/
+$PY.modules['tests.import.fromnames.shapes.sizes'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.import = {};
+    $m__tests.import.fromnames = {};
+    $m__tests.import.fromnames.shapes = {};
+    $m__tests.import.fromnames.shapes.sizes = {};
+    $m__tests.import.fromnames.shapes.sizes.PY$SMALL = $c1;
+    return module('tests.import.fromnames.shapes.sizes', 'tests/import/fromnames/shapes/sizes.py', $m__tests.import.fromnames.shapes.sizes);
+});
+
+/***********************| tests.import.fromnames.fromnames |***********************/
+$PY.modules['tests.import.fromnames.fromnames'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.import = {};
+    $m__tests.import.fromnames = {};
+    $m__tests.import.fromnames.fromnames = {};
+    var square;
+    var disc;
+    var NAME;
+    var $v1 = $PY.import_from(__import__('shapes', js(__module__)), ['square', 'circle', 'NAME']);
+    square = $v1[0];
+    disc = $v1[1];
+    NAME = $v1[2];
+    var sizes;
+    sizes = $PY.import_from(__import__('shapes', js(__module__)), ['sizes'])[0];
+    $m__tests.import.fromnames.fromnames.PY$area = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var n = ('n' in __kwargs) ? __kwargs['n'] : $v2[0];
+            delete __kwargs.n
+            if (n === undefined) {
+                __builtins__.PY$print('area() did not get parameter n');
+            };
+            var shapes = __import__('shapes', js(__module__));
+            var square;
+            square = $PY.import_from(__import__('shapes', js(__module__)), ['square'])[0];
+            return square(n).PY$__add__($PY.method(shapes, 'PY$square', 'square').call(shapes, n));
+        };
+    __builtins__.PY$print(NAME);
+    __builtins__.PY$print(square($c3), disc($c2));
+    __builtins__.PY$print((typeof sizes.PY$SMALL === 'object' ? sizes.PY$SMALL : sizes.PY$__getattr__('SMALL')));
+    var i;
+    var $v3 = $c3;
+    for (i = $c0; i.PY$__lt__($v3) == True; i = i.PY$__add__($c1)) {
+        __builtins__.PY$print($m__tests.import.fromnames.fromnames.PY$area(i));
+    }
+    try {
+        var missing;
+        missing = $PY.import_from(__import__('shapes', js(__module__)), ['missing'])[0];
+        __builtins__.PY$print(str('imported missing'));
+    } catch ($v4) {
+        if ($PY.isinstance($v4, __builtins__.PY$ImportError)) {
+        __builtins__.PY$print(str('no missing'));
+    }
+    else { throw $v4; }
+    };
+    return module('tests.import.fromnames.fromnames', 'tests/import/fromnames/fromnames.py', $m__tests.import.fromnames.fromnames);
+});
+
+$PY.import_table['tests.import.fromnames.fromnames'] = {'shapes': 'tests.import.fromnames.shapes', 'shapes.sizes': 'tests.import.fromnames.shapes.sizes'};
+$PY.run_module('tests.import.fromnames.fromnames', '__main__');
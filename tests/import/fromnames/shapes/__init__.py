@@ -0,0 +1,7 @@
+NAME = "shapes"
+
+def square(n):
+    return n * n
+
+def circle(r):
+    return 3 * r * r
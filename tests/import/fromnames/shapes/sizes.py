@@ -0,0 +1 @@
+SMALL = 1
@@ -0,0 +1,5 @@
+import report
+print "loading admin"
+
+def summary(numbers):
+    return report.largest(numbers)
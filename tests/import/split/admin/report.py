@@ -0,0 +1,8 @@
+print "loading admin.report"
+
+def largest(numbers):
+    result = numbers[0]
+    for number in numbers:
+        if number > result:
+            result = number
+    return "largest is " + str(result)
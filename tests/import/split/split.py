@@ -0,0 +1,8 @@
+def report(numbers):
+    import admin
+    return admin.summary(numbers)
+
+print "before"
+print report([3, 1, 2])
+print report([5])
+print "after"
@@ -0,0 +1,62 @@
+/***********************| tests.import.split.admin.report |************************/
+$PY.modules['tests.import.split.admin.report'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.import = {};
+    $m__tests.import.split = {};
+    $m__tests.import.split.admin = {};
+    $m__tests.import.split.admin.report = {};
+    __builtins__.PY$print(str('loading admin.report'));
+    $m__tests.import.split.admin.report.PY$largest = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var numbers = ('numbers' in __kwargs) ? __kwargs['numbers'] : $v1[0];
+            delete __kwargs.numbers
+            if (numbers === undefined) {
+                __builtins__.PY$print('largest() did not get parameter numbers');
+            };
+            var result = numbers.PY$__getitem__($c0);
+            var $v2 = numbers;
+            var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+            var $v4 = 0;
+            var number;
+              for (; (number = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+                    if (bool(number.PY$__gt__(result)) === True) {
+                            result = number;
+                    }
+              }
+            return str('largest is ').PY$__add__(__builtins__.PY$str(result));
+        };
+    return module('tests.import.split.admin.report', 'tests/import/split/admin/report.py', $m__tests.import.split.admin.report);
+});
+
+/***************************| tests.import.split.admin |***************************/
+$PY.modules['tests.import.split.admin'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.import = {};
+    $m__tests.import.split = {};
+    $m__tests.import.split.admin = {};
+    var report = __import__('report', js(__module__));
+    __builtins__.PY$print(str('loading admin'));
+    $m__tests.import.split.admin.PY$summary = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var numbers = ('numbers' in __kwargs) ? __kwargs['numbers'] : $v1[0];
+            delete __kwargs.numbers
+            if (numbers === undefined) {
+                __builtins__.PY$print('summary() did not get parameter numbers');
+            };
+            return $PY.method(report, 'PY$largest', 'largest').call(report, numbers);
+        };
+    return module('tests.import.split.admin', 'tests/import/split/admin/__init__.py', $m__tests.import.split.admin);
+});
+
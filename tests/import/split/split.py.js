@@ -0,0 +1,36 @@
+load("py-builtins.js");
+/***************************| tests.import.split.split |***************************/
+$PY.modules['tests.import.split.split'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.import = {};
+    $m__tests.import.split = {};
+    $m__tests.import.split.split = {};
+    $m__tests.import.split.split.PY$report = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var numbers = ('numbers' in __kwargs) ? __kwargs['numbers'] : $v1[0];
+            delete __kwargs.numbers
+            if (numbers === undefined) {
+                __builtins__.PY$print('report() did not get parameter numbers');
+            };
+            var admin = __import__('admin', js(__module__));
+            return $PY.method(admin, 'PY$summary', 'summary').call(admin, numbers);
+        };
+    __builtins__.PY$print(str('before'));
+    __builtins__.PY$print($m__tests.import.split.split.PY$report(list([$c3, $c1, $c2])));
+    __builtins__.PY$print($m__tests.import.split.split.PY$report(list([$c5])));
+    __builtins__.PY$print(str('after'));
+    return module('tests.import.split.split', 'tests/import/split/split.py', $m__tests.import.split.split);
+});
+
+$PY.chunks['tests.import.split.admin.report'] = 'split.py.1.js';
+$PY.chunks['tests.import.split.admin'] = 'split.py.1.js';
+$PY.chunk_base = 'tests/import/split/';
+$PY.import_table['tests.import.split.admin'] = {'report': 'tests.import.split.admin.report'};
+$PY.import_table['tests.import.split.split'] = {'admin': 'tests.import.split.admin'};
+$PY.run_module('tests.import.split.split', '__main__');
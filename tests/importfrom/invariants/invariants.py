@@ -0,0 +1,38 @@
+from stack import Stack, Reader, Counter
+
+def drain(s):
+    res = []
+    while s.size > 0:
+        res.append(s.pop())
+    return res
+
+def numbered(reader):
+    res = []
+    for line in reader:
+        res.append("%d: %s" % (reader.line_no, line))
+    return res
+
+def counted(c):
+    seen = []
+    for i in range(3):
+        len(c)
+        seen.append(c.n)
+    return seen
+
+class Offset(object):
+    def __init__(self, offset):
+        self.offset = offset
+
+    def shifted(self, *numbers):
+        res = []
+        for x in numbers:
+            res.append(x + self.offset)
+        return res
+
+s = Stack()
+for i in range(3):
+    s.push(i)
+print Offset(s.size).shifted(1, 2)
+print drain(s), s.size
+print numbered(Reader(["foo", "bar"]))
+print counted(Counter())
@@ -0,0 +1,223 @@
+load("py-builtins.js");
+/**********************| tests.importfrom.invariants.stack |***********************/
+$PY.modules['tests.importfrom.invariants.stack'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.importfrom = {};
+    $m__tests.importfrom.invariants = {};
+    $m__tests.importfrom.invariants.stack = {};
+    $m__tests.importfrom.invariants.stack.PY$Stack = __inherit(__builtins__.PY$object, 'Stack', true);
+    $m__tests.importfrom.invariants.stack.PY$Stack.PY$__init__ = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        var $v2 = list([]);
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$items'))) { self.PY$items = $v2; } else { self.PY$__setattr__('items', $v2); }
+        var $v3 = $c0;
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$size'))) { self.PY$size = $v3; } else { self.PY$__setattr__('size', $v3); }
+        return None;
+    };
+    $m__tests.importfrom.invariants.stack.PY$Stack.PY$push = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        var item = ('item' in __kwargs) ? __kwargs['item'] : $v4[0];
+        delete __kwargs.item
+        if (item === undefined) {
+            __builtins__.PY$print('Stack.push() did not get parameter item');
+        };
+        $PY.callmethod((typeof self.PY$items === 'object' ? self.PY$items : self.PY$__getattr__('items')), 'PY$append', 'append', item);
+        var $v5 = (typeof self.PY$size === 'object' ? self.PY$size : self.PY$__getattr__('size')).PY$__add__($c1);
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$size'))) { self.PY$size = $v5; } else { self.PY$__setattr__('size', $v5); }
+        return None;
+    };
+    $m__tests.importfrom.invariants.stack.PY$Stack.PY$pop = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        var $v7 = (typeof self.PY$size === 'object' ? self.PY$size : self.PY$__getattr__('size')).PY$__sub__($c1);
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$size'))) { self.PY$size = $v7; } else { self.PY$__setattr__('size', $v7); }
+        return $PY.callmethod((typeof self.PY$items === 'object' ? self.PY$items : self.PY$__getattr__('items')), 'PY$pop', 'pop');
+    };
+    $m__tests.importfrom.invariants.stack.PY$Reader = __inherit(__builtins__.PY$object, 'Reader', true);
+    $m__tests.importfrom.invariants.stack.PY$Reader.PY$__init__ = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v8 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        var lines = ('lines' in __kwargs) ? __kwargs['lines'] : $v8[0];
+        delete __kwargs.lines
+        if (lines === undefined) {
+            __builtins__.PY$print('Reader.__init__() did not get parameter lines');
+        };
+        var $v9 = lines;
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$lines'))) { self.PY$lines = $v9; } else { self.PY$__setattr__('lines', $v9); }
+        var $v10 = $c0;
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$line_no'))) { self.PY$line_no = $v10; } else { self.PY$__setattr__('line_no', $v10); }
+        return None;
+    };
+    $m__tests.importfrom.invariants.stack.PY$Reader.PY$__iter__ = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v11 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        return self;
+    };
+    $m__tests.importfrom.invariants.stack.PY$Reader.next = $PY.next_method(function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v12 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        if (bool((typeof self.PY$line_no === 'object' ? self.PY$line_no : self.PY$__getattr__('line_no')).PY$__eq__(__builtins__.PY$len((typeof self.PY$lines === 'object' ? self.PY$lines : self.PY$__getattr__('lines'))))) === True) {
+                return null;
+        }
+        var $v13 = (typeof self.PY$line_no === 'object' ? self.PY$line_no : self.PY$__getattr__('line_no')).PY$__add__($c1);
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$line_no'))) { self.PY$line_no = $v13; } else { self.PY$__setattr__('line_no', $v13); }
+        return (typeof self.PY$lines === 'object' ? self.PY$lines : self.PY$__getattr__('lines')).PY$__getitem__((typeof self.PY$line_no === 'object' ? self.PY$line_no : self.PY$__getattr__('line_no')).PY$__sub__($c1));
+    });
+    $m__tests.importfrom.invariants.stack.PY$Reader.PY$next = $PY.py_next($m__tests.importfrom.invariants.stack.PY$Reader.next);
+    $m__tests.importfrom.invariants.stack.PY$Counter = __inherit(__builtins__.PY$object, 'Counter', true);
+    $m__tests.importfrom.invariants.stack.PY$Counter.PY$__init__ = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v14 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        var $v15 = $c0;
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$n'))) { self.PY$n = $v15; } else { self.PY$__setattr__('n', $v15); }
+        return None;
+    };
+    $m__tests.importfrom.invariants.stack.PY$Counter.PY$__len__ = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v16 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        var $v17 = (typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n')).PY$__add__($c1);
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$n'))) { self.PY$n = $v17; } else { self.PY$__setattr__('n', $v17); }
+        return (typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n'));
+    };
+    return module('tests.importfrom.invariants.stack', 'tests/importfrom/invariants/stack.py', $m__tests.importfrom.invariants.stack);
+});
+
+/********************| tests.importfrom.invariants.invariants |********************/
+$PY.modules['tests.importfrom.invariants.invariants'] = (function() {
+    var __module_kwargs__ = __kwargs_get(arguments);
+    var __builtins__ = ('__builtins__' in __module_kwargs__) ? __module_kwargs__['__builtins__'] : None;
+    var __name__ = ('__name__' in __module_kwargs__) ? __module_kwargs__['__name__'] : None;
+    var __module__ = ('__module__' in __module_kwargs__) ? __module_kwargs__['__module__'] : None;
+    var $m__tests = {};
+    $m__tests.importfrom = {};
+    $m__tests.importfrom.invariants = {};
+    $m__tests.importfrom.invariants.invariants = {};
+    var Stack;
+    var Reader;
+    var Counter;
+    var $v1 = $PY.import_from(__import__('stack', js(__module__)), ['Stack', 'Reader', 'Counter']);
+    Stack = $v1[0];
+    Reader = $v1[1];
+    Counter = $v1[2];
+    $m__tests.importfrom.invariants.invariants.PY$drain = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var s = ('s' in __kwargs) ? __kwargs['s'] : $v2[0];
+            delete __kwargs.s
+            if (s === undefined) {
+                __builtins__.PY$print('drain() did not get parameter s');
+            };
+            var res = list([]);
+            while (bool((typeof s.PY$size === 'object' ? s.PY$size : s.PY$__getattr__('size')).PY$__gt__($c0)) === True) {
+                    $PY.method(res, 'PY$append', 'append').call(res, $PY.method(s, 'PY$pop', 'pop').call(s));
+            }
+            return res;
+        };
+    $m__tests.importfrom.invariants.invariants.PY$numbered = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var reader = ('reader' in __kwargs) ? __kwargs['reader'] : $v3[0];
+            delete __kwargs.reader
+            if (reader === undefined) {
+                __builtins__.PY$print('numbered() did not get parameter reader');
+            };
+            var res = list([]);
+            var $v4 = reader;
+            var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+            var $v6 = 0;
+            var line;
+              for (; (line = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+                    $PY.method(res, 'PY$append', 'append').call(res, str(js(int((typeof reader.PY$line_no === 'object' ? reader.PY$line_no : reader.PY$__getattr__('line_no')))).toString() + ': ' + js(line.PY$__str__())));
+              }
+            return res;
+        };
+    $m__tests.importfrom.invariants.invariants.PY$counted = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            var c = ('c' in __kwargs) ? __kwargs['c'] : $v7[0];
+            delete __kwargs.c
+            if (c === undefined) {
+                __builtins__.PY$print('counted() did not get parameter c');
+            };
+            var seen = list([]);
+            var $v8 = __builtins__.PY$len;
+            var i;
+            var $v9 = $c3;
+            for (i = $c0; i.PY$__lt__($v9) == True; i = i.PY$__add__($c1)) {
+                    $v8(c);
+                    $PY.method(seen, 'PY$append', 'append').call(seen, (typeof c.PY$n === 'object' ? c.PY$n : c.PY$__getattr__('n')));
+            }
+            return seen;
+        };
+    $m__tests.importfrom.invariants.invariants.PY$Offset = __inherit(__builtins__.PY$object, 'Offset', true);
+    $m__tests.importfrom.invariants.invariants.PY$Offset.PY$__init__ = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var __varargs = __varargs_get(arguments);
+        var $v10 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+        var offset = ('offset' in __kwargs) ? __kwargs['offset'] : $v10[0];
+        delete __kwargs.offset
+        if (offset === undefined) {
+            __builtins__.PY$print('Offset.__init__() did not get parameter offset');
+        };
+        var $v11 = offset;
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$offset'))) { self.PY$offset = $v11; } else { self.PY$__setattr__('offset', $v11); }
+        return None;
+    };
+    $m__tests.importfrom.invariants.invariants.PY$Offset.PY$shifted = function() {
+        var self = this;
+        var __kwargs = __kwargs_get(arguments);
+        var numbers = __varargs_get(arguments);
+        var $v12 = Array.prototype.slice.call(arguments).concat(js(numbers));
+        numbers = tuple($v12.slice(0));
+        var res = list([]);
+        var $v13 = undefined;
+        var $v14 = numbers;
+        var $v15 = ($v14.PY$__class__ === list || $v14.PY$__class__ === tuple) ? null : iter($v14);
+        var $v16 = 0;
+        var x;
+          for (; (x = ($v15 === null ? ($v16 < $v14.items.length ? $v14.items[$v16++] : null) : $PY.next($v15))) !== null; ) {
+                $PY.method(res, 'PY$append', 'append').call(res, x.PY$__add__(($v13 !== undefined ? $v13 : ($v13 = (typeof self.PY$offset === 'object' ? self.PY$offset : self.PY$__getattr__('offset'))))));
+          }
+        return res;
+    };
+    $m__tests.importfrom.invariants.invariants.PY$s = Stack();
+    var i;
+    var $v17 = $c3;
+    for (i = $c0; i.PY$__lt__($v17) == True; i = i.PY$__add__($c1)) {
+        $PY.method($m__tests.importfrom.invariants.invariants.PY$s, 'PY$push', 'push').call($m__tests.importfrom.invariants.invariants.PY$s, i);
+    }
+    __builtins__.PY$print($PY.callmethod($m__tests.importfrom.invariants.invariants.PY$Offset((typeof $m__tests.importfrom.invariants.invariants.PY$s.PY$size === 'object' ? $m__tests.importfrom.invariants.invariants.PY$s.PY$size : $m__tests.importfrom.invariants.invariants.PY$s.PY$__getattr__('size'))), 'PY$shifted', 'shifted', $c1, $c2));
+    __builtins__.PY$print($m__tests.importfrom.invariants.invariants.PY$drain($m__tests.importfrom.invariants.invariants.PY$s), (typeof $m__tests.importfrom.invariants.invariants.PY$s.PY$size === 'object' ? $m__tests.importfrom.invariants.invariants.PY$s.PY$size : $m__tests.importfrom.invariants.invariants.PY$s.PY$__getattr__('size')));
+    __builtins__.PY$print($m__tests.importfrom.invariants.invariants.PY$numbered(Reader(list([str('foo'), str('bar')]))));
+    __builtins__.PY$print($m__tests.importfrom.invariants.invariants.PY$counted(Counter()));
+    return module('tests.importfrom.invariants.invariants', 'tests/importfrom/invariants/invariants.py', $m__tests.importfrom.invariants.invariants);
+});
+
+$PY.import_table['tests.importfrom.invariants.invariants'] = {'stack': 'tests.importfrom.invariants.stack'};
+$PY.run_module('tests.importfrom.invariants.invariants', '__main__');
@@ -0,0 +1,34 @@
+class Stack(object):
+    def __init__(self):
+        self.items = []
+        self.size = 0
+
+    def push(self, item):
+        self.items.append(item)
+        self.size = self.size + 1
+
+    def pop(self):
+        self.size = self.size - 1
+        return self.items.pop()
+
+class Reader(object):
+    def __init__(self, lines):
+        self.lines = lines
+        self.line_no = 0
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self.line_no == len(self.lines):
+            raise StopIteration
+        self.line_no = self.line_no + 1
+        return self.lines[self.line_no - 1]
+
+class Counter(object):
+    def __init__(self):
+        self.n = 0
+
+    def __len__(self):
+        self.n = self.n + 1
+        return self.n
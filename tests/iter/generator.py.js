@@ -0,0 +1,70 @@
+load("py-builtins.js");
+var generator = __inherit(object, 'generator', true);
+generator.PY$iterator = __inherit(object, 'iterator', true);
+generator.PY$iterator.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var parent = ('parent' in __kwargs) ? __kwargs['parent'] : $v1[0];
+    delete __kwargs.parent
+    if (parent === undefined) {
+        __builtins__.PY$print('iterator.__init__() did not get parameter parent');
+    };
+    var $v2 = parent;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$parent'))) { self.PY$parent = $v2; } else { self.PY$__setattr__('parent', $v2); }
+    var $v3 = (typeof parent.PY$min === 'object' ? parent.PY$min : parent.PY$__getattr__('min'));
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$value'))) { self.PY$value = $v3; } else { self.PY$__setattr__('value', $v3); }
+    return None;
+};
+generator.PY$iterator.next = $PY.next_method(function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var val = (typeof self.PY$value === 'object' ? self.PY$value : self.PY$__getattr__('value'));
+    if (bool(val.PY$__gt__($PY.getattr((typeof self.PY$parent === 'object' ? self.PY$parent : self.PY$__getattr__('parent')), 'PY$max', 'max'))) === True) {
+        return null;
+    }
+    var $v5 = (typeof self.PY$value === 'object' ? self.PY$value : self.PY$__getattr__('value')).PY$__iadd__($c1);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$value'))) { self.PY$value = $v5; } else { self.PY$__setattr__('value', $v5); }
+    return val;
+});
+generator.PY$iterator.PY$next = $PY.py_next(generator.PY$iterator.next);;
+generator.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var min = ('min' in __kwargs) ? __kwargs['min'] : $v6[0];
+    delete __kwargs.min
+    if (min === undefined) {
+        __builtins__.PY$print('generator.__init__() did not get parameter min');
+    };
+    var max = ('max' in __kwargs) ? __kwargs['max'] : $v6[1];
+    delete __kwargs.max
+    if (max === undefined) {
+        __builtins__.PY$print('generator.__init__() did not get parameter max');
+    };
+    var $v7 = min;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$min'))) { self.PY$min = $v7; } else { self.PY$__setattr__('min', $v7); }
+    var $v8 = max;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$max'))) { self.PY$max = $v8; } else { self.PY$__setattr__('max', $v8); }
+    return None;
+};
+generator.PY$__iter__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v9 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return $PY.method(self, 'PY$iterator', 'iterator').call(self, self);
+};
+var g = generator($c5, $PY.mkint(10));
+var $v10 = g;
+var $v11 = ($v10.PY$__class__ === list || $v10.PY$__class__ === tuple) ? null : iter($v10);
+var $v12 = 0;
+var v;
+  for (; (v = ($v11 === null ? ($v12 < $v10.items.length ? $v10.items[$v12++] : null) : $PY.next($v11))) !== null; ) {
+__builtins__.PY$print(v);
+  }
+
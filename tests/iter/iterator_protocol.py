@@ -0,0 +1,105 @@
+
+class countdown(object):
+
+    def __init__(self, start):
+        self.n = start
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self.n <= 0:
+            raise StopIteration()
+        self.n -= 1
+        return self.n
+
+class evens(object):
+
+    def __init__(self, seq):
+        self.it = iter(seq)
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        while True:
+            x = self.it.next()
+            if x % 2 == 0:
+                return x
+
+for x in countdown(3):
+    print x
+
+print [x for x in evens([1, 2, 3, 4, 5, 6])]
+print list(evens(countdown(7)))
+
+c = countdown(1)
+print next(c)
+print next(c, "done")
+
+try:
+    c.next()
+except StopIteration:
+    print "stopped"
+
+
+class upto(object):
+
+    def __init__(self, n):
+        self.i = 0
+        self.n = n
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self.i >= self.n:
+            raise StopIteration()
+        self.i += 1
+        return self.i
+
+def squares_next(self):
+    if self.i >= self.n:
+        raise StopIteration()
+    self.i += 1
+    return self.i * self.i
+
+class squares(upto):
+    next = squares_next
+
+class tens(upto):
+    def next(self, *args):
+        return upto.next(self) * 10
+
+def doubled(next):
+    def wrapper(self):
+        return next(self) * 2
+    return wrapper
+
+class twos(upto):
+    @doubled
+    def next(self):
+        return upto.next(self)
+
+print list(upto(3))
+print list(squares(3))
+print [x for x in tens(3)]
+print list(twos(3))
+
+class negated(upto):
+    pass
+
+class cubes(upto):
+    pass
+
+def negated_next(self):
+    return -upto.next(self)
+
+def cubes_next(self):
+    value = upto.next(self)
+    return value * value * value
+
+negated.next = negated_next
+setattr(cubes, "next", cubes_next)
+print [x for x in negated(3)]
+print list(cubes(3))
@@ -0,0 +1,212 @@
+load("py-builtins.js");
+var countdown = __inherit(__builtins__.PY$object, 'countdown', true);
+countdown.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var start = ('start' in __kwargs) ? __kwargs['start'] : $v1[0];
+    delete __kwargs.start
+    if (start === undefined) {
+        __builtins__.PY$print('countdown.__init__() did not get parameter start');
+    };
+    var $v2 = start;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$n'))) { self.PY$n = $v2; } else { self.PY$__setattr__('n', $v2); }
+    return None;
+};
+countdown.PY$__iter__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return self;
+};
+countdown.next = $PY.next_method(function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    if (bool((typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n')).PY$__le__($c0)) === True) {
+        return null;
+    }
+    var $v5 = (typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n')).PY$__isub__($c1);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$n'))) { self.PY$n = $v5; } else { self.PY$__setattr__('n', $v5); }
+    return (typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n'));
+});
+countdown.PY$next = $PY.py_next(countdown.next);
+var evens = __inherit(__builtins__.PY$object, 'evens', true);
+evens.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var seq = ('seq' in __kwargs) ? __kwargs['seq'] : $v6[0];
+    delete __kwargs.seq
+    if (seq === undefined) {
+        __builtins__.PY$print('evens.__init__() did not get parameter seq');
+    };
+    var $v7 = __builtins__.PY$iter(seq);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$it'))) { self.PY$it = $v7; } else { self.PY$__setattr__('it', $v7); }
+    return None;
+};
+evens.PY$__iter__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v8 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return self;
+};
+evens.next = $PY.next_method(function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v9 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    while (bool(__builtins__.PY$True) === True) {
+        var x = $PY.callmethod((typeof self.PY$it === 'object' ? self.PY$it : self.PY$__getattr__('it')), 'PY$next', 'next');
+        if (bool(x.PY$__mod__($c2).PY$__eq__($c0)) === True) {
+            return x;
+        }
+    }
+    return None;
+});
+evens.PY$next = $PY.py_next(evens.next);
+var $v10 = countdown($c3);
+var $v11 = ($v10.PY$__class__ === list || $v10.PY$__class__ === tuple) ? null : iter($v10);
+var $v12 = 0;
+var x;
+  for (; (x = ($v11 === null ? ($v12 < $v10.items.length ? $v10.items[$v12++] : null) : $PY.next($v11))) !== null; ) {
+__builtins__.PY$print(x);
+  }
+__builtins__.PY$print((function() {var $v13 = list(); var x; for (var $v14 = iter(evens(list([$c1, $c2, $c3, $c4, $c5, $c6]))); (x = $PY.next($v14)) !== null; ) {
+ $v13.PY$append(x)}; return $v13})());
+__builtins__.PY$print(__builtins__.PY$list(evens(countdown($c7))));
+var c = countdown($c1);
+__builtins__.PY$print(__builtins__.PY$next(c));
+__builtins__.PY$print(__builtins__.PY$next(c, str('done')));
+try {
+$PY.method(c, 'PY$next', 'next').call(c);
+} catch ($v15) {
+if ($PY.isinstance($v15, __builtins__.PY$StopIteration)) {
+__builtins__.PY$print(str('stopped'));
+}
+else { throw $v15; }
+};
+var upto = __inherit(__builtins__.PY$object, 'upto', true);
+upto.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v16 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v16[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('upto.__init__() did not get parameter n');
+    };
+    var $v17 = $c0;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$i'))) { self.PY$i = $v17; } else { self.PY$__setattr__('i', $v17); }
+    var $v18 = n;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$n'))) { self.PY$n = $v18; } else { self.PY$__setattr__('n', $v18); }
+    return None;
+};
+upto.PY$__iter__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v19 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return self;
+};
+upto.next = $PY.next_method(function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v20 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    if (bool((typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')).PY$__ge__((typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n')))) === True) {
+        return null;
+    }
+    var $v21 = (typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')).PY$__iadd__($c1);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$i'))) { self.PY$i = $v21; } else { self.PY$__setattr__('i', $v21); }
+    return (typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i'));
+});
+upto.PY$next = $PY.py_next(upto.next);
+var squares_next = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v22 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    if (bool((typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')).PY$__ge__((typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n')))) === True) {
+        throw __builtins__.PY$StopIteration();
+    }
+    var $v23 = (typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')).PY$__iadd__($c1);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$i'))) { self.PY$i = $v23; } else { self.PY$__setattr__('i', $v23); }
+    return (typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')).PY$__mul__((typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')));
+};
+var squares = __inherit(upto, 'squares', true);
+squares.PY$next = squares_next;
+squares.next = $PY.next_from_py;
+var tens = __inherit(upto, 'tens', true);
+tens.PY$next = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var args = __varargs_get(arguments);
+    var $v24 = Array.prototype.slice.call(arguments).concat(js(args));
+    args = tuple($v24.slice(0));
+    return $PY.method(upto, 'PY$next', 'next').call(upto, self).PY$__mul__($PY.mkint(10));
+};
+tens.next = $PY.next_from_py;
+var doubled = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v25 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var next = ('next' in __kwargs) ? __kwargs['next'] : $v25[0];
+    delete __kwargs.next
+    if (next === undefined) {
+        __builtins__.PY$print('doubled() did not get parameter next');
+    };
+    var wrapper = function() {
+            var self = this;
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v26 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            return next(self).PY$__mul__($c2);
+        };
+    return wrapper;
+};
+var twos = __inherit(upto, 'twos', true);
+twos.PY$next = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v27 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return $PY.method(upto, 'PY$next', 'next').call(upto, self);
+}
+twos.PY$next = doubled(twos.PY$__getattr__('next'));;
+twos.next = $PY.next_from_py;
+__builtins__.PY$print(__builtins__.PY$list(upto($c3)));
+__builtins__.PY$print(__builtins__.PY$list(squares($c3)));
+__builtins__.PY$print((function() {var $v28 = list(); var x; for (var $v29 = iter(tens($c3)); (x = $PY.next($v29)) !== null; ) {
+ $v28.PY$append(x)}; return $v28})());
+__builtins__.PY$print(__builtins__.PY$list(twos($c3)));
+var negated = __inherit(upto, 'negated', true);
+var cubes = __inherit(upto, 'cubes', true);
+var negated_next = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v30 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return $PY.method(upto, 'PY$next', 'next').call(upto, self).PY$__neg__();
+};
+var cubes_next = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v31 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var value = $PY.method(upto, 'PY$next', 'next').call(upto, self);
+    return value.PY$__mul__(value).PY$__mul__(value);
+};
+var $v32 = negated_next;
+if (negated.PY$__setattr__ === $PY.plain_setattr || (negated.PY$__setattr__ === $PY.slot_setattr && negated.hasOwnProperty('PY$next'))) { negated.PY$next = $v32; } else { negated.PY$__setattr__('next', $v32); }
+__builtins__.PY$setattr(cubes, str('next'), cubes_next);
+__builtins__.PY$print((function() {var $v33 = list(); var x; for (var $v34 = iter(negated($c3)); (x = $PY.next($v34)) !== null; ) {
+ $v33.PY$append(x)}; return $v33})());
+__builtins__.PY$print(__builtins__.PY$list(cubes($c3)));
+
@@ -0,0 +1,32 @@
+
+print range(5)
+print range(2, 12, 3)
+print range(10, 0, -3)
+print range(3, 3)
+
+xr = xrange(1, 10, 2)
+print len(xr)
+print xr[0], xr[-1]
+print list(xr)
+print list(reversed(xr))
+print tuple(xrange(4))
+
+for i, x in enumerate(["a", "b", "c"]):
+    print i, x
+
+print list(enumerate("xy"))
+
+e = enumerate([7, 8])
+print e.next()
+print next(e)
+
+print zip([1, 2, 3], "ab")
+print zip()
+print map(lambda x: x * 2, xrange(4))
+print filter(lambda x: x > 2, range(6))
+
+l = [1, 2, 3]
+print list(reversed(l))
+print list(reversed((4, 5)))
+for x in reversed("abc"):
+    print x
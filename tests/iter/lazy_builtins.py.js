@@ -0,0 +1,39 @@
+load("py-builtins.js");
+__builtins__.PY$print(__builtins__.PY$range($c5));
+__builtins__.PY$print(__builtins__.PY$range($c2, $PY.mkint(12), $c3));
+__builtins__.PY$print(__builtins__.PY$range($PY.mkint(10), $c0, $PY.mkint(-3)));
+__builtins__.PY$print(__builtins__.PY$range($c3, $c3));
+var xr = __builtins__.PY$xrange($c1, $PY.mkint(10), $c2);
+__builtins__.PY$print(__builtins__.PY$len(xr));
+__builtins__.PY$print(xr.PY$__getitem__($c0), xr.PY$__getitem__($PY.mkint(-1)));
+__builtins__.PY$print(__builtins__.PY$list(xr));
+__builtins__.PY$print(__builtins__.PY$list(__builtins__.PY$reversed(xr)));
+__builtins__.PY$print(__builtins__.PY$tuple(__builtins__.PY$xrange($c4)));
+var $v2 = list([str('a'), str('b'), str('c')]);
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var $v5 = 0;
+var i;
+var x;
+  for (; (x = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null && ((i = $PY.mkint($v5++)), true); ) {
+__builtins__.PY$print(i, x);
+  }
+__builtins__.PY$print(__builtins__.PY$list(__builtins__.PY$enumerate(str('xy'))));
+var e = __builtins__.PY$enumerate(list([$c7, $c8]));
+__builtins__.PY$print($PY.method(e, 'PY$next', 'next').call(e));
+__builtins__.PY$print(__builtins__.PY$next(e));
+__builtins__.PY$print(__builtins__.PY$zip(list([$c1, $c2, $c3]), str('ab')));
+__builtins__.PY$print(__builtins__.PY$zip());
+__builtins__.PY$print(__builtins__.PY$map(function(x) {return x.PY$__mul__($c2);}, __builtins__.PY$xrange($c4)));
+__builtins__.PY$print(__builtins__.PY$filter(function(x) {return x.PY$__gt__($c2);}, __builtins__.PY$range($c6)));
+var l = list([$c1, $c2, $c3]);
+__builtins__.PY$print(__builtins__.PY$list(__builtins__.PY$reversed(l)));
+__builtins__.PY$print(__builtins__.PY$list(__builtins__.PY$reversed(tuple([$c4, $c5]))));
+var $v6 = __builtins__.PY$reversed(str('abc'));
+var $v7 = ($v6.PY$__class__ === list || $v6.PY$__class__ === tuple) ? null : iter($v6);
+var $v8 = 0;
+var x;
+  for (; (x = ($v7 === null ? ($v8 < $v6.items.length ? $v6.items[$v8++] : null) : $PY.next($v7))) !== null; ) {
+__builtins__.PY$print(x);
+  }
+
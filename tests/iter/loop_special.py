@@ -0,0 +1,107 @@
+class Counter(object):
+    def __init__(self, n):
+        self.n = n
+        self.i = 0
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self.i >= self.n:
+            raise StopIteration
+        self.i += 1
+        return self.i * 10
+
+class SortedDict(dict):
+    def items(self):
+        res = dict.items(self)
+        res.sort()
+        res.reverse()
+        return res
+
+def loops():
+    l = [1, 2, 3]
+    seen = []
+    for x in l:
+        if x == 1:
+            l.append(4)
+        seen.append(x)
+    for x in (5, 6):
+        seen.append(x)
+    for x in "ab":
+        seen.append(x)
+    for a, b in [(1, 2), [3, 4]]:
+        seen.append(a + b)
+    print seen
+
+    d = {"a": 1, "b": 2, "c": 3}
+    keys = []
+    total = 0
+    for k, v in d.items():
+        keys.append(k)
+        total = total + v
+        d["z"] = 26
+    keys.sort()
+    print keys, total
+    del d["z"]
+    for k in d.keys():
+        if k == "a":
+            del d["a"]
+    print len(d)
+    vals = []
+    for v in d.values():
+        vals.append(v)
+    vals.sort()
+    print vals
+    for item in d.items():
+        print len(item)
+    n = 0
+    for k, v in d.iteritems():
+        n = n + v
+    print n
+    ks = []
+    for k in d.iterkeys():
+        ks.append(k)
+    for v in d.itervalues():
+        ks.append(v)
+    print len(ks)
+    print sorted(d.iteritems())
+    print sorted(d.iterkeys()), sorted(d.itervalues())
+
+    for k, v in SortedDict(x=1, y=2).items():
+        print k, v
+
+    for i, x in enumerate(["a", "b", "c"]):
+        if i == 1:
+            continue
+        print i, x
+    for i, x in enumerate(Counter(3), 5):
+        print i, x
+    for i, x in enumerate("xy"):
+        print i, x
+    for pair in enumerate([7, 8]):
+        print pair
+
+    l1 = [1, 2, 3]
+    for a, b in zip(l1, [4, 5, 6, 7]):
+        l1.append(a)
+        print a, b
+    for a, b, c in zip(Counter(5), "abc", ("p", None, 0, 1)):
+        print a, b, c
+        if b == "b":
+            break
+    for t in zip([1], [2]):
+        print t
+    for t in zip([1, 2]):
+        print t
+    l2 = [1, 2, 3, 4]
+    pairs = []
+    for a, b in zip(l2, [5, 6, 7, 8]):
+        l2.pop()
+        pairs.append((a, b))
+    print pairs, l2
+
+loops()
+
+for a, b in enumerate([3, 4]):
+    print a, b
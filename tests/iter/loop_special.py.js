@@ -0,0 +1,297 @@
+load("py-builtins.js");
+var Counter = __inherit(__builtins__.PY$object, 'Counter', true);
+Counter.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v1[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('Counter.__init__() did not get parameter n');
+    };
+    var $v2 = n;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$n'))) { self.PY$n = $v2; } else { self.PY$__setattr__('n', $v2); }
+    var $v3 = $c0;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$i'))) { self.PY$i = $v3; } else { self.PY$__setattr__('i', $v3); }
+    return None;
+};
+Counter.PY$__iter__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return self;
+};
+Counter.next = $PY.next_method(function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    if (bool((typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')).PY$__ge__((typeof self.PY$n === 'object' ? self.PY$n : self.PY$__getattr__('n')))) === True) {
+        return null;
+    }
+    var $v6 = (typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')).PY$__iadd__($c1);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$i'))) { self.PY$i = $v6; } else { self.PY$__setattr__('i', $v6); }
+    return (typeof self.PY$i === 'object' ? self.PY$i : self.PY$__getattr__('i')).PY$__mul__($PY.mkint(10));
+});
+Counter.PY$next = $PY.py_next(Counter.next);
+var SortedDict = __inherit(__builtins__.PY$dict, 'SortedDict', true);
+SortedDict.PY$items = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var res = $PY.method(__builtins__.PY$dict, 'PY$items', 'items').call(__builtins__.PY$dict, self);
+    $PY.method(res, 'PY$sort', 'sort').call(res);
+    $PY.method(res, 'PY$reverse', 'reverse').call(res);
+    return res;
+};
+var loops = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v8 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var l = list([$c1, $c2, $c3]);
+    var seen = list([]);
+    var $v9 = l;
+    var $v10 = ($v9.PY$__class__ === list || $v9.PY$__class__ === tuple) ? null : iter($v9);
+    var $v11 = 0;
+    var x;
+      for (; (x = ($v10 === null ? ($v11 < $v9.items.length ? $v9.items[$v11++] : null) : $PY.next($v10))) !== null; ) {
+        if (bool(x.PY$__eq__($c1)) === True) {
+            $PY.method(l, 'PY$append', 'append').call(l, $c4);
+        }
+        $PY.method(seen, 'PY$append', 'append').call(seen, x);
+      }
+    var $v12 = tuple([$c5, $c6]);
+    var $v13 = ($v12.PY$__class__ === list || $v12.PY$__class__ === tuple) ? null : iter($v12);
+    var $v14 = 0;
+    var x;
+      for (; (x = ($v13 === null ? ($v14 < $v12.items.length ? $v12.items[$v14++] : null) : $PY.next($v13))) !== null; ) {
+        $PY.method(seen, 'PY$append', 'append').call(seen, x);
+      }
+    var $v15 = str('ab');
+    var $v16 = ($v15.PY$__class__ === list || $v15.PY$__class__ === tuple) ? null : iter($v15);
+    var $v17 = 0;
+    var x;
+      for (; (x = ($v16 === null ? ($v17 < $v15.items.length ? $v15.items[$v17++] : null) : $PY.next($v16))) !== null; ) {
+        $PY.method(seen, 'PY$append', 'append').call(seen, x);
+      }
+    var $v19 = list([tuple([$c1, $c2]), list([$c3, $c4])]);
+    var $v20 = ($v19.PY$__class__ === list || $v19.PY$__class__ === tuple) ? null : iter($v19);
+    var $v21 = 0;
+    var $v18;
+      for (; ($v18 = ($v20 === null ? ($v21 < $v19.items.length ? $v19.items[$v21++] : null) : $PY.next($v20))) !== null; ) {
+        var $v22 = $v18;
+        var $v23 = (($v22.PY$__class__ === tuple || $v22.PY$__class__ === list) && $v22.items.length === 2) ? $v22.items : $PY.unpack($v22, 2);
+        var a = $v23[0];
+        var b = $v23[1];
+        $PY.method(seen, 'PY$append', 'append').call(seen, a.PY$__add__(b));
+      }
+    __builtins__.PY$print(seen);
+    var d = dict([str('a'), $c1, str('b'), $c2, str('c'), $c3]);
+    var keys = list([]);
+    var total = $c0;
+    var $v25 = d;
+    var $v26 = ($v25.PY$__class__ === dict) ? $v25.items.slice() : null;
+    var $v27 = ($v26 === null) ? iter($PY.callmethod($v25, 'PY$items', 'items')) : null;
+    var $v28 = 0;
+    var k;
+    var v;
+    var $v29;
+      for (; $v26 !== null ? ($v28 < $v26.length && ((k = $v26[$v28]), (v = $v26[$v28 + 1]), ($v28 += 2), true)) : (($v29 = $PY.next($v27)) !== null && ((k = $v29.PY$__getitem__(0)), (v = $v29.PY$__getitem__(1)), true)); ) {
+        $PY.method(keys, 'PY$append', 'append').call(keys, k);
+        total = total.PY$__add__(v);
+        d.PY$__setitem__(str('z'), $PY.mkint(26));
+      }
+    $PY.method(keys, 'PY$sort', 'sort').call(keys);
+    __builtins__.PY$print(keys, total);
+    d.PY$__delitem__(str('z'));
+    var $v30 = d;
+    var $v31 = ($v30.PY$__class__ === dict) ? $v30.items.slice() : null;
+    var $v32 = ($v31 === null) ? iter($PY.callmethod($v30, 'PY$keys', 'keys')) : null;
+    var $v33 = 0;
+    var k;
+      for (; $v31 !== null ? ($v33 < $v31.length && ((k = $v31[$v33 + 0]), ($v33 += 2), true)) : ((k = $PY.next($v32)) !== null); ) {
+        if (bool(k.PY$__eq__(str('a'))) === True) {
+            d.PY$__delitem__(str('a'));
+        }
+      }
+    __builtins__.PY$print(__builtins__.PY$len(d));
+    var vals = list([]);
+    var $v34 = d;
+    var $v35 = ($v34.PY$__class__ === dict) ? $v34.items.slice() : null;
+    var $v36 = ($v35 === null) ? iter($PY.callmethod($v34, 'PY$values', 'values')) : null;
+    var $v37 = 0;
+    var v;
+      for (; $v35 !== null ? ($v37 < $v35.length && ((v = $v35[$v37 + 1]), ($v37 += 2), true)) : ((v = $PY.next($v36)) !== null); ) {
+        $PY.method(vals, 'PY$append', 'append').call(vals, v);
+      }
+    $PY.method(vals, 'PY$sort', 'sort').call(vals);
+    __builtins__.PY$print(vals);
+    var $v38 = $PY.method(d, 'PY$items', 'items').call(d);
+    var $v39 = ($v38.PY$__class__ === list || $v38.PY$__class__ === tuple) ? null : iter($v38);
+    var $v40 = 0;
+    var item;
+      for (; (item = ($v39 === null ? ($v40 < $v38.items.length ? $v38.items[$v40++] : null) : $PY.next($v39))) !== null; ) {
+        __builtins__.PY$print(__builtins__.PY$len(item));
+      }
+    var n = $c0;
+    var $v42 = d;
+    var $v43 = ($v42.PY$__class__ === dict) ? $v42.items : null;
+    var $v44 = ($v43 === null) ? iter($PY.callmethod($v42, 'PY$iteritems', 'iteritems')) : null;
+    var $v45 = 0;
+    var k;
+    var v;
+    var $v46;
+      for (; $v43 !== null ? ($v45 < $v43.length && ((k = $v43[$v45]), (v = $v43[$v45 + 1]), ($v45 += 2), true)) : (($v46 = $PY.next($v44)) !== null && ((k = $v46.PY$__getitem__(0)), (v = $v46.PY$__getitem__(1)), true)); ) {
+        n = n.PY$__add__(v);
+      }
+    __builtins__.PY$print(n);
+    var ks = list([]);
+    var $v47 = d;
+    var $v48 = ($v47.PY$__class__ === dict) ? $v47.items : null;
+    var $v49 = ($v48 === null) ? iter($PY.callmethod($v47, 'PY$iterkeys', 'iterkeys')) : null;
+    var $v50 = 0;
+    var k;
+      for (; $v48 !== null ? ($v50 < $v48.length && ((k = $v48[$v50 + 0]), ($v50 += 2), true)) : ((k = $PY.next($v49)) !== null); ) {
+        $PY.method(ks, 'PY$append', 'append').call(ks, k);
+      }
+    var $v51 = d;
+    var $v52 = ($v51.PY$__class__ === dict) ? $v51.items : null;
+    var $v53 = ($v52 === null) ? iter($PY.callmethod($v51, 'PY$itervalues', 'itervalues')) : null;
+    var $v54 = 0;
+    var v;
+      for (; $v52 !== null ? ($v54 < $v52.length && ((v = $v52[$v54 + 1]), ($v54 += 2), true)) : ((v = $PY.next($v53)) !== null); ) {
+        $PY.method(ks, 'PY$append', 'append').call(ks, v);
+      }
+    __builtins__.PY$print(__builtins__.PY$len(ks));
+    __builtins__.PY$print(__builtins__.PY$sorted($PY.method(d, 'PY$iteritems', 'iteritems').call(d)));
+    __builtins__.PY$print(__builtins__.PY$sorted($PY.method(d, 'PY$iterkeys', 'iterkeys').call(d)), __builtins__.PY$sorted($PY.method(d, 'PY$itervalues', 'itervalues').call(d)));
+    var $v56 = SortedDict(__kwargs_make({x: $c1, y: $c2}));
+    var $v57 = ($v56.PY$__class__ === dict) ? $v56.items.slice() : null;
+    var $v58 = ($v57 === null) ? iter($PY.callmethod($v56, 'PY$items', 'items')) : null;
+    var $v59 = 0;
+    var k;
+    var v;
+    var $v60;
+      for (; $v57 !== null ? ($v59 < $v57.length && ((k = $v57[$v59]), (v = $v57[$v59 + 1]), ($v59 += 2), true)) : (($v60 = $PY.next($v58)) !== null && ((k = $v60.PY$__getitem__(0)), (v = $v60.PY$__getitem__(1)), true)); ) {
+        __builtins__.PY$print(k, v);
+      }
+    var $v62 = list([str('a'), str('b'), str('c')]);
+    var $v63 = ($v62.PY$__class__ === list || $v62.PY$__class__ === tuple) ? null : iter($v62);
+    var $v64 = 0;
+    var $v65 = 0;
+    var i;
+    var x;
+      for (; (x = ($v63 === null ? ($v64 < $v62.items.length ? $v62.items[$v64++] : null) : $PY.next($v63))) !== null && ((i = $PY.mkint($v65++)), true); ) {
+        if (bool(i.PY$__eq__($c1)) === True) {
+            continue;
+        }
+        __builtins__.PY$print(i, x);
+      }
+    var $v67 = Counter($c3);
+    var $v68 = ($v67.PY$__class__ === list || $v67.PY$__class__ === tuple) ? null : iter($v67);
+    var $v69 = 0;
+    var $v70 = js($c5);
+    var i;
+    var x;
+      for (; (x = ($v68 === null ? ($v69 < $v67.items.length ? $v67.items[$v69++] : null) : $PY.next($v68))) !== null && ((i = $PY.mkint($v70++)), true); ) {
+        __builtins__.PY$print(i, x);
+      }
+    var $v72 = str('xy');
+    var $v73 = ($v72.PY$__class__ === list || $v72.PY$__class__ === tuple) ? null : iter($v72);
+    var $v74 = 0;
+    var $v75 = 0;
+    var i;
+    var x;
+      for (; (x = ($v73 === null ? ($v74 < $v72.items.length ? $v72.items[$v74++] : null) : $PY.next($v73))) !== null && ((i = $PY.mkint($v75++)), true); ) {
+        __builtins__.PY$print(i, x);
+      }
+    var $v76 = __builtins__.PY$enumerate(list([$c7, $c8]));
+    var $v77 = ($v76.PY$__class__ === list || $v76.PY$__class__ === tuple) ? null : iter($v76);
+    var $v78 = 0;
+    var pair;
+      for (; (pair = ($v77 === null ? ($v78 < $v76.items.length ? $v76.items[$v78++] : null) : $PY.next($v77))) !== null; ) {
+        __builtins__.PY$print(pair);
+      }
+    var l1 = list([$c1, $c2, $c3]);
+    var $v80 = l1;
+    var $v81 = ($v80.PY$__class__ === list || $v80.PY$__class__ === tuple) ? null : iter($v80);
+    var $v82 = 0;
+    var $v83 = ($v81 === null) ? $v80.items.slice() : null;
+    var $v84 = list([$c4, $c5, $c6, $c7]);
+    var $v85 = ($v84.PY$__class__ === list || $v84.PY$__class__ === tuple) ? null : iter($v84);
+    var $v86 = 0;
+    var $v87 = ($v85 === null) ? $v84.items.slice() : null;
+    var a;
+    var b;
+      for (; (a = ($v81 === null ? ($v82 < $v83.length ? $v83[$v82++] : null) : $PY.next($v81))) !== null && (b = ($v85 === null ? ($v86 < $v87.length ? $v87[$v86++] : null) : $PY.next($v85))) !== null; ) {
+        $PY.method(l1, 'PY$append', 'append').call(l1, a);
+        __builtins__.PY$print(a, b);
+      }
+    var $v89 = Counter($c5);
+    var $v90 = ($v89.PY$__class__ === list || $v89.PY$__class__ === tuple) ? null : iter($v89);
+    var $v91 = 0;
+    var $v92 = ($v90 === null) ? $v89.items.slice() : null;
+    var $v93 = str('abc');
+    var $v94 = ($v93.PY$__class__ === list || $v93.PY$__class__ === tuple) ? null : iter($v93);
+    var $v95 = 0;
+    var $v96 = ($v94 === null) ? $v93.items.slice() : null;
+    var $v97 = tuple([str('p'), __builtins__.PY$None, $c0, $c1]);
+    var $v98 = ($v97.PY$__class__ === list || $v97.PY$__class__ === tuple) ? null : iter($v97);
+    var $v99 = 0;
+    var $v100 = ($v98 === null) ? $v97.items.slice() : null;
+    var a;
+    var b;
+    var c;
+      for (; (a = ($v90 === null ? ($v91 < $v92.length ? $v92[$v91++] : null) : $PY.next($v90))) !== null && (b = ($v94 === null ? ($v95 < $v96.length ? $v96[$v95++] : null) : $PY.next($v94))) !== null && (c = ($v98 === null ? ($v99 < $v100.length ? $v100[$v99++] : null) : $PY.next($v98))) !== null; ) {
+        __builtins__.PY$print(a, b, c);
+        if (bool(b.PY$__eq__(str('b'))) === True) {
+            break;
+        }
+      }
+    var $v101 = __builtins__.PY$zip(list([$c1]), list([$c2]));
+    var $v102 = ($v101.PY$__class__ === list || $v101.PY$__class__ === tuple) ? null : iter($v101);
+    var $v103 = 0;
+    var t;
+      for (; (t = ($v102 === null ? ($v103 < $v101.items.length ? $v101.items[$v103++] : null) : $PY.next($v102))) !== null; ) {
+        __builtins__.PY$print(t);
+      }
+    var $v104 = __builtins__.PY$zip(list([$c1, $c2]));
+    var $v105 = ($v104.PY$__class__ === list || $v104.PY$__class__ === tuple) ? null : iter($v104);
+    var $v106 = 0;
+    var t;
+      for (; (t = ($v105 === null ? ($v106 < $v104.items.length ? $v104.items[$v106++] : null) : $PY.next($v105))) !== null; ) {
+        __builtins__.PY$print(t);
+      }
+    var l2 = list([$c1, $c2, $c3, $c4]);
+    var pairs = list([]);
+    var $v108 = l2;
+    var $v109 = ($v108.PY$__class__ === list || $v108.PY$__class__ === tuple) ? null : iter($v108);
+    var $v110 = 0;
+    var $v111 = ($v109 === null) ? $v108.items.slice() : null;
+    var $v112 = list([$c5, $c6, $c7, $c8]);
+    var $v113 = ($v112.PY$__class__ === list || $v112.PY$__class__ === tuple) ? null : iter($v112);
+    var $v114 = 0;
+    var $v115 = ($v113 === null) ? $v112.items.slice() : null;
+    var a;
+    var b;
+      for (; (a = ($v109 === null ? ($v110 < $v111.length ? $v111[$v110++] : null) : $PY.next($v109))) !== null && (b = ($v113 === null ? ($v114 < $v115.length ? $v115[$v114++] : null) : $PY.next($v113))) !== null; ) {
+        $PY.method(l2, 'PY$pop', 'pop').call(l2);
+        $PY.method(pairs, 'PY$append', 'append').call(pairs, tuple([a, b]));
+      }
+    __builtins__.PY$print(pairs, l2);
+    return None;
+};
+loops();
+var $v117 = list([$c3, $c4]);
+var $v118 = ($v117.PY$__class__ === list || $v117.PY$__class__ === tuple) ? null : iter($v117);
+var $v119 = 0;
+var $v120 = 0;
+var a;
+var b;
+  for (; (b = ($v118 === null ? ($v119 < $v117.items.length ? $v117.items[$v119++] : null) : $PY.next($v118))) !== null && ((a = $PY.mkint($v120++)), true); ) {
+__builtins__.PY$print(a, b);
+  }
+
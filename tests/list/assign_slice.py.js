@@ -0,0 +1,28 @@
+load("py-builtins.js");
+var a = list([$c1, $c2, $c3, $c4, $c5, $c6, $c7]);
+a.PY$__setslice__($c4, $c6, list([str('a'), str('b')]));
+var show = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('show() did not get parameter x');
+    };
+    __builtins__.PY$print(str('----'));
+    var $v2 = a;
+    var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+    var $v4 = 0;
+    var x;
+      for (; (x = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+        __builtins__.PY$print(x);
+      }
+    return None;
+};
+show(a);
+a.PY$__setslice__($c2, $c4, list([str('z')]));
+show(a);
+a.PY$__setslice__($c0, $c2, list([str('abc'), str('def'), str('abc'), str('def')]));
+show(a);
+
@@ -0,0 +1,11 @@
+load("py-builtins.js");
+var mylist = list([$c1, $c2, $c3, $c4, $c5]);
+mylist.PY$__delslice__($c1, $c3);
+var $v1 = __builtins__.PY$xrange($c0, __builtins__.PY$len(mylist));
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(mylist.PY$__getitem__(x));
+  }
+
@@ -0,0 +1,13 @@
+load("py-builtins.js");
+var list1 = list([$c1, $c2, str('f'), $PY.mkint(44)]);
+var list2 = list([str('a'), $PY.mkint(99), $PY.mkint(77)]);
+var list3 = list1.PY$__getitem__(slice(null));
+$PY.method(list3, 'PY$extend', 'extend').call(list3, list2);
+var $v1 = list3;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var item;
+  for (; (item = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(item);
+  }
+
@@ -0,0 +1,11 @@
+load("py-builtins.js");
+var l = list([$c1, $c2, $c3, $c4, $c5, $c6, $c7, $c8, $c8]);
+var l2 = __builtins__.PY$filter(function(x) {return x.PY$__gt__($c4);}, l);
+var $v1 = l2;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var v;
+  for (; (v = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(v);
+  }
+
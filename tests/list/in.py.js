@@ -0,0 +1,30 @@
+load("py-builtins.js");
+var l = list([str('a'), str('b'), str('c')]);
+var intest = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var item = ('item' in __kwargs) ? __kwargs['item'] : $v1[0];
+    delete __kwargs.item
+    if (item === undefined) {
+        __builtins__.PY$print('intest() did not get parameter item');
+    };
+    var list = ('list' in __kwargs) ? __kwargs['list'] : $v1[1];
+    delete __kwargs.list
+    if (list === undefined) {
+        __builtins__.PY$print('intest() did not get parameter list');
+    };
+    if (bool(list.PY$__contains__(item)) === True) {
+        __builtins__.PY$print(__builtins__.PY$str(item).PY$__add__(str(' is in list')));
+    } else {
+        __builtins__.PY$print(__builtins__.PY$str(item).PY$__add__(str(' is not in list')));
+    }
+    return None;
+};
+intest(str('a'), l);
+intest(str('b'), l);
+intest($PY.mkint(99), l);
+intest($c0, l);
+intest(str('z'), l);
+intest(str('c'), l);
+
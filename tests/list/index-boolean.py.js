@@ -0,0 +1,9 @@
+load("py-builtins.js");
+var x = list([str('a'), str('b'), str('c'), str('d')]);
+__builtins__.PY$print(x.PY$__getitem__($c0));
+__builtins__.PY$print(x.PY$__getitem__($c1));
+__builtins__.PY$print(x.PY$__getitem__(__builtins__.PY$False));
+__builtins__.PY$print(x.PY$__getitem__(__builtins__.PY$True));
+x.PY$__setitem__(__builtins__.PY$False, x.PY$__getitem__(__builtins__.PY$True));
+__builtins__.PY$print(x);
+
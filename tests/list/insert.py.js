@@ -0,0 +1,15 @@
+load("py-builtins.js");
+var a = list([]);
+$PY.method(a, 'PY$insert', 'insert').call(a, $c0, $c1);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$insert', 'insert').call(a, $c0, $c2);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$insert', 'insert').call(a, $c0, $c3);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$insert', 'insert').call(a, $c1, $c4);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$insert', 'insert').call(a, $c2, $c5);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$insert', 'insert').call(a, $c5, $c6);
+__builtins__.PY$print(a);
+
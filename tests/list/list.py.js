@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var x = list([$c1, $c2, $c3, str('a'), str('b'), str('c')]);
+var y = x.PY$__getitem__(slice($c2, $c4));
+__builtins__.PY$print(x.PY$__getitem__($c0));
+__builtins__.PY$print(x.PY$__getitem__($c3));
+__builtins__.PY$print(y.PY$__getitem__($c0));
+__builtins__.PY$print(y.PY$__getitem__($c1));
+
@@ -0,0 +1,78 @@
+load("py-builtins.js");
+var list1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v1[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('list1() did not get parameter n');
+    };
+    var a = list([]);
+    $PY.method(a, 'PY$append', 'append').call(a, $c1);
+    $PY.method(a, 'PY$append', 'append').call(a, $c2);
+    $PY.method(a, 'PY$append', 'append').call(a, $c3);
+    $PY.method(a, 'PY$append', 'append').call(a, n);
+    return a.PY$__getitem__($c0).PY$__add__(a.PY$__getitem__($c1)).PY$__add__(a.PY$__getitem__($c2)).PY$__add__(a.PY$__getitem__($c3));
+};
+var list2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = __builtins__.PY$list(__builtins__.PY$range($c5));
+    return __builtins__.PY$str(a);
+};
+var list3 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = __builtins__.PY$list(__builtins__.PY$range($c5));
+    a.PY$__setitem__($c0, $c5);
+    a.PY$__setitem__($c4, $c0);
+    return __builtins__.PY$str(a);
+};
+var list4 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = list([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice($c2, $c4));
+};
+var list5 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = list([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice($c4));
+};
+var list6 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = list([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice($c1, $c6, $c2));
+};
+var list7 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = list([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice(null));
+};
+var list8 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v8 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = list([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice($c4, null));
+};
+__builtins__.PY$print(list1($c4));
+__builtins__.PY$print(list1($c5));
+__builtins__.PY$print(list2());
+__builtins__.PY$print(list3());
+__builtins__.PY$print(list4());
+__builtins__.PY$print(list5());
+__builtins__.PY$print(list6());
+__builtins__.PY$print(list7());
+__builtins__.PY$print(list8());
+
@@ -0,0 +1,13 @@
+load("py-builtins.js");
+__builtins__.PY$print((function() {var $v1 = list(); var x; for (var $v2 = iter(__builtins__.PY$range($PY.mkint(10))); (x = $PY.next($v2)) !== null; ) {
+ $v1.PY$append(x)}; return $v1})());
+__builtins__.PY$print((function() {var $v3 = list(); var x; for (var $v4 = iter(__builtins__.PY$range($PY.mkint(10))); (x = $PY.next($v4)) !== null; ) {
+if (bool(x.PY$__mod__($c2).PY$__eq__($c0)) === False) { continue; } $v3.PY$append(x)}; return $v3})());
+__builtins__.PY$print((function() {var $v5 = list(); var x; for (var $v6 = iter(__builtins__.PY$range($PY.mkint(10))); (x = $PY.next($v6)) !== null; ) {
+if (bool(x.PY$__mod__($c2).PY$__eq__($c0)) === False || bool(x.PY$__lt__($c7)) === False) { continue; } $v5.PY$append(x)}; return $v5})());
+__builtins__.PY$print((function() {var $v7 = list(); var x; for (var $v8 = iter(__builtins__.PY$range($PY.mkint(10))); (x = $PY.next($v8)) !== null; ) {
+ $v7.PY$append(tuple([x, x.PY$__add__($c1)]))}; return $v7})());
+var L = list([str('fii'), str('fi'), str('foo'), str('fum'), str('bar'), str('boo')]);
+__builtins__.PY$print((function() {var $v9 = list(); var x; for (var $v10 = iter(L); (x = $PY.next($v10)) !== null; ) {
+if (bool(bool($PY.method(x, 'PY$startswith', 'startswith').call(x, str('fi'))) === True || bool(x.PY$__eq__(str('bar'))) === True) === False) { continue; } $v9.PY$append(x)}; return $v9})());
+
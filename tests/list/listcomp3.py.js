@@ -0,0 +1,6 @@
+load("py-builtins.js");
+__builtins__.PY$print((function() {var $v1 = list(); var $v2; for (var $v3 = iter(list([tuple([$c1, $c2]), tuple([$c3, $c4]), tuple([$PY.mkint(10), $PY.mkint(20)]), tuple([$PY.mkint(30), $PY.mkint(40)]), tuple([$PY.mkint(100), $PY.mkint(100)])])); ($v2 = $PY.next($v3)) !== null; ) {
+var x = $v2.PY$__getitem__($c0);
+var y = $v2.PY$__getitem__($c1);
+ $v1.PY$append(x.PY$__add__(y))}; return $v1})());
+
@@ -0,0 +1,22 @@
+load("py-builtins.js");
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('foo() did not get parameter x');
+    };
+    return x.PY$__mul__(x);
+};
+var y = list([$c1, $c2, $c3, $c4, $c5]);
+var z = __builtins__.PY$map(foo, y);
+var $v2 = z;
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var val;
+  for (; (val = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+__builtins__.PY$print(val);
+  }
+
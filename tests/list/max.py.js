@@ -0,0 +1,5 @@
+load("py-builtins.js");
+var l = list([$c4, $c7, $c3, $c4, $c2, $c1]);
+var v = __builtins__.PY$max(l);
+__builtins__.PY$print(v);
+
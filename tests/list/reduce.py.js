@@ -0,0 +1,23 @@
+load("py-builtins.js");
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('foo() did not get parameter x');
+    };
+    var y = ('y' in __kwargs) ? __kwargs['y'] : $v1[1];
+    delete __kwargs.y
+    if (y === undefined) {
+        __builtins__.PY$print('foo() did not get parameter y');
+    };
+    return x.PY$__mul__(y);
+};
+var y = list([$c1, $c2, $c3, $c4, $c5]);
+var z = __builtins__.PY$reduce(foo, y, $PY.mkint(10));
+__builtins__.PY$print(z);
+z = __builtins__.PY$reduce(foo, y);
+__builtins__.PY$print(z);
+
@@ -0,0 +1,5 @@
+load("py-builtins.js");
+var a = list([$c1, $c2, $c3, $c4]);
+$PY.method(a, 'PY$reverse', 'reverse').call(a);
+__builtins__.PY$print(a);
+
@@ -0,0 +1,39 @@
+load("py-builtins.js");
+var X = __inherit(__builtins__.PY$object, 'X', true);
+X.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = $v1[0];
+    if (x === undefined) { x = __kwargs.x === undefined ? $PY.mkint(20) : __kwargs.x; };
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('X.__init__() did not get parameter x');
+    };
+    var $v2 = x;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$x'))) { self.PY$x = $v2; } else { self.PY$__setattr__('x', $v2); }
+    return None;
+};
+X.PY$__repr__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return str('%s').PY$__mod__((typeof self.PY$x === 'object' ? self.PY$x : self.PY$__getattr__('x')));
+};
+var O = list([X(str('x')), X(str('c')), X(str('y')), X(str('A')), X(str('B')), X(str('Z')), X(str('D'))]);
+__builtins__.PY$print(O);
+var L = O.PY$__getitem__(slice(null));
+$PY.method(L, 'PY$sort', 'sort').call(L, __kwargs_make({key: function(x) {return (typeof x.PY$x === 'object' ? x.PY$x : x.PY$__getattr__('x'));}}));
+__builtins__.PY$print(L);
+L = O.PY$__getitem__(slice(null));
+$PY.method(L, 'PY$sort', 'sort').call(L, __kwargs_make({cmp: function(a, b) {return __builtins__.PY$cmp((typeof a.PY$x === 'object' ? a.PY$x : a.PY$__getattr__('x')), (typeof b.PY$x === 'object' ? b.PY$x : b.PY$__getattr__('x')));}}));
+__builtins__.PY$print(L);
+L = O.PY$__getitem__(slice(null));
+$PY.method(L, 'PY$sort', 'sort').call(L, __kwargs_make({cmp: function(a, b) {return __builtins__.PY$cmp((typeof b.PY$x === 'object' ? b.PY$x : b.PY$__getattr__('x')), (typeof a.PY$x === 'object' ? a.PY$x : a.PY$__getattr__('x'))).PY$__neg__();}}));
+__builtins__.PY$print(L);
+L = O.PY$__getitem__(slice(null));
+$PY.method(L, 'PY$sort', 'sort').call(L, __kwargs_make({key: function(x) {return $PY.callmethod((typeof x.PY$x === 'object' ? x.PY$x : x.PY$__getattr__('x')), 'PY$lower', 'lower');}}));
+__builtins__.PY$print(L);
+
@@ -0,0 +1,24 @@
+load("py-builtins.js");
+var A = __inherit(__builtins__.PY$list, 'A', true);
+A.PY$my_append = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v1[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('A.my_append() did not get parameter a');
+    };
+    $PY.method(self, 'PY$append', 'append').call(self, a);
+    return None;
+};
+var a = A();
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$append', 'append').call(a, $c5);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$my_append', 'my_append').call(a, $c6);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$remove', 'remove').call(a, $c5);
+__builtins__.PY$print(a);
+
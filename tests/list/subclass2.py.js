@@ -0,0 +1,73 @@
+load("py-builtins.js");
+var List = __inherit(__builtins__.PY$object, 'List', true);
+List.PY$__init__ = (function($v1) { return function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var l = $v2[0];
+    if (l === undefined) { l = __kwargs.l === undefined ? $v1 : __kwargs.l; };
+    delete __kwargs.l
+    if (l === undefined) {
+        __builtins__.PY$print('List.__init__() did not get parameter l');
+    };
+    var $v3 = __builtins__.PY$list(l);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$_list'))) { self.PY$_list = $v3; } else { self.PY$__setattr__('_list', $v3); }
+    return None;
+}; })(list([]));
+List.PY$append = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v4[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('List.append() did not get parameter x');
+    };
+    $PY.callmethod((typeof self.PY$_list === 'object' ? self.PY$_list : self.PY$__getattr__('_list')), 'PY$append', 'append', x);
+    return None;
+};
+List.PY$remove = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v5[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('List.remove() did not get parameter x');
+    };
+    $PY.callmethod((typeof self.PY$_list === 'object' ? self.PY$_list : self.PY$__getattr__('_list')), 'PY$remove', 'remove', x);
+    return None;
+};
+List.PY$__str__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return __builtins__.PY$str((typeof self.PY$_list === 'object' ? self.PY$_list : self.PY$__getattr__('_list')));
+};
+var A = __inherit(List, 'A', true);
+A.PY$my_append = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v7[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('A.my_append() did not get parameter a');
+    };
+    $PY.method(self, 'PY$append', 'append').call(self, a);
+    return None;
+};
+var a = A();
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$append', 'append').call(a, $c5);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$append', 'append').call(a, $c6);
+__builtins__.PY$print(a);
+$PY.method(a, 'PY$remove', 'remove').call(a, $c5);
+__builtins__.PY$print(a);
+
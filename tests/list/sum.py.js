@@ -0,0 +1,7 @@
+load("py-builtins.js");
+var s = list([$c1, $c2, $c3, $c4, $c5]);
+var t = __builtins__.PY$sum(s);
+var u = __builtins__.PY$sum((function() {var $v1 = list(); var x; for (var $v2 = iter(s); (x = $PY.next($v2)) !== null; ) {
+ $v1.PY$append(x.PY$__mul__(x))}; return $v1})());
+__builtins__.PY$print(t, u);
+
@@ -0,0 +1,6 @@
+load("py-builtins.js");
+var s = list([$c1, $c2, $c3, $c4, $c5]);
+__builtins__.PY$print(__builtins__.PY$sum(s));
+__builtins__.PY$print(__builtins__.PY$sum(list([$c1, $c8, $PY.mkint(11)])));
+__builtins__.PY$print(__builtins__.PY$sum(tuple([$c1, $c8, $PY.mkint(11)])));
+
@@ -0,0 +1,10 @@
+load("py-builtins.js");
+var xr = __builtins__.PY$xrange($PY.mkint(20), $PY.mkint(40));
+var $v1 = xr;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(x);
+  }
+
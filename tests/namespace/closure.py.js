@@ -0,0 +1,23 @@
+load("py-builtins.js");
+var factory = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('factory() did not get parameter x');
+    };
+    var fn = function() {
+            var __kwargs = __kwargs_get(arguments);
+            var __varargs = __varargs_get(arguments);
+            var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+            return x;
+        };
+    return fn;
+};
+var a1 = factory(str('foo'));
+var a2 = factory(str('bar'));
+__builtins__.PY$print(a1());
+__builtins__.PY$print(a2());
+
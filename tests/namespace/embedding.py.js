@@ -0,0 +1,18 @@
+load("py-builtins.js");
+str('pyjaco-verbatim:\nfunction foo(x) {\n    print(x);\n}\n');
+str('pyjaco-skip-begin');
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('foo() did not get parameter x');
+    };
+    __builtins__.PY$print(x);
+    return None;
+};
+str('pyjaco-skip-end');
+foo(str('bar'));
+
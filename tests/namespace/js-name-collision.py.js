@@ -0,0 +1,34 @@
+load("py-builtins.js");
+var Foo = __inherit(__builtins__.PY$object, 'Foo', true);
+Foo.PY$default = $PY.mkint(42);
+Foo.PY$test1 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var __default = ('default' in __kwargs) ? __kwargs['default'] : $v1[0];
+    delete __kwargs.__default
+    if (__default === undefined) {
+        __builtins__.PY$print('Foo.test1() did not get parameter __default');
+    };
+    __builtins__.PY$print(__default);
+    return None;
+};
+Foo.PY$test2 = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var __default = $v2[0];
+    if (__default === undefined) { __default = __kwargs.default === undefined ? $PY.mkint(10) : __kwargs.default; };
+    delete __kwargs.__default
+    if (__default === undefined) {
+        __builtins__.PY$print('Foo.test2() did not get parameter __default');
+    };
+    __builtins__.PY$print(__default);
+    return None;
+};
+__builtins__.PY$print((typeof Foo.PY$default === 'object' ? Foo.PY$default : Foo.PY$__getattr__('default')));
+__builtins__.PY$print($PY.callmethod(Foo(), 'PY$test1', 'test1', __kwargs_make({default: $PY.mkint(21)})));
+__builtins__.PY$print($PY.callmethod(Foo(), 'PY$test2', 'test2', __kwargs_make({default: $PY.mkint(22)})));
+
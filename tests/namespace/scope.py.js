@@ -0,0 +1,18 @@
+load("py-builtins.js");
+var x = $PY.mkint(12);
+var loopy = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var $v2 = __builtins__.PY$xrange($c0, $c8);
+    var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+    var $v4 = 0;
+    var x;
+      for (; (x = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+        __builtins__.PY$print(x);
+      }
+    return None;
+};
+loopy();
+__builtins__.PY$print(x);
+
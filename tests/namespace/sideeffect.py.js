@@ -0,0 +1,38 @@
+load("py-builtins.js");
+var g = dict([str('i'), $c0]);
+var se = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    g.PY$__setitem__(str('i'), g.PY$__getitem__(str('i')).PY$__add__($c1));
+    return g.PY$__getitem__(str('i'));
+};
+__builtins__.PY$print(function() { var $v2; bool($v2 = se()) === True && bool($v2 = se()) === True && bool($v2 = se()) === True; return $v2; }());
+__builtins__.PY$print(g.PY$__getitem__(str('i')));
+__builtins__.PY$print(function() { var $v3; bool($v3 = se()) === True || bool($v3 = se()) === True || bool($v3 = se()) === True; return $v3; }());
+__builtins__.PY$print(g.PY$__getitem__(str('i')));
+__builtins__.PY$print(function() { var $v4; bool($v4 = se()) === True && bool($v4 = se()) === True && bool($v4 = se()) === True; return $v4; }());
+__builtins__.PY$print(g.PY$__getitem__(str('i')));
+__builtins__.PY$print(function() { var $v5; bool($v5 = se()) === True || bool($v5 = se()) === True || bool($v5 = se()) === True; return $v5; }());
+__builtins__.PY$print(g.PY$__getitem__(str('i')));
+if (bool(bool(se()) === True && bool(se()) === True) === True) {
+__builtins__.PY$print(str('Quite so'), se());
+}
+if (bool(se()) === True) {
+__builtins__.PY$print(str('Neat'));
+}
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    if (bool(bool(se()) === True && bool(se()) === True) === True) {
+        __builtins__.PY$print(str('Quite so'), se());
+    }
+    if (bool(se()) === True) {
+        __builtins__.PY$print(str('Neat'), se());
+    }
+    var x = function() { var $v7; bool($v7 = se()) === True && bool($v7 = se()) === True; return $v7; }();
+    return None;
+};
+var x = function() { var $v8; bool($v8 = se()) === True && bool($v8 = se()) === True; return $v8; }();
+
@@ -0,0 +1,26 @@
+load("py-builtins.js");
+var x = $c1;
+var y = $c1;
+var foo = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = $c3;
+    x = x.PY$__add__($c1);
+    __builtins__.PY$print(x);
+    return None;
+};
+var bar = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    y = $c3;
+    y = y.PY$__add__($c1);
+    __builtins__.PY$print(y);
+    return None;
+};
+foo();
+bar();
+__builtins__.PY$print(x);
+__builtins__.PY$print(y);
+
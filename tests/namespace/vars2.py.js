@@ -0,0 +1,49 @@
+load("py-builtins.js");
+var x = $c1;
+var y = $c2;
+var f1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = $c3;
+    var y = $c4;
+    __builtins__.PY$print(list([x, y]));
+    return None;
+};
+var f2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = $c5;
+    y = $c6;
+    __builtins__.PY$print(list([x, y]));
+    return None;
+};
+var f3 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    x = $c7;
+    var y = $c8;
+    __builtins__.PY$print(list([x, y]));
+    return None;
+};
+var f4 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    x = $c9;
+    y = $PY.mkint(10);
+    __builtins__.PY$print(list([x, y]));
+    return None;
+};
+__builtins__.PY$print(list([x, y]));
+f1();
+__builtins__.PY$print(list([x, y]));
+f2();
+__builtins__.PY$print(list([x, y]));
+f3();
+__builtins__.PY$print(list([x, y]));
+f4();
+__builtins__.PY$print(list([x, y]));
+
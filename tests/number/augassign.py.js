@@ -0,0 +1,9 @@
+load("py-builtins.js");
+var a = $c1;
+a = a.PY$__iadd__($c1);
+__builtins__.PY$print(a);
+a = a.PY$__iadd__($c3);
+__builtins__.PY$print(a);
+a = a.PY$__isub__($c2);
+__builtins__.PY$print(a);
+
@@ -0,0 +1,132 @@
+load("py-builtins.js");
+var f1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f1() did not get parameter x');
+    };
+    return x;
+};
+var f2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v2[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f2() did not get parameter x');
+    };
+    return x.PY$__add__($c5);
+};
+var f3 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v3[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f3() did not get parameter x');
+    };
+    var a = x.PY$__add__($c1);
+    return a.PY$__sub__($c5);
+};
+var f3b = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v4[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f3b() did not get parameter x');
+    };
+    var a = x.PY$__add__($c1);
+    a = a.PY$__isub__($c5);
+    return a;
+};
+var f3c = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v5[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f3c() did not get parameter x');
+    };
+    var a = __builtins__.PY$float(x).PY$__add__($c1);
+    a = a.PY$__ifloordiv__($c5);
+    return a;
+};
+var f3d = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v6[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f3d() did not get parameter x');
+    };
+    var a = x.PY$__add__($c1);
+    a = a.PY$__imul__($c5);
+    return a;
+};
+var f3e = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v7[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f3e() did not get parameter x');
+    };
+    var a = x.PY$__add__($c1);
+    a = a.PY$__iadd__($c5);
+    return a;
+};
+var f4 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v8 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v8[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f4() did not get parameter x');
+    };
+    if (bool(x) === True) {
+        return $c5;
+    } else {
+        return $c6;
+    }
+    return None;
+};
+var f5 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v9 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v9[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('f5() did not get parameter x');
+    };
+    var a = $c1;
+    if (bool(x) === True) {
+        a = a.PY$__add__($c1);
+    } else {
+        a = a.PY$__sub__($c1);
+    }
+    return a;
+};
+__builtins__.PY$print(f1($c3));
+__builtins__.PY$print(f2($c3));
+__builtins__.PY$print(f3($c3));
+__builtins__.PY$print(f3b($c3));
+__builtins__.PY$print(f3c($c3));
+__builtins__.PY$print(f3d($c3));
+__builtins__.PY$print(f3e($c3));
+__builtins__.PY$print(f4(__builtins__.PY$True));
+__builtins__.PY$print(f4(__builtins__.PY$False));
+__builtins__.PY$print(f5(__builtins__.PY$True));
+__builtins__.PY$print(f5(__builtins__.PY$False));
+
@@ -0,0 +1,11 @@
+load("py-builtins.js");
+var x = $c1;
+var y = $c2;
+var z = $c3;
+__builtins__.PY$print($PY.mkint(10).PY$__mod__(z));
+__builtins__.PY$print(y.PY$__mul__(x));
+__builtins__.PY$print(y.PY$__sub__(z));
+__builtins__.PY$print(y.PY$__add__(x).PY$__add__(z));
+__builtins__.PY$print($PY.mkint(10).PY$__floordiv__($c2));
+__builtins__.PY$print($PY.mkint(10).PY$__pow__($c2));
+
@@ -0,0 +1,10 @@
+x = 7
+y = 2.5
+print x + 1, x - 10, x * 3, x / 2, x // 2
+print x % 3, x % 2.5, x ** 2
+print y + 1, y * 2, y / 2, -y, abs(-y)
+print -x, +x, abs(-x), ~x
+print x & 3, x | 8, x ^ 5, x << 2, x >> 1
+print int(y), float(x), int(3.0)
+print 250 + 6 == 256
+print 1000 + 1 == 1001
@@ -0,0 +1,12 @@
+load("py-builtins.js");
+var x = $c7;
+var y = $PY.mkfloat(2.5);
+__builtins__.PY$print(x.PY$__add__($c1), x.PY$__sub__($PY.mkint(10)), x.PY$__mul__($c3), x.PY$__floordiv__($c2), x.PY$__floordiv__($c2));
+__builtins__.PY$print(x.PY$__mod__($c3), x.PY$__mod__($PY.mkfloat(2.5)), x.PY$__pow__($c2));
+__builtins__.PY$print(y.PY$__add__($c1), y.PY$__mul__($c2), y.PY$__floordiv__($c2), y.PY$__neg__(), __builtins__.PY$abs(y.PY$__neg__()));
+__builtins__.PY$print(x.PY$__neg__(), x.PY$__pos__(), __builtins__.PY$abs(x.PY$__neg__()), x.PY$__invert__());
+__builtins__.PY$print(x.PY$__bitand__($c3), x.PY$__bitor__($c8), x.PY$__bitxor__($c5), x.PY$__lshift__($c2), x.PY$__rshift__($c1));
+__builtins__.PY$print(__builtins__.PY$int(y), __builtins__.PY$float(x), __builtins__.PY$int($PY.mkfloat(3.0)));
+__builtins__.PY$print($PY.mkint(250).PY$__add__($c6).PY$__eq__($PY.mkint(256)));
+__builtins__.PY$print($PY.mkint(1000).PY$__add__($c1).PY$__eq__($PY.mkint(1001)));
+
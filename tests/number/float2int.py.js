@@ -0,0 +1,10 @@
+load("py-builtins.js");
+var $v1 = list([$PY.mkfloat(123.456), $PY.mkfloat(1.1), $PY.mkfloat(-0.00045), $PY.mkfloat(-1.45), $PY.mkfloat(1.5), $PY.mkfloat(1022423.22)]);
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var f;
+  for (; (f = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+var i = __builtins__.PY$int(f);
+__builtins__.PY$print(i);
+  }
+
@@ -0,0 +1,18 @@
+load("py-builtins.js");
+var s1 = str('123');
+var s2 = str('123.456');
+try {
+var f1 = __builtins__.PY$int(s1);
+__builtins__.PY$print(__builtins__.PY$str(f1));
+var f2 = __builtins__.PY$int(s2);
+__builtins__.PY$print(__builtins__.PY$str(f2));
+} catch ($v1) {
+if ($PY.isinstance($v1, __builtins__.PY$ValueError)) {
+var ex = $v1;
+__builtins__.PY$print(str('conversion error'));
+}
+else if (true) {
+__builtins__.PY$print(str('unknown error'));
+}
+};
+
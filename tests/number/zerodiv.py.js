@@ -0,0 +1,28 @@
+load("py-builtins.js");
+var n = list([$c5, $PY.mkfloat(5.0), $c2, $c0, $PY.mkfloat(0.1)]);
+var $v1 = n;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+var $v4 = n;
+var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+var $v6 = 0;
+var y;
+  for (; (y = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+try {
+__builtins__.PY$print(str(js(x.PY$__str__()) + ' / ' + js(y.PY$__str__()) + ' = ' + js(x.PY$__floordiv__(y).PY$__str__())));
+} catch ($v7) {
+if ($PY.isinstance($v7, __builtins__.PY$ZeroDivisionError)) {
+__builtins__.PY$print(str('Oops, divided by 0: (' + js(int(x)).toString() + ' / ' + js(int(y)).toString() + ')'));
+}
+else { throw $v7; }
+};
+__builtins__.PY$print(str('%s + %s = %.5f').PY$__mod__(tuple([x, y, x.PY$__add__(y)])));
+__builtins__.PY$print(str('%s - %s = %.5f').PY$__mod__(tuple([x, y, x.PY$__sub__(y)])));
+__builtins__.PY$print(str('%s * %s = %.5f').PY$__mod__(tuple([x, y, x.PY$__mul__(y)])));
+__builtins__.PY$print(str('%s ** %s = %.5f').PY$__mod__(tuple([x, y, x.PY$__pow__(y)])));
+  }
+  }
+__builtins__.PY$print(str('Finished'));
+
@@ -0,0 +1,37 @@
+load("py-builtins.js");
+var elm = list([__builtins__.PY$True, __builtins__.PY$False, str('foo'), $PY.mkint(10), $c0, $PY.mkint(-1), $PY.mkfloat(2.1), tuple([str('x'), str('y')]), list([str('x'), str('y')]), __builtins__.PY$None, __builtins__.PY$dict(__kwargs_make({x: str('y')}))]);
+var $v1 = elm;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+var $v4 = elm;
+var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+var $v6 = 0;
+var y;
+  for (; (y = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+__builtins__.PY$print(str('types: ' + js($PY.getattr((typeof x.PY$__class__ === 'object' ? x.PY$__class__ : x.PY$__getattr__('__class__')), 'PY$__name__', '__name__').PY$__str__()) + ', ' + js($PY.getattr((typeof y.PY$__class__ === 'object' ? y.PY$__class__ : y.PY$__getattr__('__class__')), 'PY$__name__', '__name__').PY$__str__())));
+try {
+__builtins__.PY$print(str(js(x.PY$__str__()) + ' + ' + js(y.PY$__str__()) + ' = ' + js(x.PY$__add__(y).PY$__str__())));
+} catch ($v7) {
+if (true) {
+__builtins__.PY$print(str('no __add__'));
+}
+};
+try {
+__builtins__.PY$print(str(js(x.PY$__str__()) + ' - ' + js(y.PY$__str__()) + ' = ' + js(x.PY$__sub__(y).PY$__str__())));
+} catch ($v8) {
+if (true) {
+__builtins__.PY$print(str('no __sub__'));
+}
+};
+try {
+__builtins__.PY$print(str(js(x.PY$__str__()) + ' * ' + js(y.PY$__str__()) + ' = ' + js(x.PY$__mul__(y).PY$__str__())));
+} catch ($v9) {
+if (true) {
+__builtins__.PY$print(str('no __mul__'));
+}
+};
+  }
+  }
+
@@ -0,0 +1,13 @@
+load("py-builtins.js");
+__builtins__.PY$print($c1.PY$__lt__($c2));
+__builtins__.PY$print($c2.PY$__gt__($c1));
+__builtins__.PY$print($c1.PY$__le__($c1));
+__builtins__.PY$print($c2.PY$__ge__($c2));
+__builtins__.PY$print($c1.PY$__eq__($c1));
+__builtins__.PY$print(function() { var $v1; bool($v1 = __builtins__.PY$True) === True && bool($v1 = __builtins__.PY$True) === True; return $v1; }());
+__builtins__.PY$print(function() { var $v2; bool($v2 = __builtins__.PY$True) === True || bool($v2 = __builtins__.PY$False) === True; return $v2; }());
+__builtins__.PY$print(function() { var $v3; bool($v3 = __builtins__.PY$False) === True || bool($v3 = __builtins__.PY$True) === True; return $v3; }());
+__builtins__.PY$print($PY.__not__(__builtins__.PY$False));
+__builtins__.PY$print(function() { var $v4; bool($v4 = $PY.__not__(__builtins__.PY$False)) === True && bool($v4 = $PY.__not__(__builtins__.PY$False)) === True; return $v4; }());
+__builtins__.PY$print(function() { var $v5; bool($v5 = $PY.__not__(__builtins__.PY$False)) === True || bool($v5 = __builtins__.PY$False) === True; return $v5; }());
+
@@ -0,0 +1,4 @@
+load("py-builtins.js");
+__builtins__.PY$print(function() { var $v1; bool($v1 = list([])) === True || bool($v1 = $c2) === True; return $v1; }());
+__builtins__.PY$print(function() { var $v2; bool($v2 = $c2) === True && bool($v2 = list([])) === True; return $v2; }());
+
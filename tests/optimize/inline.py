@@ -0,0 +1,56 @@
+SCALE = 3
+
+def double(x):
+    return x * 2
+
+def scaled(x, factor=3):
+    return x * factor
+
+def nothing(x):
+    pass
+
+def bare():
+    return
+
+def get_name(obj):
+    "The name of obj"
+    return obj.name
+
+def plus(a, b=10):
+    return a + b
+
+def twice(f, x):
+    return f(f(x))
+
+inc = lambda x: x + 1
+
+counter = [0]
+
+def bump():
+    counter[0] += 1
+    return counter[0]
+
+def first_then(a, b):
+    return b + a
+
+class Named(object):
+    def __init__(self, name):
+        self.name = name
+
+    def shout(self):
+        return get_name(self) + "!"
+
+def run(numbers):
+    total = 0
+    for v in numbers:
+        total = total + double(v) + plus(v) + plus(v, 1) + inc(v)
+    return total
+
+print double(21), scaled(2), plus(1), plus(1, 2), inc(41)
+print nothing(1), bare()
+print get_name(Named("n")), Named("m").shout()
+print run([1, 2, 3])
+print twice(inc, 5), twice(double, 3)
+print first_then(bump(), bump() * 10)
+x = 4
+print double(x), plus(x, x)
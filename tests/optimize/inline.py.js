@@ -0,0 +1,168 @@
+load("py-builtins.js");
+var SCALE = $c3;
+var double = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('double() did not get parameter x');
+    };
+    return x.PY$__mul__($c2);
+};
+var scaled = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v2[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('scaled() did not get parameter x');
+    };
+    var factor = $v2[1];
+    if (factor === undefined) { factor = __kwargs.factor === undefined ? $c3 : __kwargs.factor; };
+    delete __kwargs.factor
+    if (factor === undefined) {
+        __builtins__.PY$print('scaled() did not get parameter factor');
+    };
+    return x.PY$__mul__(factor);
+};
+var nothing = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v3 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v3[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('nothing() did not get parameter x');
+    };
+    /* pass */
+    return None;
+};
+var bare = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return None;
+};
+var get_name = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var obj = ('obj' in __kwargs) ? __kwargs['obj'] : $v5[0];
+    delete __kwargs.obj
+    if (obj === undefined) {
+        __builtins__.PY$print('get_name() did not get parameter obj');
+    };
+    str('The name of obj');
+    return (typeof obj.PY$name === 'object' ? obj.PY$name : obj.PY$__getattr__('name'));
+};
+var plus = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v6[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('plus() did not get parameter a');
+    };
+    var b = $v6[1];
+    if (b === undefined) { b = __kwargs.b === undefined ? $PY.mkint(10) : __kwargs.b; };
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('plus() did not get parameter b');
+    };
+    return a.PY$__add__(b);
+};
+var twice = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var f = ('f' in __kwargs) ? __kwargs['f'] : $v7[0];
+    delete __kwargs.f
+    if (f === undefined) {
+        __builtins__.PY$print('twice() did not get parameter f');
+    };
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v7[1];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('twice() did not get parameter x');
+    };
+    return f(f(x));
+};
+var inc = function(x) {return x.PY$__add__($c1);};
+var counter = list([$c0]);
+var bump = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v8 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    counter.PY$__setitem__($c0, counter.PY$__getitem__($c0).PY$__iadd__($c1));
+    return counter.PY$__getitem__($c0);
+};
+var first_then = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v9 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v9[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('first_then() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v9[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('first_then() did not get parameter b');
+    };
+    return b.PY$__add__(a);
+};
+var Named = __inherit(__builtins__.PY$object, 'Named', true);
+Named.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v10 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var name = ('name' in __kwargs) ? __kwargs['name'] : $v10[0];
+    delete __kwargs.name
+    if (name === undefined) {
+        __builtins__.PY$print('Named.__init__() did not get parameter name');
+    };
+    var $v11 = name;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$name'))) { self.PY$name = $v11; } else { self.PY$__setattr__('name', $v11); }
+    return None;
+};
+Named.PY$shout = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v12 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    return (typeof self.PY$name === 'object' ? self.PY$name : self.PY$__getattr__('name')).PY$__add__(str('!'));
+};
+var run = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v13 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var numbers = ('numbers' in __kwargs) ? __kwargs['numbers'] : $v13[0];
+    delete __kwargs.numbers
+    if (numbers === undefined) {
+        __builtins__.PY$print('run() did not get parameter numbers');
+    };
+    var total = $c0;
+    var $v14 = numbers;
+    var $v15 = ($v14.PY$__class__ === list || $v14.PY$__class__ === tuple) ? null : iter($v14);
+    var $v16 = 0;
+    var v;
+      for (; (v = ($v15 === null ? ($v16 < $v14.items.length ? $v14.items[$v16++] : null) : $PY.next($v15))) !== null; ) {
+        total = total.PY$__add__(v.PY$__mul__($c2)).PY$__add__(v.PY$__add__($PY.mkint(10))).PY$__add__(v.PY$__add__($c1)).PY$__add__(v.PY$__add__($c1));
+      }
+    return total;
+};
+__builtins__.PY$print($PY.mkint(42), $c6, $PY.mkint(11), $c3, $PY.mkint(42));
+__builtins__.PY$print(__builtins__.PY$None, __builtins__.PY$None);
+__builtins__.PY$print(get_name(Named(str('n'))), $PY.callmethod(Named(str('m')), 'PY$shout', 'shout'));
+__builtins__.PY$print(run(list([$c1, $c2, $c3])));
+__builtins__.PY$print(twice(inc, $c5), twice(double, $c3));
+__builtins__.PY$print(first_then(bump(), bump().PY$__mul__($PY.mkint(10))));
+var x = $c4;
+__builtins__.PY$print(x.PY$__mul__($c2), x.PY$__add__(x));
+
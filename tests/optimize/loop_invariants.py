@@ -0,0 +1,71 @@
+SCALE = 3
+
+def bump_scale():
+    global SCALE
+    SCALE += 1
+
+class Box(object):
+    def __init__(self, size):
+        self.size = size
+        self.items = []
+
+    def fill(self, numbers):
+        total = 0
+        for n in numbers:
+            self.items.append(n * self.size)
+            total = total + len(self.items) * SCALE
+        return total
+
+    def scaled(self, *numbers):
+        res = []
+        for i in range(len(numbers)):
+            res.append(numbers[i] * self.size + SCALE)
+        return res
+
+    def grow(self, count):
+        i = 0
+        while i < count:
+            self.size = self.size + 1
+            i = i + 1
+        return self.size
+
+def sizes(boxes):
+    result = []
+    for box in boxes:
+        result.append(box.size)
+    return result
+
+def scaled(numbers):
+    out = []
+    for n in numbers:
+        bump_scale()
+        out.append(n * SCALE)
+    return out
+
+def maybe(box, flag):
+    count = 0
+    for i in range(3):
+        if flag:
+            count = count + box.missing
+        count = count + abs(-i)
+    return count
+
+def nested(rows):
+    total = 0
+    for row in rows:
+        for cell in row:
+            total = total + cell * SCALE + len(row)
+    return total
+
+b = Box(2)
+print b.fill([1, 2, 3]), b.items
+print b.grow(3)
+print b.scaled(1, 2, 3)
+print sizes([Box(1), Box(5), b])
+print scaled([1, 1, 1])
+print maybe(b, False)
+try:
+    maybe(b, True)
+except AttributeError:
+    print "no attribute"
+print nested([[1, 2], [3], []])
@@ -0,0 +1,190 @@
+load("py-builtins.js");
+var SCALE = $c3;
+var bump_scale = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    SCALE = SCALE.PY$__iadd__($c1);
+    return None;
+};
+var Box = __inherit(__builtins__.PY$object, 'Box', true);
+Box.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var size = ('size' in __kwargs) ? __kwargs['size'] : $v2[0];
+    delete __kwargs.size
+    if (size === undefined) {
+        __builtins__.PY$print('Box.__init__() did not get parameter size');
+    };
+    var $v3 = size;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$size'))) { self.PY$size = $v3; } else { self.PY$__setattr__('size', $v3); }
+    var $v4 = list([]);
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$items'))) { self.PY$items = $v4; } else { self.PY$__setattr__('items', $v4); }
+    return None;
+};
+Box.PY$fill = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v5 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var numbers = ('numbers' in __kwargs) ? __kwargs['numbers'] : $v5[0];
+    delete __kwargs.numbers
+    if (numbers === undefined) {
+        __builtins__.PY$print('Box.fill() did not get parameter numbers');
+    };
+    var total = $c0;
+    var $v6 = __builtins__.PY$len;
+    var $v7 = numbers;
+    var $v8 = ($v7.PY$__class__ === list || $v7.PY$__class__ === tuple) ? null : iter($v7);
+    var $v9 = 0;
+    var n;
+      for (; (n = ($v8 === null ? ($v9 < $v7.items.length ? $v7.items[$v9++] : null) : $PY.next($v8))) !== null; ) {
+        $PY.callmethod((typeof self.PY$items === 'object' ? self.PY$items : self.PY$__getattr__('items')), 'PY$append', 'append', n.PY$__mul__((typeof self.PY$size === 'object' ? self.PY$size : self.PY$__getattr__('size'))));
+        total = total.PY$__add__($v6((typeof self.PY$items === 'object' ? self.PY$items : self.PY$__getattr__('items'))).PY$__mul__(SCALE));
+      }
+    return total;
+};
+Box.PY$scaled = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var numbers = __varargs_get(arguments);
+    var $v10 = Array.prototype.slice.call(arguments).concat(js(numbers));
+    numbers = tuple($v10.slice(0));
+    var res = list([]);
+    var $v11 = undefined;
+    var i;
+    var $v12 = __builtins__.PY$len(numbers);
+    for (i = $c0; i.PY$__lt__($v12) == True; i = i.PY$__add__($c1)) {
+        $PY.method(res, 'PY$append', 'append').call(res, numbers.PY$__getitem__(i).PY$__mul__(($v11 !== undefined ? $v11 : ($v11 = (typeof self.PY$size === 'object' ? self.PY$size : self.PY$__getattr__('size'))))).PY$__add__(SCALE));
+    }
+    return res;
+};
+Box.PY$grow = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v13 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var count = ('count' in __kwargs) ? __kwargs['count'] : $v13[0];
+    delete __kwargs.count
+    if (count === undefined) {
+        __builtins__.PY$print('Box.grow() did not get parameter count');
+    };
+    var i = $c0;
+    while (bool(i.PY$__lt__(count)) === True) {
+        var $v14 = (typeof self.PY$size === 'object' ? self.PY$size : self.PY$__getattr__('size')).PY$__add__($c1);
+        if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$size'))) { self.PY$size = $v14; } else { self.PY$__setattr__('size', $v14); }
+        i = i.PY$__add__($c1);
+    }
+    return (typeof self.PY$size === 'object' ? self.PY$size : self.PY$__getattr__('size'));
+};
+var sizes = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v15 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var boxes = ('boxes' in __kwargs) ? __kwargs['boxes'] : $v15[0];
+    delete __kwargs.boxes
+    if (boxes === undefined) {
+        __builtins__.PY$print('sizes() did not get parameter boxes');
+    };
+    var result = list([]);
+    var $v16 = boxes;
+    var $v17 = ($v16.PY$__class__ === list || $v16.PY$__class__ === tuple) ? null : iter($v16);
+    var $v18 = 0;
+    var box;
+      for (; (box = ($v17 === null ? ($v18 < $v16.items.length ? $v16.items[$v18++] : null) : $PY.next($v17))) !== null; ) {
+        $PY.method(result, 'PY$append', 'append').call(result, (typeof box.PY$size === 'object' ? box.PY$size : box.PY$__getattr__('size')));
+      }
+    return result;
+};
+var scaled = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v19 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var numbers = ('numbers' in __kwargs) ? __kwargs['numbers'] : $v19[0];
+    delete __kwargs.numbers
+    if (numbers === undefined) {
+        __builtins__.PY$print('scaled() did not get parameter numbers');
+    };
+    var out = list([]);
+    var $v20 = bump_scale;
+    var $v21 = numbers;
+    var $v22 = ($v21.PY$__class__ === list || $v21.PY$__class__ === tuple) ? null : iter($v21);
+    var $v23 = 0;
+    var n;
+      for (; (n = ($v22 === null ? ($v23 < $v21.items.length ? $v21.items[$v23++] : null) : $PY.next($v22))) !== null; ) {
+        $v20();
+        $PY.method(out, 'PY$append', 'append').call(out, n.PY$__mul__(SCALE));
+      }
+    return out;
+};
+var maybe = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v24 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var box = ('box' in __kwargs) ? __kwargs['box'] : $v24[0];
+    delete __kwargs.box
+    if (box === undefined) {
+        __builtins__.PY$print('maybe() did not get parameter box');
+    };
+    var flag = ('flag' in __kwargs) ? __kwargs['flag'] : $v24[1];
+    delete __kwargs.flag
+    if (flag === undefined) {
+        __builtins__.PY$print('maybe() did not get parameter flag');
+    };
+    var count = $c0;
+    var $v25 = __builtins__.PY$abs;
+    var i;
+    var $v26 = $c3;
+    for (i = $c0; i.PY$__lt__($v26) == True; i = i.PY$__add__($c1)) {
+        if (bool(flag) === True) {
+            count = count.PY$__add__((typeof box.PY$missing === 'object' ? box.PY$missing : box.PY$__getattr__('missing')));
+        }
+        count = count.PY$__add__($v25(i.PY$__neg__()));
+    }
+    return count;
+};
+var nested = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v27 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var rows = ('rows' in __kwargs) ? __kwargs['rows'] : $v27[0];
+    delete __kwargs.rows
+    if (rows === undefined) {
+        __builtins__.PY$print('nested() did not get parameter rows');
+    };
+    var total = $c0;
+    var $v28 = __builtins__.PY$len;
+    var $v29 = rows;
+    var $v30 = ($v29.PY$__class__ === list || $v29.PY$__class__ === tuple) ? null : iter($v29);
+    var $v31 = 0;
+    var row;
+      for (; (row = ($v30 === null ? ($v31 < $v29.items.length ? $v29.items[$v31++] : null) : $PY.next($v30))) !== null; ) {
+        var $v32 = row;
+        var $v33 = ($v32.PY$__class__ === list || $v32.PY$__class__ === tuple) ? null : iter($v32);
+        var $v34 = 0;
+        var cell;
+          for (; (cell = ($v33 === null ? ($v34 < $v32.items.length ? $v32.items[$v34++] : null) : $PY.next($v33))) !== null; ) {
+            total = total.PY$__add__(cell.PY$__mul__(SCALE)).PY$__add__($v28(row));
+          }
+      }
+    return total;
+};
+var b = Box($c2);
+__builtins__.PY$print($PY.method(b, 'PY$fill', 'fill').call(b, list([$c1, $c2, $c3])), (typeof b.PY$items === 'object' ? b.PY$items : b.PY$__getattr__('items')));
+__builtins__.PY$print($PY.method(b, 'PY$grow', 'grow').call(b, $c3));
+__builtins__.PY$print($PY.method(b, 'PY$scaled', 'scaled').call(b, $c1, $c2, $c3));
+__builtins__.PY$print(sizes(list([Box($c1), Box($c5), b])));
+__builtins__.PY$print(scaled(list([$c1, $c1, $c1])));
+__builtins__.PY$print(maybe(b, __builtins__.PY$False));
+try {
+maybe(b, __builtins__.PY$True);
+} catch ($v35) {
+if ($PY.isinstance($v35, __builtins__.PY$AttributeError)) {
+__builtins__.PY$print(str('no attribute'));
+}
+else { throw $v35; }
+};
+__builtins__.PY$print(nested(list([list([$c1, $c2]), list([$c3]), list([])])));
+
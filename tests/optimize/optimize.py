@@ -0,0 +1,39 @@
+DEBUG = False
+
+def scale(x):
+    return x * (2 ** 10 - 24) + (3 - 5) * 7
+
+def first(l):
+    for x in l:
+        if x > 2:
+            return x
+            print "unreachable"
+            y = x
+    return None
+
+def check(n):
+    assert n > 0, "stripped at -O2"
+    if 0:
+        print "never"
+    elif n:
+        print "n is", n
+    else:
+        pass
+    while False:
+        print "never"
+    else:
+        print "while else"
+    return "yes"
+
+print scale(1)
+print 7 % 3, 17 // 5, 6 & 3, 6 | 1, 5 ^ 1, 1 << 4, 256 >> 2
+print 1.5 * 2, 10 - 0.25
+print "ab" + "cd", "-" * 10, 3 * "x"
+print -(3 + 4), +(2 - 5)
+print first([1, 2, 3, 4])
+print check(3)
+if True:
+    print "taken"
+if DEBUG:
+    print "debug"
+print 2 ** 40 / 2 ** 38
@@ -0,0 +1,64 @@
+load("py-builtins.js");
+var DEBUG = __builtins__.PY$False;
+var scale = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('scale() did not get parameter x');
+    };
+    return x.PY$__mul__($PY.mkint(1000)).PY$__add__($PY.mkint(-14));
+};
+var first = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v2 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var l = ('l' in __kwargs) ? __kwargs['l'] : $v2[0];
+    delete __kwargs.l
+    if (l === undefined) {
+        __builtins__.PY$print('first() did not get parameter l');
+    };
+    var $v3 = l;
+    var $v4 = ($v3.PY$__class__ === list || $v3.PY$__class__ === tuple) ? null : iter($v3);
+    var $v5 = 0;
+    var x;
+      for (; (x = ($v4 === null ? ($v5 < $v3.items.length ? $v3.items[$v5++] : null) : $PY.next($v4))) !== null; ) {
+        if (bool(x.PY$__gt__($c2)) === True) {
+            return x;
+            var y = x;
+        }
+      }
+    return __builtins__.PY$None;
+};
+var check = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v6 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v6[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('check() did not get parameter n');
+    };
+    if (bool(n) === True) {
+        __builtins__.PY$print(str('n is'), n);
+    } else {
+        /* pass */
+    }
+    __builtins__.PY$print(str('while else'));
+    return str('yes');
+};
+__builtins__.PY$print($PY.mkint(986));
+__builtins__.PY$print($c1, $c3, $c2, $c7, $c4, $PY.mkint(16), $PY.mkint(64));
+__builtins__.PY$print($PY.mkfloat(3.0), $PY.mkfloat(9.75));
+__builtins__.PY$print(str('abcd'), str('----------'), str('xxx'));
+__builtins__.PY$print($PY.mkint(-7), $PY.mkint(-3));
+__builtins__.PY$print(first(list([$c1, $c2, $c3, $c4])));
+__builtins__.PY$print(check($c3));
+__builtins__.PY$print(str('taken'));
+if (bool(DEBUG) === True) {
+__builtins__.PY$print(str('debug'));
+}
+__builtins__.PY$print($c2.PY$__pow__($PY.mkint(40)).PY$__floordiv__($c2.PY$__pow__($PY.mkint(38))));
+
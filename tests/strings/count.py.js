@@ -0,0 +1,15 @@
+load("py-builtins.js");
+var txt = str('the quick brown fox jumped over the lazy dogthe');
+var c = $PY.method(txt, 'PY$count', 'count').call(txt, str('the'));
+__builtins__.PY$print(c);
+c = $PY.method(txt, 'PY$count', 'count').call(txt, str('the'), $c0, $PY.mkint(-20));
+__builtins__.PY$print(c);
+c = $PY.method(txt, 'PY$count', 'count').call(txt, str('the'), $c3);
+__builtins__.PY$print(c);
+c = $PY.method(txt, 'PY$count', 'count').call(txt, str('the'), $c4, $PY.mkint(15));
+__builtins__.PY$print(c);
+c = $PY.method(txt, 'PY$count', 'count').call(txt, str('the'), $c1, __builtins__.PY$len(txt));
+__builtins__.PY$print(c);
+c = $PY.method(txt, 'PY$count', 'count').call(txt, str('the'), $c4, __builtins__.PY$len(txt).PY$__sub__($c1));
+__builtins__.PY$print(c);
+
@@ -0,0 +1,9 @@
+load("py-builtins.js");
+var s = str('the quick brown fox');
+var i = $PY.method(s, 'PY$find', 'find').call(s, str('quick'));
+__builtins__.PY$print(__builtins__.PY$str(i));
+i = $PY.method(s, 'PY$find', 'find').call(s, str('dog'));
+__builtins__.PY$print(__builtins__.PY$str(i));
+i = $PY.method(s, 'PY$find', 'find').call(s, str('the'));
+__builtins__.PY$print(__builtins__.PY$str(i));
+
@@ -0,0 +1,7 @@
+load("py-builtins.js");
+var a = list([str('a'), str('b'), str('c')]);
+__builtins__.PY$print($PY.callmethod(str(''), 'PY$join', 'join', a));
+__builtins__.PY$print($PY.callmethod(str(' '), 'PY$join', 'join', a));
+__builtins__.PY$print($PY.callmethod(str('x'), 'PY$join', 'join', a));
+__builtins__.PY$print($PY.callmethod(str('x '), 'PY$join', 'join', a));
+
@@ -0,0 +1,10 @@
+load("py-builtins.js");
+__builtins__.PY$print(tuple([str('x'), str('y')]));
+__builtins__.PY$print(list([str('x'), str('y')]));
+__builtins__.PY$print(str('x'));
+__builtins__.PY$print(__builtins__.PY$repr(str('x')));
+__builtins__.PY$print(str(js(tuple([str('x'), str('y')]).PY$__repr__())));
+__builtins__.PY$print(str(js(list([str('x'), str('y')]).PY$__repr__())));
+__builtins__.PY$print(str(js(tuple([str('x'), str('y')]).PY$__str__())));
+__builtins__.PY$print(str(js(list([str('x'), str('y')]).PY$__str__())));
+
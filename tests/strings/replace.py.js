@@ -0,0 +1,12 @@
+load("py-builtins.js");
+var txt = str('the quick brown fox jumped over thethe lazy dog');
+var txt2 = $PY.method(txt, 'PY$replace', 'replace').call(txt, str('the'), str('a'));
+__builtins__.PY$print(txt);
+__builtins__.PY$print(txt2);
+__builtins__.PY$print($PY.method(txt, 'PY$replace', 'replace').call(txt, str('the'), str('a'), $c0));
+__builtins__.PY$print($PY.method(txt, 'PY$replace', 'replace').call(txt, str('the'), str('a'), $c1));
+__builtins__.PY$print($PY.method(txt, 'PY$replace', 'replace').call(txt, str('the'), str('a'), $c2));
+__builtins__.PY$print($PY.method(txt, 'PY$replace', 'replace').call(txt, str('the'), str('a'), $c3));
+__builtins__.PY$print($PY.method(txt, 'PY$replace', 'replace').call(txt, str('the'), str('a'), $c4));
+__builtins__.PY$print($PY.method(txt, 'PY$replace', 'replace').call(txt, str('the'), str('a'), $PY.mkint(50)));
+
@@ -0,0 +1,19 @@
+print "aaaa".count("aa")
+print "abc".count("")
+print "".count("")
+print "abcabc".count("c", -2)
+
+print "aaa".replace("a", "aa")
+print "abc".replace("", "-")
+print "abc".replace("", "-", 2)
+print "".replace("", "x")
+print "a.b.c".replace(".", "", 1)
+
+print ",".join(["", "a", ""])
+print "-".join(("x", "y"))
+print "+".join("abc")
+
+print "[" + "\r\n ab \x0b\t".strip() + "]"
+print "xxabcyy".strip("xy")
+print "abc".lstrip("x")
+print "cba".rstrip("ab")
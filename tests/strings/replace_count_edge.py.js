@@ -0,0 +1,18 @@
+load("py-builtins.js");
+__builtins__.PY$print($PY.callmethod(str('aaaa'), 'PY$count', 'count', str('aa')));
+__builtins__.PY$print($PY.callmethod(str('abc'), 'PY$count', 'count', str('')));
+__builtins__.PY$print($PY.callmethod(str(''), 'PY$count', 'count', str('')));
+__builtins__.PY$print($PY.callmethod(str('abcabc'), 'PY$count', 'count', str('c'), $PY.mkint(-2)));
+__builtins__.PY$print($PY.callmethod(str('aaa'), 'PY$replace', 'replace', str('a'), str('aa')));
+__builtins__.PY$print($PY.callmethod(str('abc'), 'PY$replace', 'replace', str(''), str('-')));
+__builtins__.PY$print($PY.callmethod(str('abc'), 'PY$replace', 'replace', str(''), str('-'), $c2));
+__builtins__.PY$print($PY.callmethod(str(''), 'PY$replace', 'replace', str(''), str('x')));
+__builtins__.PY$print($PY.callmethod(str('a.b.c'), 'PY$replace', 'replace', str('.'), str(''), $c1));
+__builtins__.PY$print($PY.callmethod(str(','), 'PY$join', 'join', list([str(''), str('a'), str('')])));
+__builtins__.PY$print($PY.callmethod(str('-'), 'PY$join', 'join', tuple([str('x'), str('y')])));
+__builtins__.PY$print($PY.callmethod(str('+'), 'PY$join', 'join', str('abc')));
+__builtins__.PY$print(str('[').PY$__add__($PY.callmethod(str('\r\n ab \x0b\t'), 'PY$strip', 'strip')).PY$__add__(str(']')));
+__builtins__.PY$print($PY.callmethod(str('xxabcyy'), 'PY$strip', 'strip', str('xy')));
+__builtins__.PY$print($PY.callmethod(str('abc'), 'PY$lstrip', 'lstrip', str('x')));
+__builtins__.PY$print($PY.callmethod(str('cba'), 'PY$rstrip', 'rstrip', str('ab')));
+
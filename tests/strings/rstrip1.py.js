@@ -0,0 +1,5 @@
+load("py-builtins.js");
+var s = str('abcxyz');
+__builtins__.PY$print(str('original(').PY$__add__(s).PY$__add__(str(')')));
+__builtins__.PY$print(str('strip(').PY$__add__($PY.method(s, 'PY$rstrip', 'rstrip').call(s, str('yzx'))).PY$__add__(str(')')));
+
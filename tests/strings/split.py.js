@@ -0,0 +1,27 @@
+load("py-builtins.js");
+var s = str('the     quick brown fox jumped over the lazy dog');
+var t = $PY.method(s, 'PY$split', 'split').call(s, str(' '));
+var $v1 = t;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var v;
+  for (; (v = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(v);
+  }
+var r = $PY.method(s, 'PY$split', 'split').call(s, str('e'));
+var $v4 = r;
+var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+var $v6 = 0;
+var v;
+  for (; (v = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+__builtins__.PY$print(v);
+  }
+var x = $PY.method(s, 'PY$split', 'split').call(s);
+var $v7 = x;
+var $v8 = ($v7.PY$__class__ === list || $v7.PY$__class__ === tuple) ? null : iter($v7);
+var $v9 = 0;
+var v;
+  for (; (v = ($v8 === null ? ($v9 < $v7.items.length ? $v7.items[$v9++] : null) : $PY.next($v8))) !== null; ) {
+__builtins__.PY$print(v);
+  }
+
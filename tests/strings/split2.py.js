@@ -0,0 +1,15 @@
+load("py-builtins.js");
+var x = __builtins__.PY$str(str('a / b / c / d'));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str('/')));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str(' /')));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str(' / ')));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str(' / '), $c0));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str(' / '), $c1));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str(' / '), $c2));
+x = __builtins__.PY$str(str('xxxxxxxxx'));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str('x'), $c0));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str('x'), $c1));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str('x'), $c2));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str('x'), $c3));
+__builtins__.PY$print($PY.method(x, 'PY$split', 'split').call(x, str('y')));
+
@@ -0,0 +1,11 @@
+load("py-builtins.js");
+var txt = str('\naaa\n\nbcfdss\n\nsdsd\nwqarwqr\n\n\nwerewr');
+var lines = $PY.method(txt, 'PY$splitlines', 'splitlines').call(txt);
+var $v1 = lines;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var line;
+  for (; (line = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(line);
+  }
+
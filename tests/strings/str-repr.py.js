@@ -0,0 +1,11 @@
+load("py-builtins.js");
+var el = list([$c0, $PY.mkfloat(0.0), __builtins__.PY$True, __builtins__.PY$False, list([$c1, $c2, $c3]), tuple([$c1, $c2, $c3]), tuple([$c1, $c2]), tuple([$c1]), tuple([]), tuple([tuple([$c1])]), __builtins__.PY$dict(__kwargs_make({a: str('b')})), dict([str('0'), str('1')]), dict([str('0'), $c1])]);
+var $v1 = el;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var e;
+  for (; (e = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(__builtins__.PY$repr(e));
+__builtins__.PY$print(__builtins__.PY$str(e));
+  }
+
@@ -0,0 +1,20 @@
+load("py-builtins.js");
+var s1 = str('some string');
+var s2 = str("some 'x' string");
+var s3 = str('some "x" string');
+var s4 = str('some "x" string');
+var s5 = str('some "x" string');
+var s6 = str('some "x" string\nand some other string too...\n');
+if (bool(s2.PY$__eq__(s3)) === True) {
+__builtins__.PY$print(str('ok1'));
+}
+if (bool(s3.PY$__eq__(s4)) === True) {
+__builtins__.PY$print(str('ok2'));
+}
+if (bool(s3.PY$__eq__(s5)) === True) {
+__builtins__.PY$print(str('ok3'));
+}
+if (bool(s3.PY$__ne__(s6)) === True) {
+__builtins__.PY$print(str('ok4'));
+}
+
@@ -0,0 +1,22 @@
+class Label(object):
+    prefix = "lbl-"
+
+    def __getattr__(self, key):
+        return "missing " + key
+
+s = "hello world"
+print list(s)
+print tuple("abc")
+for c in "xyz":
+    print c, type(c)
+print "lo w" in s
+print "low" in s
+print "" in s
+print type("abc")
+print unicode("abc") == "abc"
+print len(unicode("abc"))
+
+l = Label()
+print l.prefix + "x", l.other
+print dict(zip("abc", [1, 2, 3]))["b"]
+print "-".join(reversed("abc"))
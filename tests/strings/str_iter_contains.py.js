@@ -0,0 +1,37 @@
+load("py-builtins.js");
+var Label = __inherit(__builtins__.PY$object, 'Label', true);
+Label.PY$prefix = str('lbl-');
+Label.PY$__getattr__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var key = ('key' in __kwargs) ? __kwargs['key'] : $v1[0];
+    delete __kwargs.key
+    if (key === undefined) {
+        __builtins__.PY$print('Label.__getattr__() did not get parameter key');
+    };
+    if (typeof key === 'string') { key = str(key); };
+    return str('missing ').PY$__add__(key);
+};
+var s = str('hello world');
+__builtins__.PY$print(__builtins__.PY$list(s));
+__builtins__.PY$print(__builtins__.PY$tuple(str('abc')));
+var $v2 = str('xyz');
+var $v3 = ($v2.PY$__class__ === list || $v2.PY$__class__ === tuple) ? null : iter($v2);
+var $v4 = 0;
+var c;
+  for (; (c = ($v3 === null ? ($v4 < $v2.items.length ? $v2.items[$v4++] : null) : $PY.next($v3))) !== null; ) {
+__builtins__.PY$print(c, __builtins__.PY$type(c));
+  }
+__builtins__.PY$print(s.PY$__contains__(str('lo w')));
+__builtins__.PY$print(s.PY$__contains__(str('low')));
+__builtins__.PY$print(s.PY$__contains__(str('')));
+__builtins__.PY$print(__builtins__.PY$type(str('abc')));
+__builtins__.PY$print(__builtins__.PY$unicode(str('abc')).PY$__eq__(str('abc')));
+__builtins__.PY$print(__builtins__.PY$len(__builtins__.PY$unicode(str('abc'))));
+var l = Label();
+__builtins__.PY$print((typeof l.PY$prefix === 'object' ? l.PY$prefix : l.PY$__getattr__('prefix')).PY$__add__(str('x')), (typeof l.PY$other === 'object' ? l.PY$other : l.PY$__getattr__('other')));
+__builtins__.PY$print(__builtins__.PY$dict(__builtins__.PY$zip(str('abc'), list([$c1, $c2, $c3]))).PY$__getitem__(str('b')));
+__builtins__.PY$print($PY.callmethod(str('-'), 'PY$join', 'join', __builtins__.PY$reversed(str('abc'))));
+
@@ -0,0 +1,5 @@
+load("py-builtins.js");
+__builtins__.PY$print(str('"Hello World!" <- should \'mess\' up \'\'\'thing\'\'\'?'));
+__builtins__.PY$print(str('\\x00'));
+__builtins__.PY$print(str('\\u0000'));
+
@@ -0,0 +1,13 @@
+load("py-builtins.js");
+var s1 = str('\n\nabc\n\n\n');
+var s2 = str('\t abc\n\t \n');
+var s3 = str(' abc ');
+var $v1 = list([s1, s2, s3]);
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var s;
+  for (; (s = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(str('original(').PY$__add__(s).PY$__add__(str(')')));
+__builtins__.PY$print(str('strip(').PY$__add__($PY.method(s, 'PY$strip', 'strip').call(s)).PY$__add__(str(')')));
+  }
+
@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var s = str('aBcddEzUh');
+__builtins__.PY$print(s);
+s = $PY.method(s, 'PY$upper', 'upper').call(s);
+__builtins__.PY$print(s);
+s = $PY.method(s, 'PY$lower', 'lower').call(s);
+__builtins__.PY$print(s);
+
@@ -0,0 +1,20 @@
+load("py-builtins.js");
+var s1 = str('hello');
+var s2 = str('world');
+var s3 = str('abcd');
+var s4 = __builtins__.PY$zip(s1, s2, s3);
+var $v1 = s4;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var item;
+  for (; (item = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+__builtins__.PY$print(str('----'));
+var $v4 = item;
+var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+var $v6 = 0;
+var val;
+  for (; (val = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+__builtins__.PY$print(val);
+  }
+  }
+
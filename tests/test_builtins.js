@@ -720,6 +720,38 @@ function test_str() {
     test(function() { return t.PY$__contains__(str("d")) == False });
 }
 
+function test_chunks() {
+    var load_chunk = $PY.load_chunk;
+    var loads = 0;
+    $PY.chunks['chunked'] = 'chunked.js';
+
+    $PY.load_chunk = function(chunk) {
+        loads++;
+        throw Error("no such file: " + chunk);
+    };
+    raises(__builtins__.PY$ImportError, function() { __import__('chunked', '__main__') });
+    test(function() { return loads == 1 });
+
+    $PY.load_chunk = function(chunk) {
+        loads++;
+    };
+    raises(__builtins__.PY$ImportError, function() { __import__('chunked', '__main__') });
+    test(function() { return loads == 2 });
+
+    $PY.loaded_chunks = {};
+    $PY.load_chunk = function(chunk) {
+        loads++;
+        $PY.modules['chunked'] = function() { return object(); };
+    };
+    test(function() { return __import__('chunked', '__main__') !== undefined });
+    test(function() { return loads == 3 });
+
+    $PY.load_chunk = load_chunk;
+    delete $PY.chunks['chunked'];
+    delete $PY.modules['chunked'];
+    delete $PY.__import_cache['chunked'];
+}
+
 function tests() {
     print("");
     print("Testing dictionaries");
@@ -746,6 +778,8 @@ function tests() {
     test_to_js();
     print("Testing strings");
     test_str();
+    print("Testing chunks");
+    test_chunks();
 }
 
 tests();
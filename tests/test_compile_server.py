@@ -0,0 +1,51 @@
+"""
+Smoke test of the compile server: compiles a file through pyjs.py --connect
+and checks that the result is the same as compiling it directly.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+SOURCE = "tests/basic/helloworld.py"
+
+def pyjs(*args):
+    proc = subprocess.Popen([sys.executable, "pyjs.py"] + list(args), stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+    out, err = proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError("pyjs.py %s failed:\n%s" % (" ".join(args), err))
+    return out, err
+
+tmp = tempfile.mkdtemp()
+try:
+    # --serve must not delete files that are not sockets
+    path = os.path.join(tmp, "notasocket.py")
+    with open(path, "w") as f:
+        f.write("print 1\n")
+    proc = subprocess.Popen([sys.executable, "pyjs.py", "--serve", path], stderr = subprocess.PIPE)
+    proc.communicate()
+    assert proc.returncode != 0 and os.path.isfile(path)
+
+    sock = os.path.join(tmp, "server.sock")
+    server = subprocess.Popen([sys.executable, "pyjs.py", "-q", "--serve", sock])
+    try:
+        for i in range(100):
+            if os.path.exists(sock):
+                break
+            time.sleep(0.1)
+
+        direct, err = pyjs("-q", SOURCE)
+        served, err = pyjs("-q", "--connect", sock, SOURCE)
+        assert served == direct
+
+        # Timings are sent back to the client
+        served, err = pyjs("-q", "-O1", "--timings", "--connect", sock, SOURCE)
+        assert "constant-folding" in err
+    finally:
+        server.terminate()
+        server.wait()
+finally:
+    shutil.rmtree(tmp)
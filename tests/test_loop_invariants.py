@@ -0,0 +1,25 @@
+"""
+Checks which attribute reads the loop-invariants pass hoists out of loops,
+by looking at the javascript the tests in tests/optimize and
+tests/importfrom/invariants are compiled to.
+"""
+
+import re
+import sys
+import subprocess
+
+def hoisted(path):
+    """The attributes read into a variable on first use in a loop, as
+    (object, attribute) pairs."""
+    proc = subprocess.Popen([sys.executable, "pyjs.py", "-q", "-O2", path], stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+    out, err = proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError("pyjs.py failed on %s:\n%s" % (path, err))
+    found = re.findall(r"\((\$v\d+) !== undefined \? \1 : \(\1 = \(typeof (\w+)\.PY\$(\w+) ===", out)
+    return set((obj, attr) for var, obj, attr in found)
+
+res = hoisted("tests/optimize/loop_invariants.py")
+assert res == set([("self", "size")]), res
+
+res = hoisted("tests/importfrom/invariants/invariants.py")
+assert res == set([("self", "offset")]), res
@@ -0,0 +1,165 @@
+"""
+Tests of the optimisation passes, run directly on syntax trees, and of the
+options of the compiler and pyjs.py that select them.
+"""
+
+import os
+import sys
+import ast
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyjaco import Compiler
+from pyjaco.compiler.passes import PassManager
+
+def optimize(source, *passes):
+    return PassManager(passes = list(passes)).run(ast.parse(source))
+
+def dump(source):
+    """The syntax tree of the expression source, for comparisons."""
+    return ast.dump(ast.parse(source, mode = "eval").body)
+
+# Inlining
+tree = optimize("""
+def double(x):
+    return x * 2
+
+def scaled(x, factor=3):
+    return x * factor
+
+def nothing(x):
+    pass
+
+def bare():
+    return
+
+def fact(n):
+    return n * fact(n - 1)
+
+def twice(f):
+    return f
+
+def listed(x, l=[]):
+    return l
+
+def big(x):
+    return x + x + x + x + x + x + x + x + x + x
+
+def rebound(x):
+    return x
+
+rebound = double
+
+@twice
+def decorated(x):
+    return x
+
+double(v), scaled(v), scaled(v, 2), nothing(1), bare()
+fact(3), listed(1), big(1), rebound(1), decorated(1)
+""", "inlining")
+inlined, kept = [ast.dump(x) for x in tree.body[-2].value.elts], [ast.dump(x) for x in tree.body[-1].value.elts]
+assert inlined == [dump("v * 2"), dump("v * 3"), dump("v * 2"), dump("None"), dump("None")], inlined
+assert kept == [dump("fact(3)"), dump("listed(1)"), dump("big(1)"), dump("rebound(1)"), dump("decorated(1)")], kept
+
+# Constant folding
+tree = optimize("""
+2 ** 10 - 24, "ab" + "cd", "-" * 3, -(3 + 4), 6 & 3, 1.5 * 2
+7 / 2, -7 % 3, True + 1, "x" * 2000, 2 ** 40, 1 << 40
+""", "constant-folding")
+folded, kept = [ast.dump(x) for x in tree.body[0].value.elts], [ast.dump(x) for x in tree.body[1].value.elts]
+assert folded == [dump("1000"), dump("'abcd'"), dump("'---'"), dump("-7"), dump("2"), dump("3.0")], folded
+assert kept == [dump("7 / 2"), dump("-7 % 3"), dump("True + 1"), dump("'x' * 2000"), dump("2 ** 40"), dump("1 << 40")], kept
+
+# Dead branches
+tree = optimize("""
+if 0:
+    a()
+elif x:
+    b()
+if True:
+    c()
+else:
+    d()
+while False:
+    e()
+else:
+    f()
+g(1 if 0 else 2)
+""", "dead-branches")
+assert ast.dump(tree) == ast.dump(ast.parse("""
+if x:
+    b()
+c()
+f()
+g(2)
+""")), ast.dump(tree)
+
+# Unreachable code, keeping statements that bind names
+tree = optimize("""
+def f(l):
+    for x in l:
+        break
+        print x
+    return l
+    print l
+    y = 1
+    def g():
+        pass
+""", "unreachable-code")
+assert ast.dump(tree) == ast.dump(ast.parse("""
+def f(l):
+    for x in l:
+        break
+    return l
+    y = 1
+    def g():
+        pass
+""")), ast.dump(tree)
+
+# Assert stripping
+tree = optimize("""
+assert x, "message"
+if x:
+    assert y
+""", "strip-asserts")
+assert ast.dump(tree) == ast.dump(ast.parse("""
+if x:
+    pass
+""")), ast.dump(tree)
+
+# The pass manager
+assert [p.name for p in PassManager().passes] == []
+assert [p.name for p in PassManager(1).passes] == ["constant-folding", "dead-branches", "unreachable-code"]
+assert [p.name for p in PassManager(2).passes] == \
+    ["strip-asserts", "inlining", "constant-folding", "dead-branches", "unreachable-code", "loop-invariants"]
+manager = PassManager(passes = ["dead-branches", "constant-folding"])
+assert [p.name for p in manager.passes] == ["dead-branches", "constant-folding"]
+manager.run(ast.parse("x = 1 + 2"))
+lines = manager.format_timings()
+assert [line.split()[0] for line in lines] == ["dead-branches", "constant-folding"], lines
+assert all(line.endswith(" ms") for line in lines), lines
+try:
+    PassManager(passes = ["constant-folding", "no-such-pass"])
+except ValueError, e:
+    assert "no-such-pass" in str(e)
+else:
+    raise AssertionError("unknown pass accepted")
+
+# The optimisation options of the compiler
+def compiled(source, **opts):
+    c = Compiler(opts = opts)
+    c.append_string(source)
+    return str(c)
+
+assert "1024" not in compiled("x = 2 ** 10")
+assert "1024" in compiled("x = 2 ** 10", optimize = 1)
+assert "1024" not in compiled("x = 2 ** 10", optimize = 1, passes = ["dead-branches"])
+assert "never" not in compiled("if 0:\n    print 'never'", passes = ["dead-branches"])
+
+# Timings of the passes, from the command line
+proc = subprocess.Popen([sys.executable, "pyjs.py", "-q", "-O1", "--timings", "tests/basic/helloworld.py"],
+                        stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+out, err = proc.communicate()
+assert proc.returncode == 0, err
+assert [line.split()[-3] for line in err.splitlines()] == ["constant-folding", "dead-branches", "unreachable-code"], err
@@ -0,0 +1,8 @@
+load("py-builtins.js");
+var tup = tuple([str('a'), str('b'), $c1, $c2, $c3]);
+__builtins__.PY$print(tup.PY$__getitem__($c0));
+__builtins__.PY$print(tup.PY$__getitem__($c1));
+__builtins__.PY$print(tup.PY$__getitem__($c2));
+__builtins__.PY$print(tup.PY$__getitem__($c3));
+__builtins__.PY$print(tup.PY$__getitem__($c4));
+
@@ -0,0 +1,119 @@
+load("py-builtins.js");
+var tuple1 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('tuple1() did not get parameter x');
+    };
+    var t = tuple([x, x.PY$__add__($c1), x.PY$__add__($c2)]);
+    var $v2 = t;
+    var $v3 = (($v2.PY$__class__ === tuple || $v2.PY$__class__ === list) && $v2.items.length === 3) ? $v2.items : $PY.unpack($v2, 3);
+    var a = $v3[0];
+    var b = $v3[1];
+    var c = $v3[2];
+    return a.PY$__add__(b).PY$__add__(c);
+};
+var tuple2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v4[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('tuple2() did not get parameter n');
+    };
+    var a = $c0;
+    var $v5 = tuple([$c1, $c2, n]);
+    var $v6 = ($v5.PY$__class__ === list || $v5.PY$__class__ === tuple) ? null : iter($v5);
+    var $v7 = 0;
+    var i;
+      for (; (i = ($v6 === null ? ($v7 < $v5.items.length ? $v5.items[$v7++] : null) : $PY.next($v6))) !== null; ) {
+        a = a.PY$__iadd__(i);
+      }
+    return a;
+};
+var tuple3 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v8 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = tuple([$c1, $c3, $c5, $c4, $c9, $c1, $c2, $c3]);
+    return __builtins__.PY$len(a);
+};
+var tuple4 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v9 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v9[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('tuple4() did not get parameter n');
+    };
+    var a = tuple([$c1, $c3, $c3, $c4, $c9, $c1, $c2, $c3]);
+    return $PY.method(a, 'PY$count', 'count').call(a, n);
+};
+var tuple5 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v10 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var n = ('n' in __kwargs) ? __kwargs['n'] : $v10[0];
+    delete __kwargs.n
+    if (n === undefined) {
+        __builtins__.PY$print('tuple5() did not get parameter n');
+    };
+    var a = tuple([$c1, $c3, $c3, $c4, $c9, $c1, $c2, $c3]);
+    return $PY.method(a, 'PY$index', 'index').call(a, n);
+};
+var tuple6 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v11 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = tuple([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice($c2, $c4));
+};
+var tuple7 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v12 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = tuple([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice($c4));
+};
+var tuple8 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v13 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = tuple([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice($c1, $c6, $c2));
+};
+var tuple9 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v14 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = tuple([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice(null));
+};
+var tuple10 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v15 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = tuple([$c8, $c9, $PY.mkint(10), $PY.mkint(11), $PY.mkint(12), $PY.mkint(13), $PY.mkint(14)]);
+    return a.PY$__getitem__(slice($c4, null));
+};
+__builtins__.PY$print(tuple1($c3));
+__builtins__.PY$print(tuple2($c3));
+__builtins__.PY$print(tuple2($c4));
+__builtins__.PY$print(tuple3());
+__builtins__.PY$print(tuple4($c1));
+__builtins__.PY$print(tuple4($c3));
+__builtins__.PY$print(tuple4($c4));
+__builtins__.PY$print(tuple4($c5));
+__builtins__.PY$print(tuple5($c1));
+__builtins__.PY$print(tuple5($c4));
+__builtins__.PY$print(tuple6());
+__builtins__.PY$print(tuple7());
+__builtins__.PY$print(tuple8());
+__builtins__.PY$print(tuple9());
+__builtins__.PY$print(tuple10());
+
@@ -0,0 +1,18 @@
+load("py-builtins.js");
+var tups = list([tuple([$c1, $c1]), tuple([$c1, $c2]), tuple([$c1, $c3]), tuple([$c1, $c2, $c1]), tuple([$c1, $c2, $c2]), tuple([$c1, $c2, $PY.mkint(10)])]);
+var $v1 = tups;
+var $v2 = ($v1.PY$__class__ === list || $v1.PY$__class__ === tuple) ? null : iter($v1);
+var $v3 = 0;
+var x;
+  for (; (x = ($v2 === null ? ($v3 < $v1.items.length ? $v1.items[$v3++] : null) : $PY.next($v2))) !== null; ) {
+var $v4 = tups;
+var $v5 = ($v4.PY$__class__ === list || $v4.PY$__class__ === tuple) ? null : iter($v4);
+var $v6 = 0;
+var y;
+  for (; (y = ($v5 === null ? ($v6 < $v4.items.length ? $v4.items[$v6++] : null) : $PY.next($v5))) !== null; ) {
+__builtins__.PY$print(str(js(x.PY$__str__()) + ' cmp ' + js(y.PY$__str__()) + ' = ' + js(__builtins__.PY$cmp(x, y).PY$__str__())));
+__builtins__.PY$print(str(js(x.PY$__str__()) + ' > ' + js(y.PY$__str__()) + ' = ' + js(x.PY$__gt__(y).PY$__str__())));
+__builtins__.PY$print(str(js(x.PY$__str__()) + ' < ' + js(y.PY$__str__()) + ' = ' + js(x.PY$__lt__(y).PY$__str__())));
+  }
+  }
+
@@ -0,0 +1,11 @@
+load("py-builtins.js");
+var x = list([tuple([$c1, $c2]), tuple([$c5, $c6]), tuple([$c7, $c8]), tuple([$c9, $c9])]);
+$PY.method(x, 'PY$append', 'append').call(x, tuple([$c3, $c4]));
+$PY.method(x, 'PY$append', 'append').call(x, tuple([$c1, $c8]));
+__builtins__.PY$print(x);
+$PY.method(x, 'PY$sort', 'sort').call(x);
+__builtins__.PY$print(x);
+__builtins__.PY$print($PY.method(x, 'PY$index', 'index').call(x, tuple([$c1, $c2])));
+__builtins__.PY$print($PY.method(x, 'PY$index', 'index').call(x, tuple([$c3, $c4])));
+__builtins__.PY$print($PY.method(x, 'PY$index', 'index').call(x, tuple([$c5, $c6])));
+
@@ -0,0 +1,50 @@
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+def swap(a, b):
+    a, b = b, a
+    return a, b
+
+def divmod2(a, b):
+    return a / b, a % b
+
+a, b = swap(1, 2)
+print a, b
+q, r = divmod2(17, 5)
+print q, r
+
+l = [1, 2]
+l[1], l[0] = l
+print l
+l[0], l[1] = l[1], l[0]
+print l
+
+p = Point(1, 2)
+p.x, p.y = p.y, p.x
+print p.x, p.y
+
+(c, d), e = (3, 4), "e"
+print c, d, e
+[f, g] = "fg"
+print f, g
+h, i = {"k": 1}.items()[0]
+print h, i
+for x, (y, z) in [(1, (2, 3))]:
+    print x, y, z
+for m, n in ["mn", "op"]:
+    print m, n
+
+try:
+    a, b = [1, 2, 3]
+except ValueError, e:
+    print "ValueError:", e
+try:
+    a, b, c = (1,)
+except ValueError, e:
+    print "ValueError:", e
+try:
+    a, b = xrange(5)
+except ValueError, e:
+    print "ValueError:", e
@@ -0,0 +1,172 @@
+load("py-builtins.js");
+var Point = __inherit(__builtins__.PY$object, 'Point', true);
+Point.PY$__init__ = function() {
+    var self = this;
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v1 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var x = ('x' in __kwargs) ? __kwargs['x'] : $v1[0];
+    delete __kwargs.x
+    if (x === undefined) {
+        __builtins__.PY$print('Point.__init__() did not get parameter x');
+    };
+    var y = ('y' in __kwargs) ? __kwargs['y'] : $v1[1];
+    delete __kwargs.y
+    if (y === undefined) {
+        __builtins__.PY$print('Point.__init__() did not get parameter y');
+    };
+    var $v2 = x;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$x'))) { self.PY$x = $v2; } else { self.PY$__setattr__('x', $v2); }
+    var $v3 = y;
+    if (self.PY$__setattr__ === $PY.plain_setattr || (self.PY$__setattr__ === $PY.slot_setattr && self.hasOwnProperty('PY$y'))) { self.PY$y = $v3; } else { self.PY$__setattr__('y', $v3); }
+    return None;
+};
+var swap = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v4 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v4[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('swap() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v4[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('swap() did not get parameter b');
+    };
+    var $v5 = b;
+    var $v6 = a;
+    a = $v5;
+    b = $v6;
+    return tuple([a, b]);
+};
+var divmod2 = function() {
+    var __kwargs = __kwargs_get(arguments);
+    var __varargs = __varargs_get(arguments);
+    var $v7 = Array.prototype.slice.call(arguments).concat(js(__varargs));
+    var a = ('a' in __kwargs) ? __kwargs['a'] : $v7[0];
+    delete __kwargs.a
+    if (a === undefined) {
+        __builtins__.PY$print('divmod2() did not get parameter a');
+    };
+    var b = ('b' in __kwargs) ? __kwargs['b'] : $v7[1];
+    delete __kwargs.b
+    if (b === undefined) {
+        __builtins__.PY$print('divmod2() did not get parameter b');
+    };
+    return tuple([a.PY$__floordiv__(b), a.PY$__mod__(b)]);
+};
+var $v8 = swap($c1, $c2);
+var $v9 = (($v8.PY$__class__ === tuple || $v8.PY$__class__ === list) && $v8.items.length === 2) ? $v8.items : $PY.unpack($v8, 2);
+var a = $v9[0];
+var b = $v9[1];
+__builtins__.PY$print(a, b);
+var $v10 = divmod2($PY.mkint(17), $c5);
+var $v11 = (($v10.PY$__class__ === tuple || $v10.PY$__class__ === list) && $v10.items.length === 2) ? $v10.items : $PY.unpack($v10, 2);
+var q = $v11[0];
+var r = $v11[1];
+__builtins__.PY$print(q, r);
+var l = list([$c1, $c2]);
+var $v12 = l;
+var $v13 = (($v12.PY$__class__ === tuple || $v12.PY$__class__ === list) && $v12.items.length === 2) ? $v12.items : $PY.unpack($v12, 2);
+var $v14 = $v13[0];
+var $v15 = $v13[1];
+l.PY$__setitem__($c1, $v14);
+l.PY$__setitem__($c0, $v15);
+__builtins__.PY$print(l);
+var $v16 = l.PY$__getitem__($c1);
+var $v17 = l.PY$__getitem__($c0);
+l.PY$__setitem__($c0, $v16);
+l.PY$__setitem__($c1, $v17);
+__builtins__.PY$print(l);
+var p = Point($c1, $c2);
+var $v18 = (typeof p.PY$y === 'object' ? p.PY$y : p.PY$__getattr__('y'));
+var $v19 = (typeof p.PY$x === 'object' ? p.PY$x : p.PY$__getattr__('x'));
+var $v20 = $v18;
+if (p.PY$__setattr__ === $PY.plain_setattr || (p.PY$__setattr__ === $PY.slot_setattr && p.hasOwnProperty('PY$x'))) { p.PY$x = $v20; } else { p.PY$__setattr__('x', $v20); }
+var $v21 = $v19;
+if (p.PY$__setattr__ === $PY.plain_setattr || (p.PY$__setattr__ === $PY.slot_setattr && p.hasOwnProperty('PY$y'))) { p.PY$y = $v21; } else { p.PY$__setattr__('y', $v21); }
+__builtins__.PY$print((typeof p.PY$x === 'object' ? p.PY$x : p.PY$__getattr__('x')), (typeof p.PY$y === 'object' ? p.PY$y : p.PY$__getattr__('y')));
+var $v22 = tuple([$c3, $c4]);
+var $v23 = $v22;
+var $v24 = (($v23.PY$__class__ === tuple || $v23.PY$__class__ === list) && $v23.items.length === 2) ? $v23.items : $PY.unpack($v23, 2);
+var c = $v24[0];
+var d = $v24[1];
+var e = str('e');
+__builtins__.PY$print(c, d, e);
+var $v25 = str('fg');
+var $v26 = (($v25.PY$__class__ === tuple || $v25.PY$__class__ === list) && $v25.items.length === 2) ? $v25.items : $PY.unpack($v25, 2);
+var f = $v26[0];
+var g = $v26[1];
+__builtins__.PY$print(f, g);
+var $v27 = $PY.callmethod(dict([str('k'), $c1]), 'PY$items', 'items').PY$__getitem__($c0);
+var $v28 = (($v27.PY$__class__ === tuple || $v27.PY$__class__ === list) && $v27.items.length === 2) ? $v27.items : $PY.unpack($v27, 2);
+var h = $v28[0];
+var i = $v28[1];
+__builtins__.PY$print(h, i);
+var $v30 = list([tuple([$c1, tuple([$c2, $c3])])]);
+var $v31 = ($v30.PY$__class__ === list || $v30.PY$__class__ === tuple) ? null : iter($v30);
+var $v32 = 0;
+var $v29;
+  for (; ($v29 = ($v31 === null ? ($v32 < $v30.items.length ? $v30.items[$v32++] : null) : $PY.next($v31))) !== null; ) {
+var $v33 = $v29;
+var $v34 = (($v33.PY$__class__ === tuple || $v33.PY$__class__ === list) && $v33.items.length === 2) ? $v33.items : $PY.unpack($v33, 2);
+var $v35 = $v34[0];
+var $v36 = $v34[1];
+var x = $v35;
+var $v37 = $v36;
+var $v38 = (($v37.PY$__class__ === tuple || $v37.PY$__class__ === list) && $v37.items.length === 2) ? $v37.items : $PY.unpack($v37, 2);
+var y = $v38[0];
+var z = $v38[1];
+__builtins__.PY$print(x, y, z);
+  }
+var $v40 = list([str('mn'), str('op')]);
+var $v41 = ($v40.PY$__class__ === list || $v40.PY$__class__ === tuple) ? null : iter($v40);
+var $v42 = 0;
+var $v39;
+  for (; ($v39 = ($v41 === null ? ($v42 < $v40.items.length ? $v40.items[$v42++] : null) : $PY.next($v41))) !== null; ) {
+var $v43 = $v39;
+var $v44 = (($v43.PY$__class__ === tuple || $v43.PY$__class__ === list) && $v43.items.length === 2) ? $v43.items : $PY.unpack($v43, 2);
+var m = $v44[0];
+var n = $v44[1];
+__builtins__.PY$print(m, n);
+  }
+try {
+var $v45 = list([$c1, $c2, $c3]);
+var $v46 = (($v45.PY$__class__ === tuple || $v45.PY$__class__ === list) && $v45.items.length === 2) ? $v45.items : $PY.unpack($v45, 2);
+a = $v46[0];
+b = $v46[1];
+} catch ($v47) {
+if ($PY.isinstance($v47, __builtins__.PY$ValueError)) {
+var e = $v47;
+__builtins__.PY$print(str('ValueError:'), e);
+}
+else { throw $v47; }
+};
+try {
+var $v48 = tuple([$c1]);
+var $v49 = (($v48.PY$__class__ === tuple || $v48.PY$__class__ === list) && $v48.items.length === 3) ? $v48.items : $PY.unpack($v48, 3);
+a = $v49[0];
+b = $v49[1];
+c = $v49[2];
+} catch ($v50) {
+if ($PY.isinstance($v50, __builtins__.PY$ValueError)) {
+var e = $v50;
+__builtins__.PY$print(str('ValueError:'), e);
+}
+else { throw $v50; }
+};
+try {
+var $v51 = __builtins__.PY$xrange($c5);
+var $v52 = (($v51.PY$__class__ === tuple || $v51.PY$__class__ === list) && $v51.items.length === 2) ? $v51.items : $PY.unpack($v51, 2);
+a = $v52[0];
+b = $v52[1];
+} catch ($v53) {
+if ($PY.isinstance($v53, __builtins__.PY$ValueError)) {
+var e = $v53;
+__builtins__.PY$print(str('ValueError:'), e);
+}
+else { throw $v53; }
+};
+
@@ -1,6 +1,5 @@
 """lists all the tests that are known to fail"""
 KNOWN_TO_FAIL = [
-    "tests/class/getattr2.py",
     "tests/class/oo_diamond.py",
     "tests/class/oo_super.py",
     "tests/namespace/del_global.py",
@@ -11,6 +11,9 @@ import os
 import subprocess
 import posixpath
 
+# Extra command line flags for pyjs.py, set by run_tests.py
+COMPILE_FLAGS = ""
+
 def run_command(cmd):
     return subprocess.call(cmd, shell = True)
 
@@ -23,6 +26,15 @@ def get_posix_path(path):
         heads.append(head)
     return posixpath.join(*heads[::-1])
 
+def extra_flags(file_path):
+    """Extra command line flags for pyjs.py listed in a FLAGS file in the
+    directory of a test, that all tests in it are compiled with."""
+    flags_path = os.path.join(os.path.dirname(file_path), "FLAGS")
+    if not os.path.isfile(flags_path):
+        return ""
+    with open(flags_path) as f:
+        return " ".join(line.strip() for line in f if line.strip())
+
 def run_with_stdlib(file_path, file_name=None):
     """Creates a test that runs a js file with the stdlib."""
     file_name = file_name if file_name else file_path
@@ -126,10 +138,10 @@ def compile_and_run_file_test(file_path, file_name=None):
             except OSError:
                 mtime_js_res = 0
             compile_command = (
-                '%(py_executable)s pyjs.py -I -q '
+                '%(py_executable)s pyjs.py -I -q %(flags)s '
                 '"%(py_path)s" > "%(js_path)s" 2> '
                 '"%(compiler_error)s"'
-                ) % self.templ 
+                ) % dict(self.templ, flags = " ".join([COMPILE_FLAGS, extra_flags(self.templ['py_path'])]))
 
             javascript_command = (
                 'js -f "%(js_path)s" > "%(js_out_path)s" 2> '
@@ -207,53 +219,53 @@ def compile_as_module_and_run_file_test(file_path, file_name=None, uses_imports
                 mtime_js_res = os.path.getmtime(self.templ['js_path'])
             except OSError:
                 mtime_js_res = 0
+            flags = " ".join([COMPILE_FLAGS, extra_flags(self.templ['py_path'])])
             compile_command = (
-                '%(py_executable)s pyjs.py -I -q -m '
+                '%(py_executable)s pyjs.py -I -q -m %(flags)s '
                 '"%(py_path)s" > "%(js_path)s" 2> '
                 '"%(compiler_error)s"'
-                ) % self.templ 
-            
-            templ = self.templ.copy()
-            import_commands = []
-            templ["import_js"] = ""
+                ) % dict(self.templ, flags = flags)
             
             if uses_imports:
-                dirpath = os.path.dirname(file_path)
-                for root, dirs, files in os.walk(dirpath):
-                    for fn in [x for x in files if x.endswith('.py')]:
-                        py_path = os.path.join(root, fn).replace("\\","/")
-                        if py_path == self.templ["py_path"].replace("\\","/"):
-                            continue
-                        js_path = py_path + ".js"
-                        cmd = (
-                            '%(py_executable)s pyjs.py -q -m '
-                            '"%(py_path)s" > "%(js_path)s"'
-                        ) % {
-                             "py_executable": self.templ["py_executable"],
-                             "py_path": py_path,
-                             "js_path": js_path
-                        }
-                        import_commands.append(cmd)
-                        templ["import_js"] = '%s -f "%s"' % (templ["import_js"], js_path)
-                        
-            
-            javascript_command = (
-                'js -f "%(js_path)s" %(import_js)s -f "%(js_run_file)s" > "%(js_out_path)s" 2> '
-                '"%(js_error)s"' 
-                ) % templ
-                
-            # create javascript run file
-            with open(self.templ['js_run_file'], 'w') as f:
-                dotted = os.path.splitext(self.templ['py_path'])[0].replace("\\","/").replace("/",".")
-                f.write("\n")
-                f.write("$PY.run_module('%s', '__main__')" % dotted)
+                # The program and every module it imports go into one file.
+                # Imported modules may have changed, so it is always rebuilt.
+                # Packages listed in a CHUNKS file next to the program go
+                # into chunk files of their own, loaded from its directory.
+                chunks_path = os.path.join(os.path.dirname(self.templ['py_path']), "CHUNKS")
+                if os.path.isfile(chunks_path):
+                    with open(chunks_path) as f:
+                        for line in f:
+                            if line.strip():
+                                flags += ' --chunk %s' % line.strip()
+                    flags += ' --chunk-base "%s/"' % get_posix_path(os.path.dirname(self.templ['py_path']))
+                compile_command = (
+                    '%(py_executable)s pyjs.py -I -q --bundle %(flags)s '
+                    '-o "%(js_path)s" "%(py_path)s" 2> '
+                    '"%(compiler_error)s"'
+                    ) % dict(self.templ, flags = flags)
+                mtime_js_res = 0
+
+                javascript_command = (
+                    'js -f "%(js_path)s" > "%(js_out_path)s" 2> '
+                    '"%(js_error)s"'
+                    ) % self.templ
+            else:
+                javascript_command = (
+                    'js -f "%(js_path)s" -f "%(js_run_file)s" > "%(js_out_path)s" 2> '
+                    '"%(js_error)s"'
+                    ) % self.templ
+
+                # create javascript run file
+                with open(self.templ['js_run_file'], 'w') as f:
+                    dotted = os.path.splitext(self.templ['py_path'])[0].replace("\\","/").replace("/",".")
+                    f.write("\n")
+                    f.write("$PY.run_module('%s', '__main__')" % dotted)
 
             commands = []
             if mtime_py_res < mtime_src:
                 commands.append(python_command)
             if mtime_js_res < mtime_src:
                 commands.append(compile_command)
-            commands.extend(import_commands)
             commands.append(javascript_command)
 
             for cmd in commands: